@@ -0,0 +1,51 @@
+"""add_ranking_batch_id_to_battle_results.
+
+Revision ID: c7d8e9f0a1b2
+Revises: b6c7d8e9f0a1
+Create Date: 2026-10-17
+
+Note:
+    `battle_results.ranking_batch_id`（`BattleResult.ranking_batch_id`）を追加する。
+    ランキングの差分集計は従来 `Leaderboard.updated_at` 以降に作成された
+    バトル結果を対象にしていたため、`created_at` が前回集計より前の時刻で
+    遅れてコミットされた結果が集計から漏れていた。集計時に未集計の行へ
+    集計IDを付けて印とし、差分集計はその印だけを対象にする。
+
+    既存行は NULL のまま（未集計扱い）とする。印の付いた行が1件もない状態での
+    差分集計は `RankingService.calculate_ranking()` が全件集計に切り替えるため、
+    バックフィルは不要。
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d8e9f0a1b2"
+down_revision: str | None = "b6c7d8e9f0a1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add nullable ranking_batch_id column to battle_results."""
+    op.add_column(
+        "battle_results",
+        sa.Column("ranking_batch_id", sa.Uuid(), nullable=True),
+    )
+    op.create_index(
+        op.f("ix_battle_results_ranking_batch_id"),
+        "battle_results",
+        ["ranking_batch_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop ranking_batch_id column from battle_results."""
+    op.drop_index(
+        op.f("ix_battle_results_ranking_batch_id"), table_name="battle_results"
+    )
+    op.drop_column("battle_results", "ranking_batch_id")
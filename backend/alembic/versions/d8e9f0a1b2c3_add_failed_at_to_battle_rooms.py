@@ -0,0 +1,38 @@
+"""add_failed_at_to_battle_rooms.
+
+Revision ID: d8e9f0a1b2c3
+Revises: c7d8e9f0a1b2
+Create Date: 2026-10-17
+
+Note:
+    `battle_rooms.failed_at`（`BattleRoom.failed_at`）を追加する。
+    タスク分割実行（run_batch）でワーカータスクのルーム処理が失敗すると、
+    ルームは再実行のため WAITING のまま残る。コーディネーターは実行中の
+    ルームと区別できず、待機の打ち切り時間いっぱいまで待っていたため、
+    失敗時にこの日時を記録し、今回のバッチで失敗したルームは待機対象から外す。
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d8e9f0a1b2c3"
+down_revision: str | None = "c7d8e9f0a1b2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add nullable failed_at column to battle_rooms."""
+    op.add_column(
+        "battle_rooms",
+        sa.Column("failed_at", sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop failed_at column from battle_rooms."""
+    op.drop_column("battle_rooms", "failed_at")
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 import numpy as np
 
 from app.engine.constants import MELEE_BOOST_ARRIVAL_RANGE, POST_MELEE_DISTANCE
-from app.models.models import BattleLog, MobileSuit, Vector3, Weapon
+from app.models.models import MobileSuit, Weapon
 
 if TYPE_CHECKING:
     pass
@@ -36,8 +36,8 @@ class ActionHandlerMixin:
             self._search_movement(actor, dt)  # type: ignore[attr-defined]
             return
 
-        pos_actor = actor.position.to_numpy()
-        pos_target = target.position.to_numpy()
+        pos_actor = self._unit_pos(actor)  # type: ignore[attr-defined]
+        pos_target = self._unit_pos(target)  # type: ignore[attr-defined]
         diff_vector = pos_target - pos_actor
         distance = float(np.linalg.norm(diff_vector))
 
@@ -145,17 +145,16 @@ class ActionHandlerMixin:
             # ブースト開始
             resources["is_boosting"] = True
             resources["boost_elapsed"] = 0.0
-            self.logs.append(  # type: ignore[attr-defined]
-                BattleLog(
+            if self._log_enabled("BOOST_START"):  # type: ignore[attr-defined]
+                self.logs.record(  # type: ignore[attr-defined]
                     timestamp=float(self.elapsed_time),  # type: ignore[attr-defined]
                     actor_id=actor.id,
                     action_type="BOOST_START",
                     message=(
                         f"{self._format_actor_name(actor)} がブーストダッシュを開始した！"  # type: ignore[attr-defined]
                     ),
-                    position_snapshot=actor.position,
+                    position_snapshot=self._unit_pos(actor),  # type: ignore[attr-defined]
                 )
-            )
 
         # ブーストキャンセル判定
         cancelled = self._check_boost_cancel(actor, target, dt)  # type: ignore[attr-defined]
@@ -230,14 +229,13 @@ class ActionHandlerMixin:
             )
         else:
             # 格闘攻撃範囲内 — 格闘武器で攻撃
-            melee_weapon = next(
-                (
-                    w
-                    for w in actor.weapons
-                    if getattr(w, "weapon_type", "RANGED") == "MELEE"
-                    or getattr(w, "is_melee", False)
-                ),
-                weapon if isinstance(weapon, Weapon) else None,
+            melee_weapons = self._unit_profile(actor).melee_weapons  # type: ignore[attr-defined]
+            melee_weapon = (
+                melee_weapons[0]
+                if melee_weapons
+                else weapon
+                if isinstance(weapon, Weapon)
+                else None
             )
             if melee_weapon and isinstance(melee_weapon, Weapon):
                 self._process_engage_melee(actor, target, pos_actor, melee_weapon)
@@ -274,7 +272,7 @@ class ActionHandlerMixin:
             pos_actor: アクターの現在位置
             weapon: 使用する格闘武器
         """
-        pos_target = target.position.to_numpy()
+        pos_target = self._unit_pos(target)  # type: ignore[attr-defined]
         distance = float(np.linalg.norm(pos_target - pos_actor))
 
         # 格闘攻撃を実行
@@ -290,10 +288,11 @@ class ActionHandlerMixin:
                 dir_away = np.array([1.0, 0.0, 0.0])
 
             new_pos = pos_target + dir_away * POST_MELEE_DISTANCE
-            actor.position = Vector3.from_numpy(new_pos)
+            self._set_unit_position(actor, new_pos)  # type: ignore[attr-defined]
 
             unit_id = str(actor.id)
             self.unit_resources[unit_id]["velocity_vec"] = np.zeros(3)  # type: ignore[attr-defined]
+            self._unit_state.set_velocity(actor, np.zeros(3))  # type: ignore[attr-defined]
 
     def _log_target_selection(
         self,
@@ -310,8 +309,11 @@ class ActionHandlerMixin:
             target: 選択されたターゲット
             reason: 選択理由（戦術名）
             details: 詳細情報（スコア値など）
-            fuzzy_scores: ファジィ推論のスコア（reason が "FUZZY" の場合に提供される）
+            fuzzy_scores: ファジィ推論のスコア（reason が "FUZZY" かつ
+                log_level が LOG_LEVEL_DEBUG の場合に提供される）
         """
+        if not self._log_enabled("TARGET_SELECTION"):  # type: ignore[attr-defined]
+            return
         _tactics_label: dict[str, str] = {
             "CLOSEST": "近距離優先",
             "WEAKEST": "弱体ターゲット優先",
@@ -361,14 +363,12 @@ class ActionHandlerMixin:
         else:
             message = f"{actor_name}がターゲット選択: {target.name} (戦術: {reason}, {details})"
 
-        self.logs.append(  # type: ignore[attr-defined]
-            BattleLog(
-                timestamp=self.elapsed_time,  # type: ignore[attr-defined]
-                actor_id=actor.id,
-                action_type="TARGET_SELECTION",
-                target_id=target.id,
-                message=message,
-                position_snapshot=actor.position,
-                fuzzy_scores=fuzzy_scores,
-            )
+        self.logs.record(  # type: ignore[attr-defined]
+            timestamp=self.elapsed_time,  # type: ignore[attr-defined]
+            actor_id=actor.id,
+            action_type="TARGET_SELECTION",
+            target_id=target.id,
+            message=message,
+            position_snapshot=self._unit_pos(actor),  # type: ignore[attr-defined]
+            fuzzy_scores=fuzzy_scores,
         )
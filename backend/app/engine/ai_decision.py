@@ -6,11 +6,8 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
-from app.engine.combat import has_los
-from app.engine.constants import (
-    DEFAULT_BOOST_EN_COST,
-)
-from app.models.models import BattleLog, MobileSuit, Vector3
+from app.engine.fuzzy_engine import FuzzyEngine
+from app.models.models import MobileSuit, Vector3
 
 if TYPE_CHECKING:
     from app.engine.strategy_controller import TeamMetrics
@@ -29,6 +26,8 @@ class AiDecisionMixin:
 
         def _collect_team_metrics(self, team_id: str) -> "TeamMetrics": ...
 
+        def _team_units(self, team_id: str) -> list[MobileSuit]: ...
+
     def _strategy_phase(self) -> None:
         """戦略評価フェーズ: チームレベルの戦略モードを評価・更新する (Phase 4-2 / 4-3).
 
@@ -37,18 +36,12 @@ class AiDecisionMixin:
         を一括更新して STRATEGY_CHANGED ログを記録する。
         撤退ポイント未設定時に RETREAT → DEFENSIVE フォールバックを適用する (T10)。
         """
-        # 全チームのメトリクスを収集
-        team_ids = list(self._strategy_controllers.keys())  # type: ignore[attr-defined]
-        team_metrics_map = {
-            team_id: self._collect_team_metrics(team_id)
-            for team_id in team_ids  # type: ignore[attr-defined]
-        }
-
         for team_id, controller in self._strategy_controllers.items():  # type: ignore[attr-defined]
-            if not controller.should_evaluate():
+            if not controller.should_evaluate(self._step_span):  # type: ignore[attr-defined]
                 continue
 
-            metrics = team_metrics_map[team_id]
+            # メトリクスは評価タイミングが来たチームのみ収集する
+            metrics = self._collect_team_metrics(team_id)
             previous_strategy = controller.current_strategy
             new_strategy = controller.evaluate(metrics)
             matched_rule_id = controller._last_matched_rule_id
@@ -64,11 +57,13 @@ class AiDecisionMixin:
             # ACTIVE ユニットの strategy_mode を一括更新
             team_unit_resources = [
                 (u, self.unit_resources[str(u.id)])  # type: ignore[attr-defined]
-                for u in self.units  # type: ignore[attr-defined]
-                if u.team_id == team_id
+                for u in self._team_units(team_id)
             ]
             controller.apply(new_strategy, team_unit_resources)
 
+            if not self._log_enabled("STRATEGY_CHANGED"):  # type: ignore[attr-defined]
+                continue
+
             # STRATEGY_CHANGED ログを記録
             # trigger_metrics の float キャストで numpy 型を回避
             trigger_metrics = {
@@ -79,25 +74,23 @@ class AiDecisionMixin:
                 "total_count": int(metrics.total_count),
             }
 
-            self.logs.append(  # type: ignore[attr-defined]
-                BattleLog(
-                    timestamp=float(self.elapsed_time),  # type: ignore[attr-defined]
-                    actor_id=self._team_event_actor_id,  # type: ignore[attr-defined]
-                    action_type="STRATEGY_CHANGED",
-                    message=(
-                        f"チーム [{team_id}] の戦略が "
-                        f"[{previous_strategy}] → [{new_strategy}] に変更された。"
-                    ),
-                    position_snapshot=Vector3(),
-                    team_id=team_id,
-                    strategy_mode=new_strategy,
-                    details={
-                        "previous_strategy": previous_strategy,
-                        "new_strategy": new_strategy,
-                        "rule_id": matched_rule_id,
-                        "trigger_metrics": trigger_metrics,
-                    },
-                )
+            self.logs.record(  # type: ignore[attr-defined]
+                timestamp=float(self.elapsed_time),  # type: ignore[attr-defined]
+                actor_id=self._team_event_actor_id,  # type: ignore[attr-defined]
+                action_type="STRATEGY_CHANGED",
+                message=(
+                    f"チーム [{team_id}] の戦略が "
+                    f"[{previous_strategy}] → [{new_strategy}] に変更された。"
+                ),
+                position_snapshot=Vector3(),
+                team_id=team_id,
+                strategy_mode=new_strategy,
+                details={
+                    "previous_strategy": previous_strategy,
+                    "new_strategy": new_strategy,
+                    "rule_id": matched_rule_id,
+                    "trigger_metrics": trigger_metrics,
+                },
             )
 
     def _compute_phase_c_fuzzy_inputs(
@@ -121,12 +114,8 @@ class AiDecisionMixin:
         result: dict[str, float] = {}
 
         # ranged_ammo_ratio: 全遠距離武器の残弾割合の平均
-        ranged_weapons = [
-            w
-            for w in unit.weapons
-            if getattr(w, "weapon_type", "RANGED") != "MELEE"
-            and not getattr(w, "is_melee", False)
-        ]
+        profile = self._unit_profile(unit)  # type: ignore[attr-defined]
+        ranged_weapons = profile.ranged_weapons
         if ranged_weapons:
             ammo_ratios = []
             for rw in ranged_weapons:
@@ -142,8 +131,7 @@ class AiDecisionMixin:
 
         # los_blocked: ターゲットへの LOS 状態（Phase A の結果を使用）
         if self.obstacles:  # type: ignore[attr-defined]
-            pos_nearest = nearest_enemy.position.to_numpy()
-            los_ok = has_los(pos_unit, pos_nearest, self.obstacles)  # type: ignore[attr-defined]
+            los_ok = self._check_los(unit, nearest_enemy)  # type: ignore[attr-defined]
             result["los_blocked"] = 0.0 if los_ok else 1.0
         else:
             result["los_blocked"] = 0.0
@@ -153,7 +141,7 @@ class AiDecisionMixin:
             "boost_cooldown_remaining", 0.0
         )
         current_en = self.unit_resources[unit_id].get("current_en", 0.0)  # type: ignore[attr-defined]
-        boost_en_cost = getattr(unit, "boost_en_cost", DEFAULT_BOOST_EN_COST)
+        boost_en_cost = profile.boost_en_cost
         result["boost_available"] = (
             1.0
             if boost_cooldown_remaining == 0.0 and current_en > boost_en_cost
@@ -214,7 +202,7 @@ class AiDecisionMixin:
         if self.unit_resources[unit_id].get("status") == "RETREATED":  # type: ignore[attr-defined]
             return
 
-        pos_unit = unit.position.to_numpy()
+        pos_unit = self._unit_pos(unit)  # type: ignore[attr-defined]
 
         # 索敵済みの敵ユニットを取得
         if unit.team_id is None:
@@ -239,7 +227,7 @@ class AiDecisionMixin:
         hp_ratio = unit.current_hp / max(1, unit.max_hp)
 
         distances_to_detected = [
-            float(np.linalg.norm(e.position.to_numpy() - pos_unit))
+            float(np.linalg.norm(self._unit_pos(e) - pos_unit))  # type: ignore[attr-defined]
             for e in detected_enemies
         ]
         distance_to_nearest_enemy = (
@@ -257,7 +245,7 @@ class AiDecisionMixin:
                 if u.current_hp > 0
                 and u.team_id == unit.team_id
                 and u.id != unit.id
-                and float(np.linalg.norm(u.position.to_numpy() - pos_unit))
+                and float(np.linalg.norm(self._unit_pos(u) - pos_unit))  # type: ignore[attr-defined]
                 <= _FUZZY_NEIGHBOR_RADIUS
             )
         )
@@ -272,7 +260,7 @@ class AiDecisionMixin:
         # --- Phase C 入力変数をヘルパーで追加 ---
         nearest_enemy = min(
             detected_enemies,
-            key=lambda e: float(np.linalg.norm(e.position.to_numpy() - pos_unit)),
+            key=lambda e: float(np.linalg.norm(self._unit_pos(e) - pos_unit)),  # type: ignore[attr-defined]
         )
         phase_c_inputs = self._compute_phase_c_fuzzy_inputs(
             unit, unit_id, pos_unit, nearest_enemy
@@ -290,7 +278,7 @@ class AiDecisionMixin:
             # ターゲット未選択時は REAR が最大活性化するよう 180.0 に固定
             angle_to_target = 180.0
         else:
-            pos_target_for_angle = target_for_angle.position.to_numpy()
+            pos_target_for_angle = self._unit_pos(target_for_angle)  # type: ignore[attr-defined]
             target_dir_deg = math.degrees(
                 math.atan2(
                     float(pos_target_for_angle[2] - pos_unit[2]),
@@ -309,15 +297,12 @@ class AiDecisionMixin:
         )
 
         # --- ファジィ推論 ---
-        _, debug = behavior_engine.infer_with_debug(fuzzy_inputs)
-        fuzzy_scores: dict = debug.get("activations", {})
+        # 行動は活性化度の最大ラベルのみで決まるため、重心デファジフィケーションは省略する
+        fuzzy_scores: dict = behavior_engine.infer_activations(fuzzy_inputs)
+        self.profiler.count("fuzzy_behavior_inferences")  # type: ignore[attr-defined]
 
         # 行動を決定: action の活性化度が最も高いラベルを選択
-        action_activations: dict[str, float] = fuzzy_scores.get("action", {})
-        if action_activations:
-            action = max(action_activations, key=lambda k: action_activations[k])
-        else:
-            action = "MOVE"
+        action = FuzzyEngine.max_activation(fuzzy_scores, "action") or "MOVE"
 
         # 制約ガード（RETREAT/BOOST_DASH/ENGAGE_MELEE のフォールバック）
         action = self._resolve_final_action(action, unit_id, strategy_mode)
@@ -325,27 +310,29 @@ class AiDecisionMixin:
         # 決定した行動を保存
         self.unit_resources[unit_id]["current_action"] = action  # type: ignore[attr-defined]
 
-        # ファジィ推論結果をログに記録
-        ranged_ammo_ratio = phase_c_inputs["ranged_ammo_ratio"]
-        los_blocked = phase_c_inputs["los_blocked"]
-        boost_available = phase_c_inputs["boost_available"]
-        self.logs.append(  # type: ignore[attr-defined]
-            BattleLog(
-                timestamp=self.elapsed_time,  # type: ignore[attr-defined]
-                actor_id=unit.id,
-                action_type="AI_DECISION",
-                message=(
-                    f"{self._format_actor_name(unit)} がファジィ推論により"  # type: ignore[attr-defined]
-                    f" [{action}] を選択"
-                    f" (HP率:{hp_ratio:.2f} 近敵:{enemy_count_near:.0f}"
-                    f" 近味:{ally_count_near:.0f} 近距:{distance_to_nearest_enemy:.0f}m"
-                    f" 弾薬率:{ranged_ammo_ratio:.2f} LOS閉塞:{los_blocked:.0f}"
-                    f" ブースト可:{boost_available:.0f} 対目標角:{angle_to_target:.1f}°)"
-                ),
-                position_snapshot=unit.position,
-                fuzzy_scores=fuzzy_scores,
-                strategy_mode=strategy_mode,
-            )
+        # ファジィ推論結果をログに記録（LOG_LEVEL_DEBUG のみ）
+        if not self._log_enabled("AI_DECISION"):  # type: ignore[attr-defined]
+            return
+        self.logs.record_deferred(  # type: ignore[attr-defined]
+            "AI_DECISION",
+            {
+                "actor_name": self._format_actor_name(unit),  # type: ignore[attr-defined]
+                "action": action,
+                "hp_ratio": hp_ratio,
+                "enemy_count_near": enemy_count_near,
+                "ally_count_near": ally_count_near,
+                "distance_to_nearest_enemy": distance_to_nearest_enemy,
+                "ranged_ammo_ratio": phase_c_inputs["ranged_ammo_ratio"],
+                "los_blocked": phase_c_inputs["los_blocked"],
+                "boost_available": phase_c_inputs["boost_available"],
+                "angle_to_target": angle_to_target,
+            },
+            timestamp=self.elapsed_time,  # type: ignore[attr-defined]
+            actor_id=unit.id,
+            action_type="AI_DECISION",
+            position_snapshot=self._unit_pos(unit),  # type: ignore[attr-defined]
+            fuzzy_scores=fuzzy_scores,
+            strategy_mode=strategy_mode,
         )
 
     def _retreat_check_phase(self) -> None:
@@ -365,7 +352,7 @@ class AiDecisionMixin:
 
         for unit in retreating_units:
             unit_id = str(unit.id)
-            pos_unit = unit.position.to_numpy()
+            pos_unit = self._unit_pos(unit)  # type: ignore[attr-defined]
 
             # 対象ユニットに適用可能な撤退ポイントを抽出
             applicable_rps = [
@@ -380,17 +367,16 @@ class AiDecisionMixin:
                 if dist <= rp.radius:
                     # 撤退完了
                     self.unit_resources[unit_id]["status"] = "RETREATED"  # type: ignore[attr-defined]
-                    self.logs.append(  # type: ignore[attr-defined]
-                        BattleLog(
-                            timestamp=self.elapsed_time,  # type: ignore[attr-defined]
-                            actor_id=unit.id,
-                            action_type="RETREAT_COMPLETE",
-                            message=(
-                                f"{self._format_actor_name(unit)} が撤退ポイントに到達し、"  # type: ignore[attr-defined]
-                                f"戦線から離脱した。"
-                            ),
-                            position_snapshot=unit.position,
-                        )
+                    self._unit_state.set_status(unit, "RETREATED")  # type: ignore[attr-defined]
+                    self.logs.record(  # type: ignore[attr-defined]
+                        timestamp=self.elapsed_time,  # type: ignore[attr-defined]
+                        actor_id=unit.id,
+                        action_type="RETREAT_COMPLETE",
+                        message=(
+                            f"{self._format_actor_name(unit)} が撤退ポイントに到達し、"  # type: ignore[attr-defined]
+                            f"戦線から離脱した。"
+                        ),
+                        position_snapshot=self._unit_pos(unit),  # type: ignore[attr-defined]
                     )
                     break
 
@@ -438,8 +424,8 @@ class AiDecisionMixin:
         # 目標方向を決定
         # 攻撃時のみ敵方向を向く。移動時はmovement_heading_degに追従する
         if target is not None and current_action in ("ATTACK", "ENGAGE_MELEE"):
-            pos_actor = actor.position.to_numpy()
-            pos_target = target.position.to_numpy()
+            pos_actor = self._unit_pos(actor)  # type: ignore[attr-defined]
+            pos_target = self._unit_pos(target)  # type: ignore[attr-defined]
             target_heading = math.degrees(
                 math.atan2(
                     float(pos_target[2] - pos_actor[2]),
@@ -450,46 +436,65 @@ class AiDecisionMixin:
             target_heading = movement_heading
 
         # 旋回制限を適用
-        body_turn_rate: float = getattr(actor, "body_turn_rate", 720.0)
+        body_turn_rate: float = self._unit_profile(actor).body_turn_rate  # type: ignore[attr-defined]
         max_rotation = body_turn_rate * dt
         angular_diff = ((target_heading - current_body_heading + 180) % 360) - 180
         actual_rotation = max(-max_rotation, min(max_rotation, angular_diff))
         resources["body_heading_deg"] = current_body_heading + actual_rotation
+        self._unit_state.set_body_heading(actor, resources["body_heading_deg"])  # type: ignore[attr-defined]
 
     def _refresh_phase(self, dt: float = 0.1) -> None:
-        """リフレッシュフェーズ: ENの回復とクールダウンの減少."""
-        for unit in self.units:  # type: ignore[attr-defined]
-            if unit.current_hp <= 0:
-                continue
+        """リフレッシュフェーズ: ENの回復とクールダウンの減少.
+
+        リソーステーブルに行を持つユニットは `ResourceTable.refresh()` で一括更新し、
+        テーブル外のユニット（生成後に追加されたユニット）のみ dict を個別に更新する。
+        EN 回復はステップ単位のため、まとめたステップ数（`_step_span`）分を適用する。
+        """
+        table = self._resource_table  # type: ignore[attr-defined]
+        state = self._unit_state  # type: ignore[attr-defined]
+        # テーブルの行は SoA ストアと同じ並び（生成時の BattleSimulator.units 順）
+        if state.active:
+            alive = state.alive
+        else:
+            alive = np.array([u.current_hp > 0 for u in state.units], dtype=bool)
+        table.refresh(alive, dt, recovery_steps=self._step_span)  # type: ignore[attr-defined]
 
+        units = self.units  # type: ignore[attr-defined]
+        if len(units) == len(state.units):
+            return
+        for unit in units:
             unit_id = str(unit.id)
+            if unit.current_hp <= 0 or unit_id in table.row_of:
+                continue
             resources = self.unit_resources[unit_id]  # type: ignore[attr-defined]
+            self._refresh_unit_resources(unit, resources, dt)
+
+    def _refresh_unit_resources(
+        self, unit: MobileSuit, resources: dict, dt: float
+    ) -> None:
+        """リソーステーブル外のユニット1体分の EN・クールダウンを更新する."""
+        if resources.get("is_boosting", False):
+            # ブースト中: EN 消費（boost_en_cost × dt）
+            boost_en_cost = self._unit_profile(unit).boost_en_cost  # type: ignore[attr-defined]
+            resources["current_en"] = max(
+                0.0, resources["current_en"] - boost_en_cost * dt
+            )
+            # ブースト継続時間を加算
+            resources["boost_elapsed"] = resources.get("boost_elapsed", 0.0) + dt
+        else:
+            # 非ブースト中: EN を回復（最大値を超えない）
+            resources["current_en"] = min(
+                resources["current_en"] + unit.en_recovery * self._step_span,  # type: ignore[attr-defined]
+                unit.max_en,
+            )
 
-            is_boosting: bool = resources.get("is_boosting", False)
+            # ブーストクールダウンを減算
+            cooldown = resources.get("boost_cooldown_remaining", 0.0)
+            if cooldown > 0.0:
+                resources["boost_cooldown_remaining"] = max(0.0, cooldown - dt)
 
-            if is_boosting:
-                # ブースト中: EN 消費（boost_en_cost × dt）
-                boost_en_cost = getattr(unit, "boost_en_cost", DEFAULT_BOOST_EN_COST)
-                resources["current_en"] = max(
-                    0.0, resources["current_en"] - boost_en_cost * dt
-                )
-                # ブースト継続時間を加算
-                resources["boost_elapsed"] = resources.get("boost_elapsed", 0.0) + dt
-            else:
-                # 非ブースト中: EN を回復（最大値を超えない）
-                current_en = resources["current_en"]
-                max_en = unit.max_en
-                en_recovery = unit.en_recovery
-                new_en = min(current_en + en_recovery, max_en)
-                resources["current_en"] = new_en
-
-                # ブーストクールダウンを減算
-                cooldown = resources.get("boost_cooldown_remaining", 0.0)
-                if cooldown > 0.0:
-                    resources["boost_cooldown_remaining"] = max(0.0, cooldown - dt)
-
-            # 武器のクールダウンを減少 (Phase 6-2: 秒単位)
-            for _, weapon_state in resources["weapon_states"].items():
-                remaining = weapon_state.get("cooldown_remaining_sec", 0.0)
-                if remaining > 0.0:
-                    weapon_state["cooldown_remaining_sec"] = max(0.0, remaining - dt)
+        # 武器のクールダウンを減少 (Phase 6-2: 秒単位)
+        for weapon_state in resources["weapon_states"].values():
+            remaining = weapon_state.get("cooldown_remaining_sec", 0.0)
+            if remaining > 0.0:
+                weapon_state["cooldown_remaining_sec"] = max(0.0, remaining - dt)
@@ -9,8 +9,10 @@ LLM等の外部呼び出しは行わない。
 
 import random
 import uuid
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 
+from app.engine.log_buffer import iter_log_fields
 from app.models.models import BattleLog, MobileSuit
 
 # --- タグ判定の閾値（初期見積もり。実プレイの分布を見て調整する前提） ---
@@ -56,41 +58,209 @@ def _damage_severity(player_survived: bool, min_hp_percent: int) -> str:
     return "大破"
 
 
-def compute_unit_kills(logs: list[BattleLog], unit_id: uuid.UUID) -> int:
+def compute_kills_by_unit(logs: Sequence[BattleLog]) -> dict[uuid.UUID, int]:
+    """全ユニットの撃破数をログ1回の走査で集計する.
+
+    判定方法は `analyze_battle_logs()` を参照。撃破数以外の集計も必要な場合は
+    `analyze_battle_logs()` の結果を直接使うこと。
+
+    Returns:
+        撃破者のユニットIDをキーとした撃破数（撃破0のユニットは含まない）
+    """
+    return analyze_battle_logs(logs).kills_by_unit()
+
+
+def compute_unit_kills(logs: Sequence[BattleLog], unit_id: uuid.UUID) -> int:
     """指定ユニットが自ら撃破した数をログから集計する.
 
-    `DESTROYED` ログの `actor_id` は被撃破ユニット自身であり撃破者の情報を
-    持たない。`_process_destruction`（combat.py）は撃破に至った
+    判定方法は `analyze_battle_logs()` を参照。複数ユニットの撃破数や
+    ダイジェスト集計も必要な場合は、本関数を呼ばず `analyze_battle_logs()` の
+    結果を使い回すこと。
+    """
+    return compute_kills_by_unit(logs).get(unit_id, 0)
+
+
+@dataclass
+class UnitLogStats:
+    """1ユニット分のログ集計値（`analyze_battle_logs()` が生成する）.
+
+    Attributes:
+        kills: 撃破数（判定方法は `analyze_battle_logs()` を参照）
+        damage_dealt: 与えたダメージの合計（ATTACK / MELEE_COMBO）
+        damage_taken: 受けたダメージの合計（ATTACK / MELEE_COMBO）
+        damage_taken_count: 被弾回数（ATTACK / MELEE_COMBO の対象になった回数）
+        dodge_count: 回避回数（MISS の対象になった回数）
+        max_hit_damage: 対象最大HP比が最大だった一撃（ATTACK）のダメージ
+        max_hit_ratio: その一撃の対象最大HP比
+        weapon_usage: 武器名ごとの ATTACK 回数（初使用順）
+        action_counts: 自身が actor の action_type ごとのログ数
+    """
+
+    kills: int = 0
+    damage_dealt: int = 0
+    damage_taken: int = 0
+    damage_taken_count: int = 0
+    dodge_count: int = 0
+    max_hit_damage: int = 0
+    max_hit_ratio: float = 0.0
+    weapon_usage: dict[str, int] = field(default_factory=dict)
+    action_counts: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def attacks_received_count(self) -> int:
+        """被攻撃回数（被弾 + 回避）."""
+        return self.damage_taken_count + self.dodge_count
+
+    @property
+    def signature_weapon_name(self) -> str | None:
+        """最も多く使用した武器名（同数は先に使用した武器、未使用は None）."""
+        usage = self.weapon_usage
+        return max(usage, key=lambda name: usage[name]) if usage else None
+
+
+@dataclass
+class BattleLogStats:
+    """バトルログ全体の集計値（`analyze_battle_logs()` が生成する）.
+
+    Attributes:
+        units: ユニットIDをキーとしたユニット別集計（ログに現れないユニットは含まない）
+        action_counts: action_type ごとの全ログ数
+        strategy_transitions: STRATEGY_CHANGED ログの (変更前, 変更後) 戦略（発生順）
+    """
+
+    units: dict[uuid.UUID, UnitLogStats] = field(default_factory=dict)
+    action_counts: dict[str, int] = field(default_factory=dict)
+    strategy_transitions: list[tuple[str, str]] = field(default_factory=list)
+
+    def unit(self, unit_id: uuid.UUID) -> UnitLogStats:
+        """指定ユニットの集計を返す（ログに現れないユニットは空の集計）."""
+        return self.units.get(unit_id) or UnitLogStats()
+
+    def unit_entry(self, unit_id: uuid.UUID) -> UnitLogStats:
+        """指定ユニットの集計を返す（未登録なら空の集計を登録して返す）."""
+        unit = self.units.get(unit_id)
+        if unit is None:
+            unit = self.units[unit_id] = UnitLogStats()
+        return unit
+
+    def kills_by_unit(self) -> dict[uuid.UUID, int]:
+        """`compute_kills_by_unit()` と同じ形式の撃破数を返す."""
+        return {uid: s.kills for uid, s in self.units.items() if s.kills}
+
+
+def _record_hit(
+    stats: BattleLogStats,
+    action_type: str,
+    actor_id: uuid.UUID,
+    target_id: uuid.UUID | None,
+    weapon_name: str | None,
+    damage: int | None,
+    target_max_hp: int | None,
+) -> None:
+    """ATTACK / MELEE_COMBO ログ1行分を攻撃側・被弾側の集計に反映する."""
+    actor = stats.unit_entry(actor_id)
+    if damage:
+        actor.damage_dealt += damage
+    if target_id is not None:
+        target = stats.unit_entry(target_id)
+        target.damage_taken_count += 1
+        if damage:
+            target.damage_taken += damage
+    if action_type != "ATTACK":
+        return
+    if weapon_name:
+        actor.weapon_usage[weapon_name] = actor.weapon_usage.get(weapon_name, 0) + 1
+    if damage and target_max_hp:
+        ratio = damage / target_max_hp
+        if ratio > actor.max_hit_ratio:
+            actor.max_hit_ratio = ratio
+            actor.max_hit_damage = damage
+
+
+def _record_strategy_change(stats: BattleLogStats, details: dict | None) -> None:
+    """STRATEGY_CHANGED ログの戦略遷移を記録する."""
+    if not details:
+        return
+    previous_strategy = details.get("previous_strategy", "")
+    new_strategy = details.get("new_strategy", "")
+    if previous_strategy and new_strategy:
+        stats.strategy_transitions.append((previous_strategy, new_strategy))
+
+
+def analyze_battle_logs(logs: Sequence[BattleLog]) -> BattleLogStats:
+    """全ユニットの撃破数・与被ダメージ・回避・最大打撃・武器使用・行動数を1回の走査で集計する.
+
+    ルーム戦の保存（エントリーごとのダイジェスト）やベンチマークの集計で
+    ユニットごとにログを再走査しないよう、必要な値をまとめて求める。
+
+    撃破者の判定: `DESTROYED` ログの `actor_id` は被撃破ユニット自身であり撃破者の
+    情報を持たない。`_process_destruction`（combat.py）は撃破に至った
     `ATTACK`/`MELEE_COMBO` ログを追加した直後に呼ばれるため、`DESTROYED` ログの
     直前のログが同じ対象への `ATTACK`/`MELEE_COMBO` であれば、その `actor_id` が
     撃破者とみなせる。
+
+    Args:
+        logs: BattleLogBuffer または BattleLog のシーケンス
+
+    Returns:
+        集計結果
     """
-    kills = 0
-    for i, log in enumerate(logs):
-        if log.action_type != "DESTROYED" or i == 0:
-            continue
-        prev = logs[i - 1]
-        if (
-            prev.action_type in ("ATTACK", "MELEE_COMBO")
-            and prev.target_id == log.actor_id
-            and prev.actor_id == unit_id
-        ):
-            kills += 1
-    return kills
+    stats = BattleLogStats()
+    action_counts = stats.action_counts
+    prev: tuple | None = None
+    rows = iter_log_fields(
+        logs,
+        "action_type",
+        "actor_id",
+        "target_id",
+        "weapon_name",
+        "damage",
+        "target_max_hp",
+        "details",
+    )
+    for action_type, actor_id, target_id, weapon, damage, max_hp, details in rows:
+        action_counts[action_type] = action_counts.get(action_type, 0) + 1
+        counts = stats.unit_entry(actor_id).action_counts
+        counts[action_type] = counts.get(action_type, 0) + 1
+
+        if action_type in ("ATTACK", "MELEE_COMBO"):
+            _record_hit(stats, action_type, actor_id, target_id, weapon, damage, max_hp)
+        elif action_type == "MISS" and target_id is not None:
+            stats.unit_entry(target_id).dodge_count += 1
+        elif action_type == "DESTROYED" and prev is not None:
+            # 直前のログが同じ対象への攻撃なら、その攻撃者を撃破者とみなす
+            prev_action, prev_actor, prev_target = prev
+            if prev_action in ("ATTACK", "MELEE_COMBO") and prev_target == actor_id:
+                stats.unit_entry(prev_actor).kills += 1
+        elif action_type == "STRATEGY_CHANGED":
+            _record_strategy_change(stats, details)
+        prev = (action_type, actor_id, target_id)
+    return stats
 
 
 def compute_digest_stats(
     player: MobileSuit,
-    logs: list[BattleLog],
+    logs: Sequence[BattleLog],
     kills: int,
     win_loss: str,
     steps_used: int,
     max_steps: int,
+    log_stats: BattleLogStats | None = None,
 ) -> DigestStats:
     """プレイヤー視点でバトルログを集計する.
 
     HPは回復要素がないため（simulation.py/combat.py に repair 処理なし）、
     最終 current_hp がそのままバトル中の最低到達HPと一致する前提で計算する。
+
+    Args:
+        player: 集計対象ユニット（バトル後の状態）
+        logs: バトルの全ログ（log_stats 指定時は走査しない）
+        kills: 撃破数
+        win_loss: "WIN" / "LOSE" / "DRAW"
+        steps_used: シミュレーションが消費したステップ数
+        max_steps: シミュレーションの最大ステップ数
+        log_stats: `analyze_battle_logs()` で集計済みの結果。複数ユニットの
+            ダイジェストを作る場合は1回だけ集計して渡すこと
     """
     player_survived = player.current_hp > 0
     # 辛勝判定などの閾値比較に使うため round() ではなく切り捨てにする
@@ -99,35 +269,9 @@ def compute_digest_stats(
         int(max(player.current_hp, 0) / player.max_hp * 100) if player.max_hp else 0
     )
 
-    damage_taken_count = 0
-    dodge_count = 0
-    max_hit_ratio = 0.0
-    max_hit_damage = 0
-    weapon_counter: dict[str, int] = {}
-
-    for log in logs:
-        if log.target_id == player.id and log.action_type in ("ATTACK", "MELEE_COMBO"):
-            damage_taken_count += 1
-        elif log.target_id == player.id and log.action_type == "MISS":
-            dodge_count += 1
-
-        if log.actor_id == player.id and log.action_type == "ATTACK":
-            if log.weapon_name:
-                weapon_counter[log.weapon_name] = (
-                    weapon_counter.get(log.weapon_name, 0) + 1
-                )
-            if log.damage and log.target_max_hp:
-                ratio = log.damage / log.target_max_hp
-                if ratio > max_hit_ratio:
-                    max_hit_ratio = ratio
-                    max_hit_damage = log.damage
-
-    attacks_received_count = damage_taken_count + dodge_count
-    signature_weapon_name = (
-        max(weapon_counter, key=lambda name: weapon_counter[name])
-        if weapon_counter
-        else None
-    )
+    if log_stats is None:
+        log_stats = analyze_battle_logs(logs)
+    unit_stats = log_stats.unit(player.id)
     step_ratio = steps_used / max_steps if max_steps else 0.0
 
     return DigestStats(
@@ -136,13 +280,13 @@ def compute_digest_stats(
         player_survived=player_survived,
         min_hp_percent=min_hp_percent,
         damage_severity=_damage_severity(player_survived, min_hp_percent),
-        damage_taken_count=damage_taken_count,
-        max_hit_damage=max_hit_damage,
-        max_hit_ratio=max_hit_ratio,
-        dodge_count=dodge_count,
-        attacks_received_count=attacks_received_count,
+        damage_taken_count=unit_stats.damage_taken_count,
+        max_hit_damage=unit_stats.max_hit_damage,
+        max_hit_ratio=unit_stats.max_hit_ratio,
+        dodge_count=unit_stats.dodge_count,
+        attacks_received_count=unit_stats.attacks_received_count,
         pilot_ms_name=player.name,
-        signature_weapon_name=signature_weapon_name,
+        signature_weapon_name=unit_stats.signature_weapon_name,
         step_ratio=step_ratio,
     )
 
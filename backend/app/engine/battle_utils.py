@@ -1,10 +1,11 @@
 # backend/app/engine/battle_utils.py
 """戦闘ユーティリティ: フォーマット・チャッター関数群のミックスイン."""
 
-import random
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 from app.core.npc_data import BATTLE_CHATTER
+from app.engine.log_buffer import BattleLogBuffer
 from app.models.models import BattleLog, MobileSuit
 
 if TYPE_CHECKING:
@@ -40,18 +41,22 @@ def serialize_obstacles(obstacles: "list[Obstacle]") -> list[dict[str, Any]] | N
 _BATTLE_LOG_DEBUG_FIELDS: frozenset[str] = frozenset({"fuzzy_scores"})
 
 
-def strip_debug_fields(logs: list[BattleLog]) -> list[dict[str, Any]]:
+def strip_debug_fields(logs: Sequence[BattleLog]) -> list[dict[str, Any]]:
     """バトルログからデバッグ用フィールドを除去した dict リストを返す.
 
     DBへの保存前に呼び出すことで、不要なストレージ消費を削減する。
     APIレスポンス（BattleResponse.logs）には影響しない。
+    `BattleLogBuffer`（BattleSimulator.logs）の場合は BattleLog を生成せず
+    列から直接 dict を組み立てる。
 
     Args:
-        logs: 除去対象のバトルログリスト
+        logs: 除去対象のバトルログ（BattleLogBuffer または BattleLog のリスト）
 
     Returns:
         デバッグフィールド（fuzzy_scores 等）を除いた BattleLog 相当の dict リスト
     """
+    if isinstance(logs, BattleLogBuffer):
+        return logs.to_dicts(exclude=_BATTLE_LOG_DEBUG_FIELDS)
     return [
         {k: v for k, v in log.model_dump().items() if k not in _BATTLE_LOG_DEBUG_FIELDS}
         for log in logs
@@ -79,7 +84,7 @@ class BattleUtilsMixin:
             return None
 
         # 30%の確率でセリフを発言
-        if random.random() > 0.3:
+        if self.rng.random() > 0.3:  # type: ignore[attr-defined]
             return None
 
         # 性格に応じたセリフを取得
@@ -87,7 +92,7 @@ class BattleUtilsMixin:
         if personality in BATTLE_CHATTER:
             chatter_list = BATTLE_CHATTER[personality].get(chatter_type, [])
             if chatter_list:
-                return random.choice(chatter_list)
+                return self.rng.choice(chatter_list)  # type: ignore[attr-defined]
 
         return None
 
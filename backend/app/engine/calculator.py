@@ -10,6 +10,8 @@ Note:
 import random
 from dataclasses import dataclass, field
 
+from app.engine.random_source import RandomSource
+
 
 @dataclass
 class PilotStats:
@@ -109,6 +111,7 @@ def calculate_damage_variance(
     defender_dex: int = 0,
     defender_tou: int = 0,
     defender_luk: int = 0,
+    rng: RandomSource = random,
 ) -> tuple[int, bool]:
     """ダメージの乱数変動とステータス補正を計算する.
 
@@ -128,6 +131,7 @@ def calculate_damage_variance(
         defender_dex: 防御側の DEX ステータス値
         defender_tou: 防御側の TOU ステータス値
         defender_luk: 防御側の LUK ステータス値
+        rng: 乱数源（省略時は `random` モジュールのグローバル乱数）
 
     Returns:
         tuple[int, bool]: (最終ダメージ, 完全回避フラグ)
@@ -136,7 +140,7 @@ def calculate_damage_variance(
     # LUK（防御側）: 完全回避チェック
     if defender_luk > 0:
         perfect_evade_chance = min(defender_luk * 0.001, 0.05)  # 最大5%
-        if random.random() < perfect_evade_chance:
+        if rng.random() < perfect_evade_chance:
             return 0, True  # 完全回避
 
     damage = base_damage
@@ -148,11 +152,11 @@ def calculate_damage_variance(
     if attacker_luk > 0:
         # LUKが高いほど乱数が最大値に偏る（べき乗による分布の偏り）
         luk_factor = max(0.1, 1.0 - attacker_luk * 0.05)
-        r = random.random()
+        r = rng.random()
         variance = 0.9 + 0.2 * (r**luk_factor)
     else:
         # ステータスゼロの場合は従来どおりの一様乱数
-        variance = random.uniform(0.9, 1.1)
+        variance = rng.uniform(0.9, 1.1)
 
     damage = int(damage * variance)
 
@@ -2,7 +2,6 @@
 """攻撃・命中・ダメージ・破壊処理のミックスイン."""
 
 import math
-import random
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -38,7 +37,7 @@ from app.engine.constants import (
     SECTOR_REAR_SIDE_DEG,
     SPECIAL_ENVIRONMENT_EFFECTS,
 )
-from app.models.models import BattleLog, MobileSuit, Obstacle, Vector3, Weapon
+from app.models.models import MobileSuit, Obstacle, Vector3, Weapon
 
 if TYPE_CHECKING:
     pass
@@ -86,6 +85,56 @@ def has_los(
     return True
 
 
+def obstacle_arrays(obstacles: "list[Obstacle]") -> tuple[np.ndarray, np.ndarray]:
+    """障害物リストを (中心座標 (M, 3), 半径 (M,)) の配列に変換する."""
+    centers = np.array(
+        [[obs.position.x, obs.position.y, obs.position.z] for obs in obstacles],
+        dtype=float,
+    ).reshape(-1, 3)
+    radii = np.array([obs.radius for obs in obstacles], dtype=float)
+    return centers, radii
+
+
+def has_los_batch(
+    origins: np.ndarray,
+    targets: np.ndarray,
+    centers: np.ndarray,
+    radii: np.ndarray,
+) -> np.ndarray:
+    """複数の視線 (K 本) × 複数の障害物 (M 個) の LOS 判定を一括で行う.
+
+    `has_los()` と同じ Ray-Sphere 交差判定（球への進入点 t が 0 < t < 距離 の
+    とき遮断）を配列演算で行う。判定結果は視線ごとに `has_los()` と一致する。
+
+    Args:
+        origins: 視線の始点 (K, 3)
+        targets: 視線の終点 (K, 3)
+        centers: 障害物の中心座標 (M, 3)（`obstacle_arrays()` 参照）
+        radii: 障害物の半径 (M,)
+
+    Returns:
+        (K,) の bool 配列。True: LOS あり / False: 障害物で遮断
+    """
+    k = len(origins)
+    if k == 0 or len(radii) == 0:
+        return np.ones(k, dtype=bool)
+
+    direction = targets - origins
+    dist = np.sqrt(np.einsum("ij,ij->i", direction, direction))
+    valid = dist >= 1e-6
+    unit_dir = np.zeros_like(direction)
+    unit_dir[valid] = direction[valid] / dist[valid, None]
+
+    oc = origins[:, None, :] - centers[None, :, :]  # (K, M, 3)
+    b = 2.0 * np.einsum("kmj,kj->km", oc, unit_dir)
+    c = np.einsum("kmj,kmj->km", oc, oc) - radii[None, :] ** 2
+    discriminant = b**2 - 4.0 * c
+    hit = discriminant >= 0
+    t = (-b - np.sqrt(np.where(hit, discriminant, 0.0))) / 2.0
+    blocked = hit & (t > 0.0) & (t < dist[:, None])
+    return ~(blocked.any(axis=1) & valid)
+
+
 # ---------------------------------------------------------------------------
 # シグモイドダメージ計算ヘルパー関数 (Phase E-1)
 # ---------------------------------------------------------------------------
@@ -174,6 +223,9 @@ def calculate_attack_sector(
 class CombatMixin:
     """攻撃・命中・ダメージ・破壊処理のミックスイン."""
 
+    # BattleSimulator が提供するインスタンス属性 (mypy 向け型宣言のみ; 実体は simulation.py)
+    _obstacle_arrays_cache: tuple[list[Obstacle], int, np.ndarray, np.ndarray] | None
+
     def _get_or_init_weapon_state(self, weapon: Weapon, resources: dict) -> dict:
         """武器状態を取得または初期化する."""
         weapon_state = resources["weapon_states"].get(weapon.id)
@@ -185,6 +237,8 @@ class CombatMixin:
                 "cooldown_remaining_sec": 0.0,  # 残りクールダウン時間（秒）(Phase 6-2)
             }
             resources["weapon_states"][weapon.id] = weapon_state
+            # リソーステーブル上のユニットでは代入した dict がビューに置き換わる
+            weapon_state = resources["weapon_states"][weapon.id]
         return weapon_state
 
     @staticmethod
@@ -280,8 +334,8 @@ class CombatMixin:
             hit_chance -= obstacle["accuracy_penalty"]
 
         # パイロットステータス補正を適用 (Phase E-2: 全ユニット対応)
-        _attacker_stats = self.unit_pilot_stats.get(str(actor.id), PilotStats())  # type: ignore[attr-defined]
-        _defender_stats = self.unit_pilot_stats.get(str(target.id), PilotStats())  # type: ignore[attr-defined]
+        _attacker_stats = self._unit_profile(actor).pilot_stats  # type: ignore[attr-defined]
+        _defender_stats = self._unit_profile(target).pilot_stats  # type: ignore[attr-defined]
         _is_melee_weapon = getattr(
             weapon, "weapon_type", "RANGED"
         ) == "MELEE" or getattr(weapon, "is_melee", False)
@@ -307,7 +361,9 @@ class CombatMixin:
         _target_resources = self.unit_resources[str(target.id)]  # type: ignore[attr-defined]
         target_heading = _target_resources.get("body_heading_deg", 0.0)
         attack_sector = calculate_attack_sector(
-            actor.position.to_numpy(), target.position.to_numpy(), target_heading
+            self._unit_pos(actor),  # type: ignore[attr-defined]
+            self._unit_pos(target),  # type: ignore[attr-defined]
+            target_heading,
         )
         hit_chance = hit_chance * SECTOR_ACCURACY_MODIFIERS[attack_sector]
 
@@ -355,6 +411,8 @@ class CombatMixin:
         snapshot: Vector3,
     ) -> None:
         """攻撃リソース不足時の待機ログを追記する."""
+        if not self._log_enabled("WAIT"):  # type: ignore[attr-defined]
+            return
         actor_name = self._format_actor_name(actor)  # type: ignore[attr-defined]
         weapon_display = f"[{weapon.name}]" if weapon.name else "[格闘]"
         if "弾切れ" in failure_reason:
@@ -366,17 +424,13 @@ class CombatMixin:
             wait_message = f"{actor_name}は{weapon_display}の冷却を待ちながら（残り{remaining_sec:.1f}s）、やむなく待機"
         else:
             wait_message = f"{actor_name}は{failure_reason}のため攻撃できない（待機）"
-        self.logs.append(  # type: ignore[attr-defined]
-            BattleLog(
-                timestamp=self.elapsed_time,  # type: ignore[attr-defined]
-                actor_id=actor.id,
-                action_type="WAIT",
-                message=wait_message,
-                position_snapshot=snapshot,
-                velocity_snapshot=Vector3.from_numpy(
-                    self.unit_resources[str(actor.id)]["velocity_vec"]  # type: ignore[attr-defined]
-                ),  # type: ignore[attr-defined]
-            )
+        self.logs.record(  # type: ignore[attr-defined]
+            timestamp=self.elapsed_time,  # type: ignore[attr-defined]
+            actor_id=actor.id,
+            action_type="WAIT",
+            message=wait_message,
+            position_snapshot=snapshot,
+            velocity_snapshot=self.unit_resources[str(actor.id)]["velocity_vec"],  # type: ignore[attr-defined]
         )
 
     def _process_attack(
@@ -402,7 +456,7 @@ class CombatMixin:
         resources = self.unit_resources[unit_id]  # type: ignore[attr-defined]
 
         # LOS チェック（格闘武器はスキップ、障害物がある場合のみ）
-        if self._is_los_blocked(actor, target, weapon, pos_actor, snapshot):  # type: ignore[attr-defined]
+        if self._is_los_blocked(actor, target, weapon, snapshot):
             return
 
         # リソース状態を取得または初期化
@@ -432,7 +486,7 @@ class CombatMixin:
             skill_bonus -= evasion_skill_level * 2.0
 
         # ダイスロール（ロール値を保持してスキル発動判定に使用）
-        roll = random.uniform(0, 100)
+        roll = self.rng.uniform(0, 100)  # type: ignore[attr-defined]
         is_hit = roll <= hit_chance
 
         # スキル発動判定: スキルボーナスがあり、それが命中/回避の結果を変えた場合
@@ -496,7 +550,7 @@ class CombatMixin:
         if is_melee_weapon:
             return False
         unit_id = str(actor.id)
-        pos_target = target.position.to_numpy()
+        pos_target = self._unit_pos(target)  # type: ignore[attr-defined]
         target_dir_deg = math.degrees(
             math.atan2(
                 float(pos_target[2] - pos_actor[2]),
@@ -510,60 +564,158 @@ class CombatMixin:
         if angle_to_tgt <= effective_fire_arc:
             return False
         # 弧外: 攻撃をスキップして旋回を継続する
+        if not self._log_enabled("TURNING_TO_TARGET"):  # type: ignore[attr-defined]
+            return True
         actor_name = self._format_actor_name(actor)  # type: ignore[attr-defined]
         weapon_display = f"[{weapon.name}]" if weapon.name else "[武装]"
-        self.logs.append(  # type: ignore[attr-defined]
-            BattleLog(
-                timestamp=self.elapsed_time,  # type: ignore[attr-defined]
-                actor_id=actor.id,
-                action_type="TURNING_TO_TARGET",
-                target_id=target.id,
-                message=(
-                    f"{actor_name}の{weapon_display}は射撃弧外"
-                    f"（角度差:{angle_to_tgt:.1f}° > 弧:{effective_fire_arc:.1f}°）"
-                    f"のため旋回中"
-                ),
-                position_snapshot=snapshot,
-                heading=self.unit_resources[unit_id].get("body_heading_deg"),  # type: ignore[attr-defined]
-                velocity_snapshot=Vector3.from_numpy(
-                    self.unit_resources[str(actor.id)]["velocity_vec"]  # type: ignore[attr-defined]
-                ),  # type: ignore[attr-defined]
-            )
+        self.logs.record(  # type: ignore[attr-defined]
+            timestamp=self.elapsed_time,  # type: ignore[attr-defined]
+            actor_id=actor.id,
+            action_type="TURNING_TO_TARGET",
+            target_id=target.id,
+            message=(
+                f"{actor_name}の{weapon_display}は射撃弧外"
+                f"（角度差:{angle_to_tgt:.1f}° > 弧:{effective_fire_arc:.1f}°）"
+                f"のため旋回中"
+            ),
+            position_snapshot=snapshot,
+            heading=self.unit_resources[unit_id].get("body_heading_deg"),  # type: ignore[attr-defined]
+            velocity_snapshot=self.unit_resources[str(actor.id)]["velocity_vec"],  # type: ignore[attr-defined]
         )
         return True
 
+    def _get_obstacle_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """障害物の (中心座標 (M, 3), 半径 (M,)) 配列を返す（生成は1回だけ）.
+
+        `self.obstacles` のリスト自体が差し替えられた場合（スポーン領域解決時や
+        テストでの再設定）のみ再構築する。差し替え時は LOS キャッシュも破棄する。
+        """
+        obstacles = self.obstacles  # type: ignore[attr-defined]
+        cached = self._obstacle_arrays_cache
+        if cached is None or cached[0] is not obstacles or cached[1] != len(obstacles):
+            centers, radii = obstacle_arrays(obstacles)
+            cached = (obstacles, len(obstacles), centers, radii)
+            self._obstacle_arrays_cache = cached
+            self._los_cache.clear()  # type: ignore[attr-defined]
+        return cached[2], cached[3]
+
+    def _los_key(
+        self, unit_a: MobileSuit, unit_b: MobileSuit
+    ) -> tuple[MobileSuit, MobileSuit]:
+        """LOS 判定の向きを正規化する（self.units 内の出現順が先のユニットを始点にする）."""
+        order = self._unit_order_index  # type: ignore[attr-defined]
+        if order.get(unit_a.id, 0) > order.get(unit_b.id, 0):
+            return unit_b, unit_a
+        return unit_a, unit_b
+
+    def _check_los(self, unit_a: MobileSuit, unit_b: MobileSuit) -> bool:
+        """2ユニット間の LOS を判定する（ステップ内キャッシュ付き）.
+
+        同一ステップ内で索敵・AI 意思決定 (Phase C 入力)・攻撃時の射線判定が
+        同じペアを何度もレイキャストしないよう、ユニットペア単位で結果を
+        キャッシュする。キャッシュは向きを区別しない対称なもので、判定自体も
+        常に `self.units` 内の出現順が先のユニットから後のユニットへの向きで
+        行う（Ray-Sphere 判定は端点が障害物の内部にある場合のみ向きで結果が
+        変わりうるため、向きを固定して結果を一意にする）。
+
+        各エントリは計算時点の両ユニットの位置バージョン
+        （`UnitStateStore.position_versions`）を持ち、どちらかが移動した後の
+        呼び出しでは再計算する。`step()` 外（SoA ストア非アクティブ時）は
+        キャッシュを使わずに毎回判定する。
+        """
+        if not self.obstacles:  # type: ignore[attr-defined]
+            return True
+        profiler = self.profiler  # type: ignore[attr-defined]
+        profiler.count("los_checks")
+        centers, radii = self._get_obstacle_arrays()
+        unit_a, unit_b = self._los_key(unit_a, unit_b)
+        state = self._unit_state  # type: ignore[attr-defined]
+        row_a = state.row(unit_a) if state.active else None
+        row_b = state.row(unit_b) if state.active else None
+        if row_a is None or row_b is None:
+            profiler.count("los_raycasts")
+            return bool(
+                has_los_batch(
+                    self._unit_pos(unit_a)[None, :],  # type: ignore[attr-defined]
+                    self._unit_pos(unit_b)[None, :],  # type: ignore[attr-defined]
+                    centers,
+                    radii,
+                )[0]
+            )
+
+        versions = state.position_versions
+        key = (unit_a.id, unit_b.id)
+        cached = self._los_cache.get(key)  # type: ignore[attr-defined]
+        if (
+            cached is not None
+            and cached[0] == versions[row_a]
+            and cached[1] == versions[row_b]
+        ):
+            return cached[2]
+        profiler.count("los_raycasts")
+        result = bool(
+            has_los_batch(
+                state.positions[row_a][None, :],
+                state.positions[row_b][None, :],
+                centers,
+                radii,
+            )[0]
+        )
+        self._los_cache[key] = (versions[row_a], versions[row_b], result)  # type: ignore[attr-defined]
+        return result
+
+    def _store_los_results(
+        self,
+        units_a: list[MobileSuit],
+        units_b: list[MobileSuit],
+        results: np.ndarray,
+    ) -> None:
+        """一括判定した LOS 結果をステップ内キャッシュへ登録する.
+
+        `units_a[k]` → `units_b[k]` の向きが `_los_key()` の正規化済みの向きで
+        あることを前提とする（`_detection_phase_batched()` 参照）。
+        """
+        state = self._unit_state  # type: ignore[attr-defined]
+        if not state.active:
+            return
+        versions = state.position_versions
+        index = state.index
+        cache = self._los_cache  # type: ignore[attr-defined]
+        for unit_a, unit_b, result in zip(units_a, units_b, results, strict=True):
+            cache[(unit_a.id, unit_b.id)] = (
+                versions[index[unit_a.id]],
+                versions[index[unit_b.id]],
+                bool(result),
+            )
+
     def _is_los_blocked(
         self,
         actor: MobileSuit,
         target: MobileSuit,
         weapon: Weapon,
-        pos_actor: np.ndarray,
         snapshot: Vector3,
     ) -> bool:
         """LOS（射線）チェック. 射線なしなら True を返してログを記録する."""
         is_melee = getattr(weapon, "is_melee", False)
         if is_melee or not self.obstacles:  # type: ignore[attr-defined]
             return False
-        pos_target = target.position.to_numpy()
-        if has_los(pos_actor, pos_target, self.obstacles):  # type: ignore[attr-defined]
+        if self._check_los(actor, target):
             return False
+        if not self._log_enabled("ATTACK_BLOCKED_LOS"):  # type: ignore[attr-defined]
+            return True
         actor_name = self._format_actor_name(actor)  # type: ignore[attr-defined]
         weapon_display = f"[{weapon.name}]" if weapon.name else "[武装]"
-        self.logs.append(  # type: ignore[attr-defined]
-            BattleLog(
-                timestamp=self.elapsed_time,  # type: ignore[attr-defined]
-                actor_id=actor.id,
-                action_type="ATTACK_BLOCKED_LOS",
-                target_id=target.id,
-                message=(
-                    f"{actor_name}の{weapon_display}は障害物に遮られ、"
-                    f"{target.name}への射線が確保できない"
-                ),
-                position_snapshot=snapshot,
-                velocity_snapshot=Vector3.from_numpy(
-                    self.unit_resources[str(actor.id)]["velocity_vec"]  # type: ignore[attr-defined]
-                ),  # type: ignore[attr-defined]
-            )
+        self.logs.record(  # type: ignore[attr-defined]
+            timestamp=self.elapsed_time,  # type: ignore[attr-defined]
+            actor_id=actor.id,
+            action_type="ATTACK_BLOCKED_LOS",
+            target_id=target.id,
+            message=(
+                f"{actor_name}の{weapon_display}は障害物に遮られ、"
+                f"{target.name}への射線が確保できない"
+            ),
+            position_snapshot=snapshot,
+            velocity_snapshot=self.unit_resources[str(actor.id)]["velocity_vec"],  # type: ignore[attr-defined]
         )
         return True
 
@@ -588,8 +740,8 @@ class CombatMixin:
         )
 
         # パイロットステータス補正: ダメージ乱数変動・LUK 完全回避 (Phase E-2: 全ユニット対応)
-        _attacker_stats = self.unit_pilot_stats.get(str(actor.id), PilotStats())  # type: ignore[attr-defined]
-        _defender_stats = self.unit_pilot_stats.get(str(target.id), PilotStats())  # type: ignore[attr-defined]
+        _attacker_stats = self._unit_profile(actor).pilot_stats  # type: ignore[attr-defined]
+        _defender_stats = self._unit_profile(target).pilot_stats  # type: ignore[attr-defined]
         attacker_tou = _attacker_stats.tou
         attacker_luk = _attacker_stats.luk
         defender_dex = 0  # DEX は廃止（Phase E-1: SHT/MEL に置換）
@@ -603,31 +755,29 @@ class CombatMixin:
             defender_dex=defender_dex,
             defender_tou=defender_tou,
             defender_luk=defender_luk,
+            rng=self.rng,  # type: ignore[attr-defined]
         )
 
         # 完全回避（LUK 発動）
         if perfect_evade:
             # 被弾時のセリフ生成
             hit_chatter = self._generate_chatter(target, "hit")  # type: ignore[attr-defined]
-            self.logs.append(  # type: ignore[attr-defined]
-                BattleLog(
-                    timestamp=self.elapsed_time,  # type: ignore[attr-defined]
-                    actor_id=actor.id,
-                    action_type="MISS",
-                    target_id=target.id,
-                    damage=0,
-                    message=f"{log_base} -> 直撃コース！ しかし{target.name}は信じられない反射神経で紙一重の回避！ ★ [LUK]の奇跡が働いた！",
-                    position_snapshot=snapshot,
-                    chatter=attack_chatter or hit_chatter,
-                    heading=self.unit_resources[str(actor.id)].get("body_heading_deg"),  # type: ignore[attr-defined]
-                    velocity_snapshot=Vector3.from_numpy(
-                        self.unit_resources[str(actor.id)]["velocity_vec"]  # type: ignore[attr-defined]
-                    ),  # type: ignore[attr-defined]
-                )
+            self.logs.record(  # type: ignore[attr-defined]
+                timestamp=self.elapsed_time,  # type: ignore[attr-defined]
+                actor_id=actor.id,
+                action_type="MISS",
+                target_id=target.id,
+                damage=0,
+                message=f"{log_base} -> 直撃コース！ しかし{target.name}は信じられない反射神経で紙一重の回避！ ★ [LUK]の奇跡が働いた！",
+                position_snapshot=snapshot,
+                chatter=attack_chatter or hit_chatter,
+                heading=self.unit_resources[str(actor.id)].get("body_heading_deg"),  # type: ignore[attr-defined]
+                velocity_snapshot=self.unit_resources[str(actor.id)]["velocity_vec"],  # type: ignore[attr-defined]
             )
             return
 
         target.current_hp -= final_damage
+        self._unit_state.set_hp(target)  # type: ignore[attr-defined]
 
         # 被弾時のセリフ生成
         hit_chatter = self._generate_chatter(target, "hit")  # type: ignore[attr-defined]
@@ -661,27 +811,23 @@ class CombatMixin:
                 f" {target.name}に{final_damage}ダメージ！（{damage_desc}）{hp_comment}"
             )
 
-        self.logs.append(  # type: ignore[attr-defined]
-            BattleLog(
-                timestamp=self.elapsed_time,  # type: ignore[attr-defined]
-                actor_id=actor.id,
-                action_type="ATTACK",
-                target_id=target.id,
-                damage=final_damage,
-                target_max_hp=target.max_hp,
-                message=f"{log_base}{hit_text}{damage_message}",
-                position_snapshot=snapshot,
-                weapon_name=weapon.name if weapon else None,
-                weapon_id=weapon.id if weapon else None,
-                is_crit=is_crit,
-                chatter=attack_chatter or hit_chatter,
-                skill_activated=True if skill_activated else None,
-                heading=self.unit_resources[str(actor.id)].get("body_heading_deg"),  # type: ignore[attr-defined]
-                attack_sector=attack_sector,
-                velocity_snapshot=Vector3.from_numpy(
-                    self.unit_resources[str(actor.id)]["velocity_vec"]  # type: ignore[attr-defined]
-                ),  # type: ignore[attr-defined]
-            )
+        self.logs.record(  # type: ignore[attr-defined]
+            timestamp=self.elapsed_time,  # type: ignore[attr-defined]
+            actor_id=actor.id,
+            action_type="ATTACK",
+            target_id=target.id,
+            damage=final_damage,
+            target_max_hp=target.max_hp,
+            message=f"{log_base}{hit_text}{damage_message}",
+            position_snapshot=snapshot,
+            weapon_name=weapon.name if weapon else None,
+            weapon_id=weapon.id if weapon else None,
+            is_crit=is_crit,
+            chatter=attack_chatter or hit_chatter,
+            skill_activated=True if skill_activated else None,
+            heading=self.unit_resources[str(actor.id)].get("body_heading_deg"),  # type: ignore[attr-defined]
+            attack_sector=attack_sector,
+            velocity_snapshot=self.unit_resources[str(actor.id)]["velocity_vec"],  # type: ignore[attr-defined]
         )
 
         if target.current_hp <= 0:
@@ -725,7 +871,7 @@ class CombatMixin:
         combo_chance = COMBO_BASE_CHANCE
 
         for _ in range(COMBO_MAX_CHAIN):
-            if random.random() > combo_chance:
+            if self.rng.random() > combo_chance:  # type: ignore[attr-defined]
                 break
             if target.current_hp <= 0:
                 break
@@ -737,33 +883,30 @@ class CombatMixin:
 
             if target.current_hp <= 0:
                 target.current_hp = 0
+            self._unit_state.set_hp(target)  # type: ignore[attr-defined]
 
             # コンボ継続確率を減衰
             combo_chance *= COMBO_CHAIN_DECAY
 
         if combo_count > 0:
             combo_message = f"{combo_count}Combo {combo_total_damage}ダメージ!!"
-            self.logs.append(  # type: ignore[attr-defined]
-                BattleLog(
-                    timestamp=self.elapsed_time,  # type: ignore[attr-defined]
-                    actor_id=actor.id,
-                    action_type="MELEE_COMBO",
-                    target_id=target.id,
-                    damage=combo_total_damage,
-                    target_max_hp=target.max_hp,
-                    message=(
-                        f"{self._format_actor_name(actor)} の格闘コンボ！"  # type: ignore[attr-defined]
-                        f" {combo_message}"
-                    ),
-                    position_snapshot=snapshot,
-                    weapon_name=weapon.name if weapon else None,
-                    chatter=attack_chatter,
-                    combo_count=combo_count,
-                    combo_message=combo_message,
-                    velocity_snapshot=Vector3.from_numpy(
-                        self.unit_resources[str(actor.id)]["velocity_vec"]  # type: ignore[attr-defined]
-                    ),  # type: ignore[attr-defined]
-                )
+            self.logs.record(  # type: ignore[attr-defined]
+                timestamp=self.elapsed_time,  # type: ignore[attr-defined]
+                actor_id=actor.id,
+                action_type="MELEE_COMBO",
+                target_id=target.id,
+                damage=combo_total_damage,
+                target_max_hp=target.max_hp,
+                message=(
+                    f"{self._format_actor_name(actor)} の格闘コンボ！"  # type: ignore[attr-defined]
+                    f" {combo_message}"
+                ),
+                position_snapshot=snapshot,
+                weapon_name=weapon.name if weapon else None,
+                chatter=attack_chatter,
+                combo_count=combo_count,
+                combo_message=combo_message,
+                velocity_snapshot=self.unit_resources[str(actor.id)]["velocity_vec"],  # type: ignore[attr-defined]
             )
 
             if target.current_hp <= 0:
@@ -785,8 +928,8 @@ class CombatMixin:
             base_crit_rate += (crit_skill_level * 1.0) / 100.0  # +1% / Lv
 
         # パイロットステータス補正 (Phase E-2: 全ユニット対応)
-        _attacker_stats = self.unit_pilot_stats.get(str(actor.id), PilotStats())  # type: ignore[attr-defined]
-        _defender_stats = self.unit_pilot_stats.get(str(target.id), PilotStats())  # type: ignore[attr-defined]
+        _attacker_stats = self._unit_profile(actor).pilot_stats  # type: ignore[attr-defined]
+        _defender_stats = self._unit_profile(target).pilot_stats  # type: ignore[attr-defined]
         attacker_int = _attacker_stats.intel
         defender_tou_crit = _defender_stats.tou
         adjusted_crit_rate = calculate_critical_chance(
@@ -795,7 +938,7 @@ class CombatMixin:
             defender_tou=defender_tou_crit,
         )
 
-        is_crit = random.random() < adjusted_crit_rate
+        is_crit = self.rng.random() < adjusted_crit_rate  # type: ignore[attr-defined]
         if not is_crit:
             # シグモイドダメージ計算式 (Phase E-1)
             # キャッシュされた攻撃補正率・防御軽減率を参照する
@@ -856,7 +999,7 @@ class CombatMixin:
 
         weapon_type = getattr(weapon, "type", "PHYSICAL")
         if weapon_type == "BEAM":
-            resistance = getattr(target, "beam_resistance", 0.0)
+            resistance = self._unit_profile(target).beam_resistance  # type: ignore[attr-defined]
             if resistance > 0:
                 base_damage = int(base_damage * (1.0 - resistance))
                 if resistance >= 0.20:
@@ -864,7 +1007,7 @@ class CombatMixin:
                 else:
                     resistance_msg = f" {target.name}のビーム吸収コーティングをわずかに弾きながらも、"
         elif weapon_type == "PHYSICAL":
-            resistance = getattr(target, "physical_resistance", 0.0)
+            resistance = self._unit_profile(target).physical_resistance  # type: ignore[attr-defined]
             if resistance > 0:
                 base_damage = int(base_damage * (1.0 - resistance))
                 if resistance >= 0.20:
@@ -931,30 +1074,28 @@ class CombatMixin:
         else:
             miss_text = f" -> {target.name}に回避された！"
 
-        self.logs.append(  # type: ignore[attr-defined]
-            BattleLog(
-                timestamp=self.elapsed_time,  # type: ignore[attr-defined]
-                actor_id=actor.id,
-                action_type="MISS",
-                target_id=target.id,
-                message=f"{log_base}{miss_text}",
-                position_snapshot=snapshot,
-                chatter=attack_chatter or miss_chatter,
-                skill_activated=True if skill_activated else None,
-                heading=self.unit_resources[str(actor.id)].get("body_heading_deg"),  # type: ignore[attr-defined]
-                velocity_snapshot=Vector3.from_numpy(
-                    self.unit_resources[str(actor.id)]["velocity_vec"]  # type: ignore[attr-defined]
-                ),  # type: ignore[attr-defined]
-            )
+        self.logs.record(  # type: ignore[attr-defined]
+            timestamp=self.elapsed_time,  # type: ignore[attr-defined]
+            actor_id=actor.id,
+            action_type="MISS",
+            target_id=target.id,
+            message=f"{log_base}{miss_text}",
+            position_snapshot=snapshot,
+            chatter=attack_chatter or miss_chatter,
+            skill_activated=True if skill_activated else None,
+            heading=self.unit_resources[str(actor.id)].get("body_heading_deg"),  # type: ignore[attr-defined]
+            velocity_snapshot=self.unit_resources[str(actor.id)]["velocity_vec"],  # type: ignore[attr-defined]
         )
 
     def _process_destruction(self, target: MobileSuit) -> None:
         """撃破時の処理."""
         target.current_hp = 0
+        self._unit_state.set_hp(target)  # type: ignore[attr-defined]
 
         # ステータスを DESTROYED に更新 (Phase 3-3)
         target_id = str(target.id)
         self.unit_resources[target_id]["status"] = "DESTROYED"  # type: ignore[attr-defined]
+        self._unit_state.set_status(target, "DESTROYED")  # type: ignore[attr-defined]
 
         # 撃破時のセリフ生成
         destroyed_chatter = self._generate_chatter(target, "destroyed")  # type: ignore[attr-defined]
@@ -966,15 +1107,13 @@ class CombatMixin:
                 f" ★【エース撃破】{getattr(target, 'pilot_name', 'Unknown')}を撃破！"
             )
 
-        self.logs.append(  # type: ignore[attr-defined]
-            BattleLog(
-                timestamp=self.elapsed_time,  # type: ignore[attr-defined]
-                actor_id=target.id,
-                action_type="DESTROYED",
-                message=f"{self._format_actor_name(target)} は爆散した...{ace_msg}",  # type: ignore[attr-defined]
-                position_snapshot=target.position,
-                chatter=destroyed_chatter,
-            )
+        self.logs.record(  # type: ignore[attr-defined]
+            timestamp=self.elapsed_time,  # type: ignore[attr-defined]
+            actor_id=target.id,
+            action_type="DESTROYED",
+            message=f"{self._format_actor_name(target)} は爆散した...{ace_msg}",  # type: ignore[attr-defined]
+            position_snapshot=self._unit_pos(target),  # type: ignore[attr-defined]
+            chatter=destroyed_chatter,
         )
         # 勝利判定 (ACTIVE な生存ユニットのteam_idの種類が1つ以下なら戦闘終了)
         active_teams = {
@@ -10,7 +10,6 @@
 モンテカルロモード: 決定論値をもとに実際に random 判定を N 回試行し、統計値を返す。
 """
 
-import random
 from dataclasses import dataclass
 
 from app.engine.calculator import (
@@ -21,6 +20,7 @@ from app.engine.calculator import (
 )
 from app.engine.combat import CombatMixin, _sigmoid_attack, _sigmoid_defense
 from app.engine.constants import SECTOR_ACCURACY_MODIFIERS, SECTOR_DAMAGE_MODIFIERS
+from app.engine.random_source import make_random_source
 from app.models.models import MasterMobileSuitSpec, Weapon
 
 BASE_CRIT_RATE = 0.05
@@ -143,24 +143,27 @@ def run_monte_carlo_combat_stats(
     attacker_pilot: PilotStats,
     defender_pilot: PilotStats,
     trials: int,
+    seed: int | None = None,
 ) -> MonteCarloCombatResult:
     """決定論値をもとに実際の乱数判定をN回試行し、統計を集計する.
 
     `combat.py` の `_process_attack` / `_process_hit` と同一の判定順序
     （命中判定 → クリティカル判定 → ダメージ乱数変動）で乱数を消費する。
+    seed を指定すると同じ入力から同じ統計値を再現できる（省略時はグローバル乱数）。
     """
+    rng = make_random_source(seed)
     hit_count = 0
     crit_count = 0
     perfect_evade_count = 0
     damages: list[int] = []
 
     for _ in range(trials):
-        roll = random.uniform(0, 100)
+        roll = rng.uniform(0, 100)
         if roll > deterministic.hit_chance:
             continue
         hit_count += 1
 
-        is_crit = random.random() < (deterministic.crit_chance / 100.0)
+        is_crit = rng.random() < (deterministic.crit_chance / 100.0)
         base_damage = (
             deterministic.crit_damage
             if is_crit
@@ -176,6 +179,7 @@ def run_monte_carlo_combat_stats(
             defender_dex=0,
             defender_tou=defender_pilot.tou,
             defender_luk=defender_pilot.luk,
+            rng=rng,
         )
         if perfect_evade:
             perfect_evade_count += 1
@@ -1,10 +1,18 @@
 """Constants for battle simulation."""
 
+import tempfile
 from pathlib import Path
 
 # ファジィルール JSON ディレクトリ (Phase 5-2)
 FUZZY_RULES_DIR: Path = Path(__file__).parent.parent.parent / "data" / "fuzzy_rules"
 
+# ファジィ推論ルックアップテーブル（fuzzy_lut.py）
+# 隣り合うメンバーシップ関数の折れ点の間に追加する格子点の数
+# （1 にすると武器選択レイヤーのテーブルが約 500 万点になるため既定は折れ点のみ）
+FUZZY_LUT_SUBDIVISIONS: int = 0
+# 構築したテーブルのディスクキャッシュ先（ルール JSON のハッシュをキーにする）
+FUZZY_LUT_CACHE_DIR: Path = Path(tempfile.gettempdir()) / "msbs_fuzzy_lut"
+
 # 地形適正による補正係数
 TERRAIN_ADAPTABILITY_MODIFIERS = {
     "S": 1.2,
@@ -46,6 +54,30 @@ VALID_STRATEGY_MODES: frozenset[str] = frozenset(
     {"AGGRESSIVE", "DEFENSIVE", "SNIPER", "ASSAULT", "RETREAT"}
 )
 
+# バトルログの出力レベル（BattleSimulator(log_level=...)）
+# - DIGEST: 勝敗・撃破数・ダイジェスト集計に必要なログのみ（ATTACK / MISS 等）
+# - REPLAY: リプレイ表示に必要なログ（AI_DECISION と fuzzy_scores を除く全ログ）
+# - DEBUG: 全ログ + fuzzy_scores（従来の挙動・デフォルト）
+LOG_LEVEL_DIGEST: str = "DIGEST"
+LOG_LEVEL_REPLAY: str = "REPLAY"
+LOG_LEVEL_DEBUG: str = "DEBUG"
+LOG_LEVEL_RANKS: dict[str, int] = {
+    LOG_LEVEL_DIGEST: 0,
+    LOG_LEVEL_REPLAY: 1,
+    LOG_LEVEL_DEBUG: 2,
+}
+# action_type ごとの出力に必要な最低レベル（未記載の action_type は REPLAY）
+LOG_ACTION_TYPE_LEVELS: dict[str, str] = {
+    # analyze_battle_logs（撃破数・ダイジェスト集計）/ 撤退判定が参照するログ
+    "ATTACK": LOG_LEVEL_DIGEST,
+    "MELEE_COMBO": LOG_LEVEL_DIGEST,
+    "MISS": LOG_LEVEL_DIGEST,
+    "DESTROYED": LOG_LEVEL_DIGEST,
+    "RETREAT_COMPLETE": LOG_LEVEL_DIGEST,
+    # ファジィ推論の判断過程（保存・リプレイでは参照されない）
+    "AI_DECISION": LOG_LEVEL_DEBUG,
+}
+
 # ユニット種別ごとの慣性パラメータデフォルト値 (Phase 3-1)
 INERTIA_DEFAULTS: dict[str, dict[str, float]] = {
     "NORMAL_MS": {
@@ -201,6 +233,15 @@ MIN_SHRUNK_FIELD_SIZE: float = MIN_FIELD_SIZE
 # （決着直前の不自然な圧縮を避けるため）
 SHRINK_PAUSE_ALIVE_THRESHOLD: int = 1
 
+# 適応ステップ幅・膠着判定定数（BattleSimulator の adaptive_stepping / stalemate_steps）
+# どのチームも敵を発見しておらず、最大接近速度で近づいても索敵・射程圏に入らない間は
+# 複数ステップ分の dt を1ステップにまとめる。まとめる上限は障害物の斥力が効く
+# 移動量（ブースト時 160m/s × 0.5s = 80m）に収まるよう 0.5s 相当に抑える。
+ADAPTIVE_STEP_MAX_SPAN: int = 5  # 1ステップにまとめる基準ステップ数の上限
+# HP の変化もエリア収縮も無いまま経過したらその時点で引き分けとして終了する
+# ステップ数（dt=0.1s換算で60秒。エリア収縮が下限到達・停止済みの場合のみ）
+STALEMATE_NO_DAMAGE_STEPS: int = 600
+
 # ブーストダッシュシステム定数 (Phase B)
 MELEE_RANGE: float = 50.0  # 近接攻撃有効距離 (m)
 MELEE_BOOST_ARRIVAL_RANGE: float = (
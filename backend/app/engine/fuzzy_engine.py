@@ -17,10 +17,13 @@ import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
+if TYPE_CHECKING:
+    from app.engine.fuzzy_lut import FuzzyLookupTable
+
 
 def _file_hash(path: Path) -> str:
     """ファイルの SHA-256 ハッシュを返す.
@@ -57,6 +60,10 @@ class MembershipFunction(ABC):
     def support_range(self) -> tuple[float, float]:
         """メンバーシップ関数が非ゼロになる範囲 [min, max] を返す."""
 
+    @abstractmethod
+    def breakpoints(self) -> tuple[float, ...]:
+        """メンバーシップ度が区分線形に折れ曲がる点（パラメータ）を返す."""
+
     @abstractmethod
     def evaluate_array(self, x: np.ndarray) -> np.ndarray:
         """`evaluate()` のベクトル化版（重心デファジフィケーションの数値積分用）.
@@ -100,6 +107,10 @@ class TriangleMF(MembershipFunction):
         """メンバーシップ関数が非ゼロになる範囲 [min, max] を返す."""
         return (self.a, self.c)
 
+    def breakpoints(self) -> tuple[float, ...]:
+        """メンバーシップ度が区分線形に折れ曲がる点（パラメータ）を返す."""
+        return (self.a, self.b, self.c)
+
     def evaluate_array(self, x: np.ndarray) -> np.ndarray:
         """三角形メンバーシップ関数のベクトル化評価."""
         a, b, c = self.a, self.b, self.c
@@ -147,6 +158,10 @@ class TrapezoidMF(MembershipFunction):
         """メンバーシップ関数が非ゼロになる範囲 [min, max] を返す."""
         return (self.a, self.d)
 
+    def breakpoints(self) -> tuple[float, ...]:
+        """メンバーシップ度が区分線形に折れ曲がる点（パラメータ）を返す."""
+        return (self.a, self.b, self.c, self.d)
+
     def evaluate_array(self, x: np.ndarray) -> np.ndarray:
         """台形メンバーシップ関数のベクトル化評価."""
         a, b, c, d = self.a, self.b, self.c, self.d
@@ -439,6 +454,404 @@ def _defuzzify_centroid(
     return result
 
 
+# ---------------------------------------------------------------------------
+# コンパイル済みルールセット（推論ホットパス用の配列表現）
+# ---------------------------------------------------------------------------
+
+
+class _CompiledOutput:
+    """単一出力変数のデファジフィケーション用データ.
+
+    重心法の積分グリッドは「発火中の集合の組み合わせ」で決まるため、
+    発火集合のビットマスクごとにグリッドと各集合のサンプル値を初回に計算して
+    キャッシュする（同一マスクでは `_centroid_for_variable()` と同一の配列を
+    再利用するため、結果はビット単位で一致する）。
+    """
+
+    def __init__(
+        self,
+        variable: str,
+        mf_sets: dict[str, MembershipFunction],
+        key_index: list[int],
+    ) -> None:
+        """出力変数の MF 群と、各集合に対応する出力キー番号から初期化する."""
+        self.variable = variable
+        self.mfs: tuple[MembershipFunction, ...] = tuple(mf_sets.values())
+        self.supports: tuple[tuple[float, float], ...] = tuple(
+            mf.support_range() for mf in self.mfs
+        )
+        # 集合ごとの活性化度配列上の位置（ルール出力に現れない集合はゼロ枠）
+        self.key_index: np.ndarray = np.array(key_index, dtype=np.intp)
+        # {発火マスク: (x_min, xs, 発火集合のサンプル値 (k, R), 発火集合の番号)}
+        self._grids: dict[
+            int, tuple[float, np.ndarray | None, np.ndarray | None, np.ndarray]
+        ] = {}
+
+    def _grid(
+        self, mask: int
+    ) -> tuple[float, np.ndarray | None, np.ndarray | None, np.ndarray]:
+        """発火マスクに対応する積分グリッドとサンプル済み MF を返す."""
+        cached = self._grids.get(mask)
+        if cached is not None:
+            return cached
+        firing = [i for i in range(len(self.mfs)) if mask >> i & 1]
+        x_min = min(self.supports[i][0] for i in firing)
+        x_max = max(self.supports[i][1] for i in firing)
+        firing_idx = np.array(firing, dtype=np.intp)
+        if x_min >= x_max:
+            entry: tuple[float, np.ndarray | None, np.ndarray | None, np.ndarray] = (
+                x_min,
+                None,
+                None,
+                firing_idx,
+            )
+        else:
+            step = (x_max - x_min) / _DEFUZZ_RESOLUTION
+            xs = x_min + (np.arange(_DEFUZZ_RESOLUTION) + 0.5) * step
+            samples = np.array([self.mfs[i].evaluate_array(xs) for i in firing])
+            entry = (x_min, xs, samples, firing_idx)
+        self._grids[mask] = entry
+        return entry
+
+    def centroid(self, activations: np.ndarray) -> float | None:
+        """出力キーごとの活性化度配列から重心を求める. 面積ゼロなら None."""
+        set_acts = activations[self.key_index]
+        mask = 0
+        for i, act in enumerate(set_acts.tolist()):
+            if act > 0.0:
+                mask |= 1 << i
+        if mask == 0:
+            return None
+        x_min, xs, samples, firing_idx = self._grid(mask)
+        if xs is None or samples is None:
+            return x_min
+        clipped = np.minimum(samples, set_acts[firing_idx][:, None])
+        mu_combined = clipped.max(axis=0, initial=0.0)
+        area_sum = float(mu_combined.sum())
+        if area_sum <= 0.0:
+            return None
+        return float(np.dot(xs, mu_combined)) / area_sum
+
+    def centroid_batch(self, activations: np.ndarray) -> np.ndarray:
+        """`centroid()` の一括版. 行ごとの重心を返す（面積ゼロの行は NaN）.
+
+        発火マスクが同じ行は同じグリッド・サンプル値を共有するため、マスクごとに
+        まとめてクリッピング合成する。重み付き和は行ごとに `centroid()` と同じ
+        `np.dot` で求め（行列積は BLAS の加算順が異なり末尾ビットがずれる）、
+        単発推論と結果をビット単位で一致させる。
+        """
+        set_acts = activations[:, self.key_index]
+        weights = 1 << np.arange(len(self.mfs), dtype=np.int64)
+        masks = (set_acts > 0.0).astype(np.int64) @ weights
+        out = np.full(len(set_acts), np.nan)
+        for mask in np.unique(masks).tolist():
+            if mask == 0:
+                continue
+            rows = np.flatnonzero(masks == mask)
+            x_min, xs, samples, firing_idx = self._grid(mask)
+            if xs is None or samples is None:
+                out[rows] = x_min
+                continue
+            clipped = np.minimum(
+                samples[None, :, :], set_acts[rows][:, firing_idx][:, :, None]
+            )
+            mu_combined = clipped.max(axis=1, initial=0.0)
+            area_sums = mu_combined.sum(axis=1).tolist()
+            for i, row in enumerate(rows.tolist()):
+                if area_sums[i] > 0.0:
+                    out[row] = float(np.dot(xs, mu_combined[i])) / area_sums[i]
+        return out
+
+
+class CompiledRuleSet:
+    """`FuzzyRuleSet` を推論用の配列表現へ変換したもの.
+
+    行動・ターゲット選択・武器選択の各エンジンはユニット×候補×ステップの
+    回数だけ呼ばれるため、辞書ベースの `_fuzzify` / `_evaluate_rules` /
+    `_centroid_for_variable` が毎回行っていた処理を構築時に前計算する。
+
+    - 入力変数ごとのクランプ範囲（全集合の support_range の外端）
+    - 全 (変数, 集合) を通し番号の「スロット」に割り当てたメンバーシップ度配列と、
+      ルール前件をスロット番号で表したインデックス行列
+    - 出力 MF の重心積分グリッド上のサンプル値（`_CompiledOutput`）
+
+    推論結果（活性化度・デファジ値・辞書のキー順）は辞書ベースの実装と一致する。
+    """
+
+    def __init__(self, rule_set: FuzzyRuleSet) -> None:
+        """ルールセットをコンパイルする.
+
+        Args:
+            rule_set: コンパイル対象のルールセット
+        """
+        # --- 変数・集合のスロット割り当てとクランプ範囲 ---
+        self.variables: list[str] = []
+        self._var_index: dict[str, int] = {}
+        self._var_mfs: list[tuple[tuple[str, MembershipFunction], ...]] = []
+        self._var_bounds: list[tuple[float, float]] = []
+        self._var_offsets: list[int] = []
+        slot_index: dict[tuple[str, str], int] = {}
+        n_slots = 0
+        for var, mf_sets in rule_set.membership_functions.items():
+            if not mf_sets:
+                continue
+            self._var_index[var] = len(self.variables)
+            self.variables.append(var)
+            self._var_mfs.append(tuple(mf_sets.items()))
+            self._var_bounds.append(
+                (
+                    min(mf.support_range()[0] for mf in mf_sets.values()),
+                    max(mf.support_range()[1] for mf in mf_sets.values()),
+                )
+            )
+            self._var_offsets.append(n_slots)
+            for set_name in mf_sets:
+                slot_index[(var, set_name)] = n_slots
+                n_slots += 1
+        # 末尾は未定義集合を参照する条件用の常時 0.0 スロット
+        self._zero_slot = n_slots
+        self._n_slots = n_slots + 1
+
+        # --- ルール前件のインデックス行列 ---
+        # 条件数が少ないルールは先頭条件を繰り返して埋める（min / max は冪等）
+        rules = [
+            r
+            for r in rule_set.rules
+            if r.conditions and all(c.variable in self._var_index for c in r.conditions)
+        ]
+        width = max((len(r.conditions) for r in rules), default=1)
+        cond_slots = np.zeros((len(rules), width), dtype=np.intp)
+        cond_vars = np.zeros((len(rules), width), dtype=np.intp)
+        self._keys: list[tuple[str, str]] = []
+        key_lookup: dict[tuple[str, str], int] = {}
+        rule_keys: list[int] = []
+        for r_idx, rule in enumerate(rules):
+            conds = list(rule.conditions) + [rule.conditions[0]] * (
+                width - len(rule.conditions)
+            )
+            for c_idx, cond in enumerate(conds):
+                cond_slots[r_idx, c_idx] = slot_index.get(
+                    (cond.variable, cond.set), self._zero_slot
+                )
+                cond_vars[r_idx, c_idx] = self._var_index[cond.variable]
+            key = (rule.output.variable, rule.output.set)
+            if key not in key_lookup:
+                key_lookup[key] = len(self._keys)
+                self._keys.append(key)
+            rule_keys.append(key_lookup[key])
+        self._cond_slots = cond_slots
+        self._cond_vars = cond_vars
+        self._is_and = np.array([r.operator == "AND" for r in rules], dtype=bool)
+        self._weights = np.array([r.weight for r in rules], dtype=float)
+        self._rule_keys: list[int] = rule_keys
+        # (出力キー, ルール) の所属行列（最大推論法の集約用）
+        self._key_rule_mask = np.zeros((len(self._keys), len(rules)), dtype=bool)
+        self._key_rule_mask[rule_keys, np.arange(len(rules))] = True
+        self._all_keys: list[int] = list(range(len(self._keys)))
+
+        # --- 出力変数 ---
+        zero_key = len(self._keys)
+        self._outputs: dict[str, _CompiledOutput] = {}
+        for var, _ in self._keys:
+            out_sets = rule_set.membership_functions.get(var)
+            if var in self._outputs or not out_sets:
+                continue
+            self._outputs[var] = _CompiledOutput(
+                var,
+                out_sets,
+                [key_lookup.get((var, set_name), zero_key) for set_name in out_sets],
+            )
+
+    def fuzzify(self, inputs: dict[str, float]) -> tuple[list[float], list[bool]]:
+        """入力値をスロット順のメンバーシップ度リストに変換する.
+
+        Args:
+            inputs: {変数名: 数値}
+
+        Returns:
+            (スロット順のメンバーシップ度, 変数ごとの入力有無)
+        """
+        mu = [0.0] * self._n_slots
+        present = [False] * len(self.variables)
+        for v_idx, var in enumerate(self.variables):
+            if var not in inputs:
+                continue
+            present[v_idx] = True
+            lo, hi = self._var_bounds[v_idx]
+            x_clamped = max(lo, min(hi, inputs[var]))
+            slot = self._var_offsets[v_idx]
+            for _, mf in self._var_mfs[v_idx]:
+                mu[slot] = mf.evaluate(x_clamped)
+                slot += 1
+        return mu, present
+
+    def fire(
+        self, mu: list[float], present: list[bool]
+    ) -> tuple[np.ndarray, list[int]]:
+        """全ルールを一括評価し、出力キーごとの活性化度を求める.
+
+        Args:
+            mu: `fuzzify()` が返したメンバーシップ度
+            present: `fuzzify()` が返した変数ごとの入力有無
+
+        Returns:
+            (出力キーごとの活性化度（末尾はゼロ枠）, 発火対象となった出力キー番号を
+            辞書ベース実装の挿入順に並べたリスト)
+        """
+        n_keys = len(self._keys)
+        activations = np.zeros(n_keys + 1)
+        if not n_keys:
+            return activations, []
+        values = np.array(mu)[self._cond_slots]
+        strengths = (
+            np.where(self._is_and, values.min(axis=1), values.max(axis=1))
+            * self._weights
+        )
+        if all(present):
+            keys = self._all_keys
+        else:
+            # 入力が欠けている変数を参照するルールはスキップする
+            valid = np.array(present)[self._cond_vars].all(axis=1)
+            strengths = np.where(valid, strengths, 0.0)
+            keys = []
+            for r_idx in np.flatnonzero(valid).tolist():
+                key = self._rule_keys[r_idx]
+                if key not in keys:
+                    keys.append(key)
+        activations[:n_keys] = np.where(self._key_rule_mask, strengths, 0.0).max(
+            axis=1, initial=0.0
+        )
+        return activations, keys
+
+    def fuzzify_batch(
+        self, inputs: dict[str, np.ndarray], n: int
+    ) -> tuple[np.ndarray, list[bool]]:
+        """`fuzzify()` の一括版. 行ごとのメンバーシップ度行列 (n, スロット数) を返す."""
+        mu = np.zeros((n, self._n_slots))
+        present = [False] * len(self.variables)
+        for v_idx, var in enumerate(self.variables):
+            if var not in inputs:
+                continue
+            present[v_idx] = True
+            lo, hi = self._var_bounds[v_idx]
+            x_clamped = np.clip(np.asarray(inputs[var], dtype=float), lo, hi)
+            slot = self._var_offsets[v_idx]
+            for _, mf in self._var_mfs[v_idx]:
+                mu[:, slot] = mf.evaluate_array(x_clamped)
+                slot += 1
+        return mu, present
+
+    def fire_batch(
+        self, mu: np.ndarray, present: list[bool]
+    ) -> tuple[np.ndarray, list[int]]:
+        """`fire()` の一括版. 行ごとの活性化度行列 (n, 出力キー数 + 1) を返す."""
+        n_keys = len(self._keys)
+        activations = np.zeros((len(mu), n_keys + 1))
+        if not n_keys:
+            return activations, []
+        values = mu[:, self._cond_slots]
+        strengths = (
+            np.where(self._is_and, values.min(axis=2), values.max(axis=2))
+            * self._weights
+        )
+        if all(present):
+            keys = self._all_keys
+        else:
+            valid = np.array(present)[self._cond_vars].all(axis=1)
+            strengths = np.where(valid, strengths, 0.0)
+            keys = []
+            for r_idx in np.flatnonzero(valid).tolist():
+                key = self._rule_keys[r_idx]
+                if key not in keys:
+                    keys.append(key)
+        activations[:, :n_keys] = np.where(
+            self._key_rule_mask[None, :, :], strengths[:, None, :], 0.0
+        ).max(axis=2, initial=0.0)
+        return activations, keys
+
+    def fuzzified_dict(
+        self, mu: list[float], present: list[bool]
+    ) -> dict[str, dict[str, float]]:
+        """メンバーシップ度を `_fuzzify()` と同じ辞書形式へ変換する（デバッグ用）."""
+        fuzzified: dict[str, dict[str, float]] = {}
+        for v_idx, var in enumerate(self.variables):
+            if not present[v_idx]:
+                continue
+            offset = self._var_offsets[v_idx]
+            fuzzified[var] = {
+                set_name: mu[offset + i]
+                for i, (set_name, _) in enumerate(self._var_mfs[v_idx])
+            }
+        return fuzzified
+
+    def activations_dict(
+        self, activations: np.ndarray, keys: list[int]
+    ) -> dict[str, dict[str, float]]:
+        """活性化度を `_evaluate_rules()` と同じ辞書形式へ変換する."""
+        values = activations.tolist()
+        result: dict[str, dict[str, float]] = {}
+        for key in keys:
+            var, set_name = self._keys[key]
+            result.setdefault(var, {})[set_name] = values[key]
+        return result
+
+    def defuzzify(self, activations: np.ndarray, keys: list[int]) -> dict[str, float]:
+        """重心法でデファジフィケーションを実行する（`_defuzzify_centroid()` 相当）."""
+        result: dict[str, float] = {}
+        seen: set[str] = set()
+        for key in keys:
+            var = self._keys[key][0]
+            if var in seen:
+                continue
+            seen.add(var)
+            output = self._outputs.get(var)
+            if output is None:
+                continue
+            value = output.centroid(activations)
+            if value is not None:
+                result[var] = value
+        return result
+
+    def defuzzify_batch(
+        self, activations: np.ndarray, keys: list[int]
+    ) -> dict[str, np.ndarray]:
+        """`defuzzify()` の一括版. 値が得られない行は NaN とする."""
+        result: dict[str, np.ndarray] = {}
+        for key in keys:
+            var = self._keys[key][0]
+            output = self._outputs.get(var)
+            if output is None or var in result:
+                continue
+            result[var] = output.centroid_batch(activations)
+        return result
+
+    @property
+    def output_variables(self) -> list[str]:
+        """デファジフィケーション対象の出力変数名."""
+        return list(self._outputs)
+
+    @property
+    def input_variables(self) -> list[str]:
+        """ルールの前件で参照される入力変数名（変数の登録順）."""
+        used = set(self._cond_vars.ravel().tolist())
+        return [var for v_idx, var in enumerate(self.variables) if v_idx in used]
+
+    def variable_bounds(self, var: str) -> tuple[float, float]:
+        """入力変数のクランプ範囲（全集合の support_range の外端）を返す."""
+        return self._var_bounds[self._var_index[var]]
+
+    def variable_breakpoints(self, var: str) -> list[float]:
+        """入力変数の全集合の折れ点をクランプ範囲内で昇順・重複なしで返す.
+
+        各集合のメンバーシップ度は隣り合う折れ点の間で線形になる。
+        """
+        lo, hi = self.variable_bounds(var)
+        points = {lo, hi}
+        for _, mf in self._var_mfs[self._var_index[var]]:
+            points.update(p for p in mf.breakpoints() if lo <= p <= hi)
+        return sorted(points)
+
+
 # ---------------------------------------------------------------------------
 # FuzzyEngine（メインクラス）
 # ---------------------------------------------------------------------------
@@ -448,6 +861,7 @@ class FuzzyEngine:
     """ファジィ推論エンジン.
 
     ルールセット（FuzzyRuleSet）をもとに、入力辞書から出力辞書を推論する。
+    推論は構築時にコンパイルした `CompiledRuleSet` で行う。
 
     Args:
         rule_set: ロード済みのルールセット
@@ -462,6 +876,10 @@ class FuzzyEngine:
         """初期化."""
         self.rule_set = rule_set
         self._default_output: dict[str, float] = default_output or {}
+        self._compiled = CompiledRuleSet(rule_set)
+        # ルックアップテーブルモード（fuzzy_lut.py）。設定時は infer / infer_batch を
+        # 事前サンプリングした出力面の補間で近似する
+        self.lookup_table: FuzzyLookupTable | None = None
 
     @classmethod
     def from_json(
@@ -481,9 +899,38 @@ class FuzzyEngine:
         rule_set = FuzzyRuleSet.from_json(path)
         return cls(rule_set=rule_set, default_output=default_output)
 
+    @property
+    def compiled(self) -> CompiledRuleSet:
+        """推論に使うコンパイル済みルールセット."""
+        return self._compiled
+
+    @property
+    def default_output(self) -> dict[str, float]:
+        """全ルール不発火時のデフォルト出力."""
+        return dict(self._default_output)
+
     def infer(self, inputs: dict[str, float]) -> dict[str, float]:
         """ファジィ推論を実行し、デファジフィケーション結果を返す.
 
+        ルックアップテーブルが設定されている場合はテーブルの補間値を返す
+        （テーブルで近似できない入力は `infer_exact()` にフォールバックする）。
+
+        Args:
+            inputs: {入力変数名: 数値}
+
+        Returns:
+            {出力変数名: 数値}
+        """
+        table = self.lookup_table
+        if table is not None:
+            result = table.lookup(inputs)
+            if result is not None:
+                return result
+        return self.infer_exact(inputs)
+
+    def infer_exact(self, inputs: dict[str, float]) -> dict[str, float]:
+        """ルックアップテーブルを使わずにファジィ推論を実行する.
+
         処理の流れ:
         1. ファジフィケーション（入力値 → メンバーシップ度）
         2. ルール評価（メンバーシップ度 → 出力集合の活性化度）
@@ -496,17 +943,19 @@ class FuzzyEngine:
         Returns:
             {出力変数名: 数値}
         """
+        compiled = self._compiled
+
         # 1. ファジフィケーション
-        fuzzified = _fuzzify(inputs, self.rule_set.membership_functions)
+        mu, present = compiled.fuzzify(inputs)
 
         # 2. ルール評価
-        activations = _evaluate_rules(fuzzified, self.rule_set.rules)
+        activations, keys = compiled.fire(mu, present)
 
-        if not activations:
+        if not keys:
             return dict(self._default_output)
 
         # 3. デファジフィケーション（重心法）
-        result = _defuzzify_centroid(activations, self.rule_set.membership_functions)
+        result = compiled.defuzzify(activations, keys)
 
         # 4. デファジ結果が空（出力変数のMFが未定義など）の場合はデフォルト出力
         if not result:
@@ -514,6 +963,106 @@ class FuzzyEngine:
 
         return result
 
+    def infer_activations(
+        self, inputs: dict[str, float]
+    ) -> dict[str, dict[str, float]]:
+        """ルール評価までを実行し、出力集合ごとの活性化度のみを返す.
+
+        行動選択レイヤーのように活性化度の最大ラベルだけを使う呼び出し元向けに、
+        重心デファジフィケーションを省略する。戻り値は `infer_with_debug()` の
+        `debug["activations"]` と同一（キー順を含む）。
+
+        Args:
+            inputs: {入力変数名: 数値}
+
+        Returns:
+            {出力変数名: {集合名: 活性化度}}
+        """
+        compiled = self._compiled
+        mu, present = compiled.fuzzify(inputs)
+        activations, keys = compiled.fire(mu, present)
+        return compiled.activations_dict(activations, keys)
+
+    @staticmethod
+    def max_activation(
+        activations: dict[str, dict[str, float]], variable: str
+    ) -> str | None:
+        """出力変数の中で活性化度が最大の集合名を返す（同値は先に登録された集合）.
+
+        Args:
+            activations: `infer_activations()` の戻り値
+            variable: 出力変数名
+
+        Returns:
+            最大活性化度の集合名。その出力変数に発火対象のルールが無い場合は None。
+        """
+        set_activations = activations.get(variable)
+        if not set_activations:
+            return None
+        return max(set_activations, key=lambda k: set_activations[k])
+
+    def infer_batch(self, inputs: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        """複数の入力ベクトルに対してファジィ推論を一括実行する.
+
+        ルックアップテーブルが設定されている場合はテーブルの補間値を返し、
+        テーブルで近似できない要素のみ `infer_batch_exact()` で推論する。
+
+        Args:
+            inputs: {入力変数名: 候補ごとの数値配列}（全配列は同じ長さ）
+
+        Returns:
+            {出力変数名: 候補ごとの数値配列}
+        """
+        table = self.lookup_table
+        if table is not None:
+            result = table.lookup_batch(inputs)
+            if result is not None:
+                values, inexact = result
+                if inexact.any():
+                    exact = self.infer_batch_exact(
+                        {var: np.asarray(x)[inexact] for var, x in inputs.items()}
+                    )
+                    for var, column in values.items():
+                        column[inexact] = exact[var]
+                return values
+        return self.infer_batch_exact(inputs)
+
+    def infer_batch_exact(self, inputs: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        """ルックアップテーブルを使わずにファジィ推論を一括実行する.
+
+        ターゲット・武器選択のように候補ごとに `infer()` を呼ぶ箇所向けに、
+        ファジフィケーション・ルール評価・デファジフィケーションを候補数ぶんの
+        配列演算で行う。各要素の値は同じ入力で `infer()` を呼んだ結果と一致する。
+
+        Args:
+            inputs: {入力変数名: 候補ごとの数値配列}（全配列は同じ長さ）
+
+        Returns:
+            {出力変数名: 候補ごとの数値配列}。ルールセットの全出力変数と
+            デフォルト出力のキーを含む。`infer()` の結果にその変数が含まれない
+            要素は NaN、`infer()` がデフォルト出力を返す要素はデフォルト値になる。
+        """
+        n = len(next(iter(inputs.values()))) if inputs else 0
+        compiled = self._compiled
+        mu, present = compiled.fuzzify_batch(inputs, n)
+        activations, keys = compiled.fire_batch(mu, present)
+        defuzzified = compiled.defuzzify_batch(activations, keys)
+
+        result = {
+            var: defuzzified.get(var, np.full(n, np.nan))
+            for var in compiled.output_variables
+        }
+        if self._default_output:
+            # デファジ結果が1つも得られない要素はデフォルト出力で置き換える
+            empty = np.ones(n, dtype=bool)
+            for values in defuzzified.values():
+                empty &= np.isnan(values)
+            for var, default in self._default_output.items():
+                values = result.get(var, np.full(n, np.nan)).copy()
+                values[empty] = default
+                result[var] = values
+        return result
+
     def infer_with_debug(
         self, inputs: dict[str, float]
     ) -> tuple[dict[str, float], dict[str, Any]]:
@@ -525,18 +1074,19 @@ class FuzzyEngine:
         Returns:
             (デファジフィケーション結果, デバッグ情報辞書)
         """
-        fuzzified = _fuzzify(inputs, self.rule_set.membership_functions)
-        activations = _evaluate_rules(fuzzified, self.rule_set.rules)
+        compiled = self._compiled
+        mu, present = compiled.fuzzify(inputs)
+        activations, keys = compiled.fire(mu, present)
 
         debug: dict[str, Any] = {
-            "fuzzified": fuzzified,
-            "activations": activations,
+            "fuzzified": compiled.fuzzified_dict(mu, present),
+            "activations": compiled.activations_dict(activations, keys),
         }
 
-        if not activations:
+        if not keys:
             return dict(self._default_output), debug
 
-        result = _defuzzify_centroid(activations, self.rule_set.membership_functions)
+        result = compiled.defuzzify(activations, keys)
 
         if not result:
             return dict(self._default_output), debug
@@ -0,0 +1,453 @@
+# backend/app/engine/fuzzy_lut.py
+"""ファジィ推論の出力面を事前サンプリングしたルックアップテーブル.
+
+ターゲット選択・武器選択レイヤーは有界な少数の入力の純関数であり、バトル中に
+候補数×ユニット数×ステップ数だけ推論される。`FuzzyLookupTable` は入力空間の
+格子上で `FuzzyEngine.infer_batch_exact()` の出力を事前に計算しておき、推論を
+多重線形補間（格子セルの 2^d 頂点の補間）で近似する。
+
+格子の軸は入力変数ごとに、全集合のメンバーシップ関数の折れ点（各集合の
+メンバーシップ度が線形になる区間の境界）に、隣り合う折れ点の間を
+`subdivisions` 等分する点を加えたもの。`target_attack_power`（0〜9999）のように
+値域の一部にだけ折れ点が集中する変数でも、等間隔格子より少ない点数で近似できる。
+
+格子は全折れ点を含むため、各セル内で各メンバーシップ度は線形であり、どのルールも
+「セル内部全体で発火する」か「全く発火しない」かのどちらかになる。全ルールが
+不発火の領域ではデフォルト出力になり、発火し始めた瞬間に重心値へ不連続に
+跳ぶため、頂点間で発火の有無が分かれるセル（混在セル）は補間しない。
+ただし入力がセルの面上にある（補間係数が 0 または 1 の変数がある）場合は、
+重みが 0 でない頂点だけで発火の有無を判定する。真偽値の入力（0/1）は常に
+格子点上にあるため、この判定が無いと多くの入力が混在セル扱いになる。
+
+次の場合は近似せず、呼び出し側（`FuzzyEngine`）が厳密推論にフォールバックする:
+    - ルールが参照する入力変数が欠けている（欠損時はルールの発火条件が変わる）
+    - ルールが参照しない変数（出力変数など）が入力に含まれている
+    - 入力が混在セルに入り、重みを持つ頂点間で発火の有無が分かれる
+    - 補間に使う格子点の出力が NaN（デファジ結果が得られない点）
+
+構築コストがかかるため、テーブルはルール JSON のファイルハッシュ・
+デフォルト出力・分割数をキーにディスクへキャッシュする（`load_or_build()`）。
+
+Usage:
+    table = FuzzyLookupTable.build(engine, subdivisions=1)
+    engine.lookup_table = table
+    engine.infer({"target_hp_ratio": 0.4, ...})  # テーブルの補間値
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import logging
+import os
+import zipfile
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from app.engine.constants import FUZZY_LUT_SUBDIVISIONS
+from app.engine.fuzzy_engine import FuzzyEngine
+
+logger = logging.getLogger(__name__)
+
+# テーブルのファイル形式・サンプリング方法を変更したら上げる（キャッシュキーに含む）
+_LUT_FORMAT_VERSION = 2
+# 構築時に一度に infer_batch_exact() へ渡す格子点数
+_BUILD_CHUNK_ROWS = 20000
+
+
+def _axis_points(engine: FuzzyEngine, var: str, subdivisions: int) -> np.ndarray:
+    """入力変数の格子軸（折れ点 + 区間の等分点）を返す."""
+    breakpoints = engine.compiled.variable_breakpoints(var)
+    if len(breakpoints) == 1:
+        # 値域が1点の変数はクランプ後も同じ値になるため補間係数は常に 0
+        return np.array([breakpoints[0], breakpoints[0] + 1.0])
+    points: list[float] = []
+    for left, right in itertools.pairwise(breakpoints):
+        points.extend(
+            np.linspace(left, right, subdivisions + 1, endpoint=False).tolist()
+        )
+    points.append(breakpoints[-1])
+    return np.array(points)
+
+
+def _strides(shape: tuple[int, ...]) -> list[int]:
+    """C 順の多次元配列の各軸のストライド（要素数単位）を返す."""
+    strides = [1] * len(shape)
+    for dim in range(len(shape) - 2, -1, -1):
+        strides[dim] = strides[dim + 1] * shape[dim + 1]
+    return strides
+
+
+def _mixed_cells(fired: np.ndarray) -> np.ndarray:
+    """格子点ごとの発火有無から、頂点間で発火有無が分かれるセルのフラグを返す."""
+    any_fired = np.zeros(tuple(n - 1 for n in fired.shape), dtype=bool)
+    all_fired = np.ones_like(any_fired)
+    for bits in itertools.product((0, 1), repeat=fired.ndim):
+        corner = fired[
+            tuple(
+                slice(bit, bit + n - 1)
+                for bit, n in zip(bits, fired.shape, strict=True)
+            )
+        ]
+        any_fired |= corner
+        all_fired &= corner
+    return any_fired & ~all_fired
+
+
+class FuzzyLookupTable:
+    """1つのルールセットの出力面を格子上でサンプリングしたテーブル.
+
+    Attributes:
+        variables: 格子の軸となる入力変数名（ルールセットの変数の登録順）
+        axes: 変数ごとの格子点（昇順）
+        values: 出力変数名 → 格子点ごとの出力値（shape は各軸の点数）
+        fired: 格子点ごとのルール発火有無（shape は各軸の点数）
+        mixed_cells: セルごとの混在フラグ（shape は各軸の点数 - 1）
+    """
+
+    def __init__(
+        self,
+        variables: list[str],
+        axes: list[np.ndarray],
+        values: dict[str, np.ndarray],
+        fired: np.ndarray,
+        excluded_variables: list[str] | None = None,
+    ) -> None:
+        """テーブルを生成する.
+
+        Args:
+            variables: 格子の軸となる入力変数名
+            axes: 変数ごとの格子点（昇順・2点以上）
+            values: 出力変数名 → 格子点ごとの出力値
+            fired: 格子点ごとにいずれかのルールが発火するかどうか
+            excluded_variables: 入力に含まれていたら近似しない変数名
+                （ルールが参照しない変数。指定されると厳密推論と発火条件が変わる）
+        """
+        self.variables = variables
+        self.axes = axes
+        self.values = values
+        self.fired = fired
+        self.mixed_cells = _mixed_cells(fired)
+        self._excluded = frozenset(excluded_variables or ())
+
+        shape = tuple(len(axis) for axis in axes)
+        self._strides = _strides(shape)
+        self._cell_strides = _strides(tuple(n - 1 for n in shape))
+        strides = self._strides
+        self._mixed_flat: np.ndarray = self.mixed_cells.ravel()
+        self._mixed_list: list[bool] = self._mixed_flat.tolist()
+        self._fired_flat: np.ndarray = fired.ravel()
+        self._fired_list: list[bool] = self._fired_flat.tolist()
+        # 格子セルの 2^d 頂点のビット列とオフセット（先頭の変数が最上位ビット）
+        self._corner_bits: list[tuple[int, ...]] = list(
+            itertools.product((0, 1), repeat=len(shape))
+        )
+        self._corner_offsets: list[int] = [
+            sum(bit * stride for bit, stride in zip(bits, strides, strict=True))
+            for bits in self._corner_bits
+        ]
+        self._corner_offsets_array = np.array(self._corner_offsets, dtype=np.intp)
+        self._corner_bits_array = np.array(self._corner_bits, dtype=bool).reshape(
+            len(self._corner_bits), len(shape)
+        )
+        # スカラー版の補間は Python の list で引く（numpy スカラー参照より速い）
+        self._axes_list: list[list[float]] = [axis.tolist() for axis in axes]
+        self._flat: dict[str, np.ndarray] = {
+            var: grid.ravel() for var, grid in values.items()
+        }
+        self._flat_list: dict[str, list[float]] = {
+            var: flat.tolist() for var, flat in self._flat.items()
+        }
+
+    @property
+    def size(self) -> int:
+        """格子点数."""
+        return int(np.prod([len(axis) for axis in self.axes]))
+
+    # ------------------------------------------------------------------
+    # 構築・保存
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls, engine: FuzzyEngine, subdivisions: int = FUZZY_LUT_SUBDIVISIONS
+    ) -> FuzzyLookupTable:
+        """エンジンの厳密推論で格子点の出力をサンプリングしてテーブルを構築する.
+
+        Args:
+            engine: 対象のファジィ推論エンジン
+            subdivisions: 隣り合う折れ点の間に追加する等分点の数（0 なら折れ点のみ）
+
+        Returns:
+            構築したテーブル
+        """
+        compiled = engine.compiled
+        variables = compiled.input_variables
+        axes = [_axis_points(engine, var, subdivisions) for var in variables]
+        shape = tuple(len(axis) for axis in axes)
+        n = int(np.prod(shape))
+
+        columns: dict[str, np.ndarray] = {}
+        fired = np.empty(n, dtype=bool)
+        for start in range(0, n, _BUILD_CHUNK_ROWS):
+            rows = np.arange(start, min(start + _BUILD_CHUNK_ROWS, n))
+            index = np.unravel_index(rows, shape)
+            inputs = {
+                var: axis[idx]
+                for var, axis, idx in zip(variables, axes, index, strict=True)
+            }
+            for var, result in engine.infer_batch_exact(inputs).items():
+                columns.setdefault(var, np.empty(n))[rows] = result
+            mu, present = compiled.fuzzify_batch(inputs, len(rows))
+            activations, _ = compiled.fire_batch(mu, present)
+            fired[rows] = activations.max(axis=1) > 0.0
+
+        values = {var: column.reshape(shape) for var, column in columns.items()}
+        excluded = [var for var in compiled.variables if var not in variables]
+        return cls(variables, axes, values, fired.reshape(shape), excluded)
+
+    def save(self, path: Path) -> None:
+        """テーブルを .npz で保存する（一時ファイル経由で置き換える）.
+
+        Args:
+            path: 保存先パス
+        """
+        arrays: dict[str, Any] = {
+            "variables": np.array(self.variables, dtype=str),
+            "outputs": np.array(list(self.values), dtype=str),
+            "excluded": np.array(sorted(self._excluded), dtype=str),
+            "fired": self.fired,
+        }
+        for i, axis in enumerate(self.axes):
+            arrays[f"axis_{i}"] = axis
+        for i, grid in enumerate(self.values.values()):
+            arrays[f"value_{i}"] = grid
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> FuzzyLookupTable | None:
+        """`save()` で保存したテーブルを読み込む.
+
+        Args:
+            path: 読み込むファイルのパス
+
+        Returns:
+            読み込んだテーブル（ファイルが無い・壊れている場合は None）
+        """
+        if not path.exists():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                variables = data["variables"].tolist()
+                outputs = data["outputs"].tolist()
+                axes = [data[f"axis_{i}"] for i in range(len(variables))]
+                values = {var: data[f"value_{i}"] for i, var in enumerate(outputs)}
+                fired = data["fired"]
+                excluded = data["excluded"].tolist()
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            logger.warning("ファジィルックアップテーブルの読み込みに失敗: %s", path)
+            return None
+        return cls(variables, axes, values, fired, excluded)
+
+    # ------------------------------------------------------------------
+    # 参照
+    # ------------------------------------------------------------------
+
+    def lookup(self, inputs: dict[str, float]) -> dict[str, float] | None:
+        """入力に対する出力を多重線形補間で返す.
+
+        Args:
+            inputs: {入力変数名: 数値}
+
+        Returns:
+            {出力変数名: 補間値}。テーブルで近似できない入力の場合は None
+        """
+        if self._excluded and not self._excluded.isdisjoint(inputs):
+            return None
+        base = 0
+        cell = 0
+        fractions: list[float] = []
+        for var, axis, stride, cell_stride in zip(
+            self.variables,
+            self._axes_list,
+            self._strides,
+            self._cell_strides,
+            strict=True,
+        ):
+            x = inputs.get(var)
+            if x is None:
+                return None
+            lo = axis[0]
+            hi = axis[-1]
+            x = lo if x < lo else hi if x > hi else x
+            i = min(bisect_right(axis, x) - 1, len(axis) - 2)
+            left = axis[i]
+            fractions.append((x - left) / (axis[i + 1] - left))
+            base += i * stride
+            cell += i * cell_stride
+        if self._mixed_list[cell] and self._straddles(base, fractions):
+            return None
+
+        result: dict[str, float] = {}
+        offsets = self._corner_offsets
+        for out_var, flat in self._flat_list.items():
+            corners = [flat[base + offset] for offset in offsets]
+            # 末尾の変数から順に隣り合う頂点を線形補間して畳み込む
+            for f in reversed(fractions):
+                corners = [
+                    a + (b - a) * f
+                    for a, b in zip(corners[0::2], corners[1::2], strict=True)
+                ]
+            value = corners[0]
+            if value != value:  # NaN
+                return None
+            result[out_var] = value
+        return result
+
+    def _straddles(self, base: int, fractions: list[float]) -> bool:
+        """重みが 0 でない頂点間で発火の有無が分かれるかどうかを返す."""
+        fired = self._fired_list
+        seen_fired = False
+        seen_idle = False
+        for bits, offset in zip(self._corner_bits, self._corner_offsets, strict=True):
+            if any(
+                f == 1.0 if bit == 0 else f == 0.0
+                for bit, f in zip(bits, fractions, strict=True)
+            ):
+                continue
+            if fired[base + offset]:
+                seen_fired = True
+            else:
+                seen_idle = True
+            if seen_fired and seen_idle:
+                return True
+        return False
+
+    def _straddles_batch(
+        self, index: np.ndarray, fractions: list[np.ndarray]
+    ) -> np.ndarray:
+        """`_straddles()` の一括版（index は (2^d, n) の頂点の格子点番号）."""
+        weighted = np.ones(index.shape, dtype=bool)
+        for dim, f in enumerate(fractions):
+            upper = self._corner_bits_array[:, dim][:, None]
+            weighted &= np.where(upper, f != 0.0, f != 1.0)
+        fired = self._fired_flat[index]
+        return (fired & weighted).any(axis=0) & (~fired & weighted).any(axis=0)
+
+    def lookup_batch(
+        self, inputs: dict[str, np.ndarray]
+    ) -> tuple[dict[str, np.ndarray], np.ndarray] | None:
+        """`lookup()` の一括版.
+
+        Args:
+            inputs: {入力変数名: 候補ごとの数値配列}（全配列は同じ長さ）
+
+        Returns:
+            ({出力変数名: 補間値の配列}, 近似できなかった要素のマスク)。
+            入力変数が欠けている場合は None
+        """
+        if self._excluded and not self._excluded.isdisjoint(inputs):
+            return None
+        if any(var not in inputs for var in self.variables):
+            return None
+
+        n = len(np.asarray(inputs[self.variables[0]])) if self.variables else 0
+        base = np.zeros(n, dtype=np.intp)
+        cell = np.zeros(n, dtype=np.intp)
+        fractions: list[np.ndarray] = []
+        for var, axis, stride, cell_stride in zip(
+            self.variables, self.axes, self._strides, self._cell_strides, strict=True
+        ):
+            x = np.clip(np.asarray(inputs[var], dtype=float), axis[0], axis[-1])
+            i = np.minimum(np.searchsorted(axis, x, side="right") - 1, len(axis) - 2)
+            left = axis[i]
+            fractions.append((x - left) / (axis[i + 1] - left))
+            base += i * stride
+            cell += i * cell_stride
+
+        index = base[None, :] + self._corner_offsets_array[:, None]
+        inexact = self._mixed_flat[cell]
+        if inexact.any():
+            rows = np.flatnonzero(inexact)
+            inexact = np.zeros(n, dtype=bool)
+            inexact[rows] = self._straddles_batch(
+                index[:, rows], [f[rows] for f in fractions]
+            )
+        result: dict[str, np.ndarray] = {}
+        for out_var, flat in self._flat.items():
+            # (2, 2, ..., 2, n) の頂点値を末尾の変数から順に畳み込む（lookup() と同順）
+            corners = flat[index].reshape((2,) * len(fractions) + (n,))
+            for f in reversed(fractions):
+                corners = (
+                    corners[..., 0, :] + (corners[..., 1, :] - corners[..., 0, :]) * f
+                )
+            inexact |= np.isnan(corners)
+            result[out_var] = corners
+        return result, inexact
+
+
+def lut_cache_path(
+    cache_dir: Path, file_hash: str, engine: FuzzyEngine, subdivisions: int
+) -> Path:
+    """テーブルのキャッシュファイルのパスを返す.
+
+    キーはルール JSON のファイルハッシュ・デフォルト出力・分割数・ファイル形式の
+    バージョンから作るため、ルールを編集すると別のファイルになる。
+
+    Args:
+        cache_dir: キャッシュディレクトリ
+        file_hash: ルール JSON の SHA-256 ハッシュ
+        engine: 対象のファジィ推論エンジン
+        subdivisions: 折れ点間の等分点の数
+
+    Returns:
+        キャッシュファイルのパス
+    """
+    key_source = json.dumps(
+        [_LUT_FORMAT_VERSION, file_hash, subdivisions, engine.default_output],
+        sort_keys=True,
+    )
+    key = hashlib.sha256(key_source.encode()).hexdigest()[:32]
+    return cache_dir / f"fuzzy_lut_{key}.npz"
+
+
+def load_or_build(
+    engine: FuzzyEngine,
+    file_hash: str,
+    subdivisions: int = FUZZY_LUT_SUBDIVISIONS,
+    cache_dir: Path | None = None,
+) -> FuzzyLookupTable:
+    """ディスクキャッシュからテーブルを読み込み、無ければ構築して保存する.
+
+    Args:
+        engine: 対象のファジィ推論エンジン
+        file_hash: ルール JSON の SHA-256 ハッシュ
+        subdivisions: 折れ点間の等分点の数
+        cache_dir: キャッシュディレクトリ（None ならディスクキャッシュを使わない）
+
+    Returns:
+        テーブル
+    """
+    if cache_dir is None:
+        return FuzzyLookupTable.build(engine, subdivisions)
+
+    path = lut_cache_path(cache_dir, file_hash, engine, subdivisions)
+    table = FuzzyLookupTable.load(path)
+    if table is not None:
+        return table
+
+    table = FuzzyLookupTable.build(engine, subdivisions)
+    try:
+        table.save(path)
+    except OSError:
+        logger.warning("ファジィルックアップテーブルを保存できません: %s", path)
+    return table
@@ -3,14 +3,29 @@
 
 ファイルハッシュを使って JSON の変更を検出し、変更があった場合のみ
 FuzzyEngine を再構築するホットリロード機能を提供する。
+
+`get_shared_rule_cache()` はルールディレクトリごとにプロセス内で1つの
+FuzzyRuleCache を共有するレジストリで、BattleSimulator はこれを経由して
+エンジンを取得する（シミュレータ生成のたびに全 JSON の読み込み・ハッシュ計算・
+コンパイルを行わない）。マスターデータの再読み込み時は
+`invalidate_shared_rule_caches()` で破棄し、次回アクセス時にディスクから
+再ロードする。
+
+`lut_subdivisions` を指定すると、ターゲット選択・武器選択レイヤーのエンジンに
+事前計算したルックアップテーブル（`fuzzy_lut.FuzzyLookupTable`）を持たせる。
+テーブルはルール JSON のハッシュをキーにディスクへキャッシュされ、JSON が
+変更されるとエンジンと一緒に再構築される。
 """
 
 from __future__ import annotations
 
 import logging
+import threading
 from pathlib import Path
 
+from app.engine.constants import FUZZY_LUT_CACHE_DIR, FUZZY_RULES_DIR
 from app.engine.fuzzy_engine import FuzzyEngine, _file_hash
+from app.engine.fuzzy_lut import load_or_build
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +47,8 @@ _LAYER_DEFAULTS: dict[str, dict[str, float]] = {
     "target": {"target_priority": 0.0},
     "weapon": {"weapon_score": 0.0},
 }
+# ルックアップテーブルを適用するレイヤー（入力が少数・有界な純関数のもの）
+_LUT_LAYERS: frozenset[str] = frozenset({"target", "weapon"})
 
 
 class FuzzyRuleCache:
@@ -40,21 +57,37 @@ class FuzzyRuleCache:
     ファイルハッシュを使ってJSONの変更を検出し、変更があった場合のみ
     FuzzyEngine を再構築する。
 
+    複数スレッドのシミュレータから共有されるため、再ロードはロック内で
+    新しい辞書を組み立てて差し替える（copy-on-write）。一度返したエンジン辞書は
+    以後変更されないので、呼び出し側はスナップショットとして保持してよい。
+
     Usage:
         cache = FuzzyRuleCache(Path("backend/data/fuzzy_rules"))
         engines = cache.get_engines()  # 変更があったファイルのみ再ロード
         cache.force_reload_all()       # 全エンジンを強制再ロード
     """
 
-    def __init__(self, rules_dir: Path) -> None:
+    def __init__(
+        self,
+        rules_dir: Path,
+        lut_subdivisions: int | None = None,
+        lut_cache_dir: Path | None = FUZZY_LUT_CACHE_DIR,
+    ) -> None:
         """初期化.
 
         Args:
             rules_dir: ファジィルール JSON ファイルが格納されているディレクトリ
+            lut_subdivisions: ルックアップテーブルの折れ点間の等分点の数
+                （None ならテーブルを使わず厳密推論のみ）
+            lut_cache_dir: ルックアップテーブルのディスクキャッシュ先
+                （None ならディスクキャッシュを使わない）
         """
         self._rules_dir = rules_dir
+        self._lut_subdivisions = lut_subdivisions
+        self._lut_cache_dir = lut_cache_dir
         self._engines: dict[str, dict[str, FuzzyEngine]] = {}
         self._hashes: dict[str, str] = {}  # ファイルパス文字列 → SHA-256 ハッシュ値
+        self._lock = threading.Lock()
 
         # 初期ロード
         self._load_all()
@@ -65,7 +98,16 @@ class FuzzyRuleCache:
         Returns:
             {"MODE": {"behavior": FuzzyEngine, "target": FuzzyEngine, "weapon": FuzzyEngine}}
         """
-        self._scan_and_reload_changed()
+        with self._lock:
+            self._scan_and_reload_changed()
+            return self._engines
+
+    def snapshot(self) -> dict[str, dict[str, FuzzyEngine]]:
+        """ファイルの変更検出を行わず、現在ロード済みのエンジン辞書を返す.
+
+        Returns:
+            {"MODE": {"behavior": FuzzyEngine, "target": FuzzyEngine, "weapon": FuzzyEngine}}
+        """
         return self._engines
 
     def _scan_and_reload_changed(self) -> list[str]:
@@ -75,6 +117,7 @@ class FuzzyRuleCache:
             変更されたファイルに対応する "MODE:layer" キーのリスト
         """
         changed_keys: list[str] = []
+        engines = {mode: dict(layers) for mode, layers in self._engines.items()}
 
         for mode, prefix in _STRATEGY_FILE_PREFIXES.items():
             for layer, suffix in _LAYER_SUFFIXES.items():
@@ -89,12 +132,8 @@ class FuzzyRuleCache:
                     continue
 
                 # ハッシュが変わった（または初回ロード）→ 再ロード
-                engine = FuzzyEngine.from_json(
-                    json_path, default_output=_LAYER_DEFAULTS[layer]
-                )
-                if mode not in self._engines:
-                    self._engines[mode] = {}
-                self._engines[mode][layer] = engine
+                engine = self._build_engine(json_path, layer, current_hash)
+                engines.setdefault(mode, {})[layer] = engine
                 self._hashes[path_key] = current_hash
 
                 logger.info(
@@ -108,10 +147,13 @@ class FuzzyRuleCache:
                 )
                 changed_keys.append(f"{mode}:{layer}")
 
+        if changed_keys:
+            self._engines = engines
         return changed_keys
 
     def _load_all(self) -> None:
         """全ルールセットを初期ロードする（内部用）."""
+        engines: dict[str, dict[str, FuzzyEngine]] = {}
         for mode, prefix in _STRATEGY_FILE_PREFIXES.items():
             mode_engines: dict[str, FuzzyEngine] = {}
             for layer, suffix in _LAYER_SUFFIXES.items():
@@ -120,20 +162,83 @@ class FuzzyRuleCache:
                     continue
 
                 path_key = str(json_path)
-                engine = FuzzyEngine.from_json(
-                    json_path, default_output=_LAYER_DEFAULTS[layer]
-                )
-                mode_engines[layer] = engine
-                self._hashes[path_key] = _file_hash(json_path)
+                file_hash = _file_hash(json_path)
+                mode_engines[layer] = self._build_engine(json_path, layer, file_hash)
+                self._hashes[path_key] = file_hash
 
             if mode_engines:
-                self._engines[mode] = mode_engines
+                engines[mode] = mode_engines
+        self._engines = engines
+
+    def _build_engine(self, json_path: Path, layer: str, file_hash: str) -> FuzzyEngine:
+        """JSON からエンジンを構築し、対象レイヤーならルックアップテーブルを付ける.
+
+        Args:
+            json_path: ルール JSON のパス
+            layer: レイヤー名（"behavior" / "target" / "weapon"）
+            file_hash: JSON ファイルの SHA-256 ハッシュ
+
+        Returns:
+            構築したエンジン
+        """
+        engine = FuzzyEngine.from_json(json_path, default_output=_LAYER_DEFAULTS[layer])
+        if self._lut_subdivisions is not None and layer in _LUT_LAYERS:
+            engine.lookup_table = load_or_build(
+                engine, file_hash, self._lut_subdivisions, self._lut_cache_dir
+            )
+        return engine
 
     def force_reload_all(self) -> None:
         """全ルールセットを強制再ロードする.
 
         ハッシュキャッシュをリセットして全JSONを再ロードする。
         """
-        self._hashes.clear()
-        self._engines.clear()
-        self._load_all()
+        with self._lock:
+            self._hashes.clear()
+            self._load_all()
+
+
+# ---------------------------------------------------------------------------
+# プロセス共有レジストリ
+# ---------------------------------------------------------------------------
+
+_shared_caches: dict[tuple[Path, int | None], FuzzyRuleCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_shared_rule_cache(
+    rules_dir: Path = FUZZY_RULES_DIR, lut_subdivisions: int | None = None
+) -> FuzzyRuleCache:
+    """ルールディレクトリに対応するプロセス共有の FuzzyRuleCache を返す.
+
+    初回呼び出し時のみ JSON をロードし、以降は同じインスタンスを返す。
+    ルックアップテーブルの有無・分割数ごとに別のインスタンスを共有する。
+
+    Args:
+        rules_dir: ファジィルール JSON ファイルが格納されているディレクトリ
+        lut_subdivisions: ルックアップテーブルの折れ点間の等分点の数
+            （None ならテーブルを使わない）
+
+    Returns:
+        共有 FuzzyRuleCache インスタンス
+    """
+    key = (Path(rules_dir).resolve(), lut_subdivisions)
+    cache = _shared_caches.get(key)
+    if cache is not None:
+        return cache
+    with _shared_caches_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = FuzzyRuleCache(Path(rules_dir), lut_subdivisions)
+            _shared_caches[key] = cache
+        return cache
+
+
+def invalidate_shared_rule_caches() -> None:
+    """共有レジストリを破棄する（マスターデータ再読み込み時）.
+
+    既に生成済みのシミュレータは保持中のスナップショットをそのまま使い続け、
+    以降に生成されるシミュレータがディスクから再ロードしたエンジンを使う。
+    """
+    with _shared_caches_lock:
+        _shared_caches.clear()
@@ -0,0 +1,440 @@
+# backend/app/engine/log_buffer.py
+"""列指向（カラムナ）のバトルログバッファ.
+
+`BattleSimulator.logs` は従来 `BattleLog`（pydantic モデル。座標・速度の
+`Vector3` をネストして持つ）のリストで、大人数バトルでは数万件のモデルが
+バトル終了まで保持され、本番環境のピーク RSS を押し上げていた。さらに保存時は
+`strip_debug_fields()` が全件 `model_dump()` していた。
+
+`BattleLogBuffer` は1イベント1モデルを作らず、数値項目を型付き配列
+（`array.array`）へ、文字列・任意項目をサイドテーブルへ追記する。
+
+    - timestamp / 位置 / 速度 / 向き: float64 配列
+    - actor / target: UUID テーブルへのインデックス（int32、target 無しは -1）
+    - action_type: 文字列テーブルへのコード（int16）
+    - damage: int64 配列 + 有無フラグ
+    - message: 行ごとの文字列、または遅延生成用の (テンプレートID, 引数)
+    - 上記以外の項目（chatter / fuzzy_scores / details 等）: 既定値以外の値だけを
+      行番号 → dict の疎なテーブルに保持
+
+ダイジェスト集計（`analyze_battle_logs`）は
+`iter_log_fields()` で必要な列だけを走査し、保存・配信用の dict / NDJSON は
+`to_dicts()` / `iter_ndjson()` がモデルを経由せずに生成する。従来コード・テスト
+との互換のため、`Sequence[BattleLog]` として添字・反復アクセスした場合のみ
+その行の `BattleLog` を都度生成して返す。
+"""
+
+import json
+import uuid
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any, overload
+
+import numpy as np
+
+from app.engine.log_messages import render_log_message
+from app.models.models import BattleLog, Vector3
+
+# 行フラグ（_flags 配列のビット）
+_HAS_TARGET = 1
+_HAS_DAMAGE = 2
+_HAS_VELOCITY = 4
+_HAS_HEADING = 8
+
+# 列として保持する BattleLog フィールド（それ以外は疎テーブル）
+_COLUMN_FIELDS: frozenset[str] = frozenset(
+    {
+        "timestamp",
+        "actor_id",
+        "action_type",
+        "target_id",
+        "damage",
+        "message",
+        "position_snapshot",
+        "velocity_snapshot",
+        "heading",
+    }
+)
+# BattleLog のフィールド順（to_dicts() のキー順を model_dump() と揃える）
+_FIELD_ORDER: tuple[str, ...] = tuple(BattleLog.model_fields)
+# 疎テーブル項目の既定値（既定値と等しい値は保持しない）
+_EXTRA_DEFAULTS: dict[str, Any] = {
+    name: info.default
+    for name, info in BattleLog.model_fields.items()
+    if name not in _COLUMN_FIELDS
+}
+
+Snapshot = Vector3 | np.ndarray
+
+
+def _xyz(value: Snapshot) -> tuple[float, float, float]:
+    """Vector3 / ndarray を (x, y, z) の float タプルへ変換する."""
+    if isinstance(value, Vector3):
+        return value.x, value.y, value.z
+    return float(value[0]), float(value[1]), float(value[2])
+
+
+class BattleLogBuffer(Sequence[BattleLog]):
+    """追記専用の列指向バトルログバッファ.
+
+    行の追加は `record()`（通常メッセージ）/ `record_deferred()`（テンプレート
+    による遅延生成メッセージ）で行う。既存の `BattleLog` を追加する `append()`
+    も互換用に提供する。
+    """
+
+    def __init__(self, logs: Iterable[BattleLog] = ()) -> None:
+        """空のバッファを作成する.
+
+        Args:
+            logs: 初期内容として追加する BattleLog 列
+        """
+        self._timestamps = array("d")
+        self._actor_idx = array("i")
+        self._action_codes = array("h")
+        self._target_idx = array("i")
+        self._damage = array("q")
+        self._positions = array("d")  # x, y, z を行ごとに連結
+        self._velocities = array("d")  # 同上（未指定行は 0）
+        self._headings = array("d")
+        self._flags = array("B")
+        self._messages: list[str | tuple[str, dict[str, Any]]] = []
+        self._extras: dict[int, dict[str, Any]] = {}
+        # サイドテーブル（UUID・action_type の重複排除）
+        self._ids: list[uuid.UUID] = []
+        self._id_index: dict[uuid.UUID, int] = {}
+        self._action_types: list[str] = []
+        self._action_index: dict[str, int] = {}
+        for log in logs:
+            self.append(log)
+
+    # ------------------------------------------------------------------
+    # 追記
+    # ------------------------------------------------------------------
+
+    def _intern_id(self, value: uuid.UUID) -> int:
+        idx = self._id_index.get(value)
+        if idx is None:
+            idx = len(self._ids)
+            self._ids.append(value)
+            self._id_index[value] = idx
+        return idx
+
+    def _intern_action(self, action_type: str) -> int:
+        code = self._action_index.get(action_type)
+        if code is None:
+            code = len(self._action_types)
+            self._action_types.append(action_type)
+            self._action_index[action_type] = code
+        return code
+
+    def _add_row(
+        self,
+        message: str | tuple[str, dict[str, Any]],
+        timestamp: float,
+        actor_id: uuid.UUID,
+        action_type: str,
+        position_snapshot: Snapshot,
+        target_id: uuid.UUID | None,
+        damage: int | None,
+        velocity_snapshot: Snapshot | None,
+        heading: float | None,
+        extras: dict[str, Any],
+    ) -> None:
+        row = len(self._messages)
+        flags = 0
+        self._timestamps.append(float(timestamp))
+        self._actor_idx.append(self._intern_id(actor_id))
+        self._action_codes.append(self._intern_action(action_type))
+        if target_id is None:
+            self._target_idx.append(-1)
+        else:
+            self._target_idx.append(self._intern_id(target_id))
+            flags |= _HAS_TARGET
+        if damage is None:
+            self._damage.append(0)
+        else:
+            self._damage.append(int(damage))
+            flags |= _HAS_DAMAGE
+        self._positions.extend(_xyz(position_snapshot))
+        if velocity_snapshot is None:
+            self._velocities.extend((0.0, 0.0, 0.0))
+        else:
+            self._velocities.extend(_xyz(velocity_snapshot))
+            flags |= _HAS_VELOCITY
+        if heading is None:
+            self._headings.append(0.0)
+        else:
+            self._headings.append(float(heading))
+            flags |= _HAS_HEADING
+        self._flags.append(flags)
+        self._messages.append(message)
+        stored = {
+            name: value
+            for name, value in extras.items()
+            if value != _EXTRA_DEFAULTS[name]
+        }
+        if stored:
+            self._extras[row] = stored
+
+    def record(
+        self,
+        timestamp: float,
+        actor_id: uuid.UUID,
+        action_type: str,
+        message: str,
+        position_snapshot: Snapshot,
+        target_id: uuid.UUID | None = None,
+        damage: int | None = None,
+        velocity_snapshot: Snapshot | None = None,
+        heading: float | None = None,
+        **extras: Any,
+    ) -> None:
+        """ログ1行を追記する（引数は BattleLog のフィールドと同名）.
+
+        位置・速度は Vector3 のほか ndarray も受け付け、追記時点の値を
+        コピーして保持する。
+
+        Raises:
+            KeyError: extras に BattleLog に存在しないフィールドが含まれる場合
+        """
+        self._add_row(
+            message,
+            timestamp,
+            actor_id,
+            action_type,
+            position_snapshot,
+            target_id,
+            damage,
+            velocity_snapshot,
+            heading,
+            extras,
+        )
+
+    def record_deferred(
+        self,
+        template_id: str,
+        args: dict[str, Any],
+        timestamp: float,
+        actor_id: uuid.UUID,
+        action_type: str,
+        position_snapshot: Snapshot,
+        target_id: uuid.UUID | None = None,
+        damage: int | None = None,
+        velocity_snapshot: Snapshot | None = None,
+        heading: float | None = None,
+        **extras: Any,
+    ) -> None:
+        """メッセージを遅延生成するログ1行を追記する.
+
+        メッセージはテンプレートID と引数のままバッファ内に保持し、`BattleLog`
+        の生成時（添字・反復アクセス）または dict / NDJSON への書き出し時に
+        `render_log_message()` で文字列化する。
+
+        Args:
+            template_id: LOG_MESSAGE_TEMPLATES のキー
+            args: テンプレートの置換引数（生成時点の値で確定させること）
+            timestamp: 以降は record() と同じ
+            actor_id: record() と同じ
+            action_type: record() と同じ
+            position_snapshot: record() と同じ
+            target_id: record() と同じ
+            damage: record() と同じ
+            velocity_snapshot: record() と同じ
+            heading: record() と同じ
+            **extras: record() と同じ
+        """
+        self._add_row(
+            (template_id, args),
+            timestamp,
+            actor_id,
+            action_type,
+            position_snapshot,
+            target_id,
+            damage,
+            velocity_snapshot,
+            heading,
+            extras,
+        )
+
+    def append(self, log: BattleLog) -> None:
+        """既存の BattleLog を追記する（list 互換）."""
+        fields = {
+            name: value for name, value in log.__dict__.items() if name != "message"
+        }
+        self._add_row(
+            log.message,
+            fields.pop("timestamp"),
+            fields.pop("actor_id"),
+            fields.pop("action_type"),
+            fields.pop("position_snapshot"),
+            fields.pop("target_id"),
+            fields.pop("damage"),
+            fields.pop("velocity_snapshot"),
+            fields.pop("heading"),
+            fields,
+        )
+
+    # ------------------------------------------------------------------
+    # 参照
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """ログ件数を返す."""
+        return len(self._messages)
+
+    def _message(self, row: int) -> str:
+        message = self._messages[row]
+        if isinstance(message, tuple):
+            return render_log_message(*message)
+        return message
+
+    def _optional(self, row: int, value: Any, bit: int) -> Any:
+        return value if self._flags[row] & bit else None
+
+    def _vector(self, values: array, row: int) -> dict[str, float]:
+        base = row * 3
+        return {"x": values[base], "y": values[base + 1], "z": values[base + 2]}
+
+    def _row_fields(self, row: int) -> dict[str, Any]:
+        """1行分の message 以外のフィールドを BattleLog 上の値で返す."""
+        target = self._target_idx[row]
+        has_velocity = self._flags[row] & _HAS_VELOCITY
+        fields: dict[str, Any] = {
+            "timestamp": self._timestamps[row],
+            "actor_id": self._ids[self._actor_idx[row]],
+            "action_type": self._action_types[self._action_codes[row]],
+            "target_id": self._ids[target] if target >= 0 else None,
+            "damage": self._optional(row, self._damage[row], _HAS_DAMAGE),
+            "position_snapshot": self._vector(self._positions, row),
+            "velocity_snapshot": (
+                self._vector(self._velocities, row) if has_velocity else None
+            ),
+            "heading": self._optional(row, self._headings[row], _HAS_HEADING),
+        }
+        fields.update(self._extras.get(row, {}))
+        return fields
+
+    def _materialize(self, row: int) -> BattleLog:
+        return BattleLog(message=self._message(row), **self._row_fields(row))
+
+    def _column(self, name: str) -> list[Any]:
+        """1項目の全行分の値を BattleLog 上の値（UUID・dict 等）のリストで返す."""
+        getter = _COLUMN_GETTERS.get(name)
+        if getter is not None:
+            return getter(self)
+        default = _EXTRA_DEFAULTS[name]
+        column = [default] * len(self)
+        for row, extras in self._extras.items():
+            if name in extras:
+                column[row] = extras[name]
+        return column
+
+    def _optional_column(self, values: array, bit: int) -> list[Any]:
+        return [
+            v if f & bit else None for v, f in zip(values, self._flags, strict=True)
+        ]
+
+    def _vector_column(self, values: array, bit: int = 0) -> list[Any]:
+        flags = self._flags
+        return [
+            {"x": values[3 * r], "y": values[3 * r + 1], "z": values[3 * r + 2]}
+            if not bit or flags[r] & bit
+            else None
+            for r in range(len(self))
+        ]
+
+    @overload
+    def __getitem__(self, index: int) -> BattleLog: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[BattleLog]: ...
+
+    def __getitem__(self, index: int | slice) -> BattleLog | list[BattleLog]:
+        """指定行の BattleLog を生成して返す（スライスはリスト）."""
+        if isinstance(index, slice):
+            return [self._materialize(row) for row in range(len(self))[index]]
+        return self._materialize(range(len(self))[index])
+
+    def __iter__(self) -> Iterator[BattleLog]:
+        """全行の BattleLog を1件ずつ生成して返す."""
+        for row in range(len(self)):
+            yield self._materialize(row)
+
+    def iter_fields(self, *names: str) -> Iterator[tuple[Any, ...]]:
+        """指定フィールドの値を行ごとのタプルで返す（BattleLog は生成しない）.
+
+        Args:
+            *names: BattleLog のフィールド名
+
+        Yields:
+            行ごとの (names[0] の値, names[1] の値, ...)
+        """
+        yield from zip(*(self._column(name) for name in names), strict=True)
+
+    def to_models(self) -> list[BattleLog]:
+        """全行を BattleLog のリストとして返す（API レスポンス用）."""
+        return list(self)
+
+    def to_dicts(self, exclude: frozenset[str] = frozenset()) -> list[dict[str, Any]]:
+        """全行を `BattleLog.model_dump()` 相当の dict リストとして返す.
+
+        Args:
+            exclude: 出力しないフィールド名
+
+        Returns:
+            キー順・値とも model_dump() と同じ dict のリスト
+        """
+        names = [name for name in _FIELD_ORDER if name not in exclude]
+        return [
+            dict(zip(names, values, strict=True)) for values in self.iter_fields(*names)
+        ]
+
+    def iter_ndjson(self, exclude: frozenset[str] = frozenset()) -> Iterator[str]:
+        """全行を NDJSON の1行（改行付き JSON 文字列）ずつ返す.
+
+        Args:
+            exclude: 出力しないフィールド名
+
+        Yields:
+            `model_dump(mode="json")` 相当の JSON 文字列 + 改行
+        """
+        names = [name for name in _FIELD_ORDER if name not in exclude]
+        for values in self.iter_fields(*names):
+            entry = dict(zip(names, values, strict=True))
+            yield json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+
+
+def iter_log_fields(
+    logs: Sequence[BattleLog], *names: str
+) -> Iterator[tuple[Any, ...]]:
+    """ログ列から指定フィールドの値を行ごとのタプルで返す.
+
+    `BattleLogBuffer` の場合は列から直接読み、BattleLog を生成しない。
+    通常のリスト（テスト・DB から復元したログ等）は属性を参照する。
+
+    Args:
+        logs: BattleLogBuffer または BattleLog のシーケンス
+        *names: BattleLog のフィールド名
+
+    Yields:
+        行ごとの (names[0] の値, names[1] の値, ...)
+    """
+    if isinstance(logs, BattleLogBuffer):
+        yield from logs.iter_fields(*names)
+        return
+    for log in logs:
+        yield tuple(getattr(log, name) for name in names)
+
+
+# 列として保持するフィールドの一括取得関数（BattleLogBuffer._column 参照）
+_COLUMN_GETTERS: dict[str, Callable[[BattleLogBuffer], list[Any]]] = {
+    "timestamp": lambda b: b._timestamps.tolist(),
+    "actor_id": lambda b: [b._ids[i] for i in b._actor_idx],
+    "action_type": lambda b: [b._action_types[c] for c in b._action_codes],
+    "target_id": lambda b: [b._ids[i] if i >= 0 else None for i in b._target_idx],
+    "damage": lambda b: b._optional_column(b._damage, _HAS_DAMAGE),
+    "message": lambda b: [b._message(row) for row in range(len(b))],
+    "position_snapshot": lambda b: b._vector_column(b._positions),
+    "velocity_snapshot": lambda b: b._vector_column(b._velocities, _HAS_VELOCITY),
+    "heading": lambda b: b._optional_column(b._headings, _HAS_HEADING),
+}
@@ -0,0 +1,48 @@
+# backend/app/engine/log_messages.py
+"""バトルログメッセージのテンプレート.
+
+毎ステップ全ユニット分生成される MOVE / DETECTION / AI_DECISION ログは、
+生成時に f-string を組み立てず「テンプレートID + 引数」だけを
+`BattleLogBuffer.record_deferred()` でバッファ内に保持し、dict / NDJSON への
+書き出し（保存・配信）または `BattleLog` の生成時に初めて文字列化する。
+文字列化は書き出される行ごとに1回だけで、書き出されないログ（ベンチマーク・
+集計だけで終わるバトル等）では整形コストが発生しない。保存経路では全行が
+書き出されるため、整形コストはステップ処理中から保存時へ移るだけである。
+
+機体名（`_format_actor_name()`）のように生成時点の索敵状態に依存する値は、
+呼び出し側で生成時に確定させて引数として渡すこと。
+"""
+
+from typing import Any
+
+LOG_MESSAGE_TEMPLATES: dict[str, str] = {
+    "MOVE_APPROACH": "{actor_name}が移動中 (残距離: {distance}m)",
+    "MOVE_LAST_KNOWN": "{actor_name}が最終目撃地点へ向かっている (残距離: {distance}m)",
+    "MOVE_SEARCH": "{actor_name}が索敵中 (残距離: {distance}m)",
+    "DETECTION": "{actor_name}が{dist_label}に{target_name}を発見！（索敵確率 {prob_pct}%）",
+    "DETECTION_MINOVSKY": (
+        "{actor_name}が濃密なミノフスキー粒子の中、"
+        "{dist_label}に{target_name}の反応を捉えた！"
+        "（索敵確率 {prob_pct}%）"
+    ),
+    "AI_DECISION": (
+        "{actor_name} がファジィ推論により [{action}] を選択"
+        " (HP率:{hp_ratio:.2f} 近敵:{enemy_count_near:.0f}"
+        " 近味:{ally_count_near:.0f} 近距:{distance_to_nearest_enemy:.0f}m"
+        " 弾薬率:{ranged_ammo_ratio:.2f} LOS閉塞:{los_blocked:.0f}"
+        " ブースト可:{boost_available:.0f} 対目標角:{angle_to_target:.1f}°)"
+    ),
+}
+
+
+def render_log_message(template_id: str, args: dict[str, Any]) -> str:
+    """テンプレートID と引数からログメッセージを生成する.
+
+    Args:
+        template_id: LOG_MESSAGE_TEMPLATES のキー
+        args: テンプレートの置換引数
+
+    Returns:
+        整形済みメッセージ
+    """
+    return LOG_MESSAGE_TEMPLATES[template_id].format(**args)
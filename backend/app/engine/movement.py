@@ -2,17 +2,13 @@
 """移動・慣性・ポテンシャルフィールド処理のミックスイン."""
 
 import math
-import random
+from dataclasses import dataclass
 
 import numpy as np
 
 from app.engine.constants import (
     ALLY_REPULSION_RADIUS,
     BOUNDARY_MARGIN,
-    DEFAULT_BOOST_COOLDOWN,
-    DEFAULT_BOOST_EN_COST,
-    DEFAULT_BOOST_MAX_DURATION,
-    DEFAULT_BOOST_SPEED_MULTIPLIER,
     FLANKING_ACTIVATION_PROBS,
     FLANKING_ATTRACTION_WEIGHT,
     FLANKING_ENERGY_COST_RATE,
@@ -23,16 +19,38 @@ from app.engine.constants import (
     OBSTACLE_MARGIN,
     OBSTACLE_REPULSION_COEFF,
     RETREAT_ATTRACTION_COEFF,
-    SPECIAL_ENVIRONMENT_EFFECTS,
     STRAFE_ATTRACTION_COEFF,
     STRAFE_MIN_RANGE_RATIO,
-    TERRAIN_ADAPTABILITY_MODIFIERS,
     THREAT_ENEMY_REPULSION_COEFF,
     THREAT_REPULSION_CUTOFF_RADIUS,
     THREAT_REPULSION_DECAY_SCALE,
 )
 from app.engine.spatial_grid import UnitSpatialGrid
-from app.models.models import BattleLog, MobileSuit, RetreatPoint, Vector3, Weapon
+from app.models.models import MobileSuit, RetreatPoint, Weapon
+
+# ターゲット起点の力の向き（ATTACK: 引力 / HIT_AND_AWAY: 斥力）と係数
+_TARGET_FORCE_SIGNS: dict[str, float] = {"ATTACK": 1.0, "HIT_AND_AWAY": -1.0}
+_TARGET_FORCE_COEFF = 2.0
+
+
+@dataclass(slots=True)
+class MovementRequest:
+    """一括移動フェーズ（`_movement_phase_batched()`）へ積む1ユニット分の移動要求.
+
+    乱数・EN を消費するフランキング引力と、武器選択に依存するストレイフ引力は
+    行動フェーズ中の要求時点で従来どおりユニット順に計算して `extra_force` に
+    保持する。残りの力（脅威敵・味方・最近敵・境界・障害物・ターゲット起点）は
+    一括移動フェーズで全要求分をまとめて配列演算する。
+    """
+
+    actor: MobileSuit
+    target: MobileSuit | None
+    action: str
+    weapon_range: float
+    extra_force: np.ndarray
+    log_template: str
+    distance: float
+    with_heading: bool
 
 
 class MovementMixin:
@@ -42,15 +60,18 @@ class MovementMixin:
     units: list[MobileSuit]
     _movement_grid: UnitSpatialGrid | None
     _threat_repulsion_grid: UnitSpatialGrid | None
+    _batched_movement: bool
+    _movement_requests: list[MovementRequest]
 
     def _get_movement_grid(self) -> UnitSpatialGrid:
-        """ポテンシャルフィールド計算用のグリッドを取得する（1ステップに1回だけ構築. Issue #450）.
+        """ポテンシャルフィールド計算用のグリッドを取得する（1ステップに1回だけ同期. Issue #450）.
 
         `_ally_repulsion()` / `_closest_enemy_attraction()` は行動ユニットごとに
-        呼ばれるため、グリッド自体は最初の呼び出し時に一度だけ構築してキャッシュし、
-        以降の同一ステップ内の呼び出しでは使い回す。キャッシュは `step()` の冒頭
-        （`app/engine/simulation.py`）で毎ステップ確実に破棄されるため、次のステップでは
-        その時点の最新位置で再構築される。
+        呼ばれるため、グリッドは最初の呼び出し時に永続空間インデックス
+        （`_spatial_grid()`）をその時点の位置へ一度だけ同期して取得し、以降の
+        同一ステップ内の呼び出しでは使い回す。参照は `step()` の冒頭
+        （`app/engine/simulation.py`）で毎ステップ破棄されるため、次のステップでは
+        その時点の最新位置へ差分同期し直される。
 
         セルサイズは `ALLY_REPULSION_RADIUS` を使う（`_ally_repulsion()` の固定半径
         カットオフに対して3x3x3近傍走査が漏れなく候補を捕捉できる最小サイズ）。
@@ -59,12 +80,11 @@ class MovementMixin:
         （探索対象は近傍セルに限定されず自動的に拡張される）。
         """
         if self._movement_grid is None:
-            alive_units = [u for u in self.units if u.current_hp > 0]  # type: ignore[attr-defined]
-            self._movement_grid = UnitSpatialGrid(alive_units, ALLY_REPULSION_RADIUS)
+            self._movement_grid = self._spatial_grid(ALLY_REPULSION_RADIUS)  # type: ignore[attr-defined]
         return self._movement_grid
 
     def _get_threat_repulsion_grid(self) -> UnitSpatialGrid:
-        """高脅威敵斥力計算用のグリッドを取得する（1ステップに1回だけ構築. Issue #453）.
+        """高脅威敵斥力計算用のグリッドを取得する（1ステップに1回だけ同期. Issue #453）.
 
         セルサイズは早期打ち切り半径 `THREAT_REPULSION_CUTOFF_RADIUS` ではなく
         `THREAT_REPULSION_DECAY_SCALE`（既定300m）を使う。カットオフ半径を
@@ -74,13 +94,12 @@ class MovementMixin:
         なく `radius_neighbors()`（殻走査による可変半径探索）で使うため、
         セルサイズを小さく保ったまま任意の半径まで絞り込みができる。
         `_get_movement_grid()`（セルサイズ=`ALLY_REPULSION_RADIUS`=150m）とは
-        セルサイズの前提が異なるため共有せず別グリッドとして保持する
-        （`_get_movement_grid()` と同様、`step()` の冒頭で毎ステップ破棄される）。
+        セルサイズの前提が異なるため、永続空間インデックスの別の層として保持する
+        （`_get_movement_grid()` と同様、参照は `step()` の冒頭で毎ステップ破棄される）。
         """
         if self._threat_repulsion_grid is None:
-            alive_units = [u for u in self.units if u.current_hp > 0]  # type: ignore[attr-defined]
-            self._threat_repulsion_grid = UnitSpatialGrid(
-                alive_units, THREAT_REPULSION_DECAY_SCALE
+            self._threat_repulsion_grid = self._spatial_grid(  # type: ignore[attr-defined]
+                THREAT_REPULSION_DECAY_SCALE
             )
         return self._threat_repulsion_grid
 
@@ -109,11 +128,11 @@ class MovementMixin:
         for enemy in grid.radius_neighbors(pos_unit, THREAT_REPULSION_CUTOFF_RADIUS):
             if enemy.current_hp <= 0 or enemy.team_id == unit.team_id:
                 continue
-            vec_to_enemy = enemy.position.to_numpy() - pos_unit
+            vec_to_enemy = self._unit_pos(enemy) - pos_unit  # type: ignore[attr-defined]
             dist = float(np.linalg.norm(vec_to_enemy))
             if dist > THREAT_REPULSION_CUTOFF_RADIUS:
                 continue
-            threat_score = self._calculate_attack_power(enemy) / max(  # type: ignore[attr-defined]
+            threat_score = self._unit_profile(enemy).attack_power / max(  # type: ignore[attr-defined]
                 1.0, float(unit.max_hp)
             )
             if threat_score > HIGH_THREAT_THRESHOLD and dist > weapon_range:
@@ -145,7 +164,7 @@ class MovementMixin:
                 or ally.id == unit.id
             ):
                 continue
-            vec_to_ally = ally.position.to_numpy() - pos_unit
+            vec_to_ally = self._unit_pos(ally) - pos_unit  # type: ignore[attr-defined]
             dist = float(np.linalg.norm(vec_to_ally))
             if 0 < dist <= ALLY_REPULSION_RADIUS:
                 force += 0.8 * (-vec_to_ally) / max(dist, 1.0)
@@ -171,7 +190,7 @@ class MovementMixin:
         """攻撃ターゲットへの引力ベクトルを返す（ATTACK行動時）."""
         force = np.zeros(3)
         if target is not None:
-            vec = target.position.to_numpy() - pos_unit
+            vec = self._unit_pos(target) - pos_unit  # type: ignore[attr-defined]
             dist = float(np.linalg.norm(vec))
             if dist > 0:
                 force += 2.0 * vec / dist
@@ -193,7 +212,7 @@ class MovementMixin:
             lambda u: u.current_hp > 0 and u.team_id != unit.team_id,
         )
         if closest_enemy is not None:
-            vec = closest_enemy.position.to_numpy() - pos_unit
+            vec = self._unit_pos(closest_enemy) - pos_unit  # type: ignore[attr-defined]
             dist = float(np.linalg.norm(vec))
             if dist > 0:
                 force += 1.5 * vec / dist
@@ -236,10 +255,10 @@ class MovementMixin:
 
         skill_level = resources.get("flanking_skill_level", 0)
         prob = FLANKING_ACTIVATION_PROBS.get(skill_level, 0.0)
-        if prob <= 0.0 or random.random() > prob:
+        if prob <= 0.0 or self.rng.random() > prob:  # type: ignore[attr-defined]
             return np.zeros(3)
 
-        boost_en_cost = getattr(unit, "boost_en_cost", DEFAULT_BOOST_EN_COST)
+        boost_en_cost = self._unit_profile(unit).boost_en_cost  # type: ignore[attr-defined]
         flanking_en_cost = FLANKING_ENERGY_COST_RATE * boost_en_cost * dt
         if resources.get("current_en", 0.0) < flanking_en_cost:
             return np.zeros(3)
@@ -251,9 +270,9 @@ class MovementMixin:
         )
         rear_rad = math.radians(target_heading_deg + 180.0)
         rear_dir = np.array([math.cos(rear_rad), 0.0, math.sin(rear_rad)])
-        rear_point = target.position.to_numpy() + rear_dir * FLANKING_OFFSET_DISTANCE
+        rear_point = self._unit_pos(target) + rear_dir * FLANKING_OFFSET_DISTANCE  # type: ignore[attr-defined]
 
-        vec = rear_point - unit.position.to_numpy()
+        vec = rear_point - self._unit_pos(unit)  # type: ignore[attr-defined]
         dist = float(np.linalg.norm(vec))
         if dist < 1e-6:
             return np.zeros(3)
@@ -317,8 +336,8 @@ class MovementMixin:
         if weapon is None or getattr(weapon, "is_melee", False):
             return np.zeros(3)
 
-        pos_unit = unit.position.to_numpy()
-        pos_target = target.position.to_numpy()
+        pos_unit = self._unit_pos(unit)  # type: ignore[attr-defined]
+        pos_target = self._unit_pos(target)  # type: ignore[attr-defined]
 
         radial_vec = pos_unit - pos_target  # ターゲットからユニットへの方向
         radial_vec[1] = 0.0  # XZ 平面に固定
@@ -343,14 +362,17 @@ class MovementMixin:
 
     def _obstacle_repulsion(self, pos_unit: np.ndarray) -> np.ndarray:
         """障害物への斥力ベクトルを返す (Phase A — LOS システム)."""
-        force = np.zeros(3)
-        for obs in self.obstacles:  # type: ignore[attr-defined]
-            obs_pos = np.array([obs.position.x, obs.position.y, obs.position.z])
-            obs_dist = float(np.linalg.norm(pos_unit - obs_pos))
-            if obs_dist <= obs.radius + OBSTACLE_MARGIN:
-                away_vec = (pos_unit - obs_pos) / max(obs_dist, 1.0)
-                force += OBSTACLE_REPULSION_COEFF * away_vec
-        return force
+        if not self.obstacles:  # type: ignore[attr-defined]
+            return np.zeros(3)
+        # 障害物配列はシミュレータ生成後に一度だけ構築したものを使う
+        centers, radii = self._get_obstacle_arrays()  # type: ignore[attr-defined]
+        away = pos_unit[None, :] - centers
+        obs_dist = np.sqrt(np.einsum("ij,ij->i", away, away))
+        near = obs_dist <= radii + OBSTACLE_MARGIN
+        if not near.any():
+            return np.zeros(3)
+        away_vecs = away[near] / np.maximum(obs_dist[near], 1.0)[:, None]
+        return OBSTACLE_REPULSION_COEFF * away_vecs.sum(axis=0)
 
     def _hit_and_away_target_repulsion(
         self, pos_unit: np.ndarray, target: MobileSuit | None
@@ -358,7 +380,7 @@ class MovementMixin:
         """HIT_AND_AWAY 行動時のターゲット斥力ベクトルを返す (Issue #368)."""
         force = np.zeros(3)
         if target is not None:
-            vec_away = pos_unit - target.position.to_numpy()
+            vec_away = pos_unit - self._unit_pos(target)  # type: ignore[attr-defined]
             dist = float(np.linalg.norm(vec_away))
             if dist > 0:
                 force += 2.0 * vec_away / dist
@@ -390,7 +412,7 @@ class MovementMixin:
         if retreat_points is None:
             retreat_points = []
 
-        pos_unit = unit.position.to_numpy()
+        pos_unit = self._unit_pos(unit)  # type: ignore[attr-defined]
         unit_id = str(unit.id)
         current_action = self.unit_resources[unit_id].get("current_action", "MOVE")  # type: ignore[attr-defined]
         total_force = np.zeros(3)
@@ -442,7 +464,7 @@ class MovementMixin:
         total_force[1] = 0.0  # Y 成分を XZ 平面に固定
         magnitude = float(np.linalg.norm(total_force))
         if magnitude < 1e-6:
-            angle = random.uniform(0.0, 2.0 * math.pi)
+            angle = self.rng.uniform(0.0, 2.0 * math.pi)  # type: ignore[attr-defined]
             return np.array([math.cos(angle), 0.0, math.sin(angle)])
         return total_force / magnitude
 
@@ -459,8 +481,35 @@ class MovementMixin:
         """移動処理を実行する（ポテンシャルフィールドによる自律移動）."""
         if distance == 0:
             return
+        self._move_unit(actor, target, dt, "MOVE_APPROACH", distance, with_heading=True)
 
-        # ポテンシャルフィールドで目標方向を算出し、慣性モデルで位置・速度を更新
+    def _move_unit(
+        self,
+        actor: MobileSuit,
+        target: MobileSuit | None,
+        dt: float,
+        log_template: str,
+        distance: float,
+        with_heading: bool = False,
+    ) -> None:
+        """ポテンシャルフィールドで目標方向を算出し、慣性モデルで移動してログを残す.
+
+        `batched_movement` 有効時はその場では移動せず、移動要求を積んで
+        行動フェーズ後の `_movement_phase_batched()` にまとめて処理させる。
+
+        Args:
+            actor: 移動するユニット
+            target: 攻撃対象ユニット（None の場合はターゲット起点の力なし）
+            dt: 時間ステップ幅 (s)
+            log_template: MOVE ログのメッセージテンプレート名
+            distance: ログに記録する残距離
+            with_heading: ログに胴体向きを含めるか
+        """
+        if self._batched_movement:
+            self._queue_movement(
+                actor, target, dt, log_template, distance, with_heading
+            )
+            return
         desired_direction = self._calculate_potential_field(
             actor,
             target,
@@ -468,24 +517,33 @@ class MovementMixin:
             dt,
         )
         self._apply_inertia(actor, desired_direction, dt)
+        self._log_movement(actor, log_template, distance, with_heading)
 
+    def _log_movement(
+        self,
+        actor: MobileSuit,
+        log_template: str,
+        distance: float,
+        with_heading: bool,
+    ) -> None:
+        """移動後の MOVE ログを追記する（残距離が MOVE_LOG_MIN_DIST 未満なら省略）."""
         # MOVE_LOG_MIN_DIST 以上の残距離のステップのみログ出力（ログ量削減）
-        if distance >= MOVE_LOG_MIN_DIST:
-            self.logs.append(  # type: ignore[attr-defined]
-                BattleLog(
-                    timestamp=self.elapsed_time,  # type: ignore[attr-defined]
-                    actor_id=actor.id,
-                    action_type="MOVE",
-                    message=f"{self._format_actor_name(actor)}が移動中 (残距離: {int(distance)}m)",  # type: ignore[attr-defined]
-                    position_snapshot=actor.position,
-                    velocity_snapshot=Vector3.from_numpy(
-                        self.unit_resources[str(actor.id)]["velocity_vec"]  # type: ignore[attr-defined]
-                    ),
-                    heading=self.unit_resources[str(actor.id)].get(  # type: ignore[attr-defined]
-                        "body_heading_deg"
-                    ),
-                )
-            )
+        if distance < MOVE_LOG_MIN_DIST or not self._log_enabled("MOVE"):  # type: ignore[attr-defined]
+            return
+        resources = self.unit_resources[str(actor.id)]  # type: ignore[attr-defined]
+        self.logs.record_deferred(  # type: ignore[attr-defined]
+            log_template,
+            {
+                "actor_name": self._format_actor_name(actor),  # type: ignore[attr-defined]
+                "distance": int(distance),
+            },
+            timestamp=self.elapsed_time,  # type: ignore[attr-defined]
+            actor_id=actor.id,
+            action_type="MOVE",
+            position_snapshot=self._unit_pos(actor),  # type: ignore[attr-defined]
+            velocity_snapshot=resources["velocity_vec"],
+            heading=resources.get("body_heading_deg") if with_heading else None,
+        )
 
     def _apply_inertia(
         self,
@@ -497,7 +555,7 @@ class MovementMixin:
 
         旋回制限・加速制限を適用したうえで速度ベクトルと位置を更新する。
         `unit_resources` の `velocity_vec` / `movement_heading_deg` を更新し、
-        `actor.position` を書き換える。
+        SoA ストアの位置を書き換える（`MobileSuit.position` への反映はバトル終了時）。
 
         Args:
             actor: 移動対象ユニット
@@ -515,31 +573,32 @@ class MovementMixin:
             math.atan2(float(desired_direction[2]), float(desired_direction[0]))
         )
 
+        profile = self._unit_profile(actor)  # type: ignore[attr-defined]
+
         # 1. 旋回制限
-        max_rotation = actor.max_turn_rate * dt
+        max_rotation = profile.max_turn_rate * dt
         angular_diff = ((desired_heading - current_heading + 180) % 360) - 180
         actual_rotation = max(-max_rotation, min(max_rotation, angular_diff))
         new_heading = current_heading + actual_rotation
 
         # 2. 加速・減速制限
         current_speed = float(np.linalg.norm(current_velocity))
-        terrain_modifier = self._get_terrain_modifier(actor)
+        terrain_modifier = profile.terrain_modifier
 
         # ブースト中は effective_max_speed を boost_speed_multiplier 倍にする (Phase B)
-        boost_multiplier = getattr(
-            actor, "boost_speed_multiplier", DEFAULT_BOOST_SPEED_MULTIPLIER
-        )
         if resources.get("is_boosting", False):
-            effective_max_speed = actor.max_speed * boost_multiplier * terrain_modifier
+            effective_max_speed = (
+                profile.max_speed * profile.boost_speed_multiplier * terrain_modifier
+            )
         else:
-            effective_max_speed = actor.max_speed * terrain_modifier
+            effective_max_speed = profile.max_speed * terrain_modifier
 
         if current_speed < effective_max_speed:
             new_speed = min(
-                current_speed + actor.acceleration * dt, effective_max_speed
+                current_speed + profile.acceleration * dt, effective_max_speed
             )
         else:
-            new_speed = max(current_speed - actor.deceleration * dt, 0.0)
+            new_speed = max(current_speed - profile.deceleration * dt, 0.0)
 
         # 新しい方向ベクトルと速度ベクトルを計算 (XZ 平面、Y=0)
         heading_rad = math.radians(new_heading)
@@ -547,31 +606,287 @@ class MovementMixin:
         new_velocity = new_direction * new_speed
 
         # 3. 位置更新
-        pos_actor = actor.position.to_numpy()
+        pos_actor = self._unit_pos(actor)  # type: ignore[attr-defined]
         new_pos = pos_actor + new_velocity * dt
 
         # unit_resources を更新
         resources["velocity_vec"] = new_velocity
         resources["movement_heading_deg"] = new_heading
+        self._unit_state.set_velocity(actor, new_velocity, new_heading)  # type: ignore[attr-defined]
 
-        # 位置を更新
-        actor.position = Vector3.from_numpy(new_pos)
+        # 位置を更新（MobileSuit と SoA ストアの両方へ書き込む）
+        self._set_unit_position(actor, new_pos)  # type: ignore[attr-defined]
 
-    def _get_terrain_modifier(self, unit: MobileSuit) -> float:
-        """地形適正による補正係数を取得."""
-        # 地形適正を取得
-        terrain_adaptability = getattr(unit, "terrain_adaptability", {})
-        adaptability_grade = terrain_adaptability.get(self.environment, "A")  # type: ignore[attr-defined]
+    def _queue_movement(
+        self,
+        actor: MobileSuit,
+        target: MobileSuit | None,
+        dt: float,
+        log_template: str,
+        distance: float,
+        with_heading: bool,
+    ) -> None:
+        """一括移動フェーズ向けの移動要求を積む.
+
+        行動種別は要求時点の `current_action` を保持する（HIT_AND_AWAY の接近
+        フェーズのように、移動中だけ一時的に行動種別を差し替えるケースを
+        従来どおり扱うため）。基準武器の選択・フランキング引力（乱数と EN を
+        消費する）・ストレイフ引力は `_calculate_potential_field()` と同じ
+        順序でこの時点で計算する。
+        """
+        action = self.unit_resources[str(actor.id)].get("current_action", "MOVE")  # type: ignore[attr-defined]
+        reference_weapon = self._get_reference_weapon(actor, target)
+        extra_force = np.zeros(3)
+        if target is not None:
+            if action in ("ATTACK", "MOVE"):
+                extra_force += self._flanking_attraction(actor, target, dt)
+            if action == "ATTACK":
+                extra_force += self._strafe_attraction(actor, target, reference_weapon)
+        self._movement_requests.append(
+            MovementRequest(
+                actor=actor,
+                target=target,
+                action=action,
+                weapon_range=float(reference_weapon.range) if reference_weapon else 0.0,
+                extra_force=extra_force,
+                log_template=log_template,
+                distance=distance,
+                with_heading=with_heading,
+            )
+        )
+
+    def _movement_phase_batched(self, dt: float) -> None:
+        """行動フェーズで積まれた移動要求を一括で処理する（batched_movement 用）.
+
+        全要求ユニットのポテンシャルフィールドを、行動フェーズ終了時点の位置に
+        対する配列演算で一度に求め、旋回・加減速制限も配列でまとめて適用する。
+        各ユニットは同一ステップ内で先に移動したユニットの新位置ではなく
+        ステップ内で共通の位置を参照する（同時更新）。逐次版との差分はこの
+        参照位置と、合力ゼロ時のランダム方向の乱数消費順のみ。
+        """
+        requests = self._movement_requests
+        if not requests:
+            return
+        self._movement_requests = []
+        actors = [r.actor for r in requests]
+        directions = self._batched_potential_directions(requests)
+        self._apply_inertia_batched(actors, directions, dt)
+        for r in requests:
+            self._log_movement(r.actor, r.log_template, r.distance, r.with_heading)
+
+    def _batched_potential_directions(
+        self, requests: list[MovementRequest]
+    ) -> np.ndarray:
+        """移動要求ごとの目標方向（`_calculate_potential_field()` の一括版）.
+
+        Returns:
+            (M, 3) の単位ベクトル配列（XZ 平面）
+        """
+        positions = self._unit_positions([r.actor for r in requests])  # type: ignore[attr-defined]
+        forces = np.array([r.extra_force for r in requests], dtype=float)
+        forces += self._batched_target_forces(requests, positions)
+        forces += self._batched_unit_forces(requests, positions)
+        forces += self._batched_boundary_forces(positions)
+        forces += self._batched_obstacle_forces(positions)
+        for i, r in enumerate(requests):
+            if r.action != "RETREAT":
+                continue
+            applicable_rps = [
+                rp
+                for rp in self.retreat_points  # type: ignore[attr-defined]
+                if rp.team_id is None or rp.team_id == r.actor.team_id
+            ]
+            forces[i] += self._retreat_points_attraction(positions[i], applicable_rps)
 
-        # 補正係数を返す
-        modifier = TERRAIN_ADAPTABILITY_MODIFIERS.get(adaptability_grade, 1.0)
+        # 正規化 — ゼロベクトル時はランダム方向でローカルミニマムを回避
+        forces[:, 1] = 0.0
+        magnitudes = np.linalg.norm(forces, axis=1)
+        for row in np.flatnonzero(magnitudes < 1e-6):
+            angle = self.rng.uniform(0.0, 2.0 * math.pi)  # type: ignore[attr-defined]
+            forces[row] = (math.cos(angle), 0.0, math.sin(angle))
+            magnitudes[row] = 1.0
+        return forces / magnitudes[:, None]
+
+    def _batched_target_forces(
+        self, requests: list[MovementRequest], positions: np.ndarray
+    ) -> np.ndarray:
+        """ATTACK の攻撃対象引力・HIT_AND_AWAY の離脱斥力を一括計算する."""
+        signs = np.array(
+            [
+                _TARGET_FORCE_SIGNS.get(r.action, 0.0) if r.target is not None else 0.0
+                for r in requests
+            ]
+        )
+        if not signs.any():
+            return np.zeros_like(positions)
+        targets = [r.target if r.target is not None else r.actor for r in requests]
+        vec = self._unit_positions(targets) - positions  # type: ignore[attr-defined]
+        dist = np.linalg.norm(vec, axis=1)
+        scale = np.divide(
+            _TARGET_FORCE_COEFF * signs,
+            dist,
+            out=np.zeros_like(dist),
+            where=dist > 0,
+        )
+        return vec * scale[:, None]
 
-        # 重力井戸効果: 機動性をさらに低下
-        if "GRAVITY_WELL" in self.special_effects:  # type: ignore[attr-defined]
-            gravity = SPECIAL_ENVIRONMENT_EFFECTS["GRAVITY_WELL"]
-            modifier *= gravity["mobility_multiplier"]
+    def _batched_unit_forces(
+        self, requests: list[MovementRequest], positions: np.ndarray
+    ) -> np.ndarray:
+        """高脅威敵の斥力・味方の斥力・最近敵の引力を全ペアの配列演算で求める.
 
-        return modifier
+        力の定義は `_threat_enemy_repulsion()` / `_ally_repulsion()` /
+        `_closest_enemy_attraction()` と同じ。生存ユニット数 N に対し
+        (移動要求数 × N) の距離行列を1回だけ作り、空間グリッドは使わない。
+        """
+        state = self._unit_state  # type: ignore[attr-defined]
+        rows = np.flatnonzero(state.alive)
+        forces = np.zeros_like(positions)
+        if rows.size == 0:
+            return forces
+        mover_rows = np.array([state.index[r.actor.id] for r in requests])
+        vec = state.positions[rows][None, :, :] - positions[:, None, :]
+        dist = np.sqrt(np.einsum("mkd,mkd->mk", vec, vec))
+        same_team = state.team_idx[rows][None, :] == state.team_idx[mover_rows][:, None]
+        safe_dist = np.maximum(dist, 1.0)
+
+        # 高脅威敵（自機射程外）: THREAT_REPULSION_DECAY_SCALE 超で 1/dist^2 減衰
+        attack_power = np.array(
+            [self._unit_profile(state.units[k]).attack_power for k in rows]  # type: ignore[attr-defined]
+        )
+        threat_score = attack_power[None, :] / state.max_hp[mover_rows][:, None]
+        weapon_ranges = np.array([r.weapon_range for r in requests])
+        threat = (
+            ~same_team
+            & (dist <= THREAT_REPULSION_CUTOFF_RADIUS)
+            & (threat_score > HIGH_THREAT_THRESHOLD)
+            & (dist > weapon_ranges[:, None])
+        )
+        decay = (
+            THREAT_REPULSION_DECAY_SCALE
+            / np.maximum(dist, THREAT_REPULSION_DECAY_SCALE)
+        ) ** 2
+        weights = np.where(
+            threat, THREAT_ENEMY_REPULSION_COEFF * decay / safe_dist, 0.0
+        )
+
+        # 味方（自機以外・ALLY_REPULSION_RADIUS 以内）
+        ally = (
+            same_team
+            & (rows[None, :] != mover_rows[:, None])
+            & (dist > 0)
+            & (dist <= ALLY_REPULSION_RADIUS)
+        )
+        weights += np.where(ally, 0.8 / safe_dist, 0.0)
+        forces -= np.einsum("mk,mkd->md", weights, vec)
+
+        # MOVE 行動時の最近敵への引力
+        is_move = np.array([r.action == "MOVE" for r in requests])
+        if is_move.any():
+            enemy_dist = np.where(same_team, np.inf, dist)
+            nearest = np.argmin(enemy_dist, axis=1)
+            m = np.arange(len(requests))
+            nearest_dist = enemy_dist[m, nearest]
+            pull = is_move & np.isfinite(nearest_dist) & (nearest_dist > 0)
+            forces[pull] += (
+                1.5 * vec[m[pull], nearest[pull]] / nearest_dist[pull][:, None]
+            )
+        return forces
+
+    def _batched_boundary_forces(self, positions: np.ndarray) -> np.ndarray:
+        """マップ境界への斥力を一括計算する（`_boundary_repulsion()` の一括版）."""
+        forces = np.zeros_like(positions)
+        map_min, map_max = self.map_bounds  # type: ignore[attr-defined]
+        xz = positions[:, [0, 2]]
+        dist_min = xz - map_min
+        dist_max = map_max - xz
+        forces[:, [0, 2]] = np.where(
+            dist_min < BOUNDARY_MARGIN, 3.0 / np.maximum(dist_min, 1.0), 0.0
+        ) - np.where(dist_max < BOUNDARY_MARGIN, 3.0 / np.maximum(dist_max, 1.0), 0.0)
+        return forces
+
+    def _batched_obstacle_forces(self, positions: np.ndarray) -> np.ndarray:
+        """障害物への斥力を一括計算する（`_obstacle_repulsion()` の一括版）."""
+        if not self.obstacles:  # type: ignore[attr-defined]
+            return np.zeros_like(positions)
+        centers, radii = self._get_obstacle_arrays()  # type: ignore[attr-defined]
+        away = positions[:, None, :] - centers[None, :, :]
+        obs_dist = np.sqrt(np.einsum("mod,mod->mo", away, away))
+        weights = np.where(
+            obs_dist <= radii[None, :] + OBSTACLE_MARGIN,
+            1.0 / np.maximum(obs_dist, 1.0),
+            0.0,
+        )
+        return OBSTACLE_REPULSION_COEFF * np.einsum("mo,mod->md", weights, away)
+
+    def _apply_inertia_batched(
+        self,
+        actors: list[MobileSuit],
+        desired_directions: np.ndarray,
+        dt: float,
+    ) -> None:
+        """慣性モデルによる速度・位置更新の一括版（`_apply_inertia()` と同じ式）.
+
+        Args:
+            actors: 移動対象ユニット
+            desired_directions: 目標方向の単位ベクトル (M, 3)
+            dt: 時間ステップ幅 (s)
+        """
+        resources = [self.unit_resources[str(u.id)] for u in actors]  # type: ignore[attr-defined]
+        velocities = np.array([r["velocity_vec"] for r in resources], dtype=float)
+        headings = np.array([r["movement_heading_deg"] for r in resources], dtype=float)
+
+        # 1. 旋回制限
+        desired_headings = np.degrees(
+            np.arctan2(desired_directions[:, 2], desired_directions[:, 0])
+        )
+        profiles = [self._unit_profile(u) for u in actors]  # type: ignore[attr-defined]
+        max_rotation = np.array([p.max_turn_rate for p in profiles], dtype=float) * dt
+        angular_diff = np.mod(desired_headings - headings + 180, 360) - 180
+        new_headings = headings + np.clip(angular_diff, -max_rotation, max_rotation)
+
+        # 2. 加速・減速制限（ブースト中は boost_speed_multiplier 倍）
+        boost_multipliers = np.array(
+            [
+                p.boost_speed_multiplier if r.get("is_boosting", False) else 1.0
+                for p, r in zip(profiles, resources, strict=True)
+            ]
+        )
+        effective_max_speeds = (
+            np.array([p.max_speed for p in profiles], dtype=float)
+            * boost_multipliers
+            * np.array([p.terrain_modifier for p in profiles])
+        )
+        speeds = np.linalg.norm(velocities, axis=1)
+        accelerations = np.array([p.acceleration for p in profiles], dtype=float)
+        decelerations = np.array([p.deceleration for p in profiles], dtype=float)
+        new_speeds = np.where(
+            speeds < effective_max_speeds,
+            np.minimum(speeds + accelerations * dt, effective_max_speeds),
+            np.maximum(speeds - decelerations * dt, 0.0),
+        )
+
+        headings_rad = np.radians(new_headings)
+        new_velocities = np.zeros_like(velocities)
+        new_velocities[:, 0] = np.cos(headings_rad) * new_speeds
+        new_velocities[:, 2] = np.sin(headings_rad) * new_speeds
+
+        # 3. 位置更新
+        new_positions = (
+            self._unit_positions(actors)  # type: ignore[attr-defined]
+            + new_velocities * dt
+        )
+        for i, actor in enumerate(actors):
+            velocity = new_velocities[i].copy()
+            heading = float(new_headings[i])
+            resources[i]["velocity_vec"] = velocity
+            resources[i]["movement_heading_deg"] = heading
+            self._unit_state.set_velocity(actor, velocity, heading)  # type: ignore[attr-defined]
+            self._set_unit_position(actor, new_positions[i])  # type: ignore[attr-defined]
+
+    def _get_terrain_modifier(self, unit: MobileSuit) -> float:
+        """地形適正による補正係数を取得（静的プロファイルに計算済みの値）."""
+        return self._unit_profile(unit).terrain_modifier  # type: ignore[attr-defined]
 
     def _check_boost_cancel(
         self,
@@ -602,10 +917,9 @@ class MovementMixin:
         if not resources.get("is_boosting", False):
             return False
 
-        boost_max_duration = getattr(
-            actor, "boost_max_duration", DEFAULT_BOOST_MAX_DURATION
-        )
-        boost_cooldown = getattr(actor, "boost_cooldown", DEFAULT_BOOST_COOLDOWN)
+        profile = self._unit_profile(actor)  # type: ignore[attr-defined]
+        boost_max_duration = profile.boost_max_duration
+        boost_cooldown = profile.boost_cooldown
         boost_elapsed = resources.get("boost_elapsed", 0.0)
         current_en = resources.get("current_en", 0.0)
 
@@ -620,8 +934,8 @@ class MovementMixin:
             cancel_reason = "EN 枯渇"
 
         elif target is not None:
-            pos_actor = actor.position.to_numpy()
-            pos_target = target.position.to_numpy()
+            pos_actor = self._unit_pos(actor)  # type: ignore[attr-defined]
+            pos_target = self._unit_pos(target)  # type: ignore[attr-defined]
             distance_to_target = float(np.linalg.norm(pos_target - pos_actor))
 
             # 条件 3: ターゲットが格闘到達射程内
@@ -657,7 +971,7 @@ class MovementMixin:
                 if ranged_weapon is not None:
                     current_velocity: np.ndarray = resources["velocity_vec"]
                     current_speed = float(np.linalg.norm(current_velocity))
-                    deceleration = actor.deceleration
+                    deceleration = profile.deceleration
 
                     # 停止距離: d_stop = v² / (2 × deceleration)
                     if deceleration > 0 and current_speed > 0:
@@ -682,22 +996,25 @@ class MovementMixin:
         resources["is_boosting"] = False
         resources["boost_cooldown_remaining"] = boost_cooldown
 
-        self.logs.append(  # type: ignore[attr-defined]
-            BattleLog(
-                timestamp=float(self.elapsed_time),  # type: ignore[attr-defined]
-                actor_id=actor.id,
-                action_type="BOOST_END",
-                message=(
-                    f"{self._format_actor_name(actor)} のブーストが終了した"  # type: ignore[attr-defined]
-                    f" (理由: {cancel_reason})"
-                ),
-                position_snapshot=actor.position,
-                details={"reason": cancel_reason},
-            )
-        )
-
+        self._log_boost_end(actor, cancel_reason)
         return True
 
+    def _log_boost_end(self, actor: MobileSuit, cancel_reason: str) -> None:
+        """BOOST_END ログを追記する."""
+        if not self._log_enabled("BOOST_END"):  # type: ignore[attr-defined]
+            return
+        self.logs.record(  # type: ignore[attr-defined]
+            timestamp=float(self.elapsed_time),  # type: ignore[attr-defined]
+            actor_id=actor.id,
+            action_type="BOOST_END",
+            message=(
+                f"{self._format_actor_name(actor)} のブーストが終了した"  # type: ignore[attr-defined]
+                f" (理由: {cancel_reason})"
+            ),
+            position_snapshot=self._unit_pos(actor),  # type: ignore[attr-defined]
+            details={"reason": cancel_reason},
+        )
+
     def _search_movement(self, actor: MobileSuit, dt: float = 0.1) -> None:
         """索敵移動: 未発見の敵を探すための移動."""
         # 敵対勢力を特定 (team_idが異なるユニットが敵)
@@ -710,11 +1027,12 @@ class MovementMixin:
         if not potential_targets:
             return
 
-        pos_actor = actor.position.to_numpy()
+        pos_actor = self._unit_pos(actor)  # type: ignore[attr-defined]
         unit_id = str(actor.id)
 
         # LOS 喪失済みの最終既知座標がある場合はそこへ向かう（Phase A）
-        last_known = self.unit_resources[unit_id].get("last_known_enemy_position", {})  # type: ignore[attr-defined]
+        resources = self.unit_resources[unit_id]  # type: ignore[attr-defined]
+        last_known = resources.get("last_known_enemy_position", {})
         if last_known:
             # 最も近い最終既知座標を選ぶ
             best_pos: np.ndarray | None = None
@@ -729,38 +1047,16 @@ class MovementMixin:
                 diff_vector = best_pos - pos_actor
                 distance = float(np.linalg.norm(diff_vector))
                 if distance > 0:
-                    desired_direction = self._calculate_potential_field(
-                        actor,
-                        target=None,
-                        retreat_points=self.retreat_points,  # type: ignore[attr-defined]
-                        dt=dt,
-                    )
-                    self._apply_inertia(actor, desired_direction, dt)
-                    if distance >= MOVE_LOG_MIN_DIST:
-                        self.logs.append(  # type: ignore[attr-defined]
-                            BattleLog(
-                                timestamp=self.elapsed_time,  # type: ignore[attr-defined]
-                                actor_id=actor.id,
-                                action_type="MOVE",
-                                message=(
-                                    f"{self._format_actor_name(actor)}が最終目撃地点へ向かっている"  # type: ignore[attr-defined]
-                                    f" (残距離: {int(distance)}m)"
-                                ),
-                                position_snapshot=actor.position,
-                                velocity_snapshot=Vector3.from_numpy(
-                                    self.unit_resources[unit_id]["velocity_vec"]  # type: ignore[attr-defined]
-                                ),
-                            )
-                        )
+                    self._move_unit(actor, None, dt, "MOVE_LAST_KNOWN", distance)
                     return
 
         # 最も近い敵の方向へ移動（まだ発見していなくても）
         closest_enemy = min(
             potential_targets,
-            key=lambda t: np.linalg.norm(t.position.to_numpy() - pos_actor),
+            key=lambda t: np.linalg.norm(self._unit_pos(t) - pos_actor),  # type: ignore[attr-defined]
         )
 
-        pos_target = closest_enemy.position.to_numpy()
+        pos_target = self._unit_pos(closest_enemy)  # type: ignore[attr-defined]
         diff_vector = pos_target - pos_actor
         distance = float(np.linalg.norm(diff_vector))
 
@@ -768,25 +1064,4 @@ class MovementMixin:
             return
 
         # ポテンシャルフィールドで目標方向を算出し、慣性モデルで移動
-        desired_direction = self._calculate_potential_field(
-            actor,
-            target=None,
-            retreat_points=self.retreat_points,  # type: ignore[attr-defined]
-            dt=dt,
-        )
-        self._apply_inertia(actor, desired_direction, dt)
-
-        # MOVE_LOG_MIN_DIST 以上の残距離のステップのみログ出力
-        if distance >= MOVE_LOG_MIN_DIST:
-            self.logs.append(  # type: ignore[attr-defined]
-                BattleLog(
-                    timestamp=self.elapsed_time,  # type: ignore[attr-defined]
-                    actor_id=actor.id,
-                    action_type="MOVE",
-                    message=f"{self._format_actor_name(actor)}が索敵中 (残距離: {int(distance)}m)",  # type: ignore[attr-defined]
-                    position_snapshot=actor.position,
-                    velocity_snapshot=Vector3.from_numpy(
-                        self.unit_resources[str(actor.id)]["velocity_vec"]  # type: ignore[attr-defined]
-                    ),
-                )
-            )
+        self._move_unit(actor, None, dt, "MOVE_SEARCH", distance)
@@ -0,0 +1,242 @@
+# backend/app/engine/profiler.py
+"""バトルエンジンのステップ内計測（フェーズ別タイマー・カウンタ）.
+
+`BattleSimulator.step()` の各フェーズ（エリア収縮・索敵・戦略評価・AI意思決定・
+胴体向き更新・行動・一括移動・撤退判定・リソース更新）の所要時間と、
+LOS 判定回数・ファジィ推論回数・グリッド同期回数・ログ出力件数などの
+カウンタを集計する。外部プロファイラを使わずに、ユニット数の増加で
+どのフェーズが重くなるかを確認するためのもの。
+
+無効時（デフォルト）は `phase()` が共有の nullcontext を返し、`count()` も
+即座に return するため、計測コードを残したままでもオーバーヘッドは小さい。
+
+Usage:
+    sim = BattleSimulator(player, enemies, profile=True)
+    ...
+    print(sim.profiler.format_table())
+
+    # 任意の区間だけ計測する場合
+    with sim.profiler.profiling():
+        for _ in range(100):
+            sim.step()
+    report = sim.profiler.to_dict()
+"""
+
+import json
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Any
+
+_NULL_PHASE: AbstractContextManager[None] = nullcontext()
+
+
+class _PhaseTimer:
+    """1フェーズ分の経過時間を StepProfiler へ加算するコンテキストマネージャ."""
+
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler: "StepProfiler", name: str) -> None:
+        self._profiler = profiler
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._profiler.add_time(self._name, time.perf_counter() - self._start)
+
+
+class StepProfiler:
+    """フェーズ別の累計時間・呼び出し回数と、名前付きカウンタのレジストリ.
+
+    Attributes:
+        enabled: 計測が有効かどうか
+        steps: 計測中に実行されたステップ数
+        total_seconds: 計測中のステップ全体の累計時間（秒）
+        phase_seconds: フェーズ名 → 累計時間（秒）。フェーズの実行順を保持する
+        phase_calls: フェーズ名 → 実行回数
+        counters: カウンタ名 → 累計値
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """レジストリを初期化する.
+
+        Args:
+            enabled: 生成時点で計測を有効にするかどうか
+        """
+        self.enabled = enabled
+        self.steps = 0
+        self.total_seconds = 0.0
+        self.phase_seconds: dict[str, float] = {}
+        self.phase_calls: dict[str, int] = {}
+        self.counters: dict[str, int] = {}
+
+    def reset(self) -> None:
+        """集計値をすべて破棄する（有効・無効の状態は維持する）."""
+        self.steps = 0
+        self.total_seconds = 0.0
+        self.phase_seconds.clear()
+        self.phase_calls.clear()
+        self.counters.clear()
+
+    def merge(self, other: "StepProfiler") -> None:
+        """別のプロファイラの集計値を加算する（複数バトルの合算用）.
+
+        Args:
+            other: 加算する集計値を持つプロファイラ
+        """
+        self.steps += other.steps
+        self.total_seconds += other.total_seconds
+        for name, seconds in other.phase_seconds.items():
+            self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + seconds
+            self.phase_calls[name] = (
+                self.phase_calls.get(name, 0) + other.phase_calls[name]
+            )
+        for name, value in other.counters.items():
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    @contextmanager
+    def profiling(self) -> Iterator["StepProfiler"]:
+        """With ブロックの区間だけ計測を有効にする.
+
+        Yields:
+            このプロファイラ自身
+        """
+        previous = self.enabled
+        self.enabled = True
+        try:
+            yield self
+        finally:
+            self.enabled = previous
+
+    # ------------------------------------------------------------------
+    # 計測
+    # ------------------------------------------------------------------
+
+    def phase(self, name: str) -> AbstractContextManager[None]:
+        """フェーズの所要時間を計測するコンテキストマネージャを返す.
+
+        Args:
+            name: フェーズ名
+
+        Returns:
+            計測用コンテキストマネージャ（無効時は何もしない nullcontext）
+        """
+        if not self.enabled:
+            return _NULL_PHASE
+        return _PhaseTimer(self, name)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """フェーズの所要時間を加算する.
+
+        Args:
+            name: フェーズ名
+            seconds: 加算する時間（秒）
+        """
+        self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + seconds
+        self.phase_calls[name] = self.phase_calls.get(name, 0) + 1
+
+    def add_step(self, seconds: float) -> None:
+        """ステップ1回分の所要時間を加算する.
+
+        Args:
+            seconds: ステップ全体の所要時間（秒）
+        """
+        self.steps += 1
+        self.total_seconds += seconds
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """カウンタを加算する（無効時は何もしない）.
+
+        Args:
+            name: カウンタ名
+            amount: 加算量
+        """
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    # ------------------------------------------------------------------
+    # 出力
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        """集計結果を JSON 化可能な dict で返す.
+
+        Returns:
+            steps / total_seconds / phases（フェーズ名 → seconds・calls・
+            ms_per_step・share）/ counters（カウンタ名 → 累計値・ステップ平均）
+        """
+        steps = max(self.steps, 1)
+        total = self.total_seconds
+        phases = {
+            name: {
+                "seconds": seconds,
+                "calls": self.phase_calls[name],
+                "ms_per_step": seconds * 1000.0 / steps,
+                "share": seconds / total if total > 0 else 0.0,
+            }
+            for name, seconds in self.phase_seconds.items()
+        }
+        counters = {
+            name: {"total": value, "per_step": value / steps}
+            for name, value in sorted(self.counters.items())
+        }
+        return {
+            "steps": self.steps,
+            "total_seconds": total,
+            "ms_per_step": total * 1000.0 / steps,
+            "phases": phases,
+            "counters": counters,
+        }
+
+    def to_json(self, indent: int | None = 2) -> str:
+        """集計結果を JSON 文字列で返す.
+
+        Args:
+            indent: json.dumps の indent
+
+        Returns:
+            `to_dict()` の JSON 文字列
+        """
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
+
+    def format_table(self) -> str:
+        """集計結果を CLI 表示用のテキスト表に整形する.
+
+        Returns:
+            `format_profile(self.to_dict())` の結果
+        """
+        return format_profile(self.to_dict())
+
+
+def format_profile(report: dict[str, Any]) -> str:
+    """`StepProfiler.to_dict()` の結果を CLI 表示用のテキスト表に整形する.
+
+    Args:
+        report: `StepProfiler.to_dict()` の戻り値
+
+    Returns:
+        フェーズ別時間とカウンタの表
+    """
+    lines = [
+        f"steps: {report['steps']}  total: {report['total_seconds']:.3f}s"
+        f"  ({report['ms_per_step']:.3f} ms/step)",
+        f"{'phase':<16} | {'ms/step':>10} | {'share':>7} | {'calls':>8}",
+        "-" * 50,
+    ]
+    for name, stats in report["phases"].items():
+        lines.append(
+            f"{name:<16} | {stats['ms_per_step']:>10.3f} | "
+            f"{stats['share']:>6.1%} | {stats['calls']:>8}"
+        )
+    if report["counters"]:
+        lines.append("")
+        lines.append(f"{'counter':<28} | {'total':>10} | {'per step':>10}")
+        lines.append("-" * 54)
+        for name, stats in report["counters"].items():
+            lines.append(
+                f"{name:<28} | {stats['total']:>10} | {stats['per_step']:>10.2f}"
+            )
+    return "\n".join(lines)
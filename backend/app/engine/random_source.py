@@ -0,0 +1,76 @@
+# backend/app/engine/random_source.py
+"""バトルエンジンが使う乱数源.
+
+エンジン内の確率判定（索敵・命中・クリティカル・フランキング等）は
+`BattleSimulator.rng` を、スポーン位置・障害物配置の配列サンプリングは
+同じシードから派生させた NumPy Generator を使う。これにより
+(入力, seed) からバトルをビット単位で再現できる。
+
+seed / rng をどちらも指定しない場合は従来どおり `random` モジュールの
+グローバル乱数を使う（`random.seed()` による固定・`random.random` の
+パッチがそのまま効く）。
+"""
+
+import random
+from collections.abc import Sequence
+from typing import Protocol, TypeVar
+
+import numpy as np
+
+_T = TypeVar("_T")
+
+
+class RandomSource(Protocol):
+    """エンジンが使う乱数 API（`random.Random` インスタンス / `random` モジュール）."""
+
+    def random(self) -> float:
+        """[0.0, 1.0) の一様乱数を返す."""
+        ...
+
+    def uniform(self, a: float, b: float) -> float:
+        """[a, b] の一様乱数を返す."""
+        ...
+
+    def choice(self, seq: Sequence[_T]) -> _T:
+        """空でないシーケンスから要素を1つ選ぶ."""
+        ...
+
+    def getrandbits(self, k: int, /) -> int:
+        """指定ビット数の乱数整数を返す（NumPy Generator のシード派生に使う）."""
+        ...
+
+
+def make_random_source(
+    seed: int | None = None, rng: random.Random | None = None
+) -> RandomSource:
+    """シード・乱数生成器の指定からエンジンの乱数源を決める.
+
+    Args:
+        seed: 乱数シード（rng 未指定時に `random.Random(seed)` を生成する）
+        rng: 使用する乱数生成器（seed より優先）
+
+    Returns:
+        乱数源。どちらも None の場合は `random` モジュール（グローバル乱数）
+    """
+    if rng is not None:
+        return rng
+    if seed is not None:
+        return random.Random(seed)
+    return random
+
+
+def make_numpy_rng(source: RandomSource) -> np.random.Generator:
+    """乱数源から配列サンプリング用の NumPy Generator を派生させる.
+
+    グローバル乱数（`random` モジュール）の場合は従来どおりシードなしの
+    `np.random.default_rng()` を返し、グローバル乱数の状態を消費しない。
+
+    Args:
+        source: `make_random_source()` の戻り値
+
+    Returns:
+        NumPy の乱数生成器
+    """
+    if source is random:
+        return np.random.default_rng()
+    return np.random.default_rng(source.getrandbits(64))
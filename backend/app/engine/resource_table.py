@@ -0,0 +1,401 @@
+# backend/app/engine/resource_table.py
+"""ユニットのリソース状態（EN・推進剤・ブースト・武器弾数/クールダウン）の配列テーブル.
+
+従来の `unit_resources` はユニットごとの入れ子 dict で、リフレッシュフェーズが
+ユニット×武器ごとに dict の読み書きを行っていた。`ResourceTable` はこれらを
+ユニット行インデックス（`BattleSimulator.units` と同順）で引く NumPy 配列として
+保持し、`refresh()` で全ユニット分の EN 回復・ブースト消費・クールダウン減算を
+一括で行う。
+
+既存コード・テストとの互換のため、`unit_resources[unit_id]` は引き続き dict と
+同じインターフェースで参照できる（`UnitResourceView`）。配列で保持するキーは
+読み書きともテーブルへ直接反映され（ライトスルー）、それ以外のキー
+（current_action / velocity_vec / status など）はビュー内の dict に保持する。
+
+武器の列は全ユニット分を1次元に連結して保持する（`weapon_owner` が所有ユニットの
+行インデックス）。弾数無制限（`current_ammo is None`）は NaN で表す。
+"""
+
+from collections.abc import Iterator, Mapping, MutableMapping
+from typing import Any
+
+import numpy as np
+
+from app.engine.constants import DEFAULT_BOOST_EN_COST
+from app.models.models import MobileSuit
+
+# unit_resources のキー → ResourceTable の配列属性名
+_UNIT_ARRAY_KEYS: dict[str, str] = {
+    "current_en": "en",
+    "current_propellant": "propellant",
+    "is_boosting": "is_boosting",
+    "boost_elapsed": "boost_elapsed",
+    "boost_cooldown_remaining": "boost_cooldown",
+}
+_WEAPON_STATES_KEY = "weapon_states"
+_WEAPON_ARRAY_KEYS: tuple[str, str] = ("current_ammo", "cooldown_remaining_sec")
+
+
+class ResourceTable:
+    """全ユニットのリソース状態を行インデックスで保持する配列群.
+
+    Attributes:
+        row_of: ユニットID（文字列）→ 行インデックス
+        en / propellant / boost_elapsed / boost_cooldown: ユニット行ごとの現在値
+        is_boosting: ユニット行ごとのブースト中フラグ
+        max_en / en_recovery / boost_en_cost: 機体の固定値（生成時に取得）
+        weapon_owner: 武器列 → 所有ユニットの行インデックス
+        weapon_ammo: 武器列ごとの残弾数（無制限は NaN）
+        weapon_cooldown: 武器列ごとの残りクールダウン（秒）
+        weapon_cols: ユニット行ごとの 武器ID → 武器列インデックス
+    """
+
+    def __init__(self, units: list[MobileSuit]) -> None:
+        """ユニットリストから初期状態（EN・推進剤は最大値、武器は満タン）を構築する.
+
+        Args:
+            units: 対象ユニット（BattleSimulator.units と同順）
+        """
+        self.row_of: dict[str, int] = {str(u.id): i for i, u in enumerate(units)}
+        self.max_en: np.ndarray = np.array([float(u.max_en) for u in units])
+        self.en_recovery: np.ndarray = np.array([float(u.en_recovery) for u in units])
+        self.boost_en_cost: np.ndarray = np.array(
+            [float(getattr(u, "boost_en_cost", DEFAULT_BOOST_EN_COST)) for u in units]
+        )
+        self.en: np.ndarray = self.max_en.copy()
+        self.propellant: np.ndarray = np.array([float(u.max_propellant) for u in units])
+        n = len(units)
+        self.is_boosting: np.ndarray = np.zeros(n, dtype=bool)
+        self.boost_elapsed: np.ndarray = np.zeros(n)
+        self.boost_cooldown: np.ndarray = np.zeros(n)
+
+        self.weapon_cols: list[dict[str, int]] = [{} for _ in range(n)]
+        owners: list[int] = []
+        ammo: list[float] = []
+        for i, u in enumerate(units):
+            for weapon in u.weapons:
+                self.weapon_cols[i][weapon.id] = len(owners)
+                owners.append(i)
+                ammo.append(_ammo_to_float(weapon.max_ammo))
+        self.weapon_owner: np.ndarray = np.array(owners, dtype=np.intp)
+        self.weapon_ammo: np.ndarray = np.array(ammo, dtype=float)
+        self.weapon_cooldown: np.ndarray = np.zeros(len(owners))
+
+    def add_weapon(
+        self, row: int, weapon_id: str, ammo: int | None, cooldown: float
+    ) -> int:
+        """ユニット行に武器列を追加する（既存の武器IDなら値を上書きする）.
+
+        Args:
+            row: ユニット行インデックス
+            weapon_id: 武器ID
+            ammo: 残弾数（無制限は None）
+            cooldown: 残りクールダウン（秒）
+
+        Returns:
+            武器列インデックス
+        """
+        col = self.weapon_cols[row].get(weapon_id)
+        if col is None:
+            col = len(self.weapon_owner)
+            self.weapon_owner = np.append(self.weapon_owner, row)
+            self.weapon_ammo = np.append(self.weapon_ammo, 0.0)
+            self.weapon_cooldown = np.append(self.weapon_cooldown, 0.0)
+            self.weapon_cols[row][weapon_id] = col
+        self.weapon_ammo[col] = _ammo_to_float(ammo)
+        self.weapon_cooldown[col] = cooldown
+        return col
+
+    def refresh(self, alive: np.ndarray, dt: float, recovery_steps: int = 1) -> None:
+        """生存ユニットの EN・ブースト・クールダウンを1ステップ分更新する.
+
+        - ブースト中: EN を boost_en_cost × dt 消費し、継続時間に dt を加算する。
+        - 非ブースト中: EN を en_recovery × recovery_steps 回復（最大値まで）し、
+          ブーストクールダウンを dt 減算する。
+        - 全武器のクールダウンを dt 減算する（0 未満にはしない）。
+
+        Args:
+            alive: ユニット行ごとの生存フラグ（撃破済みユニットは更新しない）
+            dt: 経過時間（秒）
+            recovery_steps: EN 回復の適用回数（EN 回復はステップ単位のため、
+                複数ステップをまとめて進める場合はそのステップ数）
+        """
+        boosting = alive & self.is_boosting
+        recovering = alive & ~self.is_boosting
+
+        if boosting.any():
+            self.en[boosting] = np.maximum(
+                0.0, self.en[boosting] - self.boost_en_cost[boosting] * dt
+            )
+            self.boost_elapsed[boosting] += dt
+
+        if recovering.any():
+            self.en[recovering] = np.minimum(
+                self.en[recovering] + self.en_recovery[recovering] * recovery_steps,
+                self.max_en[recovering],
+            )
+            cooling = recovering & (self.boost_cooldown > 0.0)
+            self.boost_cooldown[cooling] = np.maximum(
+                0.0, self.boost_cooldown[cooling] - dt
+            )
+
+        if len(self.weapon_owner):
+            cooling = alive[self.weapon_owner] & (self.weapon_cooldown > 0.0)
+            self.weapon_cooldown[cooling] = np.maximum(
+                0.0, self.weapon_cooldown[cooling] - dt
+            )
+
+
+def _ammo_to_float(ammo: int | None) -> float:
+    return float("nan") if ammo is None else float(ammo)
+
+
+class WeaponStateView(MutableMapping[str, Any]):
+    """1武器分の状態を dict として参照するビュー（テーブルへライトスルー）."""
+
+    __slots__ = ("_table", "_col", "_extra")
+
+    def __init__(self, table: ResourceTable, col: int) -> None:
+        """ビューを生成する.
+
+        Args:
+            table: 参照先のリソーステーブル
+            col: 武器列インデックス
+        """
+        self._table = table
+        self._col = col
+        self._extra: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        """キーの値を返す（配列で保持するキーはテーブルから読む）."""
+        if key == "cooldown_remaining_sec":
+            return float(self._table.weapon_cooldown[self._col])
+        if key == "current_ammo":
+            ammo = self._table.weapon_ammo[self._col]
+            return None if np.isnan(ammo) else int(ammo)
+        return self._extra[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """dict.get と同じ（ホットパス向けに例外を介さず引く）."""
+        if key in _WEAPON_ARRAY_KEYS:
+            return self[key]
+        return self._extra.get(key, default)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """キーに値を書き込む（配列で保持するキーはテーブルへ書く）."""
+        if key == "cooldown_remaining_sec":
+            self._table.weapon_cooldown[self._col] = value
+        elif key == "current_ammo":
+            self._table.weapon_ammo[self._col] = _ammo_to_float(value)
+        else:
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        """キーを削除する（配列で保持するキーは削除できない）."""
+        if key in _WEAPON_ARRAY_KEYS:
+            raise KeyError(f"{key} はテーブルで保持するため削除できません")
+        del self._extra[key]
+
+    def __contains__(self, key: object) -> bool:
+        """キーが存在するかを返す."""
+        return key in _WEAPON_ARRAY_KEYS or key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        """キーを順に返す."""
+        yield from _WEAPON_ARRAY_KEYS
+        yield from self._extra
+
+    def __len__(self) -> int:
+        """キー数を返す."""
+        return len(_WEAPON_ARRAY_KEYS) + len(self._extra)
+
+    def __repr__(self) -> str:
+        """通常の dict と同じ形式の文字列を返す."""
+        return repr(dict(self))
+
+
+class WeaponStatesView(MutableMapping[str, Any]):
+    """1ユニット分の 武器ID → 武器状態 を dict として参照するビュー.
+
+    dict を代入した場合はその値をテーブルの武器列へ書き込み、以降は
+    `WeaponStateView` として参照される。
+    """
+
+    __slots__ = ("_table", "_row", "_views")
+
+    def __init__(self, table: ResourceTable, row: int) -> None:
+        """ビューを生成する.
+
+        Args:
+            table: 参照先のリソーステーブル
+            row: ユニット行インデックス
+        """
+        self._table = table
+        self._row = row
+        self._views: dict[str, WeaponStateView] = {
+            weapon_id: WeaponStateView(table, col)
+            for weapon_id, col in table.weapon_cols[row].items()
+        }
+
+    def __getitem__(self, weapon_id: str) -> WeaponStateView:
+        """武器IDの武器状態ビューを返す."""
+        return self._views[weapon_id]
+
+    def get(self, weapon_id: str, default: Any = None) -> Any:
+        """dict.get と同じ（ホットパス向けに例外を介さず引く）."""
+        return self._views.get(weapon_id, default)
+
+    def __setitem__(self, weapon_id: str, value: Mapping[str, Any]) -> None:
+        """武器状態をテーブルの武器列へ書き込む（未登録の武器IDなら列を追加する）."""
+        if isinstance(value, WeaponStateView) and value._table is self._table:
+            if value._col == self._table.weapon_cols[self._row].get(weapon_id):
+                return
+        col = self._table.add_weapon(
+            self._row,
+            weapon_id,
+            value.get("current_ammo"),
+            value.get("cooldown_remaining_sec", 0.0),
+        )
+        view = WeaponStateView(self._table, col)
+        for key, item in value.items():
+            if key not in _WEAPON_ARRAY_KEYS:
+                view[key] = item
+        self._views[weapon_id] = view
+
+    def __delitem__(self, weapon_id: str) -> None:
+        """武器IDの武器状態を削除する."""
+        del self._views[weapon_id]
+        col = self._table.weapon_cols[self._row].pop(weapon_id)
+        # 孤立した列はクールダウン 0 のまま残す（refresh で更新対象外になる）
+        self._table.weapon_cooldown[col] = 0.0
+
+    def __contains__(self, weapon_id: object) -> bool:
+        """武器IDが存在するかを返す."""
+        return weapon_id in self._views
+
+    def __iter__(self) -> Iterator[str]:
+        """武器IDを順に返す."""
+        return iter(self._views)
+
+    def __len__(self) -> int:
+        """武器数を返す."""
+        return len(self._views)
+
+    def __repr__(self) -> str:
+        """通常の dict と同じ形式の文字列を返す."""
+        return repr({k: dict(v) for k, v in self._views.items()})
+
+
+class UnitResourceView(MutableMapping[str, Any]):
+    """1ユニット分の `unit_resources` エントリを dict として参照するビュー.
+
+    EN・推進剤・ブースト状態・武器状態はテーブルの配列へライトスルーし、
+    それ以外のキーはビュー内の dict に保持する。
+    """
+
+    __slots__ = ("_table", "_row", "_weapons", "_extra")
+
+    def __init__(self, table: ResourceTable, row: int) -> None:
+        """ビューを生成する.
+
+        Args:
+            table: 参照先のリソーステーブル
+            row: ユニット行インデックス
+        """
+        self._table = table
+        self._row = row
+        self._weapons = WeaponStatesView(table, row)
+        self._extra: dict[str, Any] = {}
+
+    @property
+    def row(self) -> int:
+        """参照先のユニット行インデックス."""
+        return self._row
+
+    def __getitem__(self, key: str) -> Any:
+        """キーの値を返す（配列で保持するキーはテーブルから読む）."""
+        attr = _UNIT_ARRAY_KEYS.get(key)
+        if attr is not None:
+            value = getattr(self._table, attr)[self._row]
+            return bool(value) if attr == "is_boosting" else float(value)
+        if key == _WEAPON_STATES_KEY:
+            return self._weapons
+        return self._extra[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """dict.get と同じ（ホットパス向けに例外を介さず引く）."""
+        if key in _UNIT_ARRAY_KEYS or key == _WEAPON_STATES_KEY:
+            return self[key]
+        return self._extra.get(key, default)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """キーに値を書き込む（配列で保持するキーはテーブルへ書く）."""
+        attr = _UNIT_ARRAY_KEYS.get(key)
+        if attr is not None:
+            getattr(self._table, attr)[self._row] = value
+        elif key == _WEAPON_STATES_KEY:
+            if value is not self._weapons:
+                for weapon_id in list(self._weapons):
+                    del self._weapons[weapon_id]
+                for weapon_id, state in value.items():
+                    self._weapons[weapon_id] = state
+        else:
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        """キーを削除する（配列で保持するキーは削除できない）."""
+        if key in _UNIT_ARRAY_KEYS or key == _WEAPON_STATES_KEY:
+            raise KeyError(f"{key} はテーブルで保持するため削除できません")
+        del self._extra[key]
+
+    def __contains__(self, key: object) -> bool:
+        """キーが存在するかを返す."""
+        return (
+            key in _UNIT_ARRAY_KEYS or key == _WEAPON_STATES_KEY or key in self._extra
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        """キーを順に返す."""
+        yield from _UNIT_ARRAY_KEYS
+        yield _WEAPON_STATES_KEY
+        yield from self._extra
+
+    def __len__(self) -> int:
+        """キー数を返す."""
+        return len(_UNIT_ARRAY_KEYS) + 1 + len(self._extra)
+
+    def __repr__(self) -> str:
+        """通常の dict と同じ形式の文字列を返す."""
+        return repr(dict(self))
+
+
+class UnitResources(dict[str, Any]):
+    """`BattleSimulator.unit_resources`: ユニットID → `UnitResourceView` の dict.
+
+    参照は通常の dict と同じ。テーブルに行を持つユニットへ dict を代入した場合は
+    その値をテーブルへ書き込んだ新しいビューに置き換える。テーブル外のユニット
+    （生成後に `units` へ追加されたユニット等）は代入された dict をそのまま保持する。
+    """
+
+    def __init__(self, table: ResourceTable) -> None:
+        """テーブルの全ユニット行分のビューを生成する.
+
+        Args:
+            table: 参照先のリソーステーブル
+        """
+        super().__init__(
+            (unit_id, UnitResourceView(table, row))
+            for unit_id, row in table.row_of.items()
+        )
+        self.table = table
+
+    def __setitem__(self, unit_id: str, value: Any) -> None:
+        """ユニットのリソース状態を登録する（テーブル上のユニットはビューに変換する）."""
+        row = self.table.row_of.get(unit_id)
+        if row is None or isinstance(value, UnitResourceView):
+            super().__setitem__(unit_id, value)
+            return
+        view = UnitResourceView(self.table, row)
+        for key, item in value.items():
+            view[key] = item
+        super().__setitem__(unit_id, view)
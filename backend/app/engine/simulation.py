@@ -1,6 +1,8 @@
 # backend/app/engine/simulation.py
 import logging
 import math
+import random
+import time
 import uuid
 
 import numpy as np
@@ -11,9 +13,14 @@ from app.engine.battle_utils import BattleUtilsMixin
 from app.engine.calculator import PilotStats
 from app.engine.combat import CombatMixin, has_los
 from app.engine.constants import (
+    ADAPTIVE_STEP_MAX_SPAN,
     ALLY_REPULSION_RADIUS,
     AREA_PER_UNIT,
     FUZZY_RULES_DIR,
+    LOG_ACTION_TYPE_LEVELS,
+    LOG_LEVEL_DEBUG,
+    LOG_LEVEL_RANKS,
+    LOG_LEVEL_REPLAY,
     MAX_FIELD_SIZE,
     MIN_FIELD_SIZE,
     MIN_SHRUNK_FIELD_SIZE,
@@ -37,14 +44,23 @@ from app.engine.constants import (
     VALID_STRATEGY_MODES,
 )
 from app.engine.fuzzy_engine import FuzzyEngine
-from app.engine.fuzzy_rule_cache import FuzzyRuleCache
-from app.engine.movement import MovementMixin
-from app.engine.spatial_grid import PointSpatialGrid, UnitSpatialGrid
+from app.engine.fuzzy_rule_cache import FuzzyRuleCache, get_shared_rule_cache
+from app.engine.log_buffer import BattleLogBuffer
+from app.engine.movement import MovementMixin, MovementRequest
+from app.engine.profiler import StepProfiler
+from app.engine.random_source import RandomSource, make_numpy_rng, make_random_source
+from app.engine.resource_table import ResourceTable, UnitResources
+from app.engine.spatial_grid import (
+    PointSpatialGrid,
+    UnitSpatialGrid,
+    UnitSpatialIndex,
+)
 from app.engine.strategy_controller import TeamMetrics, TeamStrategyController
 from app.engine.targeting import TargetingMixin
+from app.engine.unit_profile import UnitProfile, build_unit_profile
+from app.engine.unit_state import UnitStateStore
 from app.models.models import (
     BattleField,
-    BattleLog,
     MobileSuit,
     Obstacle,
     RetreatPoint,
@@ -149,6 +165,20 @@ def _resolve_flanking_skill_level(
     return 1 if getattr(unit, "personality", None) == "AGGRESSIVE" else 0
 
 
+def _resolve_log_level_rank(log_level: str) -> int:
+    """log_level を LOG_LEVEL_RANKS の順位へ変換する.
+
+    Raises:
+        ValueError: log_level が未知の値の場合
+    """
+    if log_level not in LOG_LEVEL_RANKS:
+        raise ValueError(
+            f"未知の log_level です: {log_level!r} "
+            f"(有効値: {', '.join(LOG_LEVEL_RANKS)})"
+        )
+    return LOG_LEVEL_RANKS[log_level]
+
+
 class BattleSimulator(
     BattleUtilsMixin,
     CombatMixin,
@@ -173,6 +203,16 @@ class BattleSimulator(
         enable_hot_reload: bool = False,
         obstacles: list[Obstacle] | None = None,
         battlefield: BattleField | None = None,
+        batched_detection: bool = False,
+        batched_movement: bool = False,
+        log_level: str = LOG_LEVEL_DEBUG,
+        seed: int | None = None,
+        rng: random.Random | None = None,
+        profile: bool = False,
+        adaptive_stepping: bool = False,
+        stalemate_steps: int | None = None,
+        fuzzy_lut_subdivisions: int | None = None,
+        max_steps: int = _MAX_STEPS,
     ):
         """初期化.
 
@@ -193,10 +233,53 @@ class BattleSimulator(
             obstacles: フィールド上の障害物リスト (Phase A — LOS システム)
             battlefield: バトルフィールド定義 (Phase 6-3)。obstacle_density / spawn_zones を含む。
                 obstacles と同時に指定した場合は obstacles が優先される。
+            batched_detection: True の場合、索敵フェーズを全ペアの配列演算による
+                一括計算版（`_detection_phase_batched()`）で実行する（大人数ルーム向け）。
+                確率判定の乱数消費順のみ従来と異なる。
+            batched_movement: True の場合、行動フェーズでは移動要求を積むだけにして、
+                行動フェーズ後に全ユニットのポテンシャルフィールド・慣性を配列演算で
+                一括計算する（`_movement_phase_batched()`）。各ユニットはステップ内で
+                共通の位置を参照して同時に移動するため、先に移動したユニットの新位置を
+                後続ユニットが参照する従来の逐次処理とは軌跡が異なる（大人数ルーム向け）。
+            log_level: バトルログの出力レベル（LOG_LEVEL_DIGEST / LOG_LEVEL_REPLAY /
+                LOG_LEVEL_DEBUG）。レベル未満のログは生成自体を省略する。
+                fuzzy_scores は LOG_LEVEL_DEBUG の場合のみ記録する。省略される
+                ログは乱数を消費しないため、戦闘結果はレベルに依存しない。
+            seed: 乱数シード。指定するとエンジン内の全ての乱数判定とスポーン位置・
+                障害物配置がこのシードから決まり、(入力, seed) からバトルを再現できる。
+            rng: エンジン内の乱数判定に使う乱数生成器（seed より優先）。
+                seed / rng をどちらも省略した場合は `random` モジュールの
+                グローバル乱数を使う（従来の挙動）。
+            profile: True の場合、生成時点からフェーズ別の所要時間・カウンタを
+                `self.profiler` に集計する（`StepProfiler.profiling()` で区間を
+                限定して有効にすることもできる）。
+            adaptive_stepping: True の場合、どのチームも敵を発見しておらず、
+                最大接近速度で近づいても次の数ステップ以内に索敵・射程圏へ入り得ない間は
+                最大 ADAPTIVE_STEP_MAX_SPAN ステップ分の dt を1ステップにまとめて進める
+                （接近中の AI 意思決定・ターゲット選定の回数を減らす）。接敵し得る距離に
+                なった時点で通常の dt に戻る。`step_count` はまとめたステップ数分進む。
+            stalemate_steps: 指定した場合、全ユニットの HP とマップ境界が変化しないまま
+                このステップ数が経過し、かつエリア収縮が下限到達・停止済みであれば
+                膠着とみなして引き分け（`is_stalemate=True`）で終了する。
+            fuzzy_lut_subdivisions: 指定した場合、ターゲット選択・武器選択レイヤーの
+                ファジィ推論を事前計算したルックアップテーブルの補間で近似する
+                （値はメンバーシップ関数の折れ点間に追加する格子点の数。
+                app/engine/fuzzy_lut.py 参照）。近似誤差により選択結果が厳密推論と
+                変わり得る。None の場合は厳密推論のみ（デフォルト）。
+            max_steps: 最大ステップ数。到達すると引き分けとして終了する。
+                適応ステップ幅でまとめて進める場合もこの値を超えない。
+
+        Raises:
+            ValueError: log_level が未知の値の場合
 
         Note:
             team_id が未設定のユニットは in-place で team_id が自動付与されます。
         """
+        self.log_level: str = log_level
+        self._max_steps: int = max_steps
+        self._log_level_rank: int = _resolve_log_level_rank(log_level)
+        # fuzzy_scores（推論過程のデバッグ情報）を記録するか
+        self._record_fuzzy_scores: bool = log_level == LOG_LEVEL_DEBUG
         self.player = player
         self.enemies = enemies
         self.units: list[MobileSuit] = [player] + enemies
@@ -210,13 +293,22 @@ class BattleSimulator(
         self._unit_order_index: dict[uuid.UUID, int] = {
             unit.id: i for i, unit in enumerate(self.units)
         }
-        self.logs: list[BattleLog] = []
+        # バトルログ（列指向バッファ。Sequence[BattleLog] として参照可能）
+        self.logs: BattleLogBuffer = BattleLogBuffer()
         self.elapsed_time: float = 0.0
         self._step_count: int = 0
+        # 現在のステップが進める基準ステップ数（適応ステップ幅。通常は1）
+        self._step_span: int = 1
         self.is_finished = False
+        # stalemate_steps による膠着終了かどうか
+        self.is_stalemate = False
+        # 索敵・移動で使うセルサイズ別グリッドの永続インデックス。毎ステップ
+        # 再構築せず、_spatial_grid() の呼び出し時にセル境界を跨いだユニット・
+        # 撃破されたユニットだけを差分更新する。
+        self._spatial_index: UnitSpatialIndex = UnitSpatialIndex(self.units)
         # ポテンシャルフィールド計算用のグリッド（Issue #450）。step() の冒頭で
         # 毎ステップ None にリセットされ、そのステップ内で最初に必要になった
-        # タイミングで _get_movement_grid() が最新位置から再構築する（遅延構築）。
+        # タイミングで _get_movement_grid() が最新位置へ同期する（遅延同期）。
         self._movement_grid: UnitSpatialGrid | None = None
         # 高脅威敵斥力計算用のグリッド（Issue #453）。セルサイズが上記と異なるため
         # 別キャッシュとして持つ。同様に step() の冒頭で毎ステップリセットされる。
@@ -228,6 +320,28 @@ class BattleSimulator(
         # （キー自体に計算時点の _step_count を持たせているため、ステップが
         # 進めば自然に無効化される）。
         self._fuzzy_target_cache: dict[str, tuple[int, MobileSuit | None]] = {}
+        # ユニットペア単位の LOS 判定キャッシュ（CombatMixin._check_los 参照）。
+        # (始点ID, 終点ID) → (始点の位置バージョン, 終点の位置バージョン, LOS)。
+        # step() の冒頭で毎ステップ破棄する。
+        self._los_cache: dict[tuple[uuid.UUID, uuid.UUID], tuple[int, int, bool]] = {}
+        # 障害物の中心座標・半径配列（CombatMixin._get_obstacle_arrays 参照）
+        self._obstacle_arrays_cache: (
+            tuple[list[Obstacle], int, np.ndarray, np.ndarray] | None
+        ) = None
+        # 乱数源（app/engine/random_source.py 参照）。スポーン領域・障害物の生成より前に決める
+        self.rng: RandomSource = make_random_source(seed, rng)
+        self._np_rng: np.random.Generator = make_numpy_rng(self.rng)
+        # フェーズ別タイマー・カウンタ（app/engine/profiler.py 参照）
+        self.profiler: StepProfiler = StepProfiler(enabled=profile)
+        self._batched_detection: bool = batched_detection
+        self._batched_movement: bool = batched_movement
+        self._adaptive_stepping: bool = adaptive_stepping
+        self._stalemate_steps: int | None = stalemate_steps
+        # 膠着判定: 直近で変化した (HP 合計, マップ境界) と、その変化を観測したステップ
+        self._stalemate_state: tuple[float, tuple[float, float]] | None = None
+        self._stalemate_since_step: int = 0
+        # batched_movement 時に行動フェーズ中に積まれる移動要求（MovementMixin 参照）
+        self._movement_requests: list[MovementRequest] = []
         self.player_skills = player_skills or {}
         self.environment = environment
         self.special_effects: list[str] = special_effects or []
@@ -239,6 +353,17 @@ class BattleSimulator(
             self.player, self.enemies, self.player_pilot_stats, npc_pilot_stats
         )
 
+        # ユニット ID → 静的プロファイル（攻撃力・武器分類・耐性・機動パラメータ・
+        # 地形補正・パイロットステータス）。装備が変わらない限り再計算しない
+        # （unit_profile.py 参照）
+        # キーはユニットオブジェクトの id()（SQLModel の属性参照を避けるため。ユニットは
+        # self.units が戦闘終了まで保持するので id が再利用されることはない）
+        self._unit_profiles: dict[int, UnitProfile] = {}
+        for unit in self.units:
+            self._unit_profile(unit)
+        # unit.strategy_mode の生の値 → 解決済みの戦略モード
+        self._strategy_mode_cache: dict[object, str] = {}
+
         # team_id が未設定のユニットにはソロ参加用のIDを自動付与
         # (map_bounds 計算でチーム数を使うため、フィールドサイズ決定より前に行う)
         for unit in self.units:
@@ -333,33 +458,24 @@ class BattleSimulator(
         }
 
         # リソース状態管理（戦闘中の一時ステータス）
-        self.unit_resources: dict = {}
+        # EN・推進剤・ブースト・武器弾数/クールダウンは配列テーブルで保持し、
+        # unit_resources[unit_id] はそれを dict として参照するビュー
+        # （resource_table.py 参照）
+        self._resource_table: ResourceTable = ResourceTable(self.units)
+        self.unit_resources: UnitResources = UnitResources(self._resource_table)
         for unit in self.units:
             unit_id = str(unit.id)
-            self.unit_resources[unit_id] = {
-                "current_en": unit.max_en,
-                "current_propellant": unit.max_propellant,
-                "weapon_states": {},
-                "current_action": "MOVE",  # 中階層ファジィ推論で決定した行動
-                "velocity_vec": np.zeros(3),  # 現在の速度ベクトル (3D, m/s)
-                "movement_heading_deg": 0.0,  # 移動方向の向き (XZ平面, 度) (Phase 6-1: heading_deg からリネーム)
-                "body_heading_deg": 0.0,  # 胴体（砲塔）の向き (XZ平面, 度) (Phase 6-1)
-                "status": "ACTIVE",  # ユニット状態: ACTIVE / RETREATED / DESTROYED (Phase 3-3)
-                "last_known_enemy_position": {},  # {enemy_id: [x, y, z]} LOS 喪失時の最終座標 (Phase A)
-                "is_boosting": False,  # ブースト中フラグ (Phase B)
-                "boost_elapsed": 0.0,  # 現ブーストの継続時間 (s) (Phase B)
-                "boost_cooldown_remaining": 0.0,  # 残クールダウン時間 (s) (Phase B)
-                "flanking_skill_level": 0,  # フランキングスキルレベル (Phase E-3.5)
-            }
-            # 各武器のリソース状態を初期化
-            for weapon in unit.weapons:
-                weapon_id = weapon.id
-                self.unit_resources[unit_id]["weapon_states"][weapon_id] = {
-                    "current_ammo": weapon.max_ammo
-                    if weapon.max_ammo is not None
-                    else None,
-                    "cooldown_remaining_sec": 0.0,  # 残りクールダウン時間（秒）(Phase 6-2)
+            self.unit_resources[unit_id].update(
+                {
+                    "current_action": "MOVE",  # 中階層ファジィ推論で決定した行動
+                    "velocity_vec": np.zeros(3),  # 現在の速度ベクトル (3D, m/s)
+                    "movement_heading_deg": 0.0,  # 移動方向の向き (XZ平面, 度) (Phase 6-1: heading_deg からリネーム)
+                    "body_heading_deg": 0.0,  # 胴体（砲塔）の向き (XZ平面, 度) (Phase 6-1)
+                    "status": "ACTIVE",  # ユニット状態: ACTIVE / RETREATED / DESTROYED (Phase 3-3)
+                    "last_known_enemy_position": {},  # {enemy_id: [x, y, z]} LOS 喪失時の最終座標 (Phase A)
+                    "flanking_skill_level": 0,  # フランキングスキルレベル (Phase E-3.5)
                 }
+            )
 
             # フランキングスキルレベルの解決 (Phase E-3.5)
             self.unit_resources[unit_id]["flanking_skill_level"] = (
@@ -370,29 +486,30 @@ class BattleSimulator(
                 )
             )
 
-        # 中階層ファジィ推論エンジン（AGGRESSIVEルールセット）
-        self._fuzzy_engine: FuzzyEngine = FuzzyEngine.from_json(
-            FUZZY_RULES_DIR / "aggressive.json", default_output={"action": 0.0}
-        )
-        # 低階層ファジィ推論エンジン: ターゲット選択（AGGRESSIVEルールセット）
-        self._target_selection_fuzzy_engine: FuzzyEngine = FuzzyEngine.from_json(
-            FUZZY_RULES_DIR / "aggressive_target_selection.json",
-            default_output={"target_priority": 0.0},
-        )
-        # 低階層ファジィ推論エンジン: 武器選択（AGGRESSIVEルールセット）
-        self._weapon_selection_fuzzy_engine: FuzzyEngine = FuzzyEngine.from_json(
-            FUZZY_RULES_DIR / "aggressive_weapon_selection.json",
-            default_output={"weapon_score": 0.0},
-        )
+        # ユニット状態の SoA ストア。step() の冒頭で MobileSuit / unit_resources から
+        # 一括ロードし、ステップ内のホットパスはこの配列を参照する
+        # （unit_state.py 参照）
+        self._unit_state: UnitStateStore = UnitStateStore(self.units)
 
         # ホットリロード設定 (Phase 5-2)
+        # ルールキャッシュはプロセス内で共有し、JSON のロードはプロセスごとに1回のみ
         self._enable_hot_reload: bool = enable_hot_reload
-        self._rule_cache: FuzzyRuleCache = FuzzyRuleCache(FUZZY_RULES_DIR)
+        self._rule_cache: FuzzyRuleCache = get_shared_rule_cache(
+            FUZZY_RULES_DIR, fuzzy_lut_subdivisions
+        )
         # ホットリロード無効時はスナップショットとしてキャッシュから一度だけ取得
         self._cached_engines: dict[str, dict[str, FuzzyEngine]] = (
             self._rule_cache.get_engines()
+            if enable_hot_reload
+            else self._rule_cache.snapshot()
         )
 
+        # 中階層・低階層ファジィ推論エンジン（戦略モード未解決時の AGGRESSIVE ルールセット）
+        aggressive_engines = self._cached_engines["AGGRESSIVE"]
+        self._fuzzy_engine: FuzzyEngine = aggressive_engines["behavior"]
+        self._target_selection_fuzzy_engine: FuzzyEngine = aggressive_engines["target"]
+        self._weapon_selection_fuzzy_engine: FuzzyEngine = aggressive_engines["weapon"]
+
         # チームレベル戦略コントローラ (Phase 4-2)
         team_ids = {unit.team_id for unit in self.units if unit.team_id is not None}
         self._strategy_controllers: dict[str, TeamStrategyController] = {
@@ -555,7 +672,7 @@ class BattleSimulator(
             ]
             radius = SPAWN_ZONE_RADIUS_4TEAM
 
-        rng = np.random.default_rng()
+        rng = self._np_rng
         centers = [
             self._find_clear_spawn_center(center, radius, rng) for center in centers
         ]
@@ -749,7 +866,7 @@ class BattleSimulator(
         map_min, map_max = self.map_bounds
         field_center = (map_min + map_max) / 2.0
 
-        rng = np.random.default_rng()
+        rng = self._np_rng
         for team_id, units in team_units.items():
             zone = zone_map[team_id]
 
@@ -809,7 +926,7 @@ class BattleSimulator(
         cell_size = (map_max - map_min) / n
 
         obstacles: list[Obstacle] = []
-        rng = np.random.default_rng()
+        rng = self._np_rng
         obs_counter = 0
 
         for i in range(n):
@@ -853,12 +970,52 @@ class BattleSimulator(
             return self._rule_cache.get_engines()
         return self._cached_engines
 
+    def _unit_profile(self, unit: MobileSuit) -> UnitProfile:
+        """ユニットの静的プロファイルを返す（未計算の場合は計算する）.
+
+        Args:
+            unit: 対象ユニット
+
+        Returns:
+            静的プロファイル
+        """
+        profile = self._unit_profiles.get(id(unit))
+        if profile is None:
+            profile = build_unit_profile(
+                unit,
+                self.environment,
+                self.special_effects,
+                self.unit_pilot_stats.get(str(unit.id), PilotStats()),
+            )
+            self._unit_profiles[id(unit)] = profile
+        return profile
+
+    def invalidate_unit_profile(self, unit: MobileSuit) -> None:
+        """ユニットの静的プロファイルを破棄する（次回参照時に再計算）.
+
+        武器リストの差し替え・増減は step() の冒頭で自動的に検出されるが、
+        ステップ外で装備を変更して直後に参照する場合や、武器オブジェクトの
+        ステータス・機体の耐性・機動パラメータを直接書き換えた場合は呼び出す。
+
+        Args:
+            unit: 対象ユニット
+        """
+        self._unit_profiles.pop(id(unit), None)
+
+    def _drop_stale_unit_profiles(self) -> None:
+        """装備武器が差し替え・増減・入れ替えされたユニットのプロファイルを破棄する."""
+        for unit in self.units:
+            profile = self._unit_profiles.get(id(unit))
+            if profile is not None and not profile.matches_loadout(unit):
+                del self._unit_profiles[id(unit)]
+
     def _resolve_strategy_mode(self, unit: MobileSuit) -> str:
         """ユニットの戦略モードを解決する.
 
         unit.strategy_mode が有効な値でない場合は AGGRESSIVE にフォールバックし、
         ログに警告を出力する。ロードされたエンジンが存在しないモードも AGGRESSIVE へ
-        フォールバックする。
+        フォールバックする。ホットリロード無効時は解決結果を strategy_mode の値ごとに
+        キャッシュする（警告も値ごとに1回のみ）。
 
         Args:
             unit: 対象ユニット
@@ -867,6 +1024,17 @@ class BattleSimulator(
             使用する戦略モード名（常にロード済みエンジンが存在するモード）
         """
         raw = getattr(unit, "strategy_mode", None)
+        if self._enable_hot_reload:
+            # ロード済みのモードが変わり得るため毎回検証する
+            return self._validate_strategy_mode(unit, raw)
+        mode = self._strategy_mode_cache.get(raw)
+        if mode is None:
+            mode = self._validate_strategy_mode(unit, raw)
+            self._strategy_mode_cache[raw] = mode
+        return mode
+
+    def _validate_strategy_mode(self, unit: MobileSuit, raw: object) -> str:
+        """strategy_mode の生の値を検証し、使用する戦略モード名を返す."""
         if raw is None:
             return "AGGRESSIVE"
 
@@ -904,19 +1072,87 @@ class BattleSimulator(
         Returns:
             射程内にいるユニットのリスト
         """
-        pos_unit = unit.position.to_numpy()
+        pos_unit = self._unit_pos(unit)
         result = []
         for target in all_units:
             if target.id == unit.id:
                 continue
-            dist = float(np.linalg.norm(target.position.to_numpy() - pos_unit))
+            dist = float(np.linalg.norm(self._unit_pos(target) - pos_unit))
             if dist <= weapon_max_range:
                 result.append(target)
         return result
 
+    def _log_enabled(self, action_type: str) -> bool:
+        """指定 action_type のログを現在の log_level で記録するかを返す.
+
+        Args:
+            action_type: BattleLog.action_type
+
+        Returns:
+            記録する場合 True（呼び出し側はメッセージ組み立て前に判定すること）
+        """
+        required = LOG_ACTION_TYPE_LEVELS.get(action_type, LOG_LEVEL_REPLAY)
+        return LOG_LEVEL_RANKS[required] <= self._log_level_rank
+
+    def _unit_pos(self, unit: MobileSuit) -> np.ndarray:
+        """ユニットの現在位置を ndarray で返す.
+
+        `step()` 実行中は SoA ストアの行から取得し、`position.to_numpy()` による
+        pydantic 属性アクセス + 配列生成を省く。ステップ外（テスト等からの
+        直接呼び出し）では `unit.position.to_numpy()` と同じ値を返す。
+        """
+        return self._unit_state.position(unit)
+
+    def _unit_positions(self, units: list[MobileSuit]) -> np.ndarray:
+        """ユニット列の現在位置を (N, 3) 配列で返す（`_unit_pos()` の一括版）."""
+        state = self._unit_state
+        if state.active and all(u.id in state.index for u in units):
+            return state.positions[[state.index[u.id] for u in units]]
+        return np.array([self._unit_pos(u) for u in units], dtype=float).reshape(-1, 3)
+
+    def _spatial_grid(self, cell_size: float) -> UnitSpatialGrid:
+        """永続空間インデックスの指定セルサイズの層を、現時点の位置・生存状態へ同期して返す.
+
+        `step()` 実行中は SoA ストアの配列をそのまま渡す。ステップ外（テスト等
+        からの直接呼び出し）では `MobileSuit` の現在値から配列を組み立てる。
+        """
+        self.profiler.count("grid_syncs")
+        state = self._unit_state
+        if state.active:
+            return self._spatial_index.grid(cell_size, state.positions, state.alive)
+        positions = self._unit_positions(self.units)
+        alive = np.array([u.current_hp > 0 for u in self.units], dtype=bool)
+        return self._spatial_index.grid(cell_size, positions, alive)
+
+    def _set_unit_position(self, unit: MobileSuit, new_pos: np.ndarray) -> None:
+        """ユニット位置を書き込む.
+
+        `step()` 実行中は SoA ストアにだけ書き込み、`MobileSuit.position` への
+        反映はバトル終了時または `sync_unit_positions()` の呼び出し時に行う。
+        """
+        if not self._unit_state.set_position(unit, new_pos):
+            unit.position = Vector3.from_numpy(new_pos)
+
+    def sync_unit_positions(self) -> None:
+        """バトル中の位置を各ユニットの `MobileSuit.position` へ書き戻す.
+
+        移動は SoA ストアにだけ書き込まれ、`MobileSuit.position` はバトル終了時に
+        まとめて更新される。終了前（最大ステップ数での打ち切り・途中経過の
+        参照等）にユニットの位置を読む場合は、先にこれを呼び出すこと。
+        """
+        self._unit_state.write_back()
+
+    @property
+    def step_count(self) -> int:
+        """経過ステップ数（適応ステップ幅でまとめたステップは基準 dt 換算で数える）."""
+        return self._step_count
+
     def step(self, dt: float = 0.1) -> None:
         """1時間ステップ分の処理を実行.
 
+        adaptive_stepping が有効な場合、非交戦中は複数ステップ分の dt を
+        1回の呼び出しで進めることがある（`_adaptive_step_span()` 参照）。
+
         Args:
             dt: 時間ステップ幅（秒）。デフォルト 0.1s。
         """
@@ -924,53 +1160,190 @@ class BattleSimulator(
             return
 
         # 最大ステップ数超過 → 引き分けとして終了
-        if self._step_count >= _MAX_STEPS:
+        if self._step_count >= self._max_steps:
             self.is_finished = True
+            self.sync_unit_positions()
             return
 
-        # ポテンシャルフィールド計算用グリッドのキャッシュを破棄（Issue #450/#453）。
-        # 前ステップで構築したグリッドは古い位置情報を持つため、このステップの
-        # 行動フェーズで最初に必要になったタイミングで最新位置から再構築させる。
+        # ポテンシャルフィールド計算用グリッドの参照を破棄（Issue #450/#453）。
+        # 前ステップで同期したグリッドは古い位置情報を持つため、このステップの
+        # 行動フェーズで最初に必要になったタイミングで最新位置へ差分同期させる。
         self._movement_grid = None
         self._threat_repulsion_grid = None
+        self._los_cache.clear()
+
+        self._step_span = self._adaptive_step_span(dt) if self._adaptive_stepping else 1
+        dt *= self._step_span
+
+        profiler = self.profiler
+        if profiler.enabled:
+            step_start = time.perf_counter()
+            log_count = len(self.logs)
+
+        # SoA ストアへ現在の状態を一括ロード（ステップ外での直接書き換えも反映する）
+        self._unit_state.load(self.unit_resources)
+        self._drop_stale_unit_profiles()
+        try:
+            self._run_step_phases(dt)
+        finally:
+            self._unit_state.deactivate()
+
+        if profiler.enabled:
+            profiler.count("logs_emitted", len(self.logs) - log_count)
+            profiler.count("adaptive_skipped_steps", self._step_span - 1)
+            profiler.add_step(time.perf_counter() - step_start)
+
+        # 9. 時間を進める
+        self.elapsed_time += dt
+        self._step_count += self._step_span
+
+        if self._stalemate_steps is not None and not self.is_finished:
+            self._check_stalemate(self._stalemate_steps)
+        if self.is_finished:
+            self.sync_unit_positions()
+
+    def _run_step_phases(self, dt: float) -> None:
+        """step() の各フェーズを順に実行する（SoA ストアがアクティブな区間）.
+
+        各フェーズは `self.profiler.phase()` で囲み、計測有効時はフェーズ別の
+        所要時間を集計する。
+        """
+        phase = self.profiler.phase
 
         # 1. エリア収縮フェーズ（Issue #474）: 索敵・移動より前に map_bounds を
         # 更新することで、このステップの索敵・移動が新しい境界を反映する
-        self._area_shrink_phase()
+        with phase("area_shrink"):
+            self._area_shrink_phase()
 
         # 2. 索敵フェーズ
-        self._detection_phase()
+        with phase("detection"):
+            self._detection_phase()
 
         # 3. 戦略評価フェーズ (Phase 4-2)
-        self._strategy_phase()
+        with phase("strategy"):
+            self._strategy_phase()
 
         # 4. AI意思決定フェーズ（中階層ファジィ推論）
-        alive_units = [u for u in self.units if u.current_hp > 0]
-        for unit in alive_units:
-            self._ai_decision_phase(unit)
+        with phase("ai_decision"):
+            for unit in self._unit_state.alive_units():
+                self._ai_decision_phase(unit)
 
         # 5. 胴体向き更新フェーズ (Phase 6-1)
-        alive_units = [u for u in self.units if u.current_hp > 0]
-        for unit in alive_units:
-            self._update_body_heading(unit, dt)
+        with phase("body_heading"):
+            for unit in self._unit_state.alive_units():
+                self._update_body_heading(unit, dt)
 
         # 6. 行動フェーズ（全ユニットを同一ステップで並列処理）
-        alive_units = [u for u in self.units if u.current_hp > 0]
-        for unit in alive_units:
-            if self.is_finished:
-                break
-            self._action_phase(unit, dt)
+        with phase("action"):
+            for unit in self._unit_state.alive_units():
+                if self.is_finished:
+                    break
+                self._action_phase(unit, dt)
+
+        # 6b. 一括移動フェーズ（batched_movement 有効時のみ）
+        if self._batched_movement:
+            with phase("movement_batched"):
+                self._movement_phase_batched(dt)
 
         # 7. 撤退離脱判定フェーズ (Phase 3-3)
         if self.retreat_points:
-            self._retreat_check_phase()
+            with phase("retreat_check"):
+                self._retreat_check_phase()
 
         # 8. リソース更新フェーズ（EN回復・クールダウン減少）
-        self._refresh_phase(dt)
+        with phase("refresh"):
+            self._refresh_phase(dt)
 
-        # 9. 時間を進める
-        self.elapsed_time += dt
-        self._step_count += 1
+    def _adaptive_step_span(self, dt: float) -> int:
+        """非交戦中に1ステップへまとめる基準ステップ数を決める（適応ステップ幅）.
+
+        どのチームも敵を発見しておらず、敵ペアの距離が「索敵範囲・最大射程の
+        大きい方」をまとめる時間分の最大接近距離以上に上回っている場合のみ2以上を
+        返す。エリア収縮のタイミング・最大ステップ数は跨がないようにする
+        （`_area_shrink_phase()` は各ステップ開始時の `_step_count` で判定するため）。
+
+        Args:
+            dt: 基準の時間ステップ幅（秒）
+
+        Returns:
+            1 以上 ADAPTIVE_STEP_MAX_SPAN 以下のステップ数
+        """
+        if any(self.team_detected_units.values()):
+            return 1
+        margin, closing_speed = self._idle_contact_margin()
+        if closing_speed <= 0.0:
+            return 1
+        span = min(int(margin // (closing_speed * dt)), ADAPTIVE_STEP_MAX_SPAN)
+        step = self._step_count
+        if step < SHRINK_START_STEP:
+            next_shrink = SHRINK_START_STEP
+        else:
+            next_shrink = step + SHRINK_INTERVAL_STEPS
+            next_shrink -= (step - SHRINK_START_STEP) % SHRINK_INTERVAL_STEPS
+        return max(1, min(span, next_shrink - step, self._max_steps - step))
+
+    def _idle_contact_margin(self) -> tuple[float, float]:
+        """敵ペアが接敵し得る距離までの最小余裕と、最大接近速度を返す.
+
+        各ユニットの到達距離は「有効索敵範囲・最大射程の大きい方」、速度上限は
+        ブースト・地形補正込みの最高速度（現在速度の方が大きければ現在速度）とする。
+
+        Returns:
+            (最小余裕 (m), 最大接近速度 (m/s))。敵ペアが無い場合は (inf, 0.0)
+        """
+        alive_units = [u for u in self.units if u.current_hp > 0]
+        team_codes: dict[str | None, int] = {}
+        teams = np.array(
+            [team_codes.setdefault(u.team_id, len(team_codes)) for u in alive_units]
+        )
+        if len(team_codes) < 2:
+            return math.inf, 0.0
+
+        sensor_multiplier, _ = self._detection_params()
+        profiles = [self._unit_profile(u) for u in alive_units]
+        reach = np.array(
+            [
+                max(u.sensor_range * sensor_multiplier, profile.max_weapon_range)
+                for u, profile in zip(alive_units, profiles, strict=True)
+            ]
+        )
+        speeds = [
+            max(
+                profile.max_speed
+                * profile.boost_speed_multiplier
+                * profile.terrain_modifier,
+                float(np.linalg.norm(self.unit_resources[str(u.id)]["velocity_vec"])),
+            )
+            for u, profile in zip(alive_units, profiles, strict=True)
+        ]
+        positions = self._unit_positions(alive_units)
+        diff = positions[None, :, :] - positions[:, None, :]
+        distances = np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+        margins = distances - np.maximum(reach[:, None], reach[None, :])
+        is_enemy = teams[:, None] != teams[None, :]
+        return float(margins[is_enemy].min()), 2.0 * max(speeds)
+
+    def _check_stalemate(self, stalemate_steps: int) -> None:
+        """HP・マップ境界が変化しないまま stalemate_steps が経過したら引き分けで終了する.
+
+        エリア収縮がまだ進む場合は収縮で接敵が起こり得るため、下限到達
+        （MIN_SHRUNK_FIELD_SIZE）または停止済みの場合のみ終了させる。
+
+        Args:
+            stalemate_steps: 膠着とみなす経過ステップ数
+        """
+        state = (sum(max(u.current_hp, 0) for u in self.units), self.map_bounds)
+        if state != self._stalemate_state:
+            self._stalemate_state = state
+            self._stalemate_since_step = self._step_count
+            return
+        if self._step_count - self._stalemate_since_step < stalemate_steps:
+            return
+        map_min, map_max = self.map_bounds
+        if not self._shrink_paused and map_max - map_min > MIN_SHRUNK_FIELD_SIZE:
+            return
+        self.is_finished = True
+        self.is_stalemate = True
 
     def _area_shrink_phase(self) -> None:
         """時間経過に応じて map_bounds を段階的に収縮させる (Issue #474).
@@ -1036,6 +1409,8 @@ class BattleSimulator(
         停止）イベント時のみ記録する。リプレイ再構成側は直近イベント値を保持する
         形で map_bounds の推移を再現する想定。
         """
+        if not self._log_enabled("AREA_SHRINK"):
+            return
         if reason == "scheduled_shrink":
             message = (
                 f"エリアが収縮した（{old_max - old_min:.0f}m → "
@@ -1044,27 +1419,45 @@ class BattleSimulator(
         else:
             message = "残存ユニット数が少ないためエリア収縮を停止した。"
 
-        self.logs.append(
-            BattleLog(
-                timestamp=float(self.elapsed_time),
-                actor_id=self._team_event_actor_id,
-                action_type="AREA_SHRINK",
-                message=message,
-                position_snapshot=Vector3(),
-                details={
-                    "step": self._step_count,
-                    "old_bounds": [old_min, old_max],
-                    "new_bounds": [new_min, new_max],
-                    "reason": reason,
-                },
-            )
+        self.logs.record(
+            timestamp=float(self.elapsed_time),
+            actor_id=self._team_event_actor_id,
+            action_type="AREA_SHRINK",
+            message=message,
+            position_snapshot=Vector3(),
+            details={
+                "step": self._step_count,
+                "old_bounds": [old_min, old_max],
+                "new_bounds": [new_min, new_max],
+                "reason": reason,
+            },
         )
 
+    def _team_units(self, team_id: str) -> list[MobileSuit]:
+        """チームに所属するユニットを返す.
+
+        チーム所属は生成時に SoA ストアで索引化済みのため全ユニットを走査しない。
+        生成後に `units` へユニットが追加された場合のみ全ユニットを走査する。
+
+        Args:
+            team_id: 対象チームID
+
+        Returns:
+            所属ユニットのリスト（BattleSimulator.units 順）
+        """
+        if len(self._unit_state.units) != len(self.units):
+            return [u for u in self.units if u.team_id == team_id]
+        return self._unit_state.team_units(team_id)
+
     def _collect_team_metrics(self, team_id: str) -> TeamMetrics:
         """チームのバトルメトリクスを収集する (Phase 4-2).
 
         ACTIVE ステータスのユニットのみを対象に HP 割合を計算する。
 
+        ステップ実行中は SoA ストアのチーム別行インデックスと HP・ステータス配列
+        （撃破・撤退・被弾時にライトスルーで更新される）から、対象チームの行のみを
+        参照して算出する。
+
         Args:
             team_id: 対象チームID
 
@@ -1074,23 +1467,23 @@ class BattleSimulator(
         controller = self._strategy_controllers.get(team_id)
         current_strategy = controller.current_strategy if controller else "AGGRESSIVE"
 
-        team_units = [u for u in self.units if u.team_id == team_id]
-        total_count = len(team_units)
-
-        active_units = [
-            u
-            for u in team_units
-            if self.unit_resources[str(u.id)].get("status") == "ACTIVE"
-            and u.current_hp > 0
-        ]
-        alive_count = len(active_units)
+        state = self._unit_state
+        if state.active and len(state.units) == len(self.units):
+            total_count, hp_ratios = state.team_active_hp_ratios(team_id)
+        else:
+            team_units = self._team_units(team_id)
+            total_count = len(team_units)
+            hp_ratios = [
+                float(u.current_hp) / float(max(1, u.max_hp))
+                for u in team_units
+                if self.unit_resources[str(u.id)].get("status") == "ACTIVE"
+                and u.current_hp > 0
+            ]
+        alive_count = len(hp_ratios)
 
         alive_ratio = alive_count / total_count if total_count > 0 else 0.0
 
-        if active_units:
-            hp_ratios = [
-                float(u.current_hp) / float(max(1, u.max_hp)) for u in active_units
-            ]
+        if hp_ratios:
             avg_hp_ratio = float(sum(hp_ratios) / len(hp_ratios))
             min_hp_ratio = float(min(hp_ratios))
         else:
@@ -0,0 +1,381 @@
+# backend/app/engine/simulation_executor.py
+"""シミュレーション実行器（プロセスプール）.
+
+`POST /api/battle/simulate` は `async def` でありながら `BattleSimulator.step()`
+を同期的にイベントループ上で実行していたため、1戦闘の計算中はワーカー上の
+他のリクエストがすべて停止していた。本モジュールはシミュレーション本体を
+`ProcessPoolExecutor` のワーカープロセスで実行し、エンドポイントからは
+`await SimulationExecutor.run()` で結果を待てるようにする。
+
+    - ワーカーは起動時（`_init_worker()`）にファジィルールを読み込み済みの
+      状態で待機する（`start()` で全ワーカーを事前起動する）
+    - 入力 `SimulationRequest` / 出力 `SimulationOutcome` は pickle 可能な
+      dataclass で、DB セッション等は含めない
+    - 実行中 + 待機中のジョブ数が `max_pending` に達している場合は
+      `SimulationQueueFullError` を送出する（バックプレッシャー）。ジョブは
+      呼び出し側の待機がタイムアウトしても、プール上で完了（または取り消し）
+      されるまで件数に含める
+    - `timeout_sec` を超えた場合は `SimulationTimeoutError` を送出する。
+      ワーカー側もステップごとに期限を確認して打ち切るため、タイムアウトした
+      ジョブがワーカーを占有し続けることはない
+
+設定は環境変数で行う（`SIMULATION_WORKERS=0` でプロセスを使わずスレッドで
+実行する。ローカル開発・テスト用）。
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, TypeVar
+
+from app.engine.calculator import PilotStats
+from app.engine.constants import FUZZY_RULES_DIR, LOG_LEVEL_DEBUG
+from app.engine.log_buffer import BattleLogBuffer
+from app.models.models import BattleField, MobileSuit, Obstacle, Vector3
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# ワーカープロセス数（0 の場合はスレッド1本で実行する）
+SIMULATION_WORKERS: int = int(
+    os.environ.get("SIMULATION_WORKERS", str(min(2, os.cpu_count() or 1)))
+)
+# 実行中 + 待機中ジョブ数の上限（これを超える要求は即座に拒否する）
+SIMULATION_MAX_PENDING: int = int(
+    os.environ.get("SIMULATION_MAX_PENDING", str(max(1, SIMULATION_WORKERS) * 4))
+)
+# 1ジョブあたりのタイムアウト（秒）。待機時間を含む
+SIMULATION_TIMEOUT_SEC: float = float(os.environ.get("SIMULATION_TIMEOUT_SEC", "30"))
+# ワーカープロセスの起動方式（uvicorn のスレッドを fork で複製しないよう spawn）
+SIMULATION_MP_START_METHOD: str = os.environ.get("SIMULATION_MP_START_METHOD", "spawn")
+# ワーカー側の期限判定に足す猶予（秒）。呼び出し側の待機打ち切りを優先させる
+_WORKER_DEADLINE_GRACE_SEC: float = 1.0
+
+
+class SimulationQueueFullError(RuntimeError):
+    """実行待ちジョブ数が上限に達している."""
+
+
+class SimulationTimeoutError(TimeoutError):
+    """シミュレーションがタイムアウトした."""
+
+
+@dataclass
+class SimulationRequest:
+    """ワーカーへ渡すシミュレーション入力（pickle 可能）.
+
+    各項目は `BattleSimulator.__init__()` の同名引数に渡される。
+    """
+
+    player: MobileSuit
+    enemies: list[MobileSuit]
+    max_steps: int
+    player_skills: dict[str, int] = field(default_factory=dict)
+    environment: str = "SPACE"
+    player_pilot_stats: PilotStats | None = None
+    npc_pilot_stats: dict[str, PilotStats] | None = None
+    battlefield: BattleField | None = None
+    batched_detection: bool = False
+    batched_movement: bool = False
+    adaptive_stepping: bool = False
+    stalemate_steps: int | None = None
+    fuzzy_lut_subdivisions: int | None = None
+    log_level: str = LOG_LEVEL_DEBUG
+    # ワーカー側で打ち切る時刻（time.time() 基準。None の場合は無期限）
+    deadline: float | None = None
+
+
+@dataclass
+class SimulationOutcome:
+    """ワーカーから返すシミュレーション結果（pickle 可能）.
+
+    `player` / `enemies` はシミュレーション終了時点の状態（HP・位置）で、
+    `spawn_positions` はスポーン領域適用直後（戦闘開始前）の位置。
+    """
+
+    player: MobileSuit
+    enemies: list[MobileSuit]
+    logs: BattleLogBuffer
+    steps_used: int
+    elapsed_time: float
+    obstacles: list[Obstacle]
+    map_bounds: tuple[float, float]
+    spawn_positions: tuple[Vector3, dict[uuid.UUID, Vector3]]
+
+    @property
+    def units(self) -> list[MobileSuit]:
+        """全ユニット（`BattleSimulator.units` と同じ並び）."""
+        return [self.player, *self.enemies]
+
+
+def run_simulation(request: SimulationRequest) -> SimulationOutcome:
+    """シミュレーションを最後まで（または max_steps まで）実行する.
+
+    ワーカープロセス内で呼ばれるが、通常の関数として直接呼んでもよい。
+
+    Args:
+        request: シミュレーション入力
+
+    Returns:
+        シミュレーション結果
+
+    Raises:
+        SimulationTimeoutError: request.deadline を過ぎた場合
+    """
+    from app.engine.simulation import BattleSimulator
+
+    player, enemies = request.player, request.enemies
+    sim = BattleSimulator(
+        player,
+        enemies,
+        player_skills=request.player_skills,
+        environment=request.environment,
+        player_pilot_stats=request.player_pilot_stats,
+        npc_pilot_stats=request.npc_pilot_stats,
+        battlefield=request.battlefield,
+        batched_detection=request.batched_detection,
+        batched_movement=request.batched_movement,
+        adaptive_stepping=request.adaptive_stepping,
+        stalemate_steps=request.stalemate_steps,
+        fuzzy_lut_subdivisions=request.fuzzy_lut_subdivisions,
+        log_level=request.log_level,
+        max_steps=request.max_steps,
+    )
+    # sim.step() は player/enemies を直接書き換えるため、リプレイの t=0 表示用に
+    # スポーン位置を退避しておく
+    spawn_positions = (
+        player.position.model_copy(),
+        {enemy.id: enemy.position.model_copy() for enemy in enemies},
+    )
+
+    # 適応ステップ幅では1回の step() が複数ステップ分進むため、ステップ数は
+    # 呼び出し回数ではなく sim.step_count（基準 dt 換算）で数える
+    while not sim.is_finished and sim.step_count < request.max_steps:
+        if request.deadline is not None and time.time() > request.deadline:
+            raise SimulationTimeoutError(
+                f"シミュレーションが期限内に終了しませんでした（{sim.step_count} ステップ）"
+            )
+        sim.step()
+    # max_steps で打ち切った場合も終了時点の位置を player/enemies へ反映する
+    sim.sync_unit_positions()
+    steps_used = min(sim.step_count, request.max_steps)
+
+    return SimulationOutcome(
+        player=player,
+        enemies=enemies,
+        logs=sim.logs,
+        steps_used=steps_used,
+        elapsed_time=sim.elapsed_time,
+        obstacles=sim.obstacles,
+        map_bounds=sim.map_bounds,
+        spawn_positions=spawn_positions,
+    )
+
+
+def _init_worker(rules_dir: Path, lut_subdivisions: int | None = None) -> None:
+    """ワーカープロセスの初期化: ファジィルール（とルックアップテーブル）を事前に読み込む."""
+    from app.engine import simulation  # noqa: F401  シミュレータ一式の import を済ませる
+    from app.engine.fuzzy_rule_cache import get_shared_rule_cache
+
+    get_shared_rule_cache(rules_dir, lut_subdivisions).snapshot()
+
+
+def create_simulation_pool(
+    max_workers: int,
+    start_method: str = SIMULATION_MP_START_METHOD,
+    rules_dir: Path = FUZZY_RULES_DIR,
+    lut_subdivisions: int | None = None,
+) -> ProcessPoolExecutor:
+    """ファジィルールを事前読み込みするワーカーのプロセスプールを生成する.
+
+    Args:
+        max_workers: ワーカープロセス数
+        start_method: multiprocessing の起動方式
+        rules_dir: ワーカーで事前読み込みするファジィルールのディレクトリ
+        lut_subdivisions: ワーカーで事前構築するファジィ推論ルックアップテーブルの
+            分割数（`SimulationRequest.fuzzy_lut_subdivisions` と揃える。None なら構築しない）
+
+    Returns:
+        run_simulation() を投入できるプロセスプール
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context(start_method),
+        initializer=_init_worker,
+        initargs=(rules_dir, lut_subdivisions),
+    )
+
+
+def _ping() -> int:
+    """ワーカー起動確認用の空ジョブ."""
+    return os.getpid()
+
+
+class SimulationExecutor:
+    """シミュレーションをプロセスプールで実行する非同期ラッパー."""
+
+    def __init__(
+        self,
+        max_workers: int = SIMULATION_WORKERS,
+        max_pending: int = SIMULATION_MAX_PENDING,
+        timeout_sec: float = SIMULATION_TIMEOUT_SEC,
+        start_method: str = SIMULATION_MP_START_METHOD,
+        rules_dir: Path = FUZZY_RULES_DIR,
+    ) -> None:
+        """初期化（プールの生成は最初の start() / run() まで遅延する）.
+
+        Args:
+            max_workers: ワーカープロセス数。0 の場合はスレッド1本で実行する
+            max_pending: 実行中 + 待機中ジョブ数の上限
+            timeout_sec: 1ジョブあたりのタイムアウト（秒、待機時間を含む）
+            start_method: multiprocessing の起動方式
+            rules_dir: ワーカーで事前読み込みするファジィルールのディレクトリ
+
+        Raises:
+            ValueError: max_workers < 0 または max_pending < 1 の場合
+        """
+        if max_workers < 0 or max_pending < 1:
+            raise ValueError(
+                f"max_workers は 0 以上、max_pending は 1 以上を指定してください "
+                f"(max_workers={max_workers}, max_pending={max_pending})"
+            )
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout_sec = timeout_sec
+        self._start_method = start_method
+        self._rules_dir = rules_dir
+        self._pool: Executor | None = None
+        self._pool_lock = threading.Lock()
+        self._pending = 0
+        # ジョブ完了時のコールバックはプール側のスレッドで呼ばれるため排他する
+        self._pending_lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """実行中 + 待機中のジョブ数."""
+        return self._pending
+
+    def _release_slot(self, _job: Future | None = None) -> None:
+        """ジョブの完了・取り消し時に実行中 + 待機中の件数を1減らす."""
+        with self._pending_lock:
+            self._pending -= 1
+
+    def _get_pool(self) -> Executor:
+        with self._pool_lock:
+            if self._pool is None:
+                if self.max_workers == 0:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="simulation"
+                    )
+                else:
+                    self._pool = create_simulation_pool(
+                        self.max_workers, self._start_method, self._rules_dir
+                    )
+            return self._pool
+
+    async def start(self) -> None:
+        """全ワーカーを起動し、ルール読み込みが済むまで待つ（ウォームアップ）."""
+        pool = self._get_pool()
+        if self.max_workers == 0:
+            return
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(pool, _ping) for _ in range(self.max_workers))
+        )
+
+    async def _submit(self, fn: Callable[..., T], *args: Any) -> T:
+        """ジョブを投入し、バックプレッシャーとタイムアウトを適用して結果を待つ.
+
+        Raises:
+            SimulationQueueFullError: 実行中 + 待機中ジョブ数が上限に達している場合
+            SimulationTimeoutError: timeout_sec 以内に結果が得られなかった場合
+        """
+        with self._pending_lock:
+            if self._pending >= self.max_pending:
+                raise SimulationQueueFullError(
+                    f"シミュレーションの実行待ちが上限（{self.max_pending}件）に達しています"
+                )
+            self._pending += 1
+        try:
+            job = self._get_pool().submit(fn, *args)
+        except BaseException:
+            self._release_slot()
+            raise
+        # 待機のタイムアウト後もジョブはワーカー上で実行され続ける（実行前なら
+        # 取り消される）ため、件数はプール側のジョブが終わった時点で減らす
+        job.add_done_callback(self._release_slot)
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(job), timeout=self.timeout_sec
+            )
+        except TimeoutError as exc:
+            raise SimulationTimeoutError(
+                f"シミュレーションが {self.timeout_sec:.0f} 秒以内に終了しませんでした"
+            ) from exc
+
+    async def run(self, request: SimulationRequest) -> SimulationOutcome:
+        """シミュレーションをワーカーで実行して結果を返す.
+
+        Args:
+            request: シミュレーション入力（deadline は timeout_sec から自動設定）
+
+        Returns:
+            シミュレーション結果
+
+        Raises:
+            SimulationQueueFullError: 実行中 + 待機中ジョブ数が上限に達している場合
+            SimulationTimeoutError: timeout_sec 以内に終了しなかった場合
+        """
+        deadline = time.time() + self.timeout_sec + _WORKER_DEADLINE_GRACE_SEC
+        return await self._submit(run_simulation, replace(request, deadline=deadline))
+
+    def restart(self) -> None:
+        """プールを作り直す（ファジィルール・マスターデータのリロード時）.
+
+        実行中のジョブは旧プールで最後まで実行され、新規ジョブは新しい
+        ワーカー（ルールを読み直したもの）で実行される。
+        """
+        with self._pool_lock:
+            old, self._pool = self._pool, None
+        if old is not None:
+            old.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        """プールを停止する（アプリケーション終了時）."""
+        with self._pool_lock:
+            old, self._pool = self._pool, None
+        if old is not None:
+            old.shutdown(wait=True, cancel_futures=True)
+
+
+_executor: SimulationExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_simulation_executor() -> SimulationExecutor:
+    """プロセス共通の SimulationExecutor を返す（初回呼び出し時に生成）."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = SimulationExecutor()
+                logger.info(
+                    "SimulationExecutor を生成しました (workers=%d, max_pending=%d)",
+                    _executor.max_workers,
+                    _executor.max_pending,
+                )
+    return _executor
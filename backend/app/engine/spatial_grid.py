@@ -6,6 +6,8 @@
 判定対象を近接ユニットに絞り込む。
 """
 
+import bisect
+import uuid
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Iterator
 
@@ -77,6 +79,10 @@ class UnitSpatialGrid:
         pos = unit.position
         return self._cell_key(pos.x, pos.y, pos.z)
 
+    def _unit_position(self, unit: MobileSuit) -> np.ndarray:
+        """`nearest()` の距離計算に使うユニットの現在位置."""
+        return unit.position.to_numpy()
+
     def _cell_key(self, x: float, y: float, z: float) -> CellKey:
         return (
             int(x // self.cell_size),
@@ -139,7 +145,7 @@ class UnitSpatialGrid:
                 for candidate in cell:
                     if not predicate(candidate):
                         continue
-                    diff = candidate.position.to_numpy() - pos
+                    diff = self._unit_position(candidate) - pos
                     dist_sq = float(
                         diff[0] * diff[0] + diff[1] * diff[1] + diff[2] * diff[2]
                     )
@@ -241,3 +247,154 @@ class PointSpatialGrid:
             cell = self._cells.get((cx + dx, cy + dy, cz + dz))
             if cell:
                 yield from cell
+
+
+class IncrementalUnitGrid(UnitSpatialGrid):
+    """ステップをまたいで再利用する `UnitSpatialGrid`（差分更新版）.
+
+    毎ステップ全ユニットから辞書・リストを確保し直す代わりに、ユニットごとの
+    現在セルを保持しておき、`sync()` ではセル境界を跨いだユニット・撃破された
+    ユニット・復帰したユニットだけをセル間で移し替える。各セル内のユニットは
+    行インデックス（`BattleSimulator.units` の並び）順に保つため、同じ位置・
+    生存状態から `UnitSpatialGrid` を新規構築した場合と `neighbors()` /
+    `nearest()` / `radius_neighbors()` の列挙順まで一致する。
+
+    `nearest()` が使うセル座標範囲（`_min_cell` / `_max_cell`）も、軸ごとに
+    「その座標値を持つ空でないセルの数」を保持して差分更新する。セルの追加時は
+    範囲を広げるだけで、範囲の端の座標値を持つセルが全て空になった軸のみ、
+    その軸の座標値（グリッドの幅程度の個数）から求め直す。
+    """
+
+    def __init__(self, units: list[MobileSuit], cell_size: float) -> None:
+        """空のグリッドを確保する（`sync()` を呼ぶまでユニットは登録されない）.
+
+        Args:
+            units: 全ユニット（行インデックスの並び。バトル中は不変）
+            cell_size: セルサイズ (m)
+        """
+        super().__init__((), cell_size)
+        self._units = units
+        self._row_of: dict[uuid.UUID, int] = {u.id: i for i, u in enumerate(units)}
+        self._keys = np.zeros((len(units), 3), dtype=np.int64)
+        self._present = np.zeros(len(units), dtype=bool)
+        # 最後に sync() した位置配列（SoA ストアの配列そのもの。MobileSuit.position
+        # はバトル中に書き戻されないため、距離計算はこちらを参照する）
+        self._positions = np.zeros((len(units), 3))
+        # 軸ごとの セル座標値 → その座標値を持つ空でないセルの数
+        self._axis_counts: tuple[dict[int, int], ...] = ({}, {}, {})
+
+    def _row_key(self, unit: MobileSuit) -> int:
+        return self._row_of[unit.id]
+
+    def _unit_position(self, unit: MobileSuit) -> np.ndarray:
+        return self._positions[self._row_of[unit.id]]
+
+    def sync(self, positions: np.ndarray, alive: np.ndarray) -> None:
+        """現在の位置・生存フラグに合わせてセルの所属を差分更新する.
+
+        Args:
+            positions: 全ユニットの位置 (N, 3)（行は `units` と同順）
+            alive: 生存フラグ (N,)。False のユニットはグリッドから外す
+        """
+        self._positions = positions
+        keys = np.floor_divide(positions, self.cell_size).astype(np.int64)
+        present = self._present
+        moved = present & alive & (keys != self._keys).any(axis=1)
+        leaving = np.flatnonzero(moved | (present & ~alive))
+        entering = np.flatnonzero(moved | (alive & ~present))
+        if leaving.size == 0 and entering.size == 0:
+            return
+
+        cells = self._cells
+        axis_counts = self._axis_counts
+        # 範囲を求め直す軸（空のグリッドへの追加時は全軸）
+        stale_axes = set() if cells else {0, 1, 2}
+        for row in leaving:
+            key: CellKey = tuple(self._keys[row].tolist())  # type: ignore[assignment]
+            cell = cells[key]
+            cell.remove(self._units[row])
+            if not cell:
+                del cells[key]
+                stale_axes.update(self._release_cell(key))
+        for row in entering:
+            key = tuple(keys[row].tolist())  # type: ignore[assignment]
+            cell = cells[key]
+            if not cell:
+                for axis, value in enumerate(key):
+                    counts = axis_counts[axis]
+                    counts[value] = counts.get(value, 0) + 1
+            bisect.insort(cell, self._units[row], key=self._row_key)
+        self._keys[entering] = keys[entering]
+        self._present = alive.copy()
+        self._update_bounds(keys[entering], stale_axes)
+
+    def _update_bounds(self, entering_keys: np.ndarray, stale_axes: set[int]) -> None:
+        """追加されたセル座標で範囲を広げ、端が消えた軸は集計から求め直す."""
+        axis_counts = self._axis_counts
+        if not self._cells:
+            self._min_cell = (0, 0, 0)
+            self._max_cell = (0, 0, 0)
+            return
+        lo = list(self._min_cell)
+        hi = list(self._max_cell)
+        if entering_keys.size:
+            entering_lo = entering_keys.min(axis=0).tolist()
+            entering_hi = entering_keys.max(axis=0).tolist()
+            for axis in range(3):
+                lo[axis] = min(lo[axis], entering_lo[axis])
+                hi[axis] = max(hi[axis], entering_hi[axis])
+        for axis in stale_axes:
+            lo[axis] = min(axis_counts[axis])
+            hi[axis] = max(axis_counts[axis])
+        self._min_cell = tuple(lo)  # type: ignore[assignment]
+        self._max_cell = tuple(hi)  # type: ignore[assignment]
+
+    def _release_cell(self, key: CellKey) -> list[int]:
+        """空になったセルを軸ごとの集計から外し、範囲の端が消えた軸を返す."""
+        stale = []
+        for axis, value in enumerate(key):
+            counts = self._axis_counts[axis]
+            remaining = counts[value] - 1
+            if remaining:
+                counts[value] = remaining
+                continue
+            del counts[value]
+            if value == self._min_cell[axis] or value == self._max_cell[axis]:
+                stale.append(axis)
+        return stale
+
+
+class UnitSpatialIndex:
+    """バトル全体で1つだけ保持する永続的な空間インデックス.
+
+    索敵（セルサイズ = 最大索敵範囲）・味方斥力 / 最近敵探索
+    （`ALLY_REPULSION_RADIUS`）・高脅威敵斥力（`THREAT_REPULSION_DECAY_SCALE`）
+    のように探索半径の異なる用途ごとに、セルサイズ別の `IncrementalUnitGrid`
+    を層として遅延生成し、以降は差分更新だけで使い回す。
+    """
+
+    def __init__(self, units: list[MobileSuit]) -> None:
+        """全ユニット（行インデックスの並び）を指定してインデックスを生成する."""
+        self._units = units
+        self._layers: dict[float, IncrementalUnitGrid] = {}
+
+    def grid(
+        self, cell_size: float, positions: np.ndarray, alive: np.ndarray
+    ) -> IncrementalUnitGrid:
+        """指定セルサイズの層を現在の位置・生存フラグへ同期して返す.
+
+        Args:
+            cell_size: セルサイズ (m)（`_MIN_CELL_SIZE` 未満は切り上げる）
+            positions: 全ユニットの位置 (N, 3)
+            alive: 生存フラグ (N,)
+
+        Returns:
+            同期済みのグリッド
+        """
+        size = max(float(cell_size), _MIN_CELL_SIZE)
+        layer = self._layers.get(size)
+        if layer is None:
+            layer = IncrementalUnitGrid(self._units, size)
+            self._layers[size] = layer
+        layer.sync(positions, alive)
+        return layer
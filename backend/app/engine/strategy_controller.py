@@ -180,17 +180,26 @@ class TeamStrategyController:
             None  # 直近でマッチしたルールID (Phase 4-3)
         )
 
-    def should_evaluate(self) -> bool:
+    def should_evaluate(self, steps: int = 1) -> bool:
         """このステップで戦略評価を行うべきか判定する.
 
         バトル開始直後（_step_counter == 0）は評価をスキップし、
         初期戦略が即座に上書きされる問題を回避する。
 
+        Args:
+            steps: このステップが進める基準ステップ数（適応ステップ幅で
+                複数ステップ分をまとめた場合は2以上）。その間に評価タイミングを
+                跨いだ場合も True を返す。
+
         Returns:
             評価を行うべき場合は True
         """
-        self._step_counter += 1
-        return self._step_counter % self.update_interval == 0
+        previous = self._step_counter
+        self._step_counter += steps
+        return (
+            self._step_counter // self.update_interval
+            != previous // self.update_interval
+        )
 
     def evaluate(self, team_metrics: TeamMetrics) -> str | None:
         """遷移ルールを上から評価し、最初にマッチしたルールの to_strategy を返す.
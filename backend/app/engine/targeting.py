@@ -1,19 +1,17 @@
 # backend/app/engine/targeting.py
 """索敵・ターゲット選択・武器選択処理のミックスイン."""
 
-import random
 from typing import TYPE_CHECKING
 
 import numpy as np
 
-from app.engine.combat import has_los
+from app.engine.combat import has_los_batch
 from app.engine.constants import (
     DETECTION_FALLOFF_EXPONENT,
     DETECTION_FALLOFF_EXPONENT_MINOVSKY,
     SPECIAL_ENVIRONMENT_EFFECTS,
 )
-from app.engine.spatial_grid import UnitSpatialGrid
-from app.models.models import BattleLog, MobileSuit, Weapon
+from app.models.models import MobileSuit, Weapon
 
 if TYPE_CHECKING:
     pass
@@ -24,6 +22,20 @@ _TARGET_SELECTION_MAX_DIST = 3000.0
 _WEAPON_SELECTION_MAX_DIST = 3000.0
 
 
+def _scores_or_zero(
+    batch_result: dict[str, np.ndarray], variable: str, candidates: list
+) -> list[float]:
+    """`FuzzyEngine.infer_batch()` の結果から候補ごとのスコアを取り出す.
+
+    単発推論の `result.get(variable, 0.0)` と同様に、値が得られなかった候補
+    （NaN）や出力変数そのものが無い場合は 0.0 とする。
+    """
+    values = batch_result.get(variable)
+    if values is None:
+        return [0.0] * len(candidates)
+    return np.where(np.isnan(values), 0.0, values).tolist()
+
+
 class TargetingMixin:
     """索敵・ターゲット選択・武器選択処理のミックスイン."""
 
@@ -36,6 +48,16 @@ class TargetingMixin:
     _unit_order_index: dict
     _fuzzy_target_cache: dict[str, tuple[int, MobileSuit | None]]
 
+    def _detection_params(self) -> tuple[float, float]:
+        """索敵範囲倍率と距離減衰指数を返す（ミノフスキー粒子効果を反映）."""
+        if "MINOVSKY" in self.special_effects:  # type: ignore[attr-defined]
+            minovsky = SPECIAL_ENVIRONMENT_EFFECTS["MINOVSKY"]
+            return (
+                minovsky["sensor_range_multiplier"],
+                DETECTION_FALLOFF_EXPONENT_MINOVSKY,
+            )
+        return 1.0, DETECTION_FALLOFF_EXPONENT
+
     def _detection_phase(self) -> None:
         """索敵フェーズ: 各ユニットが索敵範囲内の敵を発見.
 
@@ -43,28 +65,30 @@ class TargetingMixin:
         （`UnitSpatialGrid`）で位置的に近い候補のみを新規索敵の対象とする
         （Issue #446）。ただし既に発見済みの敵は、索敵範囲外へ移動していても
         LOS 喪失判定のため引き続き距離に関わらず処理する（従来の挙動を維持）。
+
+        `batched_detection=True` で生成したシミュレータでは、距離・確率・LOS を
+        全ペア分の配列演算で一括計算する `_detection_phase_batched()` を使う。
         """
+        if self._batched_detection:  # type: ignore[attr-defined]
+            self._detection_phase_batched()
+            return
+
         alive_units = [u for u in self.units if u.current_hp > 0]  # type: ignore[attr-defined]
 
         # ミノフスキー粒子効果: 索敵範囲を半減 + 距離減衰指数を強化
-        sensor_multiplier = 1.0
-        falloff_exponent = DETECTION_FALLOFF_EXPONENT
-        if "MINOVSKY" in self.special_effects:  # type: ignore[attr-defined]
-            minovsky = SPECIAL_ENVIRONMENT_EFFECTS["MINOVSKY"]
-            sensor_multiplier = minovsky["sensor_range_multiplier"]
-            falloff_exponent = DETECTION_FALLOFF_EXPONENT_MINOVSKY
+        sensor_multiplier, falloff_exponent = self._detection_params()
 
         # グリッドのセルサイズは実際に索敵に使う最大有効範囲以上に設定する
         # （セル幅 >= 探索半径であれば、3x3x3近傍セルの走査だけで漏れなく候補を捕捉できる）
         max_effective_range = max(
             (u.sensor_range * sensor_multiplier for u in alive_units), default=0.0
         )
-        grid = UnitSpatialGrid(alive_units, max_effective_range)
+        grid = self._spatial_grid(max_effective_range)  # type: ignore[attr-defined]
 
         for unit in alive_units:
             if unit.team_id is None:
                 continue
-            pos_unit = unit.position.to_numpy()
+            pos_unit = self._unit_pos(unit)  # type: ignore[attr-defined]
             effective_sensor_range = unit.sensor_range * sensor_multiplier
             team_detected = self.team_detected_units[unit.team_id]  # type: ignore[attr-defined]
 
@@ -90,6 +114,109 @@ class TargetingMixin:
                     unit, target, pos_unit, effective_sensor_range, falloff_exponent
                 )
 
+    def _detection_phase_batched(self) -> None:
+        """索敵フェーズの一括計算版.
+
+        生存ユニット全ペアの距離行列・索敵確率 `1-(d/d_eff)^k`・LOS を1ステップ
+        1回の配列演算で求め、その結果を使って `_detection_phase()` と同じ順序
+        （ユニット順に「発見済みの LOS 喪失判定 → 未発見の新規索敵判定」）で
+        チーム共有の発見済みセットを更新する。チーム内の先行ユニットの発見・
+        LOS 喪失が後続ユニットの判定に影響する点も従来と同じであり、確率判定の
+        乱数を除けば `team_detected_units` / `detection_step_map` は従来と一致する
+        （乱数の消費順のみ異なる）。
+        """
+        alive_units = [u for u in self.units if u.current_hp > 0]  # type: ignore[attr-defined]
+        if not alive_units:
+            return
+        positions, distances, is_enemy, detect_probs, los = self._detection_matrices(
+            alive_units
+        )
+        candidates = (detect_probs > 0.0) & los
+
+        row_of = {u.id: i for i, u in enumerate(alive_units)}
+        for i, unit in enumerate(alive_units):
+            if unit.team_id is None:
+                continue
+            team_detected = self.team_detected_units[unit.team_id]  # type: ignore[attr-defined]
+
+            # 1) 発見済みの敵: LOS 喪失なら除外して最終座標を記憶（距離は問わない）
+            if self.obstacles:  # type: ignore[attr-defined]
+                for target_id in list(team_detected):
+                    row = row_of.get(target_id)
+                    if row is None or not is_enemy[i, row] or los[i, row]:
+                        continue
+                    team_detected.discard(target_id)
+                    self.unit_resources[str(unit.id)]["last_known_enemy_position"][  # type: ignore[attr-defined]
+                        str(target_id)
+                    ] = positions[row].tolist()
+
+            # 2) 未発見の敵: 索敵範囲内かつ LOS ありの候補のみ確率判定
+            for j in np.flatnonzero(candidates[i]):
+                target = alive_units[j]
+                if target.id in team_detected:
+                    continue
+                detect_prob = float(detect_probs[i, j])
+                if self.rng.random() >= detect_prob:  # type: ignore[attr-defined]
+                    continue
+                self._register_detection(
+                    unit, target, float(distances[i, j]), detect_prob
+                )
+
+    def _detection_matrices(
+        self, alive_units: list[MobileSuit]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """索敵判定に使う全ペア分の配列を一括計算する.
+
+        Returns:
+            (位置 (N, 3), 距離行列, 敵ペアマスク, 索敵確率行列, LOS 行列)。
+            索敵確率は `1 - (d / d_eff)^k` で、索敵範囲外・味方ペアは 0。
+            LOS は障害物がない場合・味方ペアは常に True。
+        """
+        n = len(alive_units)
+        sensor_multiplier, falloff_exponent = self._detection_params()
+        positions = self._unit_positions(alive_units)  # type: ignore[attr-defined]
+        effective_ranges = (
+            np.array([u.sensor_range for u in alive_units], dtype=float)
+            * sensor_multiplier
+        )
+
+        diff = positions[None, :, :] - positions[:, None, :]
+        distances = np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+
+        team_codes: dict[str | None, int] = {}
+        teams = np.array(
+            [team_codes.setdefault(u.team_id, len(team_codes)) for u in alive_units]
+        )
+        is_enemy = teams[:, None] != teams[None, :]
+
+        # 確率的索敵判定: P = max(0, 1 - (d / d_eff)^k)（索敵範囲外は 0）
+        in_range = is_enemy & (distances <= effective_ranges[:, None])
+        safe_ranges = np.where(effective_ranges > 0, effective_ranges, 1.0)
+        ratios = np.where(
+            effective_ranges[:, None] > 0, distances / safe_ranges[:, None], 0.0
+        )
+        detect_probs = np.where(
+            in_range, np.maximum(0.0, 1.0 - ratios**falloff_exponent), 0.0
+        )
+
+        # LOS（障害物がある場合のみ）: 敵ペアのみ一括判定。LOS は対称として扱う
+        # （CombatMixin._check_los と同じく self.units 順で先のユニットを始点にする。
+        # alive_units は self.units 順なので上三角 i<j が正規化済みの向きになる）
+        los = np.ones((n, n), dtype=bool)
+        if self.obstacles:  # type: ignore[attr-defined]
+            centers, radii = self._get_obstacle_arrays()  # type: ignore[attr-defined]
+            rows, cols = np.nonzero(np.triu(is_enemy, k=1))
+            self.profiler.count("los_raycasts", len(rows))  # type: ignore[attr-defined]
+            results = has_los_batch(positions[rows], positions[cols], centers, radii)
+            los[rows, cols] = results
+            los[cols, rows] = results
+            self._store_los_results(  # type: ignore[attr-defined]
+                [alive_units[r] for r in rows],
+                [alive_units[c] for c in cols],
+                results,
+            )
+        return positions, distances, is_enemy, detect_probs, los
+
     def _process_single_detection(
         self,
         unit: MobileSuit,
@@ -101,16 +228,12 @@ class TargetingMixin:
         """単一ターゲットへの索敵判定を処理する."""
         assert unit.team_id is not None  # 呼び出し元で None チェック済み
         unit_id = str(unit.id)
-        pos_target = target.position.to_numpy()
+        pos_target = self._unit_pos(target)  # type: ignore[attr-defined]
         distance = float(np.linalg.norm(pos_target - pos_unit))
 
         if target.id in self.team_detected_units[unit.team_id]:  # type: ignore[attr-defined]
             # 既に発見済み — LOS が失われていないか再チェック（障害物がある場合）
-            if self.obstacles and not has_los(  # type: ignore[attr-defined]
-                pos_unit,
-                pos_target,
-                self.obstacles,  # type: ignore[attr-defined]
-            ):
+            if self.obstacles and not self._check_los(unit, target):  # type: ignore[attr-defined]
                 # LOS 喪失: 発見済みリストから除外し最終座標を記憶
                 self.team_detected_units[unit.team_id].discard(target.id)  # type: ignore[attr-defined]
                 self.unit_resources[unit_id]["last_known_enemy_position"][  # type: ignore[attr-defined]
@@ -123,48 +246,51 @@ class TargetingMixin:
             return
 
         # LOS チェック（障害物がある場合のみ）
-        if self.obstacles and not has_los(  # type: ignore[attr-defined]
-            pos_unit,
-            pos_target,
-            self.obstacles,  # type: ignore[attr-defined]
-        ):
+        if self.obstacles and not self._check_los(unit, target):  # type: ignore[attr-defined]
             return
 
         # 確率的索敵判定: P = max(0, 1 - (d / d_eff)^k)
         ratio = distance / effective_sensor_range
         detect_prob = max(0.0, 1.0 - ratio**falloff_exponent)
-        if random.random() >= detect_prob:
+        if self.rng.random() >= detect_prob:  # type: ignore[attr-defined]
             # 発見失敗（確率判定で見逃し）
             return
 
-        # 発見！
+        self._register_detection(unit, target, distance, detect_prob)
+
+    def _register_detection(
+        self,
+        unit: MobileSuit,
+        target: MobileSuit,
+        distance: float,
+        detect_prob: float,
+    ) -> None:
+        """発見をチーム共有の発見済みセットへ登録し、DETECTION ログを追加する."""
+        assert unit.team_id is not None  # 呼び出し元で None チェック済み
         self.team_detected_units[unit.team_id].add(target.id)  # type: ignore[attr-defined]
         self.detection_step_map[unit.team_id][str(target.id)] = self._step_count  # type: ignore[attr-defined]
 
-        # 発見ログを追加
-        dist_label = self._get_distance_label(distance)  # type: ignore[attr-defined]
-        actor_name = self._format_actor_name(unit)  # type: ignore[attr-defined]
-        prob_pct = int(detect_prob * 100)
-        if "MINOVSKY" in self.special_effects:  # type: ignore[attr-defined]
-            detect_message = (
-                f"{actor_name}が濃密なミノフスキー粒子の中、"
-                f"{dist_label}に{target.name}の反応を捉えた！"
-                f"（索敵確率 {prob_pct}%）"
-            )
-        else:
-            detect_message = (
-                f"{actor_name}が{dist_label}に{target.name}を発見！"
-                f"（索敵確率 {prob_pct}%）"
-            )
-        self.logs.append(  # type: ignore[attr-defined]
-            BattleLog(
-                timestamp=self.elapsed_time,  # type: ignore[attr-defined]
-                actor_id=unit.id,
-                action_type="DETECTION",
-                target_id=target.id,
-                message=detect_message,
-                position_snapshot=unit.position,
-            )
+        # 発見ログを追加（メッセージはシリアライズ時に生成する）
+        if not self._log_enabled("DETECTION"):  # type: ignore[attr-defined]
+            return
+        template_id = (
+            "DETECTION_MINOVSKY"
+            if "MINOVSKY" in self.special_effects  # type: ignore[attr-defined]
+            else "DETECTION"
+        )
+        self.logs.record_deferred(  # type: ignore[attr-defined]
+            template_id,
+            {
+                "actor_name": self._format_actor_name(unit),  # type: ignore[attr-defined]
+                "dist_label": self._get_distance_label(distance),  # type: ignore[attr-defined]
+                "target_name": target.name,
+                "prob_pct": int(detect_prob * 100),
+            },
+            timestamp=self.elapsed_time,  # type: ignore[attr-defined]
+            actor_id=unit.id,
+            action_type="DETECTION",
+            target_id=target.id,
+            position_snapshot=self._unit_pos(unit),  # type: ignore[attr-defined]
         )
 
     def _calculate_strategic_value(self, target: MobileSuit) -> float:
@@ -176,12 +302,8 @@ class TargetingMixin:
         Returns:
             戦略価値スコア（高いほど価値が高い）
         """
-        # 武器の平均威力を計算
-        weapon_power_avg = 0.0
-        if target.weapons:
-            weapon_power_avg = sum(w.power for w in target.weapons) / len(
-                target.weapons
-            )
+        # 武器の平均威力（静的プロファイルに計算済み）
+        weapon_power_avg = self._unit_profile(target).avg_weapon_power  # type: ignore[attr-defined]
 
         # 戦略価値 = 最大HP + 平均武器威力
         # Note: パイロットレベルは将来的に実装予定
@@ -199,14 +321,12 @@ class TargetingMixin:
         Returns:
             脅威度スコア（高いほど脅威が高い）
         """
-        # 敵の攻撃力を計算（武器威力の平均）
-        attack_power = 0.0
-        if target.weapons:
-            attack_power = sum(w.power for w in target.weapons) / len(target.weapons)
+        # 敵の攻撃力（武器威力の平均。静的プロファイルに計算済み）
+        attack_power = self._unit_profile(target).avg_weapon_power  # type: ignore[attr-defined]
 
         # 距離を計算
-        pos_actor = actor.position.to_numpy()
-        pos_target = target.position.to_numpy()
+        pos_actor = self._unit_pos(actor)  # type: ignore[attr-defined]
+        pos_target = self._unit_pos(target)  # type: ignore[attr-defined]
         distance = float(np.linalg.norm(pos_target - pos_actor))
 
         # 距離が0の場合は最小距離を設定（ゼロ除算回避）
@@ -223,7 +343,7 @@ class TargetingMixin:
         return threat_level
 
     def _calculate_attack_power(self, unit: MobileSuit) -> float:
-        """ユニットの攻撃力を計算する（武器威力の最大値）.
+        """ユニットの攻撃力を返す（武器威力の最大値。静的プロファイルに計算済み）.
 
         Args:
             unit: 評価対象のユニット
@@ -231,9 +351,7 @@ class TargetingMixin:
         Returns:
             攻撃力スコア（武器がない場合は0.0）
         """
-        if not unit.weapons:
-            return 0.0
-        return float(max(w.power for w in unit.weapons))
+        return self._unit_profile(unit).attack_power  # type: ignore[attr-defined]
 
     def _get_reaction_delay(self, actor: MobileSuit) -> int:
         """発見後に攻撃を開始するまでのリアクション遅延ステップ数を返す.
@@ -312,7 +430,7 @@ class TargetingMixin:
 
         # 戦術に基づいてターゲットを選択
         tactics_priority = actor.tactics.get("priority", "CLOSEST")
-        pos_actor = actor.position.to_numpy()
+        pos_actor = self._unit_pos(actor)  # type: ignore[attr-defined]
 
         if tactics_priority == "WEAKEST":
             # 最もHPが低い敵を選択
@@ -339,18 +457,16 @@ class TargetingMixin:
                 actor, target, "THREAT", f"脅威度: {threat_level:.2f}"
             )
         elif tactics_priority == "RANDOM":
-            import random
-
             # ランダムに敵を選択
-            target = random.choice(detected_targets)
+            target = self.rng.choice(detected_targets)  # type: ignore[attr-defined]
             self._log_target_selection(actor, target, "RANDOM", "ランダム選択")  # type: ignore[attr-defined]
         else:  # CLOSEST (デフォルト)
             # 最も近い敵を選択
             target = min(
                 detected_targets,
-                key=lambda t: np.linalg.norm(t.position.to_numpy() - pos_actor),
+                key=lambda t: np.linalg.norm(self._unit_pos(t) - pos_actor),  # type: ignore[attr-defined]
             )
-            distance = np.linalg.norm(target.position.to_numpy() - pos_actor)
+            distance = np.linalg.norm(self._unit_pos(target) - pos_actor)  # type: ignore[attr-defined]
             self._log_target_selection(  # type: ignore[attr-defined]
                 actor, target, "CLOSEST", f"距離: {int(distance)}m"
             )
@@ -396,7 +512,7 @@ class TargetingMixin:
         if not detected_targets:
             return None
 
-        pos_actor = actor.position.to_numpy()
+        pos_actor = self._unit_pos(actor)  # type: ignore[attr-defined]
 
         # 戦略モードに応じたターゲット選択エンジンを選択
         strategy_mode = self._resolve_strategy_mode(actor)  # type: ignore[attr-defined]
@@ -405,57 +521,55 @@ class TargetingMixin:
             self._target_selection_fuzzy_engine,  # type: ignore[attr-defined]
         )
 
-        # 各候補にファジィ推論を実行し優先度スコアを計算
+        # 全候補の入力を列ごとに集め、ファジィ推論を一括実行して優先度スコアを計算
         try:
-            best_target: MobileSuit | None = None
-            best_score: float = -1.0
-            best_fuzzy_scores: dict | None = None
-            all_scores: dict[str, float] = {}
-
+            distances: list[float] = []
+            hp_ratios: list[float] = []
+            attack_powers: list[float] = []
+            attacking_flags: list[float] = []
             for candidate in detected_targets:
-                pos_candidate = candidate.position.to_numpy()
+                pos_candidate = self._unit_pos(candidate)  # type: ignore[attr-defined]
                 distance = float(np.linalg.norm(pos_candidate - pos_actor))
-                distance = min(distance, _TARGET_SELECTION_MAX_DIST)
-
-                hp_ratio = candidate.current_hp / max(1, candidate.max_hp)
-                attack_power = self._calculate_attack_power(candidate)
-                unit_id_candidate = str(candidate.id)
-                candidate_action = self.unit_resources.get(unit_id_candidate, {}).get(  # type: ignore[attr-defined]
+                distances.append(min(distance, _TARGET_SELECTION_MAX_DIST))
+                hp_ratios.append(candidate.current_hp / max(1, candidate.max_hp))
+                attack_powers.append(self._calculate_attack_power(candidate))
+                candidate_action = self.unit_resources.get(str(candidate.id), {}).get(  # type: ignore[attr-defined]
                     "current_action", "MOVE"
                 )
-                is_attacking_ally = 1.0 if candidate_action == "ATTACK" else 0.0
-
-                fuzzy_inputs = {
-                    "target_hp_ratio": hp_ratio,
-                    "target_distance": distance,
-                    "target_attack_power": attack_power,
-                    "is_attacking_ally": is_attacking_ally,
+                attacking_flags.append(1.0 if candidate_action == "ATTACK" else 0.0)
+
+            self.profiler.count("fuzzy_target_inferences", len(detected_targets))  # type: ignore[attr-defined]
+            batch_result = target_engine.infer_batch(
+                {
+                    "target_hp_ratio": np.array(hp_ratios),
+                    "target_distance": np.array(distances),
+                    "target_attack_power": np.array(attack_powers),
+                    "is_attacking_ally": np.array(attacking_flags),
                 }
+            )
+            scores = _scores_or_zero(batch_result, "target_priority", detected_targets)
 
-                result, debug = target_engine.infer_with_debug(fuzzy_inputs)
-                score = result.get("target_priority", 0.0)
+            best_target: MobileSuit | None = None
+            best_index = -1
+            best_score: float = -1.0
+            all_scores: dict[str, float] = {}
+            for i, (candidate, score) in enumerate(
+                zip(detected_targets, scores, strict=True)
+            ):
                 all_scores[str(candidate.id)] = score
-
                 if score > best_score:
                     best_score = score
                     best_target = candidate
-                    best_fuzzy_scores = {
-                        "layer": "target_selection",
-                        "selected_target_id": str(candidate.id),
-                        "score": score,
-                        "inputs": fuzzy_inputs,
-                        "fuzzified": debug.get("fuzzified", {}),
-                        "activations": debug.get("activations", {}),
-                    }
+                    best_index = i
 
             if best_target is None:
                 # フォールバック: CLOSEST
                 best_target = min(
                     detected_targets,
-                    key=lambda t: np.linalg.norm(t.position.to_numpy() - pos_actor),
+                    key=lambda t: np.linalg.norm(self._unit_pos(t) - pos_actor),  # type: ignore[attr-defined]
                 )
                 fallback_distance = float(
-                    np.linalg.norm(best_target.position.to_numpy() - pos_actor)
+                    np.linalg.norm(self._unit_pos(best_target) - pos_actor)  # type: ignore[attr-defined]
                 )
                 self._log_target_selection(  # type: ignore[attr-defined]
                     actor,
@@ -465,9 +579,29 @@ class TargetingMixin:
                 )
                 return best_target
 
-            # ループ完了後に全候補スコアを記録
-            if best_fuzzy_scores is not None:
-                best_fuzzy_scores["all_scores"] = all_scores
+            if not self._record_fuzzy_scores:  # type: ignore[attr-defined]
+                self._log_target_selection(  # type: ignore[attr-defined]
+                    actor, best_target, "FUZZY", f"優先度スコア: {best_score:.3f}"
+                )
+                return best_target
+
+            # ログ用のファジィ詳細は選択された候補についてのみ単発推論で求める
+            fuzzy_inputs = {
+                "target_hp_ratio": hp_ratios[best_index],
+                "target_distance": distances[best_index],
+                "target_attack_power": attack_powers[best_index],
+                "is_attacking_ally": attacking_flags[best_index],
+            }
+            _, debug = target_engine.infer_with_debug(fuzzy_inputs)
+            best_fuzzy_scores = {
+                "layer": "target_selection",
+                "selected_target_id": str(best_target.id),
+                "score": best_score,
+                "inputs": fuzzy_inputs,
+                "fuzzified": debug.get("fuzzified", {}),
+                "activations": debug.get("activations", {}),
+                "all_scores": all_scores,
+            }
 
             self._log_target_selection(  # type: ignore[attr-defined]
                 actor,
@@ -482,10 +616,10 @@ class TargetingMixin:
             # 推論失敗時は CLOSEST フォールバック
             fallback = min(
                 detected_targets,
-                key=lambda t: np.linalg.norm(t.position.to_numpy() - pos_actor),
+                key=lambda t: np.linalg.norm(self._unit_pos(t) - pos_actor),  # type: ignore[attr-defined]
             )
             fallback_distance = float(
-                np.linalg.norm(fallback.position.to_numpy() - pos_actor)
+                np.linalg.norm(self._unit_pos(fallback) - pos_actor)  # type: ignore[attr-defined]
             )
             self._log_target_selection(  # type: ignore[attr-defined]
                 actor, fallback, "CLOSEST", f"距離: {int(fallback_distance)}m"
@@ -534,12 +668,13 @@ class TargetingMixin:
         resources = self.unit_resources[unit_id]  # type: ignore[attr-defined]
 
         # ターゲットの耐性値を取得
-        target_beam_resistance = float(getattr(target, "beam_resistance", 0.0))
-        target_physical_resistance = float(getattr(target, "physical_resistance", 0.0))
+        target_profile = self._unit_profile(target)  # type: ignore[attr-defined]
+        target_beam_resistance = target_profile.beam_resistance
+        target_physical_resistance = target_profile.physical_resistance
 
         # 距離計算（最大値でクランプ）
-        pos_actor = actor.position.to_numpy()
-        pos_target = target.position.to_numpy()
+        pos_actor = self._unit_pos(actor)  # type: ignore[attr-defined]
+        pos_target = self._unit_pos(target)  # type: ignore[attr-defined]
         distance = float(np.linalg.norm(pos_target - pos_actor))
         distance = min(distance, _WEAPON_SELECTION_MAX_DIST)
 
@@ -556,53 +691,47 @@ class TargetingMixin:
         )
 
         try:
-            best_weapon: Weapon | None = None
-            best_score: float = -1.0
-            best_fuzzy_scores: dict | None = None
-            all_scores: dict[str, float] = {}
-
+            ammo_ratios: list[float] = []
+            beam_flags: list[float] = []
             for weapon in usable_weapons:
                 # 武器の弾薬比率を計算（無制限弾薬の場合は 1.0）
                 weapon_state = resources["weapon_states"].get(weapon.id, {})
                 current_ammo = weapon_state.get("current_ammo")
                 if weapon.max_ammo is not None and weapon.max_ammo > 0:
-                    ammo_ratio = float(current_ammo or 0) / weapon.max_ammo
+                    ammo_ratios.append(float(current_ammo or 0) / weapon.max_ammo)
                 else:
-                    ammo_ratio = 1.0
+                    ammo_ratios.append(1.0)
 
                 # ビーム武器か実弾武器かを数値化（TRUE=1.0 / FALSE=0.0）
-                weapon_is_beam = (
+                beam_flags.append(
                     1.0 if getattr(weapon, "type", "PHYSICAL") == "BEAM" else 0.0
                 )
 
-                fuzzy_inputs = {
-                    "distance_to_target": distance,
-                    "current_en_ratio": current_en_ratio,
-                    "ammo_ratio": ammo_ratio,
-                    "target_beam_resistance": target_beam_resistance,
-                    "target_physical_resistance": target_physical_resistance,
-                    "weapon_is_beam": weapon_is_beam,
+            # 距離・EN・ターゲット耐性は全武器で共通
+            n_weapons = len(usable_weapons)
+            self.profiler.count("fuzzy_weapon_inferences", n_weapons)  # type: ignore[attr-defined]
+            batch_result = weapon_engine.infer_batch(
+                {
+                    "distance_to_target": np.full(n_weapons, distance),
+                    "current_en_ratio": np.full(n_weapons, current_en_ratio),
+                    "ammo_ratio": np.array(ammo_ratios),
+                    "target_beam_resistance": np.full(
+                        n_weapons, target_beam_resistance
+                    ),
+                    "target_physical_resistance": np.full(
+                        n_weapons, target_physical_resistance
+                    ),
+                    "weapon_is_beam": np.array(beam_flags),
                 }
+            )
+            scores = _scores_or_zero(batch_result, "weapon_score", usable_weapons)
 
-                result, debug = weapon_engine.infer_with_debug(fuzzy_inputs)
-                score = result.get("weapon_score", 0.0)
-                all_scores[str(weapon.id)] = score
-
+            best_weapon: Weapon | None = None
+            best_score: float = -1.0
+            for weapon, score in zip(usable_weapons, scores, strict=True):
                 if score > best_score:
                     best_score = score
                     best_weapon = weapon
-                    best_fuzzy_scores = {
-                        "layer": "weapon_selection",
-                        "selected_weapon_id": str(weapon.id),
-                        "selected_weapon_name": weapon.name,
-                        "score": score,
-                        "inputs": fuzzy_inputs,
-                        "fuzzified": debug.get("fuzzified", {}),
-                        "activations": debug.get("activations", {}),
-                    }
-
-            if best_fuzzy_scores is not None:
-                best_fuzzy_scores["all_scores"] = all_scores
 
             return best_weapon
 
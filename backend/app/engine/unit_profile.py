@@ -0,0 +1,164 @@
+# backend/app/engine/unit_profile.py
+"""戦闘中に変化しないユニットの静的プロファイル.
+
+攻撃力（武器威力の最大・平均）、射撃/格闘武器の分類、耐性、機動パラメータ、
+地形補正、パイロットステータスは装備が変わらない限り戦闘中に変化しない。
+ターゲット選定・脅威評価・移動計算はこれらを呼び出しのたびに `unit.weapons` の
+走査や getattr で求め直していたため、`UnitProfile` として BattleSimulator 生成時に
+1回だけ計算し、各 Mixin は `BattleSimulator._unit_profile()` 経由で参照する。
+
+プロファイルは計算時の各武器オブジェクトの id() を保持し、`unit.weapons` の
+差し替え・武器の追加/削除・要素の入れ替え（`unit.weapons[0] = other`）があった
+場合は step() の冒頭で破棄されて次回参照時に再計算される（参照ごとの検査は SQLModel の属性参照の
+コストが再計算の節約分を上回るため行わない）。武器オブジェクトのステータスを
+直接書き換えた場合は `BattleSimulator.invalidate_unit_profile()` で明示的に破棄する。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from app.engine.calculator import PilotStats
+from app.engine.constants import (
+    DEFAULT_BOOST_COOLDOWN,
+    DEFAULT_BOOST_EN_COST,
+    DEFAULT_BOOST_MAX_DURATION,
+    DEFAULT_BOOST_SPEED_MULTIPLIER,
+    SPECIAL_ENVIRONMENT_EFFECTS,
+    TERRAIN_ADAPTABILITY_MODIFIERS,
+)
+from app.models.models import MobileSuit, Weapon
+
+# body_turn_rate 未設定時の胴体旋回速度 (deg/s)
+_DEFAULT_BODY_TURN_RATE = 720.0
+
+
+def is_melee_weapon(weapon: Weapon) -> bool:
+    """格闘武器かどうか（weapon_type == "MELEE" または is_melee）を返す."""
+    return getattr(weapon, "weapon_type", "RANGED") == "MELEE" or getattr(
+        weapon, "is_melee", False
+    )
+
+
+def compute_terrain_modifier(
+    unit: MobileSuit, environment: str, special_effects: list[str]
+) -> float:
+    """地形適正・重力井戸効果による機動力の補正係数を返す.
+
+    Args:
+        unit: 対象ユニット
+        environment: 戦闘環境 (SPACE/GROUND/COLONY/UNDERWATER)
+        special_effects: 特殊環境効果リスト
+
+    Returns:
+        最大速度に掛ける補正係数
+    """
+    terrain_adaptability = getattr(unit, "terrain_adaptability", {})
+    adaptability_grade = terrain_adaptability.get(environment, "A")
+    modifier = TERRAIN_ADAPTABILITY_MODIFIERS.get(adaptability_grade, 1.0)
+
+    # 重力井戸効果: 機動性をさらに低下
+    if "GRAVITY_WELL" in special_effects:
+        gravity = SPECIAL_ENVIRONMENT_EFFECTS["GRAVITY_WELL"]
+        modifier *= gravity["mobility_multiplier"]
+
+    return modifier
+
+
+@dataclass(frozen=True, slots=True)
+class UnitProfile:
+    """ユニット1体分の静的プロファイル.
+
+    Attributes:
+        weapon_ids: 計算時の各武器オブジェクトの id()（装備変更の検出用。
+            武器自体は ranged_weapons / melee_weapons が参照を保持するため
+            id が再利用されることはない）
+        attack_power: 武器威力の最大値（武器なしは 0.0）
+        avg_weapon_power: 武器威力の平均値（武器なしは 0.0）
+        max_weapon_range: 武器射程の最大値（武器なしは 0.0）
+        ranged_weapons: 射撃武器（装備順）
+        melee_weapons: 格闘武器（装備順）
+        beam_resistance: 対ビーム防御力
+        physical_resistance: 対実弾防御力
+        max_speed: 最大速度 (m/s)
+        acceleration: 加速度 (m/s²)
+        deceleration: 減速度 (m/s²)
+        max_turn_rate: 移動方向の最大旋回速度 (deg/s)
+        body_turn_rate: 胴体の最大旋回速度 (deg/s)
+        boost_speed_multiplier: ブースト時速度倍率
+        boost_en_cost: ブースト中 EN 消費量 (/s)
+        boost_max_duration: 1 回のブーストの最大継続時間 (s)
+        boost_cooldown: ブースト終了後の再使用不可時間 (s)
+        terrain_modifier: 地形適正・特殊環境による機動力補正係数
+        pilot_stats: パイロットステータス
+    """
+
+    weapon_ids: tuple[int, ...]
+    attack_power: float
+    avg_weapon_power: float
+    max_weapon_range: float
+    ranged_weapons: tuple[Weapon, ...]
+    melee_weapons: tuple[Weapon, ...]
+    beam_resistance: float
+    physical_resistance: float
+    max_speed: float
+    acceleration: float
+    deceleration: float
+    max_turn_rate: float
+    body_turn_rate: float
+    boost_speed_multiplier: float
+    boost_en_cost: float
+    boost_max_duration: float
+    boost_cooldown: float
+    terrain_modifier: float
+    pilot_stats: PilotStats
+
+    def matches_loadout(self, unit: MobileSuit) -> bool:
+        """ユニットの装備武器が計算時から差し替え・増減・入れ替えされていないかを返す."""
+        return tuple(map(id, unit.weapons)) == self.weapon_ids
+
+
+def build_unit_profile(
+    unit: MobileSuit,
+    environment: str,
+    special_effects: list[str],
+    pilot_stats: PilotStats,
+) -> UnitProfile:
+    """ユニットの静的プロファイルを計算する.
+
+    Args:
+        unit: 対象ユニット
+        environment: 戦闘環境
+        special_effects: 特殊環境効果リスト
+        pilot_stats: ユニットのパイロットステータス
+
+    Returns:
+        計算したプロファイル
+    """
+    weapons = unit.weapons
+    powers = [w.power for w in weapons]
+    return UnitProfile(
+        weapon_ids=tuple(map(id, weapons)),
+        attack_power=float(max(powers)) if powers else 0.0,
+        avg_weapon_power=sum(powers) / len(powers) if powers else 0.0,
+        max_weapon_range=max((w.range for w in weapons), default=0.0),
+        ranged_weapons=tuple(w for w in weapons if not is_melee_weapon(w)),
+        melee_weapons=tuple(w for w in weapons if is_melee_weapon(w)),
+        beam_resistance=float(getattr(unit, "beam_resistance", 0.0)),
+        physical_resistance=float(getattr(unit, "physical_resistance", 0.0)),
+        max_speed=unit.max_speed,
+        acceleration=unit.acceleration,
+        deceleration=unit.deceleration,
+        max_turn_rate=unit.max_turn_rate,
+        body_turn_rate=getattr(unit, "body_turn_rate", _DEFAULT_BODY_TURN_RATE),
+        boost_speed_multiplier=getattr(
+            unit, "boost_speed_multiplier", DEFAULT_BOOST_SPEED_MULTIPLIER
+        ),
+        boost_en_cost=getattr(unit, "boost_en_cost", DEFAULT_BOOST_EN_COST),
+        boost_max_duration=getattr(
+            unit, "boost_max_duration", DEFAULT_BOOST_MAX_DURATION
+        ),
+        boost_cooldown=getattr(unit, "boost_cooldown", DEFAULT_BOOST_COOLDOWN),
+        terrain_modifier=compute_terrain_modifier(unit, environment, special_effects),
+        pilot_stats=pilot_stats,
+    )
@@ -0,0 +1,240 @@
+# backend/app/engine/unit_state.py
+"""ユニット状態の Structure-of-Arrays (SoA) ストア.
+
+各フェーズが `MobileSuit`（pydantic モデル）の `position.to_numpy()` を
+ユニット×参照回数だけ呼び、そのたびに新しい ndarray を確保していたコストを
+削減するため、位置・速度・HP・EN・チーム・生存フラグ・向きを連続した
+NumPy 配列として保持する。room_size=100 × 最大5000ステップのバッチ実行では
+この確保コストが支配的になるため、ホットパスはこのストアを直接参照する。
+
+同期方針:
+    - 位置は初回の `load()` 以降このストアが正で、`MobileSuit.position` への
+      書き戻しは `write_back()`（バトル終了時、または呼び出し側が明示的に
+      要求した時点）でまとめて行う。移動のたびに `Vector3` を生成しない。
+      ログの座標スナップショットもストアの行から記録する。
+    - `load()` は `step()` の冒頭で呼ばれる。位置は、ストアが最後に読み書き
+      した `Vector3` と別のオブジェクトが `unit.position` に代入されている
+      ユニット（ステップ外でのテスト・呼び出し側による直接代入）だけを読み直す。
+      `unit.position.x = ...` のような in-place の書き換えは検出しない。
+    - HP は `MobileSuit.current_hp`、速度・EN・向き・ステータスは
+      `unit_resources` が正で、戦闘処理がそれらを直接書き換えるため `load()`
+      で毎ステップ読み直し、ステップ内の変更は `set_*()` で配列へ反映する。
+    - `en` はステップ開始時点のスナップショットであり、ステップ内の EN 消費は
+      反映しない（正は `unit_resources["current_en"]`）。
+"""
+
+import uuid
+
+import numpy as np
+
+from app.models.models import MobileSuit, Vector3
+
+
+class UnitStateStore:
+    """全ユニットの戦闘中状態を行インデックスで保持する配列群.
+
+    行の並びは生成時の `units` の順序（`BattleSimulator.units` と同一）で、
+    バトル中は不変。`active` が True の間（`step()` 実行中）のみ配列の値が
+    最新であることが保証される。
+    """
+
+    def __init__(self, units: list[MobileSuit]) -> None:
+        """ユニットリストから空の配列群を確保する.
+
+        Args:
+            units: 対象ユニット（BattleSimulator.units と同順）
+        """
+        n = len(units)
+        self.units: list[MobileSuit] = list(units)
+        self.index: dict[uuid.UUID, int] = {u.id: i for i, u in enumerate(units)}
+        # チームID → チームインデックス（出現順）
+        self.team_ids: list[str] = []
+        team_index: dict[str, int] = {}
+        for u in units:
+            key = str(u.team_id)
+            if key not in team_index:
+                team_index[key] = len(self.team_ids)
+                self.team_ids.append(key)
+        self.team_index: dict[str, int] = team_index
+
+        self.positions: np.ndarray = np.zeros((n, 3))
+        self.velocities: np.ndarray = np.zeros((n, 3))
+        self.hp: np.ndarray = np.zeros(n)
+        self.max_hp: np.ndarray = np.array(
+            [float(max(1, u.max_hp)) for u in units], dtype=float
+        )
+        self.en: np.ndarray = np.zeros(n)
+        self.team_idx: np.ndarray = np.array(
+            [team_index[str(u.team_id)] for u in units], dtype=np.int32
+        )
+        self.alive: np.ndarray = np.zeros(n, dtype=bool)
+        # unit_resources["status"] が ACTIVE か（撃破・撤退で False になる）
+        self.status_active: np.ndarray = np.zeros(n, dtype=bool)
+        # チームインデックス → 所属ユニットの行インデックス（行順）
+        self.team_rows: list[np.ndarray] = [
+            np.flatnonzero(self.team_idx == t) for t in range(len(self.team_ids))
+        ]
+        self.movement_heading: np.ndarray = np.zeros(n)
+        self.body_heading: np.ndarray = np.zeros(n)
+        # 位置の更新回数（LOS キャッシュ等の位置依存キャッシュの無効化判定用）
+        self.position_versions: list[int] = [0] * n
+        # position() が返す行ごとの読み取り専用ビュー（呼び出しごとに確保しない）
+        readonly = self.positions.view()
+        readonly.flags.writeable = False
+        self._position_views: list[np.ndarray] = list(readonly)
+        # 各行の位置と一致している MobileSuit.position（未同期は None）
+        self._synced_positions: list[Vector3 | None] = [None] * n
+        # MobileSuit.position へ未反映の位置を持つ行
+        self._dirty_rows: set[int] = set()
+        self.active: bool = False
+
+    def load(self, unit_resources: dict) -> None:
+        """`MobileSuit` / `unit_resources` の現在値を配列へ書き込む（in-place）.
+
+        Args:
+            unit_resources: BattleSimulator.unit_resources
+        """
+        positions = self.positions
+        velocities = self.velocities
+        synced = self._synced_positions
+        for i, u in enumerate(self.units):
+            pos = u.position
+            if pos is not synced[i]:
+                # 初回、またはステップ外で unit.position が差し替えられた
+                positions[i, 0] = pos.x
+                positions[i, 1] = pos.y
+                positions[i, 2] = pos.z
+                self.position_versions[i] += 1
+                synced[i] = pos
+                self._dirty_rows.discard(i)
+            hp = float(u.current_hp)
+            self.hp[i] = hp
+            self.alive[i] = hp > 0
+            res = unit_resources.get(str(u.id))
+            if res is None:
+                self.status_active[i] = False
+                continue
+            self.status_active[i] = res.get("status") == "ACTIVE"
+            velocities[i] = res["velocity_vec"]
+            self.en[i] = res.get("current_en", 0.0)
+            self.movement_heading[i] = res.get("movement_heading_deg", 0.0)
+            self.body_heading[i] = res.get("body_heading_deg", 0.0)
+        self.active = True
+
+    def row(self, unit: MobileSuit) -> int | None:
+        """ユニットの行インデックスを返す（ストア外のユニットは None）."""
+        return self.index.get(unit.id)
+
+    def position(self, unit: MobileSuit) -> np.ndarray:
+        """ユニット位置の読み取り専用ビューを返す（コピーしない）.
+
+        ビューは同じユニットの後続の `set_position()` で値が変わるため、
+        移動をまたいで元の位置が必要な呼び出し側はコピーして保持すること。
+        ストア外のユニット、およびステップ外で `unit.position` が差し替えられた
+        ユニットは `unit.position.to_numpy()` にフォールバックする。
+        """
+        i = self.index.get(unit.id)
+        if i is None:
+            return unit.position.to_numpy()
+        if not self.active and unit.position is not self._synced_positions[i]:
+            return unit.position.to_numpy()
+        return self._position_views[i]
+
+    def set_position(self, unit: MobileSuit, pos: np.ndarray) -> bool:
+        """ユニット位置をストアへ書き込む（MobileSuit へは write_back() で反映）.
+
+        Returns:
+            書き込んだ場合 True。ストア非アクティブ時・ストア外のユニットは
+            何もせず False を返す（呼び出し側が MobileSuit へ直接書き込む）
+        """
+        i = self.index.get(unit.id)
+        if not self.active or i is None:
+            return False
+        self.positions[i] = pos
+        self.position_versions[i] += 1
+        self._dirty_rows.add(i)
+        return True
+
+    def write_back(self) -> None:
+        """ストアにしかない位置を `MobileSuit.position` へ書き戻す."""
+        positions = self.positions
+        for i in sorted(self._dirty_rows):
+            pos = Vector3(
+                x=float(positions[i, 0]),
+                y=float(positions[i, 1]),
+                z=float(positions[i, 2]),
+            )
+            self.units[i].position = pos
+            self._synced_positions[i] = pos
+        self._dirty_rows.clear()
+
+    def set_velocity(
+        self, unit: MobileSuit, velocity: np.ndarray, heading_deg: float | None = None
+    ) -> None:
+        """ユニットの速度ベクトル（と移動方向）を書き込む."""
+        i = self.index.get(unit.id)
+        if self.active and i is not None:
+            self.velocities[i] = velocity
+            if heading_deg is not None:
+                self.movement_heading[i] = heading_deg
+
+    def set_body_heading(self, unit: MobileSuit, heading_deg: float) -> None:
+        """ユニットの胴体向きを書き込む."""
+        i = self.index.get(unit.id)
+        if self.active and i is not None:
+            self.body_heading[i] = heading_deg
+
+    def set_hp(self, unit: MobileSuit) -> None:
+        """`unit.current_hp` を HP 配列・生存フラグへ反映する."""
+        i = self.index.get(unit.id)
+        if self.active and i is not None:
+            hp = float(unit.current_hp)
+            self.hp[i] = hp
+            self.alive[i] = hp > 0
+
+    def set_status(self, unit: MobileSuit, status: str) -> None:
+        """`unit_resources["status"]` の変更（撃破・撤退）を反映する."""
+        i = self.index.get(unit.id)
+        if self.active and i is not None:
+            self.status_active[i] = status == "ACTIVE"
+
+    def team_units(self, team_id: str) -> list[MobileSuit]:
+        """チームに所属するユニットを行順で返す（未知のチームは空リスト）."""
+        t = self.team_index.get(team_id)
+        if t is None:
+            return []
+        units = self.units
+        return [units[i] for i in self.team_rows[t]]
+
+    def team_active_hp_ratios(self, team_id: str) -> tuple[int, list[float]]:
+        """チームの全ユニット数と、ACTIVE な生存ユニットの HP 割合を返す.
+
+        ストアがアクティブ（`step()` 実行中）の場合のみ有効。HP 割合は行順で、
+        `current_hp / max(1, max_hp)` と同じ値になる。
+
+        Args:
+            team_id: 対象チームID
+
+        Returns:
+            (チームの全ユニット数, ACTIVE な生存ユニットの HP 割合のリスト)
+        """
+        t = self.team_index.get(team_id)
+        if t is None:
+            return 0, []
+        rows = self.team_rows[t]
+        active_rows = rows[self.alive[rows] & self.status_active[rows]]
+        return len(rows), (self.hp[active_rows] / self.max_hp[active_rows]).tolist()
+
+    def alive_units(self) -> list[MobileSuit]:
+        """生存ユニットを行順（= BattleSimulator.units 順）で返す."""
+        units = self.units
+        return [units[i] for i in np.flatnonzero(self.alive)]
+
+    def deactivate(self) -> None:
+        """ストアを非アクティブにする（`step()` の末尾で呼ばれる）.
+
+        HP はライトスルーで `MobileSuit` にも反映済み。位置は書き戻さず、
+        以降もストアの値を正とする（`write_back()` 参照）。ステップ外では
+        HP 等の配列の値が古くなりうるため `active` を落とす。
+        """
+        self.active = False
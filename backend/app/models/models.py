@@ -810,6 +810,11 @@ class BattleResult(SQLModel, table=True):
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(UTC), description="作成日時"
     )
+    ranking_batch_id: uuid.UUID | None = Field(
+        default=None,
+        index=True,
+        description="このバトル結果を集計したランキング集計のID（未集計は None）",
+    )
 
     # --- 戦闘ダイジェスト (Battle History 一覧の物語化, Issue #415) ---
     # 既存レコードとの互換のためすべて nullable。バトル終了時に一度だけ計算して保存する。
@@ -883,6 +888,10 @@ class BattleRoom(SQLModel, table=True):
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(UTC), description="作成日時"
     )
+    failed_at: datetime | None = Field(
+        default=None,
+        description="バッチでのシミュレーションに最後に失敗した日時（WAITING のまま次回再実行）",
+    )
 
 
 class BattleEntry(SQLModel, table=True):
@@ -7,11 +7,21 @@ BattleResult の生成箇所は `main.py`（ソロミッション）と
 個別実装すると、片方だけ更新してもう片方が更新漏れになる事故が起きる
 （実際にIssue #415で発生した）。新しく `BattleResult` の生成箇所を追加する
 場合は、必ず `compute_battle_digest_fields` を経由すること。
+
+ルーム内の複数エントリーをまとめて保存する場合は、直前の一言ログを
+`get_previous_digest_texts` で一括取得し、ログの集計は `analyze_battle_logs` で
+全ユニット分を1回だけ行って `build_battle_digest_fields` に渡す。
 """
 
-from sqlmodel import Session, desc, select
+from collections.abc import Iterable, Sequence
+
+from sqlmodel import Session, col, desc, func, select
 
-from app.engine.battle_digest import build_digest, compute_digest_stats
+from app.engine.battle_digest import (
+    BattleLogStats,
+    build_digest,
+    compute_digest_stats,
+)
 from app.models.models import BattleLog, BattleResult, MobileSuit
 
 
@@ -28,15 +38,92 @@ def get_previous_digest_text(session: Session, user_id: str | None) -> str | Non
     return prev_battle.digest_text if prev_battle else None
 
 
+def get_previous_digest_texts(
+    session: Session, user_ids: Iterable[str]
+) -> dict[str, str | None]:
+    """複数ユーザーの直前のバトルの一言ログを1クエリで取得する.
+
+    Args:
+        session: DBセッション
+        user_ids: ユーザーIDの一覧
+
+    Returns:
+        user_id をキーとした直前の一言ログ（バトル履歴のないユーザーは含まない）
+    """
+    unique_ids = set(user_ids)
+    if not unique_ids:
+        return {}
+    ranked = (
+        select(
+            BattleResult.user_id,
+            BattleResult.digest_text,
+            func.row_number()
+            .over(
+                partition_by=BattleResult.user_id,
+                order_by=desc(BattleResult.created_at),
+            )
+            .label("rank"),
+        )
+        .where(col(BattleResult.user_id).in_(unique_ids))
+        .subquery()
+    )
+    rows = session.exec(
+        select(ranked.c.user_id, ranked.c.digest_text).where(ranked.c.rank == 1)
+    ).all()
+    return {user_id: digest_text for user_id, digest_text in rows}
+
+
+def build_battle_digest_fields(
+    player: MobileSuit,
+    logs: Sequence[BattleLog],
+    kills: int,
+    win_loss: str,
+    steps_used: int,
+    max_steps: int,
+    avoid_text: str | None,
+    log_stats: BattleLogStats | None = None,
+) -> dict:
+    """直前の一言ログを取得済みの状態でダイジェスト関連フィールドを計算する.
+
+    引数・戻り値は `compute_battle_digest_fields` と同じ（session / user_id の
+    代わりに、直前の一言ログ `avoid_text` を受け取る）。`log_stats` に
+    `analyze_battle_logs()` の集計結果を渡した場合はログを再走査しない。
+    """
+    stats = compute_digest_stats(
+        player=player,
+        logs=logs,
+        kills=kills,
+        win_loss=win_loss,
+        steps_used=steps_used,
+        max_steps=max_steps,
+        log_stats=log_stats,
+    )
+    digest_tag, digest_text = build_digest(stats, avoid_text=avoid_text)
+
+    return {
+        "player_survived": stats.player_survived,
+        "min_hp_percent": stats.min_hp_percent,
+        "damage_severity": stats.damage_severity,
+        "damage_taken_count": stats.damage_taken_count,
+        "max_hit_damage": stats.max_hit_damage,
+        "dodge_count": stats.dodge_count,
+        "attacks_received_count": stats.attacks_received_count,
+        "pilot_ms_name": stats.pilot_ms_name,
+        "digest_tag": digest_tag,
+        "digest_text": digest_text,
+    }
+
+
 def compute_battle_digest_fields(
     session: Session,
     user_id: str | None,
     player: MobileSuit,
-    logs: list[BattleLog],
+    logs: Sequence[BattleLog],
     kills: int,
     win_loss: str,
     steps_used: int,
     max_steps: int,
+    log_stats: BattleLogStats | None = None,
 ) -> dict:
     """BattleResultに設定するダイジェスト関連フィールドをまとめて計算する.
 
@@ -51,6 +138,7 @@ def compute_battle_digest_fields(
         win_loss: "WIN" / "LOSE" / "DRAW"
         steps_used: シミュレーションが消費したステップ数
         max_steps: シミュレーションの最大ステップ数
+        log_stats: `analyze_battle_logs()` で集計済みのログ集計（省略時はここで集計する）
 
     Returns:
         `BattleResult(...)` にそのまま **展開できる dict
@@ -58,26 +146,13 @@ def compute_battle_digest_fields(
         damage_taken_count, max_hit_damage, dodge_count,
         attacks_received_count, pilot_ms_name, digest_tag, digest_text）
     """
-    stats = compute_digest_stats(
+    return build_battle_digest_fields(
         player=player,
         logs=logs,
         kills=kills,
         win_loss=win_loss,
         steps_used=steps_used,
         max_steps=max_steps,
+        avoid_text=get_previous_digest_text(session, user_id),
+        log_stats=log_stats,
     )
-    avoid_text = get_previous_digest_text(session, user_id)
-    digest_tag, digest_text = build_digest(stats, avoid_text=avoid_text)
-
-    return {
-        "player_survived": stats.player_survived,
-        "min_hp_percent": stats.min_hp_percent,
-        "damage_severity": stats.damage_severity,
-        "damage_taken_count": stats.damage_taken_count,
-        "max_hit_damage": stats.max_hit_damage,
-        "dodge_count": stats.dodge_count,
-        "attacks_received_count": stats.attacks_received_count,
-        "pilot_ms_name": stats.pilot_ms_name,
-        "digest_tag": digest_tag,
-        "digest_text": digest_text,
-    }
@@ -0,0 +1,465 @@
+"""バトルログのコンパクトなバイナリリプレイ形式（エンコーダ・デコーダ）.
+
+`GET /api/battles/{battle_id}/logs` は既定で NDJSON（1行1エントリの BattleLog
+相当 JSON）を返すが、UUID 文字列・繰り返し現れる日本語メッセージ・座標の
+ネストした dict を毎行そのまま送るため、100機規模のルームでは数十MBになり
+配信転送量の大半を占める。`Accept: application/vnd.msbs.replay` を指定した
+クライアントには、同じ内容を次の工夫で詰めたバイナリ形式で返す。
+
+    - ユニットID: フレーム内のUUID辞書へのインデックス
+    - action_type・メッセージ・武器名などの文字列: フレーム内の文字列テーブル
+      （重複排除）へのインデックス
+    - 行のキー構成（キー順と値の種別）: 文字列テーブルに JSON として1回だけ格納し、
+      各行はそのインデックスのみを持つ
+    - timestamp: ミリ秒に量子化し、直前の行との差分
+    - 座標・速度: センチメートル（cm/s）に量子化し、同じユニットの直前の値との差分
+    - heading: 0.01度に量子化し、同じユニットの直前の値との差分
+    - 整数: zigzag + 可変長整数（LEB128）
+
+座標・速度・向き・timestamp 以外の値は NDJSON と同一に復元される（種別の想定と
+異なる値・未知のキーは JSON 文字列として文字列テーブルに格納する）。
+HTTP の圧縮は従来通り `GZipMiddleware` が行うため、形式自体は圧縮しない。
+
+形式（すべての整数は可変長整数、符号付きは zigzag）::
+
+    ヘッダー : b"MSBR" + バージョン(1バイト)
+    フレーム : ペイロード長, ペイロード（ペイロード長 0 が終端）
+    ペイロード:
+        文字列数, (バイト長, UTF-8)*
+        UUID数, (16バイト)*
+        行数, 行*
+    行       : キー構成の文字列インデックス, キー構成の順に各値
+
+フレームは `REPLAY_FRAME_ROWS` 行ごとに区切り、辞書・文字列テーブル・差分の
+基準値はフレームごとに初期化する。フレーム単位で完結するため、エンコーダは
+全行をメモリに載せずにストリーム送出できる。
+"""
+
+import json
+import math
+import uuid
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+REPLAY_MEDIA_TYPE = "application/vnd.msbs.replay"
+REPLAY_MAGIC = b"MSBR"
+REPLAY_FORMAT_VERSION = 1
+# 1フレームの最大行数（辞書・差分の基準値はフレームごとに初期化される）
+REPLAY_FRAME_ROWS = 4096
+
+# 量子化スケール（値 × スケールを整数に丸める）
+_TIMESTAMP_SCALE = 1000  # ミリ秒
+_VECTOR_SCALE = 100  # cm, cm/s
+_HEADING_SCALE = 100  # 0.01度
+
+# 値の種別コード（キー構成に記録する）
+_KIND_NULL = "n"
+_KIND_TRUE = "T"
+_KIND_FALSE = "F"
+_KIND_TIMESTAMP = "t"
+_KIND_UUID = "u"
+_KIND_STRING = "s"
+_KIND_INT = "i"
+_KIND_POSITION = "p"
+_KIND_VELOCITY = "v"
+_KIND_HEADING = "h"
+_KIND_JSON = "j"
+_KIND_BOOL = "b"  # スキーマ上の種別（値に応じて T/F を記録する）
+
+# BattleLog のキーごとの想定種別（ここに無いキーは JSON として格納する）
+_FIELD_KINDS: dict[str, str] = {
+    "timestamp": _KIND_TIMESTAMP,
+    "actor_id": _KIND_UUID,
+    "target_id": _KIND_UUID,
+    "action_type": _KIND_STRING,
+    "message": _KIND_STRING,
+    "chatter": _KIND_STRING,
+    "weapon_name": _KIND_STRING,
+    "strategy_mode": _KIND_STRING,
+    "team_id": _KIND_STRING,
+    "combo_message": _KIND_STRING,
+    "attack_sector": _KIND_STRING,
+    "weapon_id": _KIND_STRING,
+    "damage": _KIND_INT,
+    "target_max_hp": _KIND_INT,
+    "combo_count": _KIND_INT,
+    "skill_activated": _KIND_BOOL,
+    "is_crit": _KIND_BOOL,
+    "position_snapshot": _KIND_POSITION,
+    "velocity_snapshot": _KIND_VELOCITY,
+    "heading": _KIND_HEADING,
+}
+
+_VECTOR_KEYS = ("x", "y", "z")
+# 値を持たない種別と復元値
+_CONSTANT_KINDS: dict[str, Any] = {
+    _KIND_NULL: None,
+    _KIND_TRUE: True,
+    _KIND_FALSE: False,
+}
+
+
+class ReplayDecodeError(ValueError):
+    """バイナリリプレイのデータが不正な場合に送出される."""
+
+
+def _write_uint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _write_int(out: bytearray, value: int) -> None:
+    _write_uint(out, (value << 1) if value >= 0 else ((-value << 1) - 1))
+
+
+def _is_number(value: Any) -> bool:
+    value_type = type(value)
+    return value_type is int or (value_type is float and math.isfinite(value))
+
+
+def _is_vector(value: Any) -> bool:
+    return (
+        isinstance(value, dict)
+        and tuple(value) == _VECTOR_KEYS
+        and all(_is_number(v) for v in value.values())
+    )
+
+
+def _uuid_str(value: Any) -> str | None:
+    """正規形の UUID 文字列（または uuid.UUID）なら文字列を返す."""
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, str) and len(value) == 36:
+        try:
+            if str(uuid.UUID(value)) == value:
+                return value
+        except ValueError:
+            return None
+    return None
+
+
+def _value_kind(key: str, value: Any, known_units: dict[str, int]) -> str:
+    """値を格納する種別を決める（想定と異なる値は JSON）."""
+    if value is None:
+        return _KIND_NULL
+    kind = _FIELD_KINDS.get(key, _KIND_JSON)
+    if kind == _KIND_STRING:
+        return kind if isinstance(value, str) else _KIND_JSON
+    if kind == _KIND_UUID:
+        if (isinstance(value, str) and value in known_units) or _uuid_str(
+            value
+        ) is not None:
+            return kind
+        return _KIND_JSON
+    if kind in (_KIND_POSITION, _KIND_VELOCITY):
+        return kind if _is_vector(value) else _KIND_JSON
+    if kind in (_KIND_TIMESTAMP, _KIND_HEADING):
+        return kind if _is_number(value) else _KIND_JSON
+    if kind == _KIND_INT:
+        return kind if type(value) is int else _KIND_JSON
+    if kind == _KIND_BOOL:
+        if isinstance(value, bool):
+            return _KIND_TRUE if value else _KIND_FALSE
+        return _KIND_JSON
+    return _KIND_JSON
+
+
+class _FrameEncoder:
+    """1フレーム分の辞書・差分の基準値と行データ."""
+
+    def __init__(self) -> None:
+        self.rows = bytearray()
+        self.row_count = 0
+        self.strings: dict[str, int] = {}
+        self.units: dict[str, int] = {}
+        # (キー順, 種別) → キー構成の文字列インデックス
+        self.layouts: dict[tuple[tuple[str, ...], str], int] = {}
+        self.prev_timestamp = 0
+        # (種別, ユニットのインデックス) → 直前の量子化値
+        self.prev_values: dict[tuple[str, int], list[int]] = {}
+
+    def _string(self, value: str) -> int:
+        idx = self.strings.get(value)
+        if idx is None:
+            idx = self.strings[value] = len(self.strings)
+        return idx
+
+    def _unit(self, value: str | uuid.UUID) -> int:
+        idx = self.units.get(value)  # type: ignore[arg-type]
+        if idx is None:
+            value = str(value)
+            idx = self.units.get(value)
+            if idx is None:
+                idx = self.units[value] = len(self.units)
+        return idx
+
+    def _layout(self, keys: tuple[str, ...], kinds: str) -> int:
+        idx = self.layouts.get((keys, kinds))
+        if idx is None:
+            layout = json.dumps([list(keys), kinds], ensure_ascii=False)
+            idx = self.layouts[(keys, kinds)] = self._string(layout)
+        return idx
+
+    def _write_delta(self, kind: str, actor: int, quantized: list[int]) -> None:
+        prev = self.prev_values.get((kind, actor))
+        if prev is None:
+            prev = [0] * len(quantized)
+        for q, p in zip(quantized, prev, strict=True):
+            _write_int(self.rows, q - p)
+        self.prev_values[(kind, actor)] = quantized
+
+    def add(self, entry: dict[str, Any]) -> None:
+        units = self.units
+        kinds = "".join(
+            [_value_kind(key, value, units) for key, value in entry.items()]
+        )
+        _write_uint(self.rows, self._layout(tuple(entry), kinds))
+
+        actor = -1  # 差分の基準値を引くユニット（actor_id より前の項目は共通）
+        for (key, value), kind in zip(entry.items(), kinds, strict=True):
+            if kind in (_KIND_NULL, _KIND_TRUE, _KIND_FALSE):
+                continue
+            if kind == _KIND_TIMESTAMP:
+                q = round(value * _TIMESTAMP_SCALE)
+                _write_int(self.rows, q - self.prev_timestamp)
+                self.prev_timestamp = q
+            elif kind == _KIND_UUID:
+                idx = self._unit(value)
+                _write_uint(self.rows, idx)
+                if key == "actor_id":
+                    actor = idx
+            elif kind == _KIND_STRING:
+                _write_uint(self.rows, self._string(value))
+            elif kind == _KIND_INT:
+                _write_int(self.rows, value)
+            elif kind in (_KIND_POSITION, _KIND_VELOCITY):
+                quantized = [round(value[k] * _VECTOR_SCALE) for k in _VECTOR_KEYS]
+                self._write_delta(kind, actor, quantized)
+            elif kind == _KIND_HEADING:
+                self._write_delta(kind, actor, [round(value * _HEADING_SCALE)])
+            else:
+                text = json.dumps(value, ensure_ascii=False)
+                _write_uint(self.rows, self._string(text))
+        self.row_count += 1
+
+    def to_bytes(self) -> bytes:
+        payload = bytearray()
+        _write_uint(payload, len(self.strings))
+        for text in self.strings:
+            data = text.encode("utf-8")
+            _write_uint(payload, len(data))
+            payload += data
+        _write_uint(payload, len(self.units))
+        for unit_id in self.units:
+            payload += uuid.UUID(unit_id).bytes
+        _write_uint(payload, self.row_count)
+        payload += self.rows
+
+        out = bytearray()
+        _write_uint(out, len(payload))
+        out += payload
+        return bytes(out)
+
+
+class ReplayEncoder:
+    """ログ dict を1件ずつ受け取り、フレーム単位でバイナリを返すエンコーダ.
+
+    `header()` → `add()`（フレームが埋まるとそのバイト列を返す）→ `finish()`
+    の順に呼び、返されたバイト列をそのまま連結・送出する。
+    """
+
+    def __init__(self, frame_rows: int = REPLAY_FRAME_ROWS) -> None:
+        """エンコーダを作成する.
+
+        Args:
+            frame_rows: 1フレームの最大行数
+        """
+        self._frame_rows = frame_rows
+        self._frame = _FrameEncoder()
+
+    @staticmethod
+    def header() -> bytes:
+        """形式のヘッダー（マジック + バージョン）を返す."""
+        return REPLAY_MAGIC + bytes([REPLAY_FORMAT_VERSION])
+
+    def add(self, entry: dict[str, Any]) -> bytes | None:
+        """ログ1件を追加し、フレームが埋まった場合はそのバイト列を返す."""
+        self._frame.add(entry)
+        if self._frame.row_count < self._frame_rows:
+            return None
+        data = self._frame.to_bytes()
+        self._frame = _FrameEncoder()
+        return data
+
+    def encode(self, entries: Iterable[dict[str, Any]]) -> bytes:
+        """複数件を追加し、埋まったフレームのバイト列を連結して返す（無ければ空）."""
+        out = bytearray()
+        for entry in entries:
+            frame = self.add(entry)
+            if frame is not None:
+                out += frame
+        return bytes(out)
+
+    def finish(self) -> bytes:
+        """残りの行のフレームと終端を返す."""
+        out = bytearray()
+        if self._frame.row_count:
+            out += self._frame.to_bytes()
+            self._frame = _FrameEncoder()
+        _write_uint(out, 0)
+        return bytes(out)
+
+
+def encode_replay(
+    entries: Iterable[dict[str, Any]], frame_rows: int = REPLAY_FRAME_ROWS
+) -> Iterator[bytes]:
+    """ログ dict の列をバイナリリプレイ形式のチャンク（ヘッダー・フレーム・終端）で返す.
+
+    Args:
+        entries: BattleLog 相当の dict（NDJSON の各行と同じ内容）
+        frame_rows: 1フレームの最大行数
+
+    Yields:
+        連結するとバイナリリプレイ全体になるバイト列
+    """
+    encoder = ReplayEncoder(frame_rows)
+    yield encoder.header()
+    for entry in entries:
+        frame = encoder.add(entry)
+        if frame is not None:
+            yield frame
+    yield encoder.finish()
+
+
+class _Reader:
+    """バイト列を先頭から読み進めるカーソル."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.pos = 0
+
+    def uint(self) -> int:
+        result = shift = 0
+        data = self.data
+        while True:
+            if self.pos >= len(data):
+                raise ReplayDecodeError("unexpected end of replay data")
+            byte = data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def sint(self) -> int:
+        value = self.uint()
+        return (value >> 1) if not value & 1 else -((value + 1) >> 1)
+
+    def take(self, size: int) -> bytes:
+        end = self.pos + size
+        if end > len(self.data):
+            raise ReplayDecodeError("unexpected end of replay data")
+        chunk = self.data[self.pos : end]
+        self.pos = end
+        return chunk
+
+
+class _FrameDecoder:
+    """1フレーム分の辞書・差分の基準値を保持して行を復元する."""
+
+    def __init__(self, reader: _Reader) -> None:
+        self.reader = reader
+        self.strings = [
+            reader.take(reader.uint()).decode("utf-8") for _ in range(reader.uint())
+        ]
+        self.units = [
+            str(uuid.UUID(bytes=reader.take(16))) for _ in range(reader.uint())
+        ]
+        self.layouts: dict[int, tuple[list[str], str]] = {}
+        self.prev_timestamp = 0
+        self.prev_values: dict[tuple[str, int], list[int]] = {}
+
+    def _layout(self, idx: int) -> tuple[list[str], str]:
+        layout = self.layouts.get(idx)
+        if layout is None:
+            keys, kinds = json.loads(self.strings[idx])
+            layout = self.layouts[idx] = (keys, kinds)
+        return layout
+
+    def _delta(self, kind: str, actor: int, size: int) -> list[int]:
+        prev = self.prev_values.get((kind, actor)) or [0] * size
+        values = [p + self.reader.sint() for p in prev]
+        self.prev_values[(kind, actor)] = values
+        return values
+
+    def _value(self, kind: str, actor: int) -> Any:
+        reader = self.reader
+        if kind == _KIND_STRING:
+            return self.strings[reader.uint()]
+        if kind == _KIND_INT:
+            return reader.sint()
+        if kind in (_KIND_POSITION, _KIND_VELOCITY):
+            q = self._delta(kind, actor, 3)
+            return {k: v / _VECTOR_SCALE for k, v in zip(_VECTOR_KEYS, q, strict=True)}
+        if kind == _KIND_HEADING:
+            return self._delta(kind, actor, 1)[0] / _HEADING_SCALE
+        if kind == _KIND_TIMESTAMP:
+            self.prev_timestamp += reader.sint()
+            return self.prev_timestamp / _TIMESTAMP_SCALE
+        if kind == _KIND_JSON:
+            return json.loads(self.strings[reader.uint()])
+        if kind in _CONSTANT_KINDS:
+            return _CONSTANT_KINDS[kind]
+        raise ReplayDecodeError(f"unknown value kind: {kind!r}")
+
+    def decode_rows(self, out: list[dict[str, Any]]) -> None:
+        reader = self.reader
+        for _ in range(reader.uint()):
+            keys, kinds = self._layout(reader.uint())
+            entry: dict[str, Any] = {}
+            actor = -1
+            for key, kind in zip(keys, kinds, strict=True):
+                if kind == _KIND_UUID:
+                    idx = reader.uint()
+                    entry[key] = self.units[idx]
+                    if key == "actor_id":
+                        actor = idx
+                else:
+                    entry[key] = self._value(kind, actor)
+            out.append(entry)
+
+
+def decode_replay(data: bytes) -> list[dict[str, Any]]:
+    """バイナリリプレイ形式をログ dict のリストへ復元する.
+
+    Args:
+        data: `encode_replay()` の出力を連結したバイト列
+
+    Returns:
+        NDJSON の各行に相当する dict のリスト（座標・速度・向き・timestamp は
+        量子化された値）
+
+    Raises:
+        ReplayDecodeError: ヘッダー・バージョンが異なる、またはデータが途中で切れている場合
+    """
+    if data[: len(REPLAY_MAGIC)] != REPLAY_MAGIC:
+        raise ReplayDecodeError("not a battle replay")
+    reader = _Reader(data)
+    reader.pos = len(REPLAY_MAGIC)
+    version = reader.take(1)[0]
+    if version != REPLAY_FORMAT_VERSION:
+        raise ReplayDecodeError(f"unsupported replay format version: {version}")
+
+    entries: list[dict[str, Any]] = []
+    try:
+        while True:
+            size = reader.uint()
+            if size == 0:
+                return entries
+            _FrameDecoder(_Reader(reader.take(size))).decode_rows(entries)
+    except ReplayDecodeError:
+        raise
+    except (IndexError, ValueError) as e:
+        raise ReplayDecodeError(f"malformed replay data: {e}") from e
@@ -1,9 +1,10 @@
 """パイロット関連のビジネスロジック."""
 
 import uuid
+from collections.abc import Iterable
 from datetime import UTC, datetime
 
-from sqlmodel import Session, func, select
+from sqlmodel import Session, col, func, select
 
 from app.core.gamedata import get_shop_listing_by_id
 from app.core.npc_data import ACE_PILOTS
@@ -313,13 +314,30 @@ class PilotService:
 
         return starter_suit
 
-    def add_rewards(
+    def get_pilots_by_user_ids(self, user_ids: Iterable[str]) -> dict[str, Pilot]:
+        """複数のパイロット（プレイヤー・NPC）を1クエリで取得する.
+
+        Args:
+            user_ids: user_id の一覧
+
+        Returns:
+            dict[str, Pilot]: user_id をキーとしたパイロット。存在しない user_id は含まない
+        """
+        unique_ids = set(user_ids)
+        if not unique_ids:
+            return {}
+        statement = select(Pilot).where(col(Pilot.user_id).in_(unique_ids))
+        return {pilot.user_id: pilot for pilot in self.session.exec(statement).all()}
+
+    def apply_rewards(
         self,
         pilot: Pilot,
         exp_gained: int,
         credits_gained: int,
-    ) -> tuple[Pilot, list[str]]:
-        """報酬を付与してレベルアップ処理を行う.
+    ) -> list[str]:
+        """報酬を付与してレベルアップ処理を行う（コミットは呼び出し側で行う）.
+
+        複数パイロットへの報酬をまとめて1回のコミットで保存する場合に使う。
 
         Args:
             pilot: 対象パイロット
@@ -327,7 +345,7 @@ class PilotService:
             credits_gained: 獲得クレジット
 
         Returns:
-            tuple[Pilot, list[str]]: 更新後のパイロットとログメッセージのリスト
+            list[str]: ログメッセージのリスト
         """
         logs = []
 
@@ -360,6 +378,25 @@ class PilotService:
             )
 
         self.session.add(pilot)
+        return logs
+
+    def add_rewards(
+        self,
+        pilot: Pilot,
+        exp_gained: int,
+        credits_gained: int,
+    ) -> tuple[Pilot, list[str]]:
+        """報酬を付与してレベルアップ処理を行う.
+
+        Args:
+            pilot: 対象パイロット
+            exp_gained: 獲得経験値
+            credits_gained: 獲得クレジット
+
+        Returns:
+            tuple[Pilot, list[str]]: 更新後のパイロットとログメッセージのリスト
+        """
+        logs = self.apply_rewards(pilot, exp_gained, credits_gained)
         self.session.commit()
         self.session.refresh(pilot)
 
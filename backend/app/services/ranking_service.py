@@ -1,9 +1,11 @@
 """ランキング集計サービス."""
 
+import uuid
+from collections.abc import Sequence
 from datetime import UTC, datetime
 
-from sqlalchemy import case
-from sqlmodel import Session, func, select
+from sqlalchemy import case, update
+from sqlmodel import Session, col, func, select
 
 from app.models.models import BattleResult, Leaderboard, Pilot, Season
 
@@ -44,131 +46,132 @@ class RankingService:
 
         return season
 
-    def calculate_ranking(self) -> None:
-        """バトル結果から現在のシーズンのランキングを集計・更新する."""
-        season = self.get_or_create_current_season()
-
-        # 全ユーザーのバトル結果を集計
-        # user_idがNoneでないBattleResultのみを対象とする
-        statement = (
-            select(
-                BattleResult.user_id,
-                func.count().label("total_battles"),
-                func.sum(
-                    case((BattleResult.win_loss == "WIN", 1), else_=0)  # type: ignore[arg-type]
-                ).label("wins"),
-                func.sum(
-                    case((BattleResult.win_loss == "LOSE", 1), else_=0)  # type: ignore[arg-type]
-                ).label("losses"),
-            )
-            .where(BattleResult.user_id != None)  # type: ignore[union-attr]  # noqa: E711
-            .group_by(BattleResult.user_id)
-        )
-
-        results = self.session.exec(statement).all()
+    def calculate_ranking(self, incremental: bool = False) -> None:
+        """バトル結果から現在のシーズンのランキングを集計・更新する.
 
-        for row in results:
-            user_id = row[0]
-            wins = row[2] or 0
-            losses = row[3] or 0
+        まだ集計していないバトル結果に今回の集計ID（`BattleResult.ranking_batch_id`）
+        を付けてから、ユーザーごとの勝敗数・撃墜数・獲得クレジットを Pilot と
+        結合した1回の集計クエリで求め、シーズンの既存 Leaderboard も1クエリで
+        読み込んでまとめて更新・追加する（最後の1回の commit で送信される）。
 
-            # user_idがNoneの場合はスキップ（型チェック対策）
-            if user_id is None:
-                continue
+        差分集計の対象は作成日時ではなく集計IDの有無で決めるため、`created_at`
+        が前回集計より前の時刻で遅れてコミットされたバトル結果も、次回の集計で
+        漏れなく1回だけ加算される（集計IDの付与と加算は同じトランザクション）。
 
-            # Pilotからパイロット名を取得
-            pilot_statement = select(Pilot).where(Pilot.user_id == user_id)
-            pilot = self.session.exec(pilot_statement).first()
-
-            if not pilot:
-                continue
-
-            # 撃墜数と獲得クレジットを集計
-            # BattleLogから撃墜数をカウントするのは複雑なので、
-            # 簡易的に勝利数から推定（1勝あたり平均撃墜数を仮定）
-            # または別途集計ロジックを実装する必要がある
-            kills = self._calculate_kills_for_user(user_id)
-            credits_earned = self._calculate_credits_for_user(user_id)
-
-            # Leaderboardレコードを更新または作成（Upsert）
-            leaderboard_statement = (
-                select(Leaderboard)
-                .where(Leaderboard.season_id == season.id)
-                .where(Leaderboard.user_id == user_id)
-            )
-            leaderboard = self.session.exec(leaderboard_statement).first()
-
-            if leaderboard:
-                # 既存レコードを更新
-                leaderboard.pilot_name = pilot.name
-                leaderboard.wins = wins
-                leaderboard.losses = losses
-                leaderboard.kills = kills
-                leaderboard.credits_earned = credits_earned
-                leaderboard.updated_at = datetime.now(UTC)
-            else:
-                # 新規レコードを作成
+        Args:
+            incremental: True の場合、今回集計IDを付けたバトル結果のみを集計し、
+                既存の値に加算する。前回の集計がない（Leaderboard または集計済みの
+                バトル結果が存在しない）場合は全件を集計する
+        """
+        season = self.get_or_create_current_season()
+        now = datetime.now(UTC)
+
+        leaderboards = {
+            leaderboard.user_id: leaderboard
+            for leaderboard in self.session.exec(
+                select(Leaderboard).where(Leaderboard.season_id == season.id)
+            ).all()
+        }
+        incremental = incremental and bool(leaderboards) and self._has_ranked_results()
+        batch_id = self._claim_unranked_results()
+
+        rows = self._aggregate_results(batch_id if incremental else None)
+        for row in rows:
+            user_id, pilot_name, wins, losses, kills, credits_earned = row
+            leaderboard = leaderboards.get(user_id)
+            if leaderboard is None:
                 leaderboard = Leaderboard(
-                    season_id=season.id,
-                    user_id=user_id,
-                    pilot_name=pilot.name,
-                    wins=wins,
-                    losses=losses,
-                    kills=kills,
-                    credits_earned=credits_earned,
+                    season_id=season.id, user_id=user_id, pilot_name=pilot_name
                 )
                 self.session.add(leaderboard)
+            elif not incremental:
+                # 全件集計では既存の値を置き換える
+                leaderboard.wins = leaderboard.losses = 0
+                leaderboard.kills = leaderboard.credits_earned = 0
+
+            leaderboard.pilot_name = pilot_name
+            leaderboard.wins += wins or 0
+            leaderboard.losses += losses or 0
+            leaderboard.kills += kills or 0
+            leaderboard.credits_earned += credits_earned or 0
+            leaderboard.updated_at = now
 
         self.session.commit()
 
-    def _calculate_kills_for_user(self, user_id: str) -> int:
-        """特定ユーザーの撃墜数を計算する.
+    def _has_ranked_results(self) -> bool:
+        """集計IDの付いた（集計済みの）バトル結果が存在するか."""
+        statement = (
+            select(BattleResult.id)
+            .where(col(BattleResult.ranking_batch_id).is_not(None))
+            .limit(1)
+        )
+        return self.session.exec(statement).first() is not None
 
-        Note: BattleLogには撃墜情報が含まれているが、
-        ログをパースするのは重いため、簡易的に勝利数×平均撃墜数で推定する。
-        将来的にはBattleResultに撃墜数フィールドを追加すべき。
+    def _claim_unranked_results(self) -> uuid.UUID:
+        """未集計のバトル結果に新しい集計IDを付け、そのIDを返す.
 
-        Args:
-            user_id: ユーザーID
+        user_id が None のバトル結果はランキング対象外のため印を付けない。
+        パイロット未作成のユーザーの結果も集計（Pilot との結合）に含まれないため
+        印を付けず、パイロット作成後の集計で初めて加算されるよう未集計のまま残す。
+        付与はコミットまで確定しないため、集計に失敗した場合は印ごと破棄される。
 
         Returns:
-            int: 推定撃墜数
+            今回の集計ID
         """
-        # 勝利時の平均撃墜数を2機と仮定
-        statement = (
-            select(func.count())
-            .select_from(BattleResult)
-            .where(BattleResult.user_id == user_id)
-            .where(BattleResult.win_loss == "WIN")
+        batch_id = uuid.uuid4()
+        self.session.exec(
+            update(BattleResult)
+            .where(col(BattleResult.ranking_batch_id).is_(None))
+            .where(col(BattleResult.user_id).is_not(None))
+            .where(col(BattleResult.user_id).in_(select(Pilot.user_id)))
+            .values(ranking_batch_id=batch_id)
         )
-        wins = self.session.exec(statement).first() or 0
-        return wins * 2  # 1勝あたり平均2機撃墜と仮定
+        return batch_id
 
-    def _calculate_credits_for_user(self, user_id: str) -> int:
-        """特定ユーザーの獲得クレジットを計算する.
+    def _aggregate_results(
+        self, batch_id: uuid.UUID | None
+    ) -> Sequence[tuple[str, str, int | None, int | None, int | None, int | None]]:
+        """ユーザーごとのバトル結果の集計値をパイロット名付きで取得する.
 
-        Note: 現在の実装では、報酬はPilotテーブルに直接加算されており、
-        バトルごとの獲得クレジットの履歴は保持されていない。
-        簡易的に勝利数と撃墜数から推定する。
+        Pilot が存在しないユーザー（および user_id が None のバトル結果）は含まない。
 
         Args:
-            user_id: ユーザーID
+            batch_id: この集計IDのバトル結果のみを集計する（None なら集計済みの全件）
 
         Returns:
-            int: 推定獲得クレジット
+            (user_id, パイロット名, 勝利数, 敗北数, 撃墜数, 獲得クレジット) の行
         """
-        # 勝利数を取得
-        statement = (
-            select(func.count())
-            .select_from(BattleResult)
-            .where(BattleResult.user_id == user_id)
-            .where(BattleResult.win_loss == "WIN")
+        # select() の型オーバーロードは4列までのため call-overload を抑止する
+        totals = (
+            select(  # type: ignore[call-overload]
+                BattleResult.user_id,
+                func.sum(
+                    case((BattleResult.win_loss == "WIN", 1), else_=0)  # type: ignore[arg-type]
+                ).label("wins"),
+                func.sum(
+                    case((BattleResult.win_loss == "LOSE", 1), else_=0)  # type: ignore[arg-type]
+                ).label("losses"),
+                func.sum(BattleResult.kills).label("kills"),
+                func.sum(BattleResult.credits_gained).label("credits_earned"),
+            )
+            .where(col(BattleResult.user_id).is_not(None))
+            .group_by(BattleResult.user_id)
         )
-        wins = self.session.exec(statement).first() or 0
-
-        # 簡易計算: 勝利ごとに50クレジット、撃墜ごとに50クレジットと仮定
-        kills = self._calculate_kills_for_user(user_id)
-        return (wins * 50) + (kills * 50)
+        if batch_id is None:
+            totals = totals.where(col(BattleResult.ranking_batch_id).is_not(None))
+        else:
+            totals = totals.where(BattleResult.ranking_batch_id == batch_id)
+        subquery = totals.subquery()
+
+        statement = select(  # type: ignore[call-overload]
+            subquery.c.user_id,
+            Pilot.name,
+            subquery.c.wins,
+            subquery.c.losses,
+            subquery.c.kills,
+            subquery.c.credits_earned,
+        ).join(Pilot, col(Pilot.user_id) == subquery.c.user_id)
+        return self.session.exec(statement).all()
 
     def get_current_rankings(self, limit: int = 100) -> list[Leaderboard]:
         """現在のシーズンのランキングを取得する.
@@ -4,12 +4,14 @@ import uuid
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException
+from fastapi import BackgroundTasks, Depends, FastAPI, Header, HTTPException
 
 if TYPE_CHECKING:
     from app.engine.calculator import PilotStats
 from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import StreamingResponse
@@ -19,9 +21,15 @@ from sqlmodel import Session, desc, select
 # DB関連
 from app.core.auth import get_current_user, get_current_user_optional
 from app.db import get_session
-from app.engine.battle_digest import compute_unit_kills
+from app.engine.battle_digest import analyze_battle_logs
 from app.engine.battle_utils import serialize_obstacles, strip_debug_fields
-from app.engine.simulation import BattleSimulator
+from app.engine.simulation_executor import (
+    SimulationOutcome,
+    SimulationQueueFullError,
+    SimulationRequest,
+    SimulationTimeoutError,
+    get_simulation_executor,
+)
 from app.models.models import (
     BattleField,
     BattleLog,
@@ -50,8 +58,23 @@ from app.services.battle_log_storage_service import (
     offload_battle_log_to_gcs,
     stream_battle_log_chunks,
 )
+from app.services.battle_replay_codec import (
+    REPLAY_FRAME_ROWS,
+    REPLAY_MEDIA_TYPE,
+    ReplayEncoder,
+)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """起動時にシミュレーション用ワーカーを事前起動し、終了時に停止する."""
+    executor = get_simulation_executor()
+    await executor.start()
+    yield
+    executor.shutdown()
 
-app = FastAPI(title="MSBS-Next API", redirect_slashes=False)
+
+app = FastAPI(title="MSBS-Next API", redirect_slashes=False, lifespan=lifespan)
 
 # --- CORS設定 ---
 # ローカル環境と本番環境のオリジンを設定
@@ -189,21 +212,6 @@ def _build_enemies_from_config(enemy_configs: list[dict]) -> list[MobileSuit]:
     return enemies
 
 
-def _snapshot_spawn_positions(
-    player: MobileSuit, enemies: list[MobileSuit]
-) -> tuple[Vector3, dict[uuid.UUID, Vector3]]:
-    """スポーン領域適用直後（戦闘開始前）の位置を退避する.
-
-    `sim.step()` はplayer/enemiesオブジェクトを直接書き換えるため、戦闘ループ後には
-    バトル終了時点の最終位置になってしまう。BattleViewerのt=0初期表示にはスポーン位置が
-    必要なため、レスポンス構築前に元へ戻せるようここで退避しておく。
-    """
-    return (
-        player.position.model_copy(),
-        {enemy.id: enemy.position.model_copy() for enemy in enemies},
-    )
-
-
 def _restore_spawn_positions(
     player: MobileSuit,
     enemies: list[MobileSuit],
@@ -226,19 +234,30 @@ def health() -> dict[str, str]:
 async def reload_master() -> dict:
     """マスターデータをリロードする（管理者用）."""
     from app.core.gamedata import reload_master_data
+    from app.engine.fuzzy_rule_cache import invalidate_shared_rule_caches
 
     result = reload_master_data()
+    # ファジィルールも次回のシミュレーション生成時にディスクから再ロードさせる
+    # （ワーカープロセスはルールを保持しているためプールごと作り直す）
+    invalidate_shared_rule_caches()
+    get_simulation_executor().restart()
     return {"status": "ok", "reloaded": result}
 
 
-@app.post("/api/battle/simulate", response_model=BattleResponse)
-async def simulate_battle(
-    background_tasks: BackgroundTasks,
-    mission_id: int = 1,
-    session: Session = Depends(get_session),
-    user_id: str | None = Depends(get_current_user_optional),
-) -> BattleResponse:
-    """DBから機体データを取得してシミュレーションを実行する."""
+# ソロミッションの最大ステップ数
+_MISSION_MAX_STEPS = 50
+
+
+def _prepare_mission_simulation(
+    session: Session, mission_id: int, user_id: str | None
+) -> tuple[Mission, SimulationRequest]:
+    """ミッションと機体・パイロット情報を DB から読み込み、シミュレーション入力を作る.
+
+    同期 DB アクセスを伴うため、イベントループ外（スレッドプール）で呼び出す。
+
+    Raises:
+        HTTPException: ミッションまたはプレイヤー機体が存在しない場合
+    """
     # 1. ミッション情報を取得
     mission = session.get(Mission, mission_id)
     if not mission:
@@ -290,30 +309,40 @@ async def simulate_battle(
     # 4.5. エース NPC のパイロットステータスを npc_data マスターから解決 (Phase E-2)
     npc_pilot_stats = _resolve_npc_pilot_stats(enemies)
 
-    # 5. シミュレーション実行（スキルと環境を渡す）
-    sim = BattleSimulator(
-        player,
-        enemies,
+    return mission, SimulationRequest(
+        player=player,
+        enemies=enemies,
+        max_steps=_MISSION_MAX_STEPS,
         player_skills=player_skills,
         environment=mission.environment,
         player_pilot_stats=player_pilot_stats,
         npc_pilot_stats=npc_pilot_stats,
         battlefield=BattleField(),
     )
-    spawn_positions = _snapshot_spawn_positions(player, enemies)
 
-    max_steps = 50
-    steps_used = 0
-    for _ in range(max_steps):
-        if sim.is_finished:
-            break
-        sim.step()
-        steps_used += 1
+
+def _finalize_mission_battle(
+    background_tasks: BackgroundTasks,
+    session: Session,
+    mission: Mission,
+    user_id: str | None,
+    outcome: SimulationOutcome,
+) -> BattleResponse:
+    """シミュレーション結果から勝敗・報酬を確定し、ログと結果を DB に保存する.
+
+    同期 DB アクセスを伴うため、イベントループ外（スレッドプール）で呼び出す。
+    """
+    mission_id = mission.id
+    player, enemies = outcome.player, outcome.enemies
+    steps_used = outcome.steps_used
+    max_steps = _MISSION_MAX_STEPS
 
     # 6. 勝者判定と撃墜数カウント
     winner_id = None
     win_loss = "DRAW"
-    kills = compute_unit_kills(sim.logs, player.id)
+    # 撃墜数・ダイジェストで同じログ集計を使い回す（ログの走査は1回）
+    log_stats = analyze_battle_logs(outcome.logs)
+    kills = log_stats.unit(player.id).kills
 
     if player.current_hp > 0 and all(e.current_hp <= 0 for e in enemies):
         # プレイヤー勝利
@@ -361,7 +390,7 @@ async def simulate_battle(
         )
 
     # 8. バトルログをDBに保存（battle_logsテーブル）
-    stripped_logs = strip_debug_fields(sim.logs)
+    stripped_logs = strip_debug_fields(outcome.logs)
     battle_log_record = BattleLogRecord(
         mission_id=mission_id,
         logs=stripped_logs,
@@ -377,11 +406,12 @@ async def simulate_battle(
         session=session,
         user_id=user_id,
         player=player,
-        logs=sim.logs,
+        logs=outcome.logs,
         kills=kills,
         win_loss=win_loss,
         steps_used=steps_used,
         max_steps=max_steps,
+        log_stats=log_stats,
     )
 
     # player_info/enemies_info/ms_snapshot にはバトル後の最終位置ではなくスポーン位置を
@@ -389,10 +419,10 @@ async def simulate_battle(
     # 最終位置のままだとフィールド外にMSが表示されるバグになる）。勝敗判定・報酬計算・
     # ダイジェスト集計（compute_battle_digest_fields）はバトル後の最終状態を前提とする
     # ため、これらの集計処理より後、レスポンス構築の直前でのみ位置を戻す。
-    _restore_spawn_positions(player, enemies, spawn_positions)
+    _restore_spawn_positions(player, enemies, outcome.spawn_positions)
 
     # 10. バトル結果をDBに保存（リプレイ用スナップショット・詳細情報含む）
-    obstacles_data = serialize_obstacles(sim.obstacles)
+    obstacles_data = serialize_obstacles(outcome.obstacles)
     battle_result = BattleResult(
         user_id=user_id,
         mission_id=mission_id,
@@ -403,7 +433,7 @@ async def simulate_battle(
         enemies_info=[e.model_dump() for e in enemies],
         obstacles_info=obstacles_data,
         ms_snapshot=player.model_dump(),
-        map_bounds=list(sim.map_bounds),
+        map_bounds=list(outcome.map_bounds),
         kills=kills,
         exp_gained=exp_gained,
         credits_gained=credits_gained,
@@ -428,12 +458,43 @@ async def simulate_battle(
 
     return BattleResponse(
         winner_id=winner_id,
-        logs=sim.logs,
+        logs=outcome.logs.to_models(),
         player_info=player,
         enemies_info=enemies,
         obstacles_info=obstacles_data,
         rewards=rewards,
-        map_bounds=sim.map_bounds,
+        map_bounds=outcome.map_bounds,
+    )
+
+
+@app.post("/api/battle/simulate", response_model=BattleResponse)
+async def simulate_battle(
+    background_tasks: BackgroundTasks,
+    mission_id: int = 1,
+    session: Session = Depends(get_session),
+    user_id: str | None = Depends(get_current_user_optional),
+) -> BattleResponse:
+    """DBから機体データを取得してシミュレーションを実行する.
+
+    DB アクセスはスレッドプール、シミュレーション本体は SimulationExecutor の
+    ワーカープロセスで実行し、イベントループを占有しない。
+    """
+    mission, request = await run_in_threadpool(
+        _prepare_mission_simulation, session, mission_id, user_id
+    )
+
+    # 5. シミュレーション実行（ワーカープロセス）
+    try:
+        outcome = await get_simulation_executor().run(request)
+    except SimulationQueueFullError as exc:
+        raise HTTPException(
+            status_code=503, detail=str(exc), headers={"Retry-After": "1"}
+        ) from exc
+    except SimulationTimeoutError as exc:
+        raise HTTPException(status_code=504, detail=str(exc)) from exc
+
+    return await run_in_threadpool(
+        _finalize_mission_battle, background_tasks, session, mission, user_id, outcome
     )
 
 
@@ -539,14 +600,78 @@ async def _ndjson_lines(entries: list[dict]) -> AsyncIterator[bytes]:
         yield (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
 
 
+def _accepts_replay_binary(accept: str | None) -> bool:
+    """Accept ヘッダーがバイナリリプレイ形式（REPLAY_MEDIA_TYPE）を要求しているかを返す.
+
+    `q=0`（明示的な拒否）以外で REPLAY_MEDIA_TYPE が含まれていればバイナリ形式を
+    返す。含まれない場合（`*/*`・未指定を含む）は従来通り NDJSON。
+    """
+    if not accept:
+        return False
+    for part in accept.split(","):
+        media_type, *params = (p.strip() for p in part.split(";"))
+        if media_type.lower() != REPLAY_MEDIA_TYPE:
+            continue
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+async def _entry_batches(entries: list[dict]) -> AsyncIterator[list[dict]]:
+    """ログdictの列をバイナリリプレイの1フレーム分ずつに区切る."""
+    for start in range(0, len(entries), REPLAY_FRAME_ROWS):
+        yield entries[start : start + REPLAY_FRAME_ROWS]
+
+
+async def _ndjson_entry_batches(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[list[dict]]:
+    """NDJSONのバイト列チャンクを行単位にパースし、1フレーム分ずつのdict列で返す."""
+    pending = b""
+    batch: list[dict] = []
+    async for chunk in chunks:
+        *lines, pending = (pending + chunk).split(b"\n")
+        batch.extend(json.loads(line) for line in lines if line.strip())
+        if len(batch) >= REPLAY_FRAME_ROWS:
+            yield batch
+            batch = []
+    if pending.strip():
+        batch.append(json.loads(pending))
+    if batch:
+        yield batch
+
+
+async def _replay_chunks(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+    """ログdictの列をバイナリリプレイ形式のバイト列として逐次生成する.
+
+    エンコードはNDJSON化よりCPUを使うため、イベントループを塞がないよう
+    1フレーム分ずつスレッドプールで行う。
+    """
+    encoder = ReplayEncoder()
+    yield encoder.header()
+    async for batch in batches:
+        data = await run_in_threadpool(encoder.encode, batch)
+        if data:
+            yield data
+    yield encoder.finish()
+
+
 @app.get(
     "/api/battles/{battle_id}/logs",
     response_class=StreamingResponse,
     responses={
         200: {
-            "content": {"application/x-ndjson": {}},
+            "content": {"application/x-ndjson": {}, REPLAY_MEDIA_TYPE: {}},
             "description": (
-                "NDJSON形式のバトルログ（1行1エントリ、各行はBattleLog相当のJSON）"
+                "NDJSON形式のバトルログ（1行1エントリ、各行はBattleLog相当のJSON）。"
+                f"`Accept: {REPLAY_MEDIA_TYPE}` 指定時はバイナリリプレイ形式"
+                "（app/services/battle_replay_codec.py）"
             ),
         }
     },
@@ -554,6 +679,7 @@ async def _ndjson_lines(entries: list[dict]) -> AsyncIterator[bytes]:
 async def get_battle_logs(
     battle_id: str,
     session: Session = Depends(get_session),
+    accept: str | None = Header(default=None),
 ) -> StreamingResponse:
     """バトルリプレイ用ログを取得する（遅延ロード）.
 
@@ -577,6 +703,11 @@ async def get_battle_logs(
     Storageへオフロード済みのNDJSONオブジェクトをストリーム中継する（Issue #493、
     Neon Network Transfer対策）。未設定（オフロード未完了・失敗）の場合は従来通り
     `logs`列から配信する。
+
+    `Accept` ヘッダーに `application/vnd.msbs.replay` を含むクライアントには、
+    同じ内容をユニットID辞書・文字列テーブル・座標の量子化差分で詰めた
+    バイナリリプレイ形式（app/services/battle_replay_codec.py）で返す。GCSから
+    配信する場合はNDJSONのチャンクを行単位にパースしながら変換する。
     """
     try:
         battle_uuid = uuid.UUID(battle_id)
@@ -587,12 +718,32 @@ async def get_battle_logs(
     if not battle:
         raise HTTPException(status_code=404, detail="Battle not found")
 
-    if battle.battle_log_id is None:
-        return StreamingResponse(_ndjson_lines([]), media_type="application/x-ndjson")
+    # 同じURLでもAcceptにより形式が変わるため、キャッシュ側で区別させる
+    headers = {"Vary": "Accept"}
+    binary = _accepts_replay_binary(accept)
 
-    log_record = session.get(BattleLogRecord, battle.battle_log_id)
-    if not log_record:
-        return StreamingResponse(_ndjson_lines([]), media_type="application/x-ndjson")
+    log_record = (
+        session.get(BattleLogRecord, battle.battle_log_id)
+        if battle.battle_log_id is not None
+        else None
+    )
+    if binary:
+        if log_record is None:
+            batches = _entry_batches([])
+        elif log_record.gcs_path:
+            batches = _ndjson_entry_batches(
+                stream_battle_log_chunks(log_record.gcs_path)
+            )
+        else:
+            batches = _entry_batches(log_record.logs)
+        return StreamingResponse(
+            _replay_chunks(batches), media_type=REPLAY_MEDIA_TYPE, headers=headers
+        )
+
+    if log_record is None:
+        return StreamingResponse(
+            _ndjson_lines([]), media_type="application/x-ndjson", headers=headers
+        )
 
     if log_record.gcs_path:
         # オフロード済み（Issue #493）: GCSオブジェクトは保存時点で既にNDJSONテキストの
@@ -600,8 +751,11 @@ async def get_battle_logs(
         return StreamingResponse(
             stream_battle_log_chunks(log_record.gcs_path),
             media_type="application/x-ndjson",
+            headers=headers,
         )
 
     return StreamingResponse(
-        _ndjson_lines(log_record.logs), media_type="application/x-ndjson"
+        _ndjson_lines(log_record.logs),
+        media_type="application/x-ndjson",
+        headers=headers,
     )
@@ -6,22 +6,47 @@
 1. マッチング: OPENルームのエントリーをグループ化し、不足分をNPCで埋める
 2. シミュレーション: 各ルームで戦闘を実行
 3. 結果保存: BattleResultを保存し、ルームのステータスを更新
+
+Cloud Run Jobs で複数タスク（CLOUD_RUN_TASK_COUNT > 1）として実行した場合:
+    - タスク 0（コーディネーター）のみがマッチング・ランキング更新・
+      次回ルーム作成を行う
+    - WAITING ルームは ID から決定的にタスクへ割り当て（`_assigned_task_index()`）、
+      各タスクは自分の担当分のみをシミュレーションする
+    - コーディネーター以外のタスクはマッチングの完了を待ってから、
+      コーディネーターは全タスクのシミュレーション完了を待ってから次のフェーズへ進む
+    - 処理に失敗したルームは WAITING のまま `failed_at` を記録する。コーディネーター
+      は今回のバッチで失敗したルームを待機対象から外す（次回のバッチで再実行される）
 """
 
 import os
 import sys
+import time
 import traceback
+import uuid
+from concurrent.futures import Future, as_completed
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
 # パスを通す
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, func, select
 
 from app.db import engine
-from app.engine.battle_digest import compute_unit_kills
+from app.engine.battle_digest import BattleLogStats, analyze_battle_logs
 from app.engine.battle_utils import serialize_obstacles, strip_debug_fields
+from app.engine.constants import (
+    FUZZY_LUT_SUBDIVISIONS,
+    LOG_LEVEL_REPLAY,
+    STALEMATE_NO_DAMAGE_STEPS,
+)
 from app.engine.simulation import BattleSimulator
+from app.engine.simulation_executor import (
+    SimulationOutcome,
+    SimulationRequest,
+    create_simulation_pool,
+    run_simulation,
+)
 from app.models.models import (
     BattleEntry,
     BattleField,
@@ -29,21 +54,62 @@ from app.models.models import (
     BattleResult,
     BattleRoom,
     MobileSuit,
+    Pilot,
     Vector3,
     Weapon,
 )
-from app.services.battle_digest_service import compute_battle_digest_fields
+from app.services.battle_digest_service import (
+    build_battle_digest_fields,
+    get_previous_digest_texts,
+)
 from app.services.matching_service import MatchingService
 from app.services.pilot_service import PilotService
 from app.services.ranking_service import RankingService
 
-# Cloud Run Jobs 並列実行対応スタブ（将来の並列化に備えた環境変数読み取り）
+# Cloud Run Jobs の並列タスク設定（タスク 0 がコーディネーター）
 _CLOUD_RUN_TASK_INDEX = int(os.environ.get("CLOUD_RUN_TASK_INDEX", 0))
 _CLOUD_RUN_TASK_COUNT = int(os.environ.get("CLOUD_RUN_TASK_COUNT", 1))
 
+# 非コーディネーターがマッチング完了を待つ最大時間（秒）
+_MATCHING_WAIT_TIMEOUT_SEC = float(
+    os.environ.get("BATCH_MATCHING_WAIT_TIMEOUT_SEC", 900)
+)
+# コーディネーターが他タスクの完了を待つ際、残りルーム数が減らないまま
+# この時間（秒）が経過したら待機を打ち切る（失敗タスクの担当分は次回に再実行される）
+_SHARD_WAIT_IDLE_TIMEOUT_SEC = float(
+    os.environ.get("BATCH_SHARD_WAIT_IDLE_TIMEOUT_SEC", 900)
+)
+# 待機中のポーリング間隔（秒）
+_SHARD_POLL_INTERVAL_SEC = float(os.environ.get("BATCH_SHARD_POLL_INTERVAL_SEC", 5))
+
+# タスク内でルームのシミュレーションを並列実行するプロセス数（1 以下なら逐次実行）
+_BATCH_SIMULATION_WORKERS = int(
+    os.environ.get("BATCH_SIMULATION_WORKERS", os.cpu_count() or 1)
+)
+
+# ランキングを前回集計以降のバトル結果のみで差分更新するか（false なら全件再集計）
+_RANKING_INCREMENTAL = os.environ.get("RANKING_INCREMENTAL", "false").lower() == "true"
+
 # シミュレーションの最大ステップ数 (1 step = 0.1 s, デフォルト 3000 step = 300 s)
 _MAX_SIMULATION_STEPS = int(os.environ.get("MAX_SIMULATION_STEPS", 3000))
 
+# 非交戦中の接近フェーズを粗い dt でまとめて進めるか（BattleSimulator の adaptive_stepping）
+_ADAPTIVE_STEPPING = os.environ.get("ADAPTIVE_STEPPING", "true").lower() == "true"
+
+# HP・マップ境界が変化しないまま経過したら膠着として引き分け終了させるステップ数
+# （0 以下なら膠着判定を行わない）
+_STALEMATE_STEPS = int(
+    os.environ.get("STALEMATE_NO_DAMAGE_STEPS", STALEMATE_NO_DAMAGE_STEPS)
+)
+
+# ターゲット選択・武器選択のファジィ推論を事前計算したルックアップテーブルで近似するか
+# （近似誤差で選択結果が厳密推論と変わり得るため既定は無効）
+_FUZZY_LUT_SUBDIVISIONS: int | None = (
+    int(os.environ.get("FUZZY_LUT_SUBDIVISIONS", FUZZY_LUT_SUBDIVISIONS))
+    if os.environ.get("FUZZY_LUT", "false").lower() == "true"
+    else None
+)
+
 
 def _check_env() -> None:
     """必須環境変数の存在を確認する."""
@@ -72,37 +138,177 @@ def run_matching_phase(session: Session) -> list[BattleRoom]:
     return rooms
 
 
-def run_simulation_phase(session: Session) -> None:
+def _assigned_task_index(room_id: uuid.UUID, task_count: int) -> int:
+    """ルームを担当するタスクのインデックスを返す.
+
+    ルームIDのみから決まるため、各タスクが別々に WAITING ルームを取得しても
+    1ルームを担当するタスクは必ず1つになる。
+
+    Args:
+        room_id: ルームID
+        task_count: タスク総数
+
+    Returns:
+        担当タスクのインデックス (0 〜 task_count - 1)
+    """
+    return room_id.int % task_count
+
+
+def _waiting_room_ids(
+    session: Session, failed_since: datetime | None = None
+) -> set[uuid.UUID]:
+    """WAITING 状態のルームIDを取得する（他タスクのコミットを反映して読み直す）.
+
+    Args:
+        session: データベースセッション
+        failed_since: 指定した場合、この日時以降に処理に失敗したルームを除く
+
+    Returns:
+        WAITING 状態のルームIDの集合
+    """
+    session.rollback()
+    statement = select(BattleRoom.id).where(BattleRoom.status == "WAITING")
+    if failed_since is not None:
+        statement = statement.where(
+            (col(BattleRoom.failed_at).is_(None))
+            | (col(BattleRoom.failed_at) < failed_since)
+        )
+    return set(session.exec(statement).all())
+
+
+def _has_unmatched_rooms(session: Session) -> bool:
+    """エントリーを持つ OPEN ルーム（マッチング待ち）が存在するかを返す."""
+    session.rollback()
+    statement = (
+        select(func.count())
+        .select_from(BattleRoom)
+        .where(
+            BattleRoom.status == "OPEN",
+            col(BattleRoom.id).in_(select(BattleEntry.room_id)),
+        )
+    )
+    return session.exec(statement).one() > 0
+
+
+def wait_for_matching(
+    session: Session,
+    timeout_sec: float = _MATCHING_WAIT_TIMEOUT_SEC,
+    poll_interval_sec: float = _SHARD_POLL_INTERVAL_SEC,
+) -> bool:
+    """コーディネーターのマッチング完了（OPEN → WAITING の確定）を待つ.
+
+    Args:
+        session: データベースセッション
+        timeout_sec: 最大待機時間（秒）
+        poll_interval_sec: ポーリング間隔（秒）
+
+    Returns:
+        マッチング完了を確認できた場合 True、タイムアウトした場合 False
+    """
+    deadline = time.monotonic() + timeout_sec
+    while _has_unmatched_rooms(session):
+        if time.monotonic() >= deadline:
+            print("警告: マッチングの完了を確認できないままタイムアウトしました")
+            return False
+        time.sleep(poll_interval_sec)
+    return True
+
+
+def wait_for_shards(
+    session: Session,
+    room_ids: set[uuid.UUID],
+    failed_since: datetime | None = None,
+    idle_timeout_sec: float = _SHARD_WAIT_IDLE_TIMEOUT_SEC,
+    poll_interval_sec: float = _SHARD_POLL_INTERVAL_SEC,
+) -> bool:
+    """他タスクが担当するルームのシミュレーション完了を待つ.
+
+    失敗したルームは WAITING のまま残るため、`failed_since` 以降に失敗が
+    記録された（`_report_room_error()`）ルームは終了済みとして待機対象から外す。
+    アイドルタイムアウトは、タスク自体が異常終了して失敗も記録されない場合の
+    打ち切りにのみ使われる。
+
+    Args:
+        session: データベースセッション
+        room_ids: 完了を待つルームIDの集合
+        failed_since: この日時以降の失敗を今回のバッチの失敗とみなす
+            （通常はバッチの開始日時。None なら失敗ルームも待ち続ける）
+        idle_timeout_sec: 残りルーム数が減らないまま待機を続ける最大時間（秒）
+        poll_interval_sec: ポーリング間隔（秒）
+
+    Returns:
+        全ルームの完了（または失敗の記録）を確認できた場合 True、打ち切った場合 False
+    """
+    remaining = room_ids & _waiting_room_ids(session, failed_since)
+    last_progress = time.monotonic()
+    while remaining:
+        if time.monotonic() - last_progress >= idle_timeout_sec:
+            print(
+                f"警告: {len(remaining)} ルームが未完了のまま待機を打ち切ります"
+                "（次回のバッチで再実行されます）"
+            )
+            return False
+        time.sleep(poll_interval_sec)
+        still_waiting = remaining & _waiting_room_ids(session, failed_since)
+        if len(still_waiting) < len(remaining):
+            last_progress = time.monotonic()
+        remaining = still_waiting
+    return True
+
+
+def run_simulation_phase(
+    session: Session,
+    task_index: int = 0,
+    task_count: int = 1,
+    workers: int = _BATCH_SIMULATION_WORKERS,
+) -> list[uuid.UUID]:
     """シミュレーションフェーズ: WAITINGルームで戦闘を実行.
 
     Args:
         session: データベースセッション
+        task_index: このタスクのインデックス
+        task_count: タスク総数（担当外のルームはスキップする）
+        workers: シミュレーションを並列実行するプロセス数（1 以下なら逐次実行）
+
+    Returns:
+        他タスクが担当する WAITING ルームのIDリスト
     """
     print("\n" + "=" * 60)
     print("シミュレーションフェーズを開始")
     print("=" * 60)
 
-    # WAITING状態のルームを取得
+    # WAITING状態のルームを取得し、このタスクの担当分に絞り込む
     statement = select(BattleRoom).where(BattleRoom.status == "WAITING")
-    waiting_rooms = list(session.exec(statement).all())
+    waiting_rooms: list[BattleRoom] = []
+    other_room_ids: list[uuid.UUID] = []
+    for room in session.exec(statement).all():
+        if _assigned_task_index(room.id, task_count) == task_index:
+            waiting_rooms.append(room)
+        else:
+            other_room_ids.append(room.id)
 
     if not waiting_rooms:
         print("実行対象のルームがありません")
-        return
+        return other_room_ids
 
     print(f"{len(waiting_rooms)} ルームで戦闘を実行します\n")
 
+    workers = min(workers, len(waiting_rooms))
+    if workers > 1:
+        print(f"{workers} プロセスで並列実行します\n")
+        _run_rooms_pipelined(session, waiting_rooms, workers)
+        return other_room_ids
+
     for room in waiting_rooms:
         try:
             print(f"ルームID: {room.id} の処理を開始")
             _process_room(session, room)
             print(f"ルームID: {room.id} の処理が完了しました\n")
         except Exception as e:
-            print(f"エラー: ルームID {room.id} の処理中にエラーが発生しました")
-            print(f"  {e}")
-            traceback.print_exc()
             # エラーが発生してもルームの処理を継続
-            continue
+            _report_room_error(session, room.id, e)
+
+    return other_room_ids
 
 
 def _resolve_team_id(unit: MobileSuit) -> str:
@@ -184,35 +390,129 @@ def _prepare_battle_units(
     return player_unit, enemy_units, unit_to_entry_map
 
 
-def _run_simulation(
+def _build_simulation_request(
     player_unit: MobileSuit, enemy_units: list[MobileSuit]
-) -> tuple[BattleSimulator, bool, int, int]:
-    """戦闘シミュレーションを実行.
+) -> SimulationRequest:
+    """バッチ用のシミュレーション入力を作成.
 
     Args:
         player_unit: プレイヤーユニット
         enemy_units: 敵ユニットリスト
 
     Returns:
-        (シミュレーター, 勝利フラグ, プレイヤー自身の撃墜数, 消費ステップ数)
+        シミュレーション入力
     """
-    simulator = BattleSimulator(player_unit, enemy_units, battlefield=BattleField())
+    # バッチは大人数ルームを扱うため、索敵・移動フェーズは配列演算による一括計算版を使う。
+    # 接敵前の接近フェーズは適応ステップ幅でまとめて進め、決着の見込みが無い膠着は
+    # 最大ステップ数を待たずに引き分けで打ち切る。
+    # 保存ログはリプレイ表示とダイジェスト集計にのみ使われるため、
+    # AI_DECISION・fuzzy_scores は生成しない（LOG_LEVEL_REPLAY）
+    return SimulationRequest(
+        player=player_unit,
+        enemies=enemy_units,
+        max_steps=_MAX_SIMULATION_STEPS,
+        battlefield=BattleField(),
+        batched_detection=True,
+        batched_movement=True,
+        adaptive_stepping=_ADAPTIVE_STEPPING,
+        stalemate_steps=_STALEMATE_STEPS if _STALEMATE_STEPS > 0 else None,
+        fuzzy_lut_subdivisions=_FUZZY_LUT_SUBDIVISIONS,
+        log_level=LOG_LEVEL_REPLAY,
+    )
 
-    steps_used = 0
-    for _step_count in range(_MAX_SIMULATION_STEPS):
-        if simulator.is_finished:
-            break
-        simulator.step()
-        steps_used += 1
 
-    print(f"  戦闘終了 (経過時間: {simulator.elapsed_time:.1f}s)")
+def _judge_outcome(
+    outcome: SimulationOutcome, log_stats: BattleLogStats
+) -> tuple[bool, int]:
+    """戦闘結果から勝敗とプレイヤー自身の撃墜数を求める.
 
+    Args:
+        outcome: シミュレーション結果
+        log_stats: `analyze_battle_logs()` で集計済みのログ集計
+
+    Returns:
+        (勝利フラグ, プレイヤー自身の撃墜数)
+    """
     # 勝敗判定 (team_idベース: プレイヤーのteam_idが生存していれば勝利)
-    alive_team_ids = {u.team_id for u in simulator.units if u.current_hp > 0}
-    primary_player_win = player_unit.team_id in alive_team_ids
-    kills = compute_unit_kills(simulator.logs, player_unit.id)
+    alive_team_ids = {u.team_id for u in outcome.units if u.current_hp > 0}
+    primary_player_win = outcome.player.team_id in alive_team_ids
+    kills = log_stats.unit(outcome.player.id).kills
+    return primary_player_win, kills
+
+
+def _grant_player_rewards(
+    pilot_service: PilotService,
+    pilots: dict[str, Pilot],
+    user_id: str,
+    entry: BattleEntry,
+    win: bool,
+    kills: int,
+) -> tuple[int, int, int, int]:
+    """プレイヤーエントリーへ報酬を付与する（コミットは呼び出し側でまとめて行う）.
+
+    Args:
+        pilot_service: パイロットサービス
+        pilots: ルーム内のパイロット（user_id → Pilot。新規作成分は追加される）
+        user_id: エントリーのユーザーID
+        entry: 対象エントリー
+        win: 勝利したか
+        kills: 撃墜数
+
+    Returns:
+        (獲得経験値, 獲得クレジット, 付与前レベル, 付与後レベル)
+    """
+    pilot = pilots.get(user_id)
+    if pilot is None:
+        # 未登録ユーザーのみ個別に作成する（スターター機体付与を含むため）
+        pilot_name = entry.mobile_suit_snapshot.get("name", "Unknown Pilot")
+        pilot = pilot_service.get_or_create_pilot(user_id, pilot_name)
+        pilots[user_id] = pilot
+    level_before = pilot.level
+
+    exp_gained, credits_gained = pilot_service.calculate_battle_rewards(
+        win=win, kills=kills
+    )
+    reward_logs = pilot_service.apply_rewards(pilot, exp_gained, credits_gained)
+    print(f"  報酬付与 ({user_id}): {', '.join(reward_logs)}")
 
-    return simulator, primary_player_win, kills, steps_used
+    return exp_gained, credits_gained, level_before, pilot.level
+
+
+def _grant_npc_rewards(
+    pilot_service: PilotService,
+    pilots: dict[str, Pilot],
+    npc_entries: list[BattleEntry],
+    alive_team_ids: set[str | None],
+) -> None:
+    """NPC の成長処理（コミットは呼び出し側でまとめて行う）.
+
+    Args:
+        pilot_service: パイロットサービス
+        pilots: ルーム内のパイロット（user_id → Pilot）
+        npc_entries: NPCエントリーリスト
+        alive_team_ids: 生存している team_id の集合
+    """
+    for npc_entry in npc_entries:
+        if not npc_entry.user_id:
+            continue
+        try:
+            npc_pilot = pilots.get(npc_entry.user_id)
+            if npc_pilot is None or not npc_pilot.is_npc:
+                continue
+            # NPC の勝敗も team_id ベースで判定
+            npc_unit = _convert_snapshot_to_mobile_suit(npc_entry.mobile_suit_snapshot)
+            npc_win = _resolve_team_id(npc_unit) in alive_team_ids
+            exp_gained, credits_gained = pilot_service.calculate_battle_rewards(
+                win=npc_win,
+                kills=0,
+            )
+            reward_logs = pilot_service.apply_rewards(
+                npc_pilot, exp_gained, credits_gained
+            )
+            print(f"  NPC成長 ({npc_pilot.name}): {', '.join(reward_logs)}")
+        except Exception as e:
+            print(f"  警告: NPC成長エラー ({npc_entry.user_id}): {e}")
+            traceback.print_exc()
 
 
 def _save_battle_results(
@@ -220,33 +520,56 @@ def _save_battle_results(
     room: BattleRoom,
     player_entries: list[BattleEntry],
     npc_entries: list[BattleEntry],
-    simulator: BattleSimulator,
+    simulator: BattleSimulator | SimulationOutcome,
     primary_player_win: bool,
     player_unit: MobileSuit,
     enemy_units: list[MobileSuit],
     steps_used: int = 0,
+    log_stats: BattleLogStats | None = None,
 ) -> None:
     """戦闘結果を保存し報酬を付与.
 
+    ルーム内の全パイロットと直前の一言ログはそれぞれ1クエリで先読みし、
+    撃破数はログ1回の走査で全ユニット分を集計する。BattleResult の追加と
+    パイロットの報酬更新は最後に1回の commit でまとめて送信する。
+
     Args:
         session: データベースセッション
         room: ルーム
         player_entries: プレイヤーエントリーリスト
         npc_entries: NPCエントリーリスト
-        simulator: シミュレーター
+        simulator: シミュレーター（またはワーカーから返されたシミュレーション結果）
         primary_player_win: 勝利フラグ
         player_unit: プレイヤーユニット（スナップショット保存用。実バトルでは
             シミュレーションによって current_hp 等が最終状態まで更新済み）
         enemy_units: 敵ユニットリスト（スナップショット保存用。同上）
         steps_used: シミュレーションが消費したステップ数（ダイジェストの
             長期戦判定に使用。テスト等でシミュレーションを行わない場合は0のままでよい）
+        log_stats: `analyze_battle_logs()` で集計済みのログ集計（省略時はここで集計する）
     """
     pilot_service = PilotService(session)
     # entry.mobile_suit_snapshot はエントリー時点（バトル前）のHPしか持たないため、
     # ダイジェスト集計にはシミュレーションで実際に更新された live なユニットを使う
-    live_units_by_id = {str(u.id): u for u in [player_unit, *enemy_units]}
+    all_units = [player_unit, *enemy_units]
+    live_units_by_id = {str(u.id): u for u in all_units}
+    # enemies_info は全エントリーで共通の内容（自機を除く全ユニット）のため、
+    # ユニットごとに一度だけダンプしておく
+    unit_dumps = {str(u.id): u.model_dump() for u in all_units}
     obstacles_data = serialize_obstacles(simulator.obstacles)
 
+    # ルーム内のパイロット（プレイヤー・NPC）と直前の一言ログを1クエリずつで先読みする。
+    # 一言ログは今回の BattleResult を追加する前に取得すること（autoflush で混ざるため）
+    pilots = pilot_service.get_pilots_by_user_ids(
+        e.user_id for e in [*player_entries, *npc_entries] if e.user_id
+    )
+    previous_digests = get_previous_digest_texts(
+        session, (e.user_id for e in player_entries if e.user_id)
+    )
+    # 撃破数・ダイジェスト用の集計はエントリーごとにログを再走査せず、
+    # 全ユニット分を1回の走査で求める（_finish_room からは集計済みの結果を受け取る）
+    if log_stats is None:
+        log_stats = analyze_battle_logs(simulator.logs)
+
     # バトルログをルーム単位で1件保存（全参加者で共有）
     #
     # GCSへのオフロード（Issue #493）はここでは行わない。この時点ではまだ
@@ -265,141 +588,113 @@ def _save_battle_results(
     # 生存しているteam_idを取得
     alive_team_ids = {u.team_id for u in simulator.units if u.current_hp > 0}
 
+    battle_results = []
     for entry in player_entries:
         # 各プレイヤーの勝敗を判定 (team_idが生存チームに含まれているか)
         entry_unit = _convert_snapshot_to_mobile_suit(entry.mobile_suit_snapshot)
-        entry_team_id = _resolve_team_id(entry_unit)
-        individual_win_loss = "WIN" if entry_team_id in alive_team_ids else "LOSE"
+        entry_unit_id = str(entry_unit.id)
+        individual_win_loss = (
+            "WIN" if _resolve_team_id(entry_unit) in alive_team_ids else "LOSE"
+        )
         # 勝敗に関わらず自機の撃破数をそのまま使う（main.py のソロミッション経路と
         # 揃える）。敗北時に0へ丸めると、LOSE時のダイジェストタグ判定
         # （kills>=1 なら「力戦及ばず」）が常に「完敗」にしかならず、報酬の
         # 撃墜ボーナスも失われてしまう（Copilotレビュー指摘、PR #472）。
-        individual_kills = compute_unit_kills(simulator.logs, entry_unit.id)
+        individual_kills = log_stats.unit(entry_unit.id).kills
 
         # 報酬の計算と付与（BattleResult作成前にlevel_beforeを確定）
-        exp_gained = 0
-        credits_gained = 0
-        level_before = 0
-        level_after = 0
-        level_up = False
-
+        exp_gained = credits_gained = level_before = level_after = 0
         if entry.user_id:
             try:
-                pilot_name = entry.mobile_suit_snapshot.get("name", "Unknown Pilot")
-                pilot = pilot_service.get_or_create_pilot(entry.user_id, pilot_name)
-                level_before = pilot.level
-
-                exp_gained, credits_gained = pilot_service.calculate_battle_rewards(
-                    win=individual_win_loss == "WIN",
-                    kills=individual_kills,
-                )
-
-                pilot, reward_logs = pilot_service.add_rewards(
-                    pilot, exp_gained, credits_gained
+                exp_gained, credits_gained, level_before, level_after = (
+                    _grant_player_rewards(
+                        pilot_service,
+                        pilots,
+                        entry.user_id,
+                        entry,
+                        individual_win_loss == "WIN",
+                        individual_kills,
+                    )
                 )
-
-                level_after = pilot.level
-                level_up = level_after > level_before
-
-                print(f"  報酬付与 ({entry.user_id}): {', '.join(reward_logs)}")
-
             except Exception as e:
                 print(f"  警告: 報酬付与エラー ({entry.user_id}): {e}")
                 traceback.print_exc()
 
         # そのエントリーのユニットを player_info、残りを enemies_info として保存
-        entry_unit_for_info = _convert_snapshot_to_mobile_suit(
-            entry.mobile_suit_snapshot
-        )
-        all_units_info = [player_unit] + enemy_units
         enemies_info_for_entry = [
-            u.model_dump()
-            for u in all_units_info
-            if str(u.id) != str(entry_unit_for_info.id)
+            dump for unit_id, dump in unit_dumps.items() if unit_id != entry_unit_id
         ]
 
         # 戦闘ダイジェスト（一言ログ）を生成する（Issue #415）
         # live_units_by_id から取れない場合（テスト等）はHPが不明なため pre-battle
         # スナップショットにフォールバックする。BattleResultのもう一つの生成箇所
         # main.py と共通のヘルパーを使う（個別実装すると更新漏れが起きるため）
-        live_entry_unit = live_units_by_id.get(
-            str(entry_unit_for_info.id), entry_unit_for_info
-        )
-        digest_fields = compute_battle_digest_fields(
-            session=session,
-            user_id=entry.user_id,
-            player=live_entry_unit,
+        digest_fields = build_battle_digest_fields(
+            player=live_units_by_id.get(entry_unit_id, entry_unit),
             logs=simulator.logs,
             kills=individual_kills,
             win_loss=individual_win_loss,
             steps_used=steps_used,
             max_steps=_MAX_SIMULATION_STEPS,
+            avoid_text=previous_digests.get(entry.user_id) if entry.user_id else None,
+            log_stats=log_stats,
         )
 
-        battle_result = BattleResult(
-            user_id=entry.user_id,
-            room_id=room.id,
-            battle_log_id=battle_log_record.id,
-            win_loss=individual_win_loss,
-            player_info=entry_unit_for_info.model_dump(),
-            enemies_info=enemies_info_for_entry,
-            obstacles_info=obstacles_data,
-            ms_snapshot=entry.mobile_suit_snapshot,
-            map_bounds=list(simulator.map_bounds),
-            kills=individual_kills,
-            exp_gained=exp_gained,
-            credits_gained=credits_gained,
-            level_before=level_before,
-            level_after=level_after,
-            level_up=level_up,
-            is_read=False,
-            **digest_fields,
+        battle_results.append(
+            BattleResult(
+                user_id=entry.user_id,
+                room_id=room.id,
+                battle_log_id=battle_log_record.id,
+                win_loss=individual_win_loss,
+                player_info=entry_unit.model_dump(),
+                enemies_info=enemies_info_for_entry,
+                obstacles_info=obstacles_data,
+                ms_snapshot=entry.mobile_suit_snapshot,
+                map_bounds=list(simulator.map_bounds),
+                kills=individual_kills,
+                exp_gained=exp_gained,
+                credits_gained=credits_gained,
+                level_before=level_before,
+                level_after=level_after,
+                level_up=level_after > level_before,
+                is_read=False,
+                **digest_fields,
+            )
         )
-        session.add(battle_result)
+    session.add_all(battle_results)
 
     # NPC の成長処理
-    for npc_entry in npc_entries:
-        if npc_entry.user_id:
-            try:
-                npc_pilot = pilot_service.get_npc_pilot(npc_entry.user_id)
-                if npc_pilot:
-                    # NPC の勝敗も team_id ベースで判定
-                    npc_unit = _convert_snapshot_to_mobile_suit(
-                        npc_entry.mobile_suit_snapshot
-                    )
-                    npc_team_id = _resolve_team_id(npc_unit)
-                    npc_win = npc_team_id in alive_team_ids
-                    exp_gained, credits_gained = pilot_service.calculate_battle_rewards(
-                        win=npc_win,
-                        kills=0,
-                    )
-                    npc_pilot, reward_logs = pilot_service.add_rewards(
-                        npc_pilot, exp_gained, credits_gained
-                    )
-                    print(f"  NPC成長 ({npc_pilot.name}): {', '.join(reward_logs)}")
-            except Exception as e:
-                print(f"  警告: NPC成長エラー ({npc_entry.user_id}): {e}")
-                traceback.print_exc()
+    _grant_npc_rewards(pilot_service, pilots, npc_entries, alive_team_ids)
 
+    # BattleResult の INSERT とパイロットの UPDATE はこの commit でまとめて送信される
     room.status = "COMPLETED"
     session.add(room)
     session.commit()
 
 
-def _process_room(session: Session, room: BattleRoom) -> None:
-    """個別ルームの戦闘シミュレーションを実行.
+@dataclass
+class _PreparedRoom:
+    """シミュレーション投入前のルーム（エントリーとシミュレーション入力）."""
+
+    room: BattleRoom
+    player_entries: list[BattleEntry]
+    npc_entries: list[BattleEntry]
+    request: SimulationRequest
+
+
+def _prepare_room(room: BattleRoom, entries: list[BattleEntry]) -> _PreparedRoom | None:
+    """エントリーからシミュレーション入力を作成.
 
     Args:
-        session: データベースセッション
         room: 処理対象のルーム
-    """
-    # エントリーを取得
-    entry_statement = select(BattleEntry).where(BattleEntry.room_id == room.id)
-    entries = list(session.exec(entry_statement).all())
+        entries: ルームのエントリー
 
+    Returns:
+        準備済みのルーム。エントリーまたはプレイヤーエントリーがない場合は None
+    """
     if not entries:
         print("  警告: エントリーが見つかりません")
-        return
+        return None
 
     print(f"  参加者: {len(entries)} 機")
 
@@ -409,7 +704,7 @@ def _process_room(session: Session, room: BattleRoom) -> None:
 
     if not player_entries:
         print("  警告: プレイヤーエントリーがありません")
-        return
+        return None
 
     # ユニット準備
     player_unit, enemy_units, _ = _prepare_battle_units(player_entries, npc_entries)
@@ -417,11 +712,29 @@ def _process_room(session: Session, room: BattleRoom) -> None:
     print(f"  プレイヤー: {player_unit.name}")
     print(f"  敵機: {len(enemy_units)} 機")
 
-    # シミュレーション実行
-    simulator, primary_player_win, kills, steps_used = _run_simulation(
-        player_unit, enemy_units
+    return _PreparedRoom(
+        room=room,
+        player_entries=player_entries,
+        npc_entries=npc_entries,
+        request=_build_simulation_request(player_unit, enemy_units),
     )
 
+
+def _finish_room(
+    session: Session, prepared: _PreparedRoom, outcome: SimulationOutcome
+) -> None:
+    """シミュレーション結果を判定して保存.
+
+    Args:
+        session: データベースセッション
+        prepared: 準備済みのルーム
+        outcome: シミュレーション結果
+    """
+    print(f"  戦闘終了 (経過時間: {outcome.elapsed_time:.1f}s)")
+    # 勝敗判定・保存（撃破数・ダイジェスト）で同じログ集計を使い回す
+    log_stats = analyze_battle_logs(outcome.logs)
+    primary_player_win, kills = _judge_outcome(outcome, log_stats)
+
     if primary_player_win:
         print(f"  結果: プレイヤー勝利 (撃墜: {kills}機)")
     else:
@@ -430,19 +743,125 @@ def _process_room(session: Session, room: BattleRoom) -> None:
     # 結果保存
     _save_battle_results(
         session,
-        room,
-        player_entries,
-        npc_entries,
-        simulator,
+        prepared.room,
+        prepared.player_entries,
+        prepared.npc_entries,
+        outcome,
         primary_player_win,
-        player_unit,
-        enemy_units,
-        steps_used,
+        outcome.player,
+        outcome.enemies,
+        outcome.steps_used,
+        log_stats=log_stats,
     )
 
     print("  結果を保存しました")
 
 
+def _process_room(session: Session, room: BattleRoom) -> None:
+    """個別ルームの戦闘シミュレーションを実行.
+
+    Args:
+        session: データベースセッション
+        room: 処理対象のルーム
+    """
+    # エントリーを取得
+    entry_statement = select(BattleEntry).where(BattleEntry.room_id == room.id)
+    entries = list(session.exec(entry_statement).all())
+
+    prepared = _prepare_room(room, entries)
+    if prepared is None:
+        return
+
+    # シミュレーション実行
+    _finish_room(session, prepared, run_simulation(prepared.request))
+
+
+def _load_room_entries(
+    session: Session, room_ids: list[uuid.UUID]
+) -> dict[uuid.UUID, list[BattleEntry]]:
+    """複数ルームのエントリーを1クエリで取得し、ルームIDごとにまとめる.
+
+    取得したエントリーはセッションから切り離す。結果保存のたびに commit されても
+    失効（1件ずつの再読み込み）しないようにするため。エントリーは読み取り専用で使う。
+
+    Args:
+        session: データベースセッション
+        room_ids: ルームIDのリスト
+
+    Returns:
+        ルームIDをキーとしたエントリーのリスト
+    """
+    statement = select(BattleEntry).where(col(BattleEntry.room_id).in_(room_ids))
+    entries_by_room: dict[uuid.UUID, list[BattleEntry]] = {}
+    for entry in session.exec(statement).all():
+        session.expunge(entry)
+        entries_by_room.setdefault(entry.room_id, []).append(entry)
+    return entries_by_room
+
+
+def _report_room_error(session: Session, room_id: uuid.UUID, exc: Exception) -> None:
+    """ルーム単位のエラーを出力し、失敗したセッションを巻き戻して失敗を記録する.
+
+    ルームは WAITING のまま残り、次回のバッチで再実行される。`failed_at` を
+    記録することで、コーディネーターは実行中のルームと区別して待機を終えられる
+    （`wait_for_shards()`）。記録自体に失敗した場合はアイドルタイムアウトで
+    打ち切られるまで待機される。
+    """
+    print(f"エラー: ルームID {room_id} の処理中にエラーが発生しました")
+    print(f"  {exc}")
+    traceback.print_exception(exc)
+    session.rollback()
+    try:
+        room = session.get(BattleRoom, room_id)
+        if room is not None:
+            room.failed_at = datetime.now(UTC)
+            session.add(room)
+            session.commit()
+    except Exception as record_exc:
+        print(f"  失敗の記録にも失敗しました: {record_exc}")
+        session.rollback()
+
+
+def _run_rooms_pipelined(
+    session: Session, rooms: list[BattleRoom], workers: int
+) -> None:
+    """複数ルームのシミュレーションをプロセスプールで並列実行する.
+
+    全ルームのエントリーを先に読み込んでシミュレーションを投入し、終了した
+    ルームから順にこのプロセス（単一の DB 書き込み役）で結果を保存する。
+    ルームごとの失敗は他のルームに影響しない。
+
+    Args:
+        session: データベースセッション
+        rooms: 処理対象のルーム
+        workers: ワーカープロセス数
+    """
+    entries_by_room = _load_room_entries(session, [room.id for room in rooms])
+    futures: dict[Future[SimulationOutcome], _PreparedRoom] = {}
+
+    with create_simulation_pool(
+        workers, lut_subdivisions=_FUZZY_LUT_SUBDIVISIONS
+    ) as pool:
+        for room in rooms:
+            print(f"ルームID: {room.id} のシミュレーションを投入")
+            try:
+                prepared = _prepare_room(room, entries_by_room.get(room.id, []))
+            except Exception as e:
+                _report_room_error(session, room.id, e)
+                continue
+            if prepared is not None:
+                futures[pool.submit(run_simulation, prepared.request)] = prepared
+
+        for future in as_completed(futures):
+            prepared = futures[future]
+            try:
+                print(f"ルームID: {prepared.room.id} の結果を保存")
+                _finish_room(session, prepared, future.result())
+                print(f"ルームID: {prepared.room.id} の処理が完了しました\n")
+            except Exception as e:
+                _report_room_error(session, prepared.room.id, e)
+
+
 def create_next_open_room(session: Session) -> None:
     """次の募集期間用の OPEN ルームを作成する.
 
@@ -493,25 +912,56 @@ def update_rankings(session: Session) -> None:
     print("=" * 60)
 
     ranking_service = RankingService(session)
-    ranking_service.calculate_ranking()
+    ranking_service.calculate_ranking(incremental=_RANKING_INCREMENTAL)
 
     print("ランキングを更新しました")
 
 
-def main() -> None:
-    """メイン処理."""
+def main(
+    task_index: int = _CLOUD_RUN_TASK_INDEX, task_count: int = _CLOUD_RUN_TASK_COUNT
+) -> None:
+    """メイン処理.
+
+    Args:
+        task_index: このタスクのインデックス（0 がコーディネーター）
+        task_count: タスク総数
+
+    Raises:
+        ValueError: task_index / task_count が不正な場合
+    """
+    if task_count < 1 or not 0 <= task_index < task_count:
+        raise ValueError(
+            f"不正なタスク設定です (task_index={task_index}, task_count={task_count})"
+        )
+    is_coordinator = task_index == 0
+    # 他タスクのルーム失敗のうち、これ以降に記録されたものを今回のバッチ分とみなす
+    batch_started_at = datetime.now(UTC)
+
     print("\n" + "=" * 60)
     print("定期実行バッチを開始")
-    if _CLOUD_RUN_TASK_COUNT > 1:
-        print(f"タスクインデックス: {_CLOUD_RUN_TASK_INDEX} / {_CLOUD_RUN_TASK_COUNT}")
+    if task_count > 1:
+        role = "コーディネーター" if is_coordinator else "ワーカー"
+        print(f"タスクインデックス: {task_index} / {task_count} ({role})")
     print("=" * 60 + "\n")
 
     with Session(engine) as session:
-        # フェーズ1: マッチング
-        run_matching_phase(session)
-
-        # フェーズ2: シミュレーション
-        run_simulation_phase(session)
+        # フェーズ1: マッチング（コーディネーターのみ。他タスクは完了を待つ）
+        if is_coordinator:
+            run_matching_phase(session)
+        else:
+            wait_for_matching(session)
+
+        # フェーズ2: シミュレーション（担当ルームのみ）
+        other_room_ids = run_simulation_phase(session, task_index, task_count)
+
+        if not is_coordinator:
+            print("\n担当ルームの処理が完了しました（以降はコーディネーターが実行）")
+            return
+
+        # 他タスクの担当ルームが完了してからランキングを集計する
+        if other_room_ids:
+            print(f"\n他タスクの担当 {len(other_room_ids)} ルームの完了を待機します")
+            wait_for_shards(session, set(other_room_ids), batch_started_at)
 
         # フェーズ3: ランキング更新
         update_rankings(session)
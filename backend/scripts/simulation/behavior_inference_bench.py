@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# backend/scripts/simulation/behavior_inference_bench.py
+"""行動選択レイヤーのファジィ推論コスト比較ベンチマーク.
+
+`AiDecisionMixin._ai_decision_phase` は行動選択エンジンの活性化度の最大ラベル
+のみを使うため、重心デファジフィケーションを省略する
+`FuzzyEngine.infer_activations()` を呼び出す。本スクリプトは
+`sim_scale_bench.py` と同じ合成ユニット（8/50/100機）でバトルを実行して
+行動選択の推論入力を記録し、同じ入力に対して従来の `infer_with_debug()` と
+`infer_activations()` を再実行して、1ステップあたりの推論時間と削減量を表示する。
+
+Usage:
+    python scripts/simulation/behavior_inference_bench.py
+    python scripts/simulation/behavior_inference_bench.py --sizes 8,50,100 --steps 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+# パスを通す
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(os.path.dirname(__file__))
+
+from sim_scale_bench import _build_units
+
+from app.engine.fuzzy_engine import FuzzyEngine
+from app.engine.simulation import BattleSimulator
+
+
+def _record_behavior_calls(
+    room_size: int, steps: int
+) -> tuple[list[tuple[FuzzyEngine, dict[str, float]]], int]:
+    """バトルを実行し、行動選択の推論呼び出し (エンジン, 入力) を記録する."""
+    player, enemies = _build_units(room_size)
+    sim = BattleSimulator(player, enemies)
+    calls: list[tuple[FuzzyEngine, dict[str, float]]] = []
+
+    original = FuzzyEngine.infer_activations
+
+    def _recording(
+        engine: FuzzyEngine, inputs: dict[str, float]
+    ) -> dict[str, dict[str, float]]:
+        calls.append((engine, dict(inputs)))
+        return original(engine, inputs)
+
+    FuzzyEngine.infer_activations = _recording  # type: ignore[method-assign]
+    try:
+        executed = 0
+        for _ in range(steps):
+            if sim.is_finished:
+                break
+            sim.step()
+            executed += 1
+    finally:
+        FuzzyEngine.infer_activations = original  # type: ignore[method-assign]
+    return calls, executed
+
+
+def bench_room_size(room_size: int, steps: int) -> tuple[float, float, int, int]:
+    """(従来 ms/step, 活性化度のみ ms/step, 総推論回数, 実行ステップ数) を返す."""
+    calls, executed = _record_behavior_calls(room_size, steps)
+    if not executed:
+        return float("nan"), float("nan"), 0, 0
+
+    start = time.perf_counter()
+    for engine, inputs in calls:
+        engine.infer_with_debug(inputs)
+    with_centroid = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for engine, inputs in calls:
+        engine.infer_activations(inputs)
+    activations_only = time.perf_counter() - start
+
+    return (
+        with_centroid / executed * 1000.0,
+        activations_only / executed * 1000.0,
+        len(calls),
+        executed,
+    )
+
+
+def main() -> None:
+    """CLI エントリポイント: 引数を解析しベンチマークを実行して結果を表示する."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=str,
+        default="8,50,100",
+        help="カンマ区切りの room_size 一覧（デフォルト: 8,50,100）",
+    )
+    parser.add_argument(
+        "--steps", type=int, default=30, help="各構成での最大計測ステップ数"
+    )
+    args = parser.parse_args()
+
+    sizes = [int(s.strip()) for s in args.sizes.split(",") if s.strip()]
+
+    print(
+        f"{'room_size':>10} | {'calls':>7} | {'with_debug ms/step':>19}"
+        f" | {'activations ms/step':>20} | {'saved ms/step':>14}"
+    )
+    print("-" * 84)
+    for size in sizes:
+        legacy_ms, activations_ms, n_calls, _ = bench_room_size(size, args.steps)
+        print(
+            f"{size:>10} | {n_calls:>7} | {legacy_ms:>19.3f}"
+            f" | {activations_ms:>20.3f} | {legacy_ms - activations_ms:>14.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,11 +8,11 @@
 接続せず、合成ユニット（`sim_scale_bench.py` と同じビルダー）で
 完結する。
 
-注意: このエンジンは戦闘処理（命中判定・ターゲット選定など）に
-`random`/`np.random.default_rng()` を非シード化のまま使っており、
-現状シード固定による再現性は無い。そのため本スクリプトは「同一
-構成をNラウンド繰り返す」ことで揺らぎを吸収する方式を取る
-（ユニット配置のみ `_build_units()` 内部で固定シード=42）。
+各ラウンドは `BattleSimulator(seed=--seed + ラウンド番号)` で実行するため、
+(構成, seed) が同じなら戦闘処理（命中判定・ターゲット選定・スポーン位置など）
+まで完全に再現する。失敗したラウンドは出力された seed を指定して手元で
+再現できる。ラウンドごとに seed を変えることで、異なる乱数系列に対しても
+完走することを確認する（ユニット配置は `_build_units()` 内部の固定シード=42）。
 
 失敗条件（exit code 1）:
 - いずれかのラウンドで例外が発生した場合
@@ -23,6 +23,7 @@
 Usage:
     python scripts/simulation/engine_ci_smoke.py
     python scripts/simulation/engine_ci_smoke.py --sizes 2,8,20 --rounds 3
+    python scripts/simulation/engine_ci_smoke.py --sizes 20 --rounds 1 --seed 7
 """
 
 from __future__ import annotations
@@ -48,10 +49,10 @@ def _determine_win_team(sim: BattleSimulator) -> str:
     return "DRAW"
 
 
-def _run_one(room_size: int, max_steps: int, dt: float) -> dict:
+def _run_one(room_size: int, max_steps: int, dt: float, seed: int) -> dict:
     """1回分のバトルを完走させ、結果を辞書で返す（例外はそのまま伝播させる）."""
     player, enemies = _build_units(room_size)
-    sim = BattleSimulator(player, enemies)
+    sim = BattleSimulator(player, enemies, seed=seed)
 
     start = time.perf_counter()
     step_count = 0
@@ -65,6 +66,7 @@ def _run_one(room_size: int, max_steps: int, dt: float) -> dict:
     finished = sim.is_finished and step_count < max_steps
     return {
         "room_size": room_size,
+        "seed": seed,
         "step_count": step_count,
         "sim_elapsed_sec": round(step_count * dt, 1),
         "wall_clock_sec": round(wall_clock, 2),
@@ -86,8 +88,13 @@ def main() -> int:
         "--rounds",
         type=int,
         default=3,
-        help="サイズごとの繰り返し回数（デフォルト: 3。戦闘処理は非シード化のため"
-        "ラウンドごとに結果が揺らぐ）",
+        help="サイズごとの繰り返し回数（デフォルト: 3。ラウンドごとに seed を変える）",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="1ラウンド目の乱数シード（デフォルト: 0。以降のラウンドは +1 ずつ）",
     )
     parser.add_argument(
         "--max-steps",
@@ -104,22 +111,24 @@ def main() -> int:
     crashed = False
 
     print(
-        f"{'room_size':>9} {'round':>6} {'steps':>7} {'sim_sec':>8} {'wall_sec':>9} {'result':>10}"
+        f"{'room_size':>9} {'round':>6} {'seed':>6} {'steps':>7} {'sim_sec':>8} "
+        f"{'wall_sec':>9} {'result':>10}"
     )
     for room_size in sizes:
         for round_idx in range(args.rounds):
+            seed = args.seed + round_idx
             try:
-                result = _run_one(room_size, args.max_steps, args.dt)
+                result = _run_one(room_size, args.max_steps, args.dt, seed)
             except Exception:
                 crashed = True
-                print(f"{room_size:>9} {round_idx:>6}  CRASHED")
+                print(f"{room_size:>9} {round_idx:>6} {seed:>6}  CRASHED")
                 traceback.print_exc()
                 continue
 
             results.append(result)
             outcome = result["win_team"] if result["finished"] else "TIMEOUT"
             print(
-                f"{result['room_size']:>9} {round_idx:>6} "
+                f"{result['room_size']:>9} {round_idx:>6} {seed:>6} "
                 f"{result['step_count']:>7} {result['sim_elapsed_sec']:>8} "
                 f"{result['wall_clock_sec']:>9} {outcome:>10}"
             )
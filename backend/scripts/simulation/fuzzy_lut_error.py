@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# backend/scripts/simulation/fuzzy_lut_error.py
+"""ファジィ推論ルックアップテーブルの近似誤差レポート.
+
+`FuzzyRuleCache(lut_subdivisions=...)` / `BattleSimulator(fuzzy_lut_subdivisions=...)`
+で有効になるルックアップテーブル（app/engine/fuzzy_lut.py）について、戦略モード ×
+レイヤー（ターゲット選択・武器選択）ごとにテーブルを構築し、厳密推論
+（`FuzzyEngine.infer_batch_exact()`）との差を表示する。
+
+入力は次の2種類:
+    - random: 各入力変数の値域（最初と最後の折れ点の間）の一様乱数
+    - battle: `sim_scale_bench.py` と同じ合成ユニットのバトルで実際に推論された入力
+      （`--battle-size 0` で省略）
+
+表示項目は最大・平均絶対誤差、厳密推論へフォールバックした割合、候補間の
+最大スコアの選択（argmax）が変わった推論呼び出しの割合（battle のみ）、
+テーブルの格子点数と構築時間。
+
+Usage:
+    python scripts/simulation/fuzzy_lut_error.py
+    python scripts/simulation/fuzzy_lut_error.py --subdivisions 1 --samples 50000
+    python scripts/simulation/fuzzy_lut_error.py --battle-size 50 --steps 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# パスを通す
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(os.path.dirname(__file__))
+
+from sim_scale_bench import _build_units
+
+from app.engine.constants import FUZZY_LUT_SUBDIVISIONS, FUZZY_RULES_DIR
+from app.engine.fuzzy_engine import FuzzyEngine
+from app.engine.fuzzy_lut import FuzzyLookupTable
+from app.engine.fuzzy_rule_cache import _LUT_LAYERS, get_shared_rule_cache
+from app.engine.simulation import BattleSimulator
+
+
+def _record_battle_calls(
+    room_size: int, steps: int, seed: int
+) -> list[tuple[FuzzyEngine, dict[str, np.ndarray]]]:
+    """バトルを実行し、一括推論の呼び出し (エンジン, 入力) を記録する."""
+    player, enemies = _build_units(room_size)
+    sim = BattleSimulator(player, enemies, seed=seed)
+    calls: list[tuple[FuzzyEngine, dict[str, np.ndarray]]] = []
+
+    original = FuzzyEngine.infer_batch
+
+    def _recording(
+        engine: FuzzyEngine, inputs: dict[str, np.ndarray]
+    ) -> dict[str, np.ndarray]:
+        calls.append((engine, {k: np.array(v, dtype=float) for k, v in inputs.items()}))
+        return original(engine, inputs)
+
+    FuzzyEngine.infer_batch = _recording  # type: ignore[method-assign]
+    try:
+        for _ in range(steps):
+            if sim.is_finished:
+                break
+            sim.step()
+    finally:
+        FuzzyEngine.infer_batch = original  # type: ignore[method-assign]
+    return calls
+
+
+def _random_inputs(
+    table: FuzzyLookupTable, samples: int, rng: np.random.Generator
+) -> dict[str, np.ndarray]:
+    """テーブルの各軸の値域から一様乱数の入力を生成する."""
+    return {
+        var: rng.uniform(axis[0], axis[-1], samples)
+        for var, axis in zip(table.variables, table.axes, strict=True)
+    }
+
+
+def _compare(
+    engine: FuzzyEngine, table: FuzzyLookupTable, inputs: dict[str, np.ndarray]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+    """(厳密値, テーブル値, 近似した要素のマスク, 絶対誤差) を返す（近似不可なら None）."""
+    result = table.lookup_batch(inputs)
+    if result is None:
+        return None
+    approx, inexact = result
+    out_var = engine.compiled.output_variables[0]
+    exact = engine.infer_batch_exact(inputs)[out_var]
+    approximated = ~inexact
+    return exact, approx[out_var], approximated, np.abs(approx[out_var] - exact)
+
+
+def _format_row(
+    label: str,
+    errors: list[np.ndarray],
+    fallback: int,
+    total: int,
+    flipped: str,
+    table: FuzzyLookupTable,
+    build_sec: float,
+) -> str:
+    """1行分のレポートを整形する."""
+    err = np.concatenate(errors) if errors else np.zeros(0)
+    max_err = float(err.max()) if err.size else float("nan")
+    mean_err = float(err.mean()) if err.size else float("nan")
+    fallback_pct = 100.0 * fallback / total if total else float("nan")
+    return (
+        f"{label:<28} | {total:>7} | {max_err:>8.4f} | {mean_err:>8.5f}"
+        f" | {fallback_pct:>9.1f}% | {flipped:>8} | {table.size:>9} | {build_sec:>7.2f}"
+    )
+
+
+def main() -> None:
+    """CLI エントリポイント: 引数を解析し誤差レポートを表示する."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--subdivisions",
+        type=int,
+        default=FUZZY_LUT_SUBDIVISIONS,
+        help=f"折れ点間に追加する格子点の数（デフォルト: {FUZZY_LUT_SUBDIVISIONS}）",
+    )
+    parser.add_argument(
+        "--samples", type=int, default=20000, help="random 入力のサンプル数"
+    )
+    parser.add_argument(
+        "--battle-size",
+        type=int,
+        default=20,
+        help="battle 入力を記録する合成バトルの room_size（0 で省略）",
+    )
+    parser.add_argument(
+        "--steps", type=int, default=300, help="合成バトルの最大ステップ数"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="乱数シード")
+    args = parser.parse_args()
+
+    engines = get_shared_rule_cache(FUZZY_RULES_DIR).snapshot()
+    battle_calls = (
+        _record_battle_calls(args.battle_size, args.steps, args.seed)
+        if args.battle_size > 0
+        else []
+    )
+    rng = np.random.default_rng(args.seed)
+
+    print(
+        f"{'strategy:layer / inputs':<28} | {'rows':>7} | {'max err':>8} | {'mean err':>8}"
+        f" | {'fallback':>10} | {'flipped':>8} | {'points':>9} | {'build s':>7}"
+    )
+    print("-" * 110)
+    for mode, layers in engines.items():
+        for layer, engine in layers.items():
+            if layer not in _LUT_LAYERS:
+                continue
+            start = time.perf_counter()
+            table = FuzzyLookupTable.build(engine, args.subdivisions)
+            build_sec = time.perf_counter() - start
+
+            compared = _compare(engine, table, _random_inputs(table, args.samples, rng))
+            if compared is not None:
+                _, _, approximated, err = compared
+                print(
+                    _format_row(
+                        f"{mode}:{layer} / random",
+                        [err[approximated]],
+                        int((~approximated).sum()),
+                        len(err),
+                        "-",
+                        table,
+                        build_sec,
+                    )
+                )
+
+            errors: list[np.ndarray] = []
+            fallback = total = flipped = n_calls = 0
+            for call_engine, inputs in battle_calls:
+                if call_engine is not engine:
+                    continue
+                compared = _compare(engine, table, inputs)
+                if compared is None:
+                    continue
+                exact, approx, approximated, err = compared
+                errors.append(err[approximated])
+                fallback += int((~approximated).sum())
+                total += len(err)
+                n_calls += 1
+                approx = np.where(approximated, approx, exact)
+                flipped += int(np.argmax(approx) != np.argmax(exact))
+            if n_calls:
+                print(
+                    _format_row(
+                        f"{mode}:{layer} / battle",
+                        errors,
+                        fallback,
+                        total,
+                        f"{100.0 * flipped / n_calls:.1f}%",
+                        table,
+                        build_sec,
+                    )
+                )
+
+
+if __name__ == "__main__":
+    main()
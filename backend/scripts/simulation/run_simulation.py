@@ -11,9 +11,11 @@ Usage:
     python scripts/run_simulation.py run --mission-id 1
     python scripts/run_simulation.py run --mission-id 2 --output results/mission2.json
     python scripts/run_simulation.py run --mission-id 1 --steps 500 --output result.json
+    python scripts/run_simulation.py run --mission-id 1 --profile  # フェーズ別計測
 
     # 複数回シミュレーションを実行してサマリーを集計
     python scripts/run_simulation.py bench --mission-id 1 --rounds 20
+    python scripts/run_simulation.py bench --mission-id 1 --rounds 5 --profile
 
     # 2つの戦略を比較対照するA/Bテスト
     python scripts/run_simulation.py compare \\
@@ -120,12 +122,22 @@ def _serialize_log_entry(log_entry) -> dict:
     return data
 
 
+def _report_profile(sim: BattleSimulator, result: dict) -> None:
+    """フェーズ別計測が有効な場合、計測結果を表示して結果 JSON へ追加する."""
+    if not sim.profiler.enabled:
+        return
+    print("\nフェーズ別計測:")
+    print(sim.profiler.format_table())
+    result["profile"] = sim.profiler.to_dict()
+
+
 def run(
     mission_id: int,
     max_steps: int = 5000,
     output_path: str | None = None,
     strategy: str | None = None,
     enable_hot_reload: bool = False,
+    profile: bool = False,
 ) -> None:
     """シミュレーションを実行して結果を JSON に出力する.
 
@@ -135,6 +147,7 @@ def run(
         output_path: 出力先 JSON ファイルパス。None の場合は自動生成。
         strategy: プレイヤー機体の戦略モード (AGGRESSIVE/DEFENSIVE/SNIPER 等)。None の場合は未設定。
         enable_hot_reload: True の場合、ファジィルール JSON の変更を自動検出して再ロードする（ローカル開発用）。
+        profile: True の場合、フェーズ別の所要時間・カウンタを表示し、結果 JSON の "profile" に含める。
     """
     print("=" * 60)
     print(f"ミッション {mission_id} のシミュレーションを開始")
@@ -197,6 +210,7 @@ def run(
         environment=mission.environment,
         special_effects=mission.special_effects or [],
         enable_hot_reload=enable_hot_reload,
+        profile=profile,
     )
 
     step_count = 0
@@ -254,6 +268,7 @@ def run(
         ],
         "logs": [_serialize_log_entry(log) for log in sim.logs],
     }
+    _report_profile(sim, result)
 
     # 出力先を決定
     if output_path is None:
@@ -341,6 +356,12 @@ def parse_args() -> argparse.Namespace:
         "--steps", type=int, default=5000, metavar="N", help="最大ステップ数"
     )
     bench_parser.add_argument("--hot-reload", action="store_true", default=False)
+    bench_parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="フェーズ別の所要時間・カウンタを全ラウンド合算で表示する",
+    )
 
     # ---- compare サブコマンド ----
     compare_parser = subparsers.add_parser(
@@ -373,6 +394,12 @@ def parse_args() -> argparse.Namespace:
     )
     compare_parser.add_argument("--steps", type=int, default=5000, metavar="N")
     compare_parser.add_argument("--hot-reload", action="store_true", default=False)
+    compare_parser.add_argument(
+        "--adaptive-stepping",
+        action="store_true",
+        default=False,
+        help="非交戦中の接近フェーズを粗い dt でまとめて進め、膠着は早期に引き分け終了する",
+    )
 
     # ---- report サブコマンド ----
     report_parser = subparsers.add_parser(
@@ -432,6 +459,12 @@ def _add_run_args(parser: argparse.ArgumentParser) -> None:
         default=False,
         help="ファジィルール JSON の変更をシミュレーション実行ごとに自動反映する（ローカル開発用）",
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="フェーズ別の所要時間・カウンタ（LOS判定・ファジィ推論・グリッド同期・ログ件数）を表示する",
+    )
 
 
 if __name__ == "__main__":
@@ -444,6 +477,7 @@ if __name__ == "__main__":
             output_path=args.output,
             strategy=args.strategy,
             enable_hot_reload=args.hot_reload,
+            profile=args.profile,
         )
     elif args.subcommand == "bench":
         from scripts.simulation.sim_bench import run_bench_command
@@ -17,11 +17,13 @@ from typing import Any
 # パスを通す
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 
+from app.engine.battle_digest import BattleLogStats, analyze_battle_logs
 from app.engine.constants import (
     BALANCE_WARN_AVG_DURATION,
     BALANCE_WARN_DRAW_RATE,
     BALANCE_WARN_WIN_RATE,
 )
+from app.engine.profiler import StepProfiler
 from app.engine.simulation import BattleSimulator
 
 # 集計対象のアクションタイプ（チームイベントを除く）
@@ -48,6 +50,7 @@ class RoundResult:
     survivor_hp_ratio: dict[str, float]  # {team_id: avg HP ratio of survivors}
     survivor_count: dict[str, int]  # {team_id: count of surviving units}
     is_max_steps: bool  # 最大ステップ到達による終了かどうか
+    profile: StepProfiler | None = None  # フェーズ別計測（--profile 指定時のみ）
 
 
 @dataclass
@@ -66,6 +69,7 @@ class SimulationSummary:
     kills_per_round: dict[str, list[int]] = field(default_factory=dict)
     draw_by_max_steps: int = 0
     warnings: list[str] = field(default_factory=list)
+    profile: StepProfiler | None = None  # 全ラウンド合算のフェーズ別計測
 
     @property
     def total_rounds(self) -> int:
@@ -195,6 +199,12 @@ class SimulationSummary:
         for warning in self.warnings:
             lines.append(f"⚠️  {warning}")
 
+        # フェーズ別計測
+        if self.profile is not None:
+            lines.append("")
+            lines.append("フェーズ別計測（全ラウンド合算）:")
+            lines.append(self.profile.format_table())
+
         return "\n".join(lines)
 
     def to_json(self) -> dict[str, Any]:
@@ -218,19 +228,22 @@ class SimulationSummary:
             "kills_per_round": self.kills_per_round,
             "draw_by_max_steps": self.draw_by_max_steps,
             "warnings": self.warnings,
+            "profile": self.profile.to_dict() if self.profile is not None else None,
         }
 
 
 class BenchRunner:
     """N 回シミュレーションを実行してサマリーを生成する."""
 
-    def __init__(self, max_steps: int = 5000) -> None:
+    def __init__(self, max_steps: int = 5000, profile: bool = False) -> None:
         """初期化.
 
         Args:
             max_steps: シミュレーションの最大ステップ数
+            profile: True の場合、各ラウンドのフェーズ別計測を有効にしてサマリーへ合算する
         """
         self.max_steps = max_steps
+        self.profile = profile
 
     def run(
         self,
@@ -352,21 +365,15 @@ class BenchRunner:
         return "DRAW"
 
     def _collect_action_and_transitions(
-        self, sim_logs: list[Any]
+        self, log_stats: BattleLogStats
     ) -> tuple[dict[str, int], list[tuple[str, str]]]:
-        """ログから行動カウントと戦略遷移リストを収集する."""
-        action_counts: dict[str, int] = {}
-        strategy_transitions: list[tuple[str, str]] = []
-        for log in sim_logs:
-            at = log.action_type
-            if at in _UNIT_ACTION_TYPES:
-                action_counts[at] = action_counts.get(at, 0) + 1
-            if log.action_type == "STRATEGY_CHANGED" and log.details:
-                prev = log.details.get("previous_strategy", "")
-                nxt = log.details.get("new_strategy", "")
-                if prev and nxt:
-                    strategy_transitions.append((prev, nxt))
-        return action_counts, strategy_transitions
+        """ログ集計から行動カウントと戦略遷移リストを取り出す."""
+        action_counts = {
+            at: count
+            for at, count in log_stats.action_counts.items()
+            if at in _UNIT_ACTION_TYPES
+        }
+        return action_counts, list(log_stats.strategy_transitions)
 
     def _collect_survivor_stats_bench(
         self, sim_units: list[Any]
@@ -431,6 +438,7 @@ class BenchRunner:
             environment=getattr(mission, "environment", "SPACE"),
             special_effects=getattr(mission, "special_effects", None) or [],
             enable_hot_reload=enable_hot_reload,
+            profile=self.profile,
         )
 
         step_count = 0
@@ -442,17 +450,20 @@ class BenchRunner:
 
         is_max_steps = step_count >= self.max_steps
         win_team = self._determine_win_team_bench(sim, player)
+        # 行動数・戦略遷移・撃墜数はログ1回の走査でまとめて集計する
+        log_stats = analyze_battle_logs(sim.logs)
         action_counts, strategy_transitions = self._collect_action_and_transitions(
-            sim.logs
+            log_stats
         )
 
         # 撃墜数（DESTROYED ログの actor_id をユニットの team_id で分類）
-        unit_team_map = {str(u.id): u.team_id for u in sim.units}
+        unit_team_map = {u.id: u.team_id for u in sim.units}
         kills: dict[str, int] = {}
-        for log in sim.logs:
-            if log.action_type == "DESTROYED":
-                tid = unit_team_map.get(str(log.actor_id), "UNKNOWN")
-                kills[tid] = kills.get(tid, 0) + 1
+        for unit_id, unit_stats in log_stats.units.items():
+            destroyed = unit_stats.action_counts.get("DESTROYED", 0)
+            if destroyed:
+                tid = unit_team_map.get(unit_id, "UNKNOWN")
+                kills[tid] = kills.get(tid, 0) + destroyed
 
         survivor_hp_ratio, survivor_count = self._collect_survivor_stats_bench(
             sim.units
@@ -467,6 +478,7 @@ class BenchRunner:
             survivor_hp_ratio=survivor_hp_ratio,
             survivor_count=survivor_count,
             is_max_steps=is_max_steps,
+            profile=sim.profiler if self.profile else None,
         )
 
     def _accumulate(self, summary: SimulationSummary, result: RoundResult) -> None:
@@ -495,6 +507,11 @@ class BenchRunner:
         if result.is_max_steps and result.win_team == "DRAW":
             summary.draw_by_max_steps += 1
 
+        if result.profile is not None:
+            if summary.profile is None:
+                summary.profile = StepProfiler()
+            summary.profile.merge(result.profile)
+
     def _compute_warnings(self, summary: SimulationSummary) -> None:
         """異常検出: 閾値を超えた場合に警告を追加する."""
         if summary.rounds == 0:
@@ -527,7 +544,10 @@ class BenchRunner:
 
 def run_bench_command(args: Any) -> None:
     """Bench サブコマンドのエントリーポイント."""
-    runner = BenchRunner(max_steps=getattr(args, "steps", 5000))
+    runner = BenchRunner(
+        max_steps=getattr(args, "steps", 5000),
+        profile=getattr(args, "profile", False),
+    )
     print(
         f"bench 実行中: mission_id={args.mission_id}, "
         f"strategy={args.strategy}, rounds={args.rounds}"
@@ -18,7 +18,8 @@ from typing import Any
 # パスを通す
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 
-from app.engine.constants import BALANCE_WARN_WIN_RATE
+from app.engine.battle_digest import analyze_battle_logs
+from app.engine.constants import BALANCE_WARN_WIN_RATE, STALEMATE_NO_DAMAGE_STEPS
 from app.engine.simulation import BattleSimulator
 
 
@@ -188,9 +189,16 @@ _UNIT_ACTION_TYPES = {
 class CompareRunner:
     """2つの戦略モードを対戦させて比較サマリーを生成する."""
 
-    def __init__(self, max_steps: int = 5000) -> None:
-        """初期化."""
+    def __init__(self, max_steps: int = 5000, adaptive_stepping: bool = False) -> None:
+        """初期化.
+
+        Args:
+            max_steps: シミュレーションの最大ステップ数
+            adaptive_stepping: True の場合、非交戦中の適応ステップ幅と膠着時の
+                早期終了（STALEMATE_NO_DAMAGE_STEPS）を有効にする
+        """
         self.max_steps = max_steps
+        self.adaptive_stepping = adaptive_stepping
 
     def run(
         self,
@@ -304,20 +312,19 @@ class CompareRunner:
         summary: ComparisonSummary,
     ) -> None:
         """チームごとの行動分布をサマリーに積算する."""
-        unit_team_map = {str(u.id): u.team_id for u in sim.units}
-        for log in sim.logs:
-            at = log.action_type
-            if at not in _UNIT_ACTION_TYPES:
+        team_stats = {
+            "PLAYER_TEAM": summary.stats_a,
+            "ENEMY_TEAM": summary.stats_b,
+        }
+        unit_team_map = {u.id: u.team_id for u in sim.units}
+        # ユニットごとの行動数をログ1回の走査で集計し、チーム単位に足し合わせる
+        for unit_id, unit_stats in analyze_battle_logs(sim.logs).units.items():
+            stats = team_stats.get(unit_team_map.get(unit_id, ""))
+            if stats is None:
                 continue
-            team_of_actor = unit_team_map.get(str(log.actor_id), "")
-            if team_of_actor == "PLAYER_TEAM":
-                summary.stats_a.action_counts[at] = (
-                    summary.stats_a.action_counts.get(at, 0) + 1
-                )
-            elif team_of_actor == "ENEMY_TEAM":
-                summary.stats_b.action_counts[at] = (
-                    summary.stats_b.action_counts.get(at, 0) + 1
-                )
+            for at, count in unit_stats.action_counts.items():
+                if at in _UNIT_ACTION_TYPES:
+                    stats.action_counts[at] = stats.action_counts.get(at, 0) + count
 
     @staticmethod
     def _collect_team_survivor_stats(
@@ -366,14 +373,14 @@ class CompareRunner:
             environment=getattr(mission, "environment", "SPACE"),
             special_effects=getattr(mission, "special_effects", None) or [],
             enable_hot_reload=enable_hot_reload,
+            adaptive_stepping=self.adaptive_stepping,
+            stalemate_steps=STALEMATE_NO_DAMAGE_STEPS
+            if self.adaptive_stepping
+            else None,
         )
 
-        step_count = 0
-        for _ in range(self.max_steps):
-            if sim.is_finished:
-                break
+        while not sim.is_finished and sim.step_count < self.max_steps:
             sim.step()
-            step_count += 1
 
         self._determine_winner_compare(player, enemies, summary)
         self._collect_action_counts_by_team(sim, summary)
@@ -404,7 +411,10 @@ class CompareRunner:
 
 def run_compare_command(args: Any) -> None:
     """Compare サブコマンドのエントリーポイント."""
-    runner = CompareRunner(max_steps=getattr(args, "steps", 5000))
+    runner = CompareRunner(
+        max_steps=getattr(args, "steps", 5000),
+        adaptive_stepping=getattr(args, "adaptive_stepping", False),
+    )
     print(
         f"compare 実行中: mission_id={args.mission_id}, "
         f"strategy_a={args.strategy_a}, strategy_b={args.strategy_b}, "
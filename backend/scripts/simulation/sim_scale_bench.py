@@ -9,26 +9,34 @@
 Usage:
     python scripts/simulation/sim_scale_bench.py
     python scripts/simulation/sim_scale_bench.py --sizes 8,50,100 --steps 100
+    python scripts/simulation/sim_scale_bench.py --batched-detection
+    python scripts/simulation/sim_scale_bench.py --profile
+    python scripts/simulation/sim_scale_bench.py --profile-json profile.json
 """
 
 from __future__ import annotations
 
 import argparse
+import json
 import math
 import os
 import random
 import sys
 import time
+import uuid
 
 # パスを通す
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 
+from app.engine.profiler import format_profile
 from app.engine.simulation import BattleSimulator
 from app.models.models import MobileSuit, Vector3, Weapon
 
 
 def _make_unit(index: int, team_id: str, side: str, x: float, z: float) -> MobileSuit:
+    # ID はユニット名から決定的に生成する（seed 指定時に実行ごとの結果を一致させるため）
     return MobileSuit(
+        id=uuid.uuid5(uuid.NAMESPACE_OID, f"{team_id}-{index}"),
         name=f"{team_id}-{index}",
         max_hp=100,
         current_hp=100,
@@ -95,11 +103,25 @@ def _build_units(room_size: int) -> tuple[MobileSuit, list[MobileSuit]]:
     return player, enemies
 
 
-def bench_room_size(room_size: int, steps: int) -> tuple[float, int]:
-    """指定ユニット数でのシミュレーションを実行し、(1ステップあたりの平均秒数, 総ユニット数) を返す."""
+def bench_room_size(
+    room_size: int,
+    steps: int,
+    batched_detection: bool = False,
+    profile: dict | None = None,
+) -> tuple[float, int]:
+    """指定ユニット数でのシミュレーションを実行し、(1ステップあたりの平均秒数, 総ユニット数) を返す.
+
+    profile に dict を渡した場合はフェーズ別計測を有効にし、
+    `StepProfiler.to_dict()` の結果をその dict へ書き込む。
+    """
     player, enemies = _build_units(room_size)
     total_units = 1 + len(enemies)
-    sim = BattleSimulator(player, enemies)
+    sim = BattleSimulator(
+        player,
+        enemies,
+        batched_detection=batched_detection,
+        profile=profile is not None,
+    )
 
     start = time.perf_counter()
     executed = 0
@@ -111,6 +133,8 @@ def bench_room_size(room_size: int, steps: int) -> tuple[float, int]:
     elapsed = time.perf_counter() - start
 
     avg_sec = elapsed / executed if executed else float("nan")
+    if profile is not None:
+        profile.update(sim.profiler.to_dict())
     return avg_sec, total_units
 
 
@@ -126,15 +150,48 @@ def main() -> None:
     parser.add_argument(
         "--steps", type=int, default=50, help="各構成での最大計測ステップ数"
     )
+    parser.add_argument(
+        "--batched-detection",
+        action="store_true",
+        help="索敵フェーズを配列演算による一括計算版で実行する",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="構成ごとにフェーズ別の所要時間・カウンタを表示する",
+    )
+    parser.add_argument(
+        "--profile-json",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help="フェーズ別計測結果（room_size → StepProfiler.to_dict()）を JSON で保存する",
+    )
     args = parser.parse_args()
 
     sizes = [int(s.strip()) for s in args.sizes.split(",") if s.strip()]
+    profiling = args.profile or args.profile_json is not None
+    profiles: dict[int, dict] = {}
 
     print(f"{'room_size':>10} | {'avg sec/step':>14} | {'units':>6}")
     print("-" * 38)
     for size in sizes:
-        avg_sec, total_units = bench_room_size(size, args.steps)
+        profile: dict | None = {} if profiling else None
+        avg_sec, total_units = bench_room_size(
+            size, args.steps, batched_detection=args.batched_detection, profile=profile
+        )
         print(f"{size:>10} | {avg_sec:>14.6f} | {total_units:>6}")
+        if profile is not None:
+            profiles[size] = profile
+
+    if args.profile:
+        for size, profile in profiles.items():
+            print(f"\n[room_size={size}]")
+            print(format_profile(profile))
+    if args.profile_json is not None:
+        with open(args.profile_json, "w", encoding="utf-8") as f:
+            json.dump(profiles, f, ensure_ascii=False, indent=2)
+        print(f"\nフェーズ別計測結果を保存しました: {args.profile_json}")
 
 
 if __name__ == "__main__":
@@ -1,4 +1,4 @@
-"""GET /api/battles/{battle_id}/logs のGCSオフロード分岐のテスト（Issue #493）."""
+"""GET /api/battles/{battle_id}/logs のGCSオフロード分岐・形式ネゴシエーションのテスト（Issue #493）."""
 
 import uuid
 from datetime import UTC, datetime
@@ -8,6 +8,7 @@ from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from app.models.models import BattleLogRecord, BattleResult
+from app.services.battle_replay_codec import REPLAY_MEDIA_TYPE, decode_replay
 
 
 def _create_battle_with_log(
@@ -90,3 +91,64 @@ def test_get_battle_logs_404_for_unknown_battle(client: TestClient) -> None:
     """存在しないbattle_idは404になることを確認する（既存挙動の回帰確認）."""
     res = client.get(f"/api/battles/{uuid.uuid4()}/logs")
     assert res.status_code == 404
+
+
+def test_get_battle_logs_returns_binary_replay_when_accepted(
+    client: TestClient, session: Session
+) -> None:
+    """Accept でバイナリリプレイ形式を要求した場合のみバイナリで返すことを確認する."""
+    logs = [
+        {"timestamp": 0.5, "action_type": "MOVE", "message": "移動"},
+        {"msg": "from-neon"},
+    ]
+    battle = _create_battle_with_log(session, gcs_path=None, logs=logs)
+
+    res = client.get(
+        f"/api/battles/{battle.id}/logs",
+        headers={"Accept": f"{REPLAY_MEDIA_TYPE}, application/x-ndjson;q=0.5"},
+    )
+    assert res.status_code == 200
+    assert res.headers["content-type"] == REPLAY_MEDIA_TYPE
+    assert "Accept" in res.headers["vary"].split(", ")
+    assert decode_replay(res.content) == logs
+
+    # q=0 は明示的な拒否として扱い、従来通り NDJSON を返す
+    res = client.get(
+        f"/api/battles/{battle.id}/logs",
+        headers={"Accept": f"{REPLAY_MEDIA_TYPE};q=0, */*"},
+    )
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    assert len([line for line in res.text.splitlines() if line.strip()]) == 2
+
+
+def test_get_battle_logs_converts_gcs_ndjson_to_binary_replay(
+    client: TestClient, session: Session
+) -> None:
+    """GCSのNDJSONがチャンク境界をまたいでもバイナリリプレイへ変換されることを確認する."""
+    battle = _create_battle_with_log(
+        session, gcs_path="battle-logs/mocked.ndjson", logs=[]
+    )
+
+    def fake_stream(gcs_path: str):
+        async def _gen():
+            yield b'{"msg": "from-'
+            yield b'gcs"}\n{"damage": 3'
+            yield b"}"
+
+        return _gen()
+
+    with patch("main.stream_battle_log_chunks", side_effect=fake_stream):
+        res = client.get(
+            f"/api/battles/{battle.id}/logs", headers={"Accept": REPLAY_MEDIA_TYPE}
+        )
+
+    assert res.status_code == 200
+    assert decode_replay(res.content) == [{"msg": "from-gcs"}, {"damage": 3}]
+
+    empty = BattleResult(win_loss="WIN", created_at=datetime.now(UTC))
+    session.add(empty)
+    session.commit()
+    res = client.get(
+        f"/api/battles/{empty.id}/logs", headers={"Accept": REPLAY_MEDIA_TYPE}
+    )
+    assert decode_replay(res.content) == []
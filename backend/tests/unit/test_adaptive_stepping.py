@@ -0,0 +1,156 @@
+"""Tests for adaptive time stepping and stalemate termination.
+
+- adaptive_stepping=True で非交戦中は複数ステップ分の dt を1ステップにまとめ、
+  接敵し得る距離・発見後は通常の dt に戻ること
+- エリア収縮のタイミングを跨がないこと
+- stalemate_steps 指定時、HP・マップ境界が変化しない膠着を引き分けで打ち切ること
+"""
+
+import uuid
+
+from app.engine.constants import ADAPTIVE_STEP_MAX_SPAN, SHRINK_START_STEP
+from app.engine.simulation import BattleSimulator
+from app.engine.simulation_executor import SimulationRequest, run_simulation
+from app.engine.strategy_controller import TeamStrategyController
+from app.models.models import MobileSuit, Vector3, Weapon
+
+
+def _make_unit(i: int, x: float, team_id: str, armed: bool = True) -> MobileSuit:
+    return MobileSuit(
+        id=uuid.UUID(int=i + 1),
+        name=f"u{i}",
+        max_hp=100,
+        current_hp=100,
+        armor=0,
+        mobility=1.0,
+        position=Vector3(x=x, y=0.0, z=0.0),
+        sensor_range=400.0,
+        side="PLAYER" if team_id == "A" else "ENEMY",
+        team_id=team_id,
+        weapons=(
+            [Weapon(id=f"w{i}", name="Rifle", power=30, range=300, accuracy=80)]
+            if armed
+            else []
+        ),
+    )
+
+
+def _far_apart_sim(**kwargs) -> BattleSimulator:
+    return BattleSimulator(
+        _make_unit(0, 0.0, "A"), [_make_unit(1, 1900.0, "B")], seed=1, **kwargs
+    )
+
+
+def test_idle_steps_are_merged_until_contact() -> None:
+    """接敵前はステップがまとめられ、接敵し得る距離では通常の dt に戻ること."""
+    sim = _far_apart_sim(adaptive_stepping=True)
+    spans: list[int] = []
+    while not sim.is_finished and sim.step_count < 400:
+        detected_before = any(sim.team_detected_units.values())
+        sim.step()
+        spans.append(sim._step_span)
+        if detected_before:
+            assert sim._step_span == 1
+
+    assert spans[0] == ADAPTIVE_STEP_MAX_SPAN
+    assert 1 in spans
+    assert len(spans) < sim.step_count
+    assert abs(sim.elapsed_time - sim.step_count * 0.1) < 1e-6
+
+
+def test_adaptive_stepping_disabled_by_default() -> None:
+    """デフォルトでは1回の step() が常に1ステップであること."""
+    sim = _far_apart_sim()
+    for _ in range(20):
+        sim.step()
+    assert sim.step_count == 20
+
+
+def test_span_does_not_cross_area_shrink() -> None:
+    """エリア収縮のステップを跨がないようにまとめるステップ数が制限されること."""
+    sim = _far_apart_sim(adaptive_stepping=True)
+    sim._step_count = SHRINK_START_STEP - 2
+    assert sim._adaptive_step_span(0.1) == 2
+    sim._step_count = SHRINK_START_STEP
+    assert sim._adaptive_step_span(0.1) == ADAPTIVE_STEP_MAX_SPAN
+
+
+def test_span_is_one_when_any_team_has_detection() -> None:
+    """いずれかのチームが敵を発見している間はまとめないこと."""
+    sim = _far_apart_sim(adaptive_stepping=True)
+    sim.team_detected_units["A"].add(sim.units[1].id)
+    assert sim._adaptive_step_span(0.1) == 1
+
+
+def test_strategy_evaluation_counts_merged_steps() -> None:
+    """まとめたステップ中に評価タイミングを跨いだ場合も戦略評価が行われること."""
+    controller = TeamStrategyController("A", "AGGRESSIVE", update_interval=10)
+    assert controller.should_evaluate(5) is False
+    assert controller.should_evaluate(3) is False
+    assert controller.should_evaluate(5) is True
+    assert controller.should_evaluate(5) is False
+
+
+def test_stalemate_ends_battle_as_draw() -> None:
+    """攻撃手段が無く HP が変化しない膠着は stalemate_steps 経過で打ち切られること."""
+    player = _make_unit(0, 0.0, "A", armed=False)
+    enemy = _make_unit(1, 300.0, "B", armed=False)
+    sim = BattleSimulator(player, [enemy], seed=1, stalemate_steps=100)
+    while not sim.is_finished and sim.step_count < 1000:
+        sim.step()
+
+    assert sim.is_stalemate
+    assert sim.step_count == 101
+    assert player.current_hp > 0 and enemy.current_hp > 0
+
+
+def test_no_stalemate_without_option() -> None:
+    """stalemate_steps を指定しない場合は膠着でも終了しないこと."""
+    player = _make_unit(0, 0.0, "A", armed=False)
+    enemy = _make_unit(1, 300.0, "B", armed=False)
+    sim = BattleSimulator(player, [enemy], seed=1)
+    for _ in range(200):
+        sim.step()
+    assert not sim.is_finished
+    assert not sim.is_stalemate
+
+
+def test_executor_counts_steps_in_base_dt() -> None:
+    """run_simulation() の steps_used が基準 dt 換算で max_steps を超えないこと."""
+    outcome = run_simulation(
+        SimulationRequest(
+            player=_make_unit(0, 0.0, "A"),
+            enemies=[_make_unit(1, 1900.0, "B")],
+            max_steps=53,
+            adaptive_stepping=True,
+        )
+    )
+    assert outcome.steps_used == 53
+    assert outcome.elapsed_time >= 5.3 - 1e-6
+
+
+def test_span_does_not_cross_max_steps() -> None:
+    """まとめたステップが呼び出し側の max_steps を超えないこと."""
+    sim = _far_apart_sim(adaptive_stepping=True, max_steps=ADAPTIVE_STEP_MAX_SPAN + 3)
+    calls = 0
+    while not sim.is_finished:
+        sim.step()
+        calls += 1
+        assert sim.step_count <= ADAPTIVE_STEP_MAX_SPAN + 3
+
+    assert sim.step_count == ADAPTIVE_STEP_MAX_SPAN + 3
+    assert calls < sim.step_count
+    assert abs(sim.elapsed_time - sim.step_count * 0.1) < 1e-6
+
+
+def test_executor_elapsed_time_stops_at_max_steps() -> None:
+    """run_simulation() の戦闘時間が max_steps 分を超えて進まないこと."""
+    outcome = run_simulation(
+        SimulationRequest(
+            player=_make_unit(0, 0.0, "A"),
+            enemies=[_make_unit(1, 1900.0, "B")],
+            max_steps=53,
+            adaptive_stepping=True,
+        )
+    )
+    assert abs(outcome.elapsed_time - 5.3) < 1e-6
@@ -0,0 +1,135 @@
+"""Tests for the batched detection phase and has_los_batch.
+
+- has_los_batch() が has_los() と視線ごとに一致すること
+- batched_detection=True の索敵フェーズが従来版と同じ発見済みセット・
+  detection_step_map・最終既知座標を生成すること（確率判定の乱数を固定した場合）
+"""
+
+import random
+from unittest.mock import patch
+
+import numpy as np
+
+from app.engine.combat import has_los, has_los_batch, obstacle_arrays
+from app.engine.simulation import BattleSimulator
+from app.models.models import MobileSuit, Obstacle, Vector3, Weapon
+
+
+def _make_unit(name: str, team_id: str, x: float, z: float) -> MobileSuit:
+    return MobileSuit(
+        name=name,
+        max_hp=100,
+        current_hp=100,
+        armor=0,
+        mobility=1.0,
+        position=Vector3(x=x, y=0.0, z=z),
+        sensor_range=1500.0,
+        side="PLAYER" if team_id == "A" else "ENEMY",
+        team_id=team_id,
+        weapons=[Weapon(id=f"w_{name}", name="w", power=10, range=500, accuracy=80)],
+    )
+
+
+def _make_obstacles(rng: random.Random, count: int) -> list[Obstacle]:
+    return [
+        Obstacle(
+            obstacle_id=f"obs{i}",
+            position=Vector3(
+                x=rng.uniform(0, 3000), y=rng.uniform(-50, 50), z=rng.uniform(0, 3000)
+            ),
+            radius=rng.uniform(50, 250),
+        )
+        for i in range(count)
+    ]
+
+
+def _build_sim(batched: bool, seed: int) -> BattleSimulator:
+    rng = random.Random(seed)
+    teams = ["A", "B", "C"]
+    units = [
+        _make_unit(f"u{i}", teams[i % 3], rng.uniform(0, 3000), rng.uniform(0, 3000))
+        for i in range(18)
+    ]
+    return BattleSimulator(
+        units[0],
+        units[1:],
+        obstacles=_make_obstacles(rng, 12),
+        batched_detection=batched,
+    )
+
+
+def _detection_state(sim: BattleSimulator) -> tuple[dict, dict, dict]:
+    """ユニット名ベースに正規化した索敵状態を返す（UUID はシミュレータごとに異なる）."""
+    names = {u.id: u.name for u in sim.units}
+    names_by_str = {str(u.id): u.name for u in sim.units}
+    detected = {
+        team: {names[uid] for uid in ids}
+        for team, ids in sim.team_detected_units.items()
+    }
+    steps = {
+        team: {names_by_str[uid]: step for uid, step in m.items()}
+        for team, m in sim.detection_step_map.items()
+    }
+    last_known = {
+        names_by_str[uid]: {
+            names_by_str[tid]: pos
+            for tid, pos in res["last_known_enemy_position"].items()
+        }
+        for uid, res in sim.unit_resources.items()
+    }
+    return detected, steps, last_known
+
+
+def test_has_los_batch_matches_has_los() -> None:
+    """has_los_batch() の結果が has_los() の逐次判定と一致すること."""
+    rng = random.Random(0)
+    obstacles = _make_obstacles(rng, 20)
+    centers, radii = obstacle_arrays(obstacles)
+    origins = np.array(
+        [[rng.uniform(0, 3000), 0.0, rng.uniform(0, 3000)] for _ in range(200)]
+    )
+    targets = np.array(
+        [[rng.uniform(0, 3000), 0.0, rng.uniform(0, 3000)] for _ in range(200)]
+    )
+    # 始点=終点の縮退ケースも含める
+    targets[0] = origins[0]
+
+    batched = has_los_batch(origins, targets, centers, radii)
+    expected = [has_los(a, b, obstacles) for a, b in zip(origins, targets, strict=True)]
+    assert batched.tolist() == expected
+    assert not all(expected) and any(expected)
+
+
+def test_has_los_batch_without_obstacles() -> None:
+    """障害物がない場合は全視線が LOS ありになること."""
+    centers, radii = obstacle_arrays([])
+    result = has_los_batch(np.zeros((3, 3)), np.ones((3, 3)), centers, radii)
+    assert result.tolist() == [True, True, True]
+
+
+def test_batched_detection_matches_legacy() -> None:
+    """一括計算版と従来版で発見済みセット・発見ステップ・最終既知座標が一致すること."""
+    legacy = _build_sim(batched=False, seed=7)
+    batched = _build_sim(batched=True, seed=7)
+
+    # 確率判定を固定値にすると結果は乱数の消費順に依存しなくなる
+    with patch("random.random", return_value=0.4):
+        legacy._detection_phase()
+        batched._detection_phase()
+    assert _detection_state(legacy) == _detection_state(batched)
+    assert any(legacy.team_detected_units.values())
+
+    # ユニットを動かして LOS 喪失・再発見を発生させる
+    for sim in (legacy, batched):
+        for unit in sim.units:
+            unit.position = Vector3(
+                x=unit.position.z, y=0.0, z=3000.0 - unit.position.x
+            )
+        sim._step_count += 1
+    with patch("random.random", return_value=0.4):
+        legacy._detection_phase()
+        batched._detection_phase()
+
+    state = _detection_state(legacy)
+    assert state == _detection_state(batched)
+    assert any(state[2].values()), "LOS 喪失が発生するケースであること"
@@ -0,0 +1,150 @@
+"""Tests for the batched movement phase (batched_movement=True).
+
+- 一括計算版のポテンシャルフィールドが `_calculate_potential_field()` と
+  ユニットごとに一致すること（同一位置を参照した場合）
+- 一括版の慣性モデルが `_apply_inertia()` と同じ速度・位置を与えること
+- batched_movement=True でバトルが最後まで進行すること
+"""
+
+import random
+import uuid
+from unittest.mock import patch
+
+import numpy as np
+
+from app.engine.simulation import BattleSimulator
+from app.models.models import MobileSuit, Obstacle, RetreatPoint, Vector3, Weapon
+
+_ACTIONS = ["ATTACK", "MOVE", "HIT_AND_AWAY", "RETREAT"]
+
+
+def _make_unit(i: int, team_id: str, x: float, z: float) -> MobileSuit:
+    return MobileSuit(
+        id=uuid.UUID(int=i + 1),
+        name=f"u{i}",
+        max_hp=100 if i % 4 else 20,
+        current_hp=100 if i % 4 else 20,
+        armor=0,
+        mobility=1.0,
+        position=Vector3(x=x, y=0.0, z=z),
+        sensor_range=1500.0,
+        side="PLAYER" if team_id == "A" else "ENEMY",
+        team_id=team_id,
+        weapons=[
+            Weapon(
+                id=f"w{i}",
+                name="w",
+                power=30 + 10 * (i % 5),
+                range=200 + 50 * (i % 4),
+                accuracy=80,
+            )
+        ],
+    )
+
+
+def _build_sim(seed: int, batched: bool = False) -> BattleSimulator:
+    rng = random.Random(seed)
+    teams = ["A", "B", "C"]
+    units = [
+        _make_unit(i, teams[i % 3], rng.uniform(0, 2500), rng.uniform(0, 2500))
+        for i in range(18)
+    ]
+    # 味方斥力・境界斥力が働く配置を含める
+    units[3].position = Vector3(x=units[0].position.x + 40.0, y=0.0, z=0.0)
+    obstacles = [
+        Obstacle(
+            obstacle_id=f"obs{i}",
+            position=Vector3(x=rng.uniform(0, 2500), y=0.0, z=rng.uniform(0, 2500)),
+            radius=rng.uniform(80, 200),
+        )
+        for i in range(8)
+    ]
+    return BattleSimulator(
+        units[0],
+        units[1:],
+        obstacles=obstacles,
+        retreat_points=[
+            RetreatPoint(position=Vector3(x=0.0, y=0.0, z=0.0), radius=100.0)
+        ],
+        batched_movement=batched,
+    )
+
+
+def _assign_actions(sim: BattleSimulator) -> dict[uuid.UUID, MobileSuit | None]:
+    """各ユニットに行動種別とターゲットを割り当てる."""
+    targets: dict[uuid.UUID, MobileSuit | None] = {}
+    for i, unit in enumerate(sim.units):
+        action = _ACTIONS[i % len(_ACTIONS)]
+        sim.unit_resources[str(unit.id)]["current_action"] = action
+        enemies = [u for u in sim.units if u.team_id != unit.team_id]
+        targets[unit.id] = enemies[i % len(enemies)] if i % 5 else None
+    return targets
+
+
+def test_batched_directions_match_potential_field() -> None:
+    """同一位置を参照した場合、一括版の目標方向が逐次版と一致すること."""
+    sim = _build_sim(seed=3)
+    targets = _assign_actions(sim)
+    sim._unit_state.load(sim.unit_resources)
+
+    # フランキングの発動判定（乱数）を常に不発にして比較する
+    with patch("random.random", return_value=1.0):
+        expected = [
+            sim._calculate_potential_field(u, targets[u.id], sim.retreat_points)
+            for u in sim.units
+        ]
+        for unit in sim.units:
+            sim._queue_movement(unit, targets[unit.id], 0.1, "MOVE_APPROACH", 1.0, True)
+    directions = sim._batched_potential_directions(sim._movement_requests)
+
+    np.testing.assert_allclose(directions, np.array(expected), atol=1e-9)
+
+
+def test_batched_inertia_matches_apply_inertia() -> None:
+    """一括版の慣性モデルが逐次版と同じ速度・向き・位置を与えること."""
+    random.seed(5)
+    legacy = _build_sim(seed=5)
+    random.seed(5)
+    batched = _build_sim(seed=5)
+    rng = np.random.default_rng(0)
+    angles = rng.uniform(0.0, 2.0 * np.pi, len(legacy.units))
+    directions = np.stack([np.cos(angles), np.zeros_like(angles), np.sin(angles)], 1)
+    # ブースト中・減速中のユニットを含める
+    for sim in (legacy, batched):
+        sim.unit_resources[str(sim.units[1].id)]["is_boosting"] = True
+        sim.unit_resources[str(sim.units[2].id)]["velocity_vec"] = np.array(
+            [500.0, 0.0, 0.0]
+        )
+        sim._unit_state.load(sim.unit_resources)
+
+    for unit, direction in zip(legacy.units, directions, strict=True):
+        legacy._apply_inertia(unit, direction, 0.1)
+    batched._apply_inertia_batched(batched.units, directions, 0.1)
+
+    for a, b in zip(legacy.units, batched.units, strict=True):
+        res_a = legacy.unit_resources[str(a.id)]
+        res_b = batched.unit_resources[str(b.id)]
+        np.testing.assert_allclose(res_a["velocity_vec"], res_b["velocity_vec"])
+        assert np.isclose(res_a["movement_heading_deg"], res_b["movement_heading_deg"])
+        np.testing.assert_allclose(a.position.to_numpy(), b.position.to_numpy())
+
+
+def test_batched_movement_battle_progresses() -> None:
+    """batched_movement=True でもユニットが移動し、移動ログが記録されること."""
+    random.seed(11)
+    sim = _build_sim(seed=11, batched=True)
+    start = {u.id: u.position.to_numpy() for u in sim.units}
+    for _ in range(100):
+        sim.step()
+        assert sim._movement_requests == []
+        if sim.is_finished:
+            break
+    sim.sync_unit_positions()
+
+    moved = [
+        u
+        for u in sim.units
+        if np.linalg.norm(u.position.to_numpy() - start[u.id]) > 1.0
+    ]
+    assert len(moved) > len(sim.units) // 2
+    assert any(log.action_type == "MOVE" for log in sim.logs)
@@ -4,8 +4,11 @@ import uuid
 
 from app.engine.battle_digest import (
     TEMPLATE_POOLS,
+    analyze_battle_logs,
     build_digest,
     compute_digest_stats,
+    compute_kills_by_unit,
+    compute_unit_kills,
     determine_tag,
 )
 from app.models.models import BattleLog, MobileSuit, Vector3
@@ -28,6 +31,7 @@ def make_log(
     damage: int | None = None,
     target_max_hp: int | None = None,
     weapon_name: str | None = None,
+    details: dict | None = None,
 ) -> BattleLog:
     """テスト用の BattleLog を生成する."""
     return BattleLog(
@@ -40,9 +44,84 @@ def make_log(
         position_snapshot=Vector3(x=0, y=0, z=0),
         target_max_hp=target_max_hp,
         weapon_name=weapon_name,
+        details=details,
     )
 
 
+def test_compute_kills_by_unit_matches_per_unit_count():
+    """全ユニット一括の撃破数集計が compute_unit_kills と一致すること."""
+    a, b, c, d = (uuid.UUID(int=i) for i in range(1, 5))
+    logs = [
+        make_log(a, "ATTACK", target_id=c),
+        make_log(c, "DESTROYED"),
+        make_log(b, "MELEE_COMBO", target_id=d),
+        make_log(d, "DESTROYED"),
+        # 直前のログが別ターゲットへの攻撃の場合は撃破者とみなさない
+        make_log(a, "ATTACK", target_id=c),
+        make_log(b, "DESTROYED"),
+    ]
+    kills = compute_kills_by_unit(logs)
+    assert kills == {a: 1, b: 1}
+    for unit_id in (a, b, c, d):
+        assert compute_unit_kills(logs, unit_id) == kills.get(unit_id, 0)
+
+
+def test_analyze_battle_logs_aggregates_all_units_in_one_pass():
+    """一括集計が全ユニット分の撃破数・与被ダメージ・回避・武器使用・行動数を返すこと."""
+    a, b, c = (uuid.UUID(int=i) for i in range(1, 4))
+    logs = [
+        make_log(
+            a, "ATTACK", target_id=b, damage=100, target_max_hp=1000, weapon_name="BR"
+        ),
+        make_log(b, "MISS", target_id=a),
+        make_log(
+            a, "ATTACK", target_id=c, damage=500, target_max_hp=1000, weapon_name="BZ"
+        ),
+        make_log(
+            a, "ATTACK", target_id=b, damage=50, target_max_hp=1000, weapon_name="BZ"
+        ),
+        make_log(c, "MELEE_COMBO", target_id=b, damage=900),
+        make_log(b, "DESTROYED"),
+        make_log(
+            a,
+            "STRATEGY_CHANGED",
+            details={"previous_strategy": "AGGRESSIVE", "new_strategy": "RETREAT"},
+        ),
+    ]
+    stats = analyze_battle_logs(logs)
+
+    assert stats.kills_by_unit() == compute_kills_by_unit(logs) == {c: 1}
+    assert stats.action_counts == {
+        "ATTACK": 3,
+        "MISS": 1,
+        "MELEE_COMBO": 1,
+        "DESTROYED": 1,
+        "STRATEGY_CHANGED": 1,
+    }
+    assert stats.strategy_transitions == [("AGGRESSIVE", "RETREAT")]
+
+    unit_a = stats.unit(a)
+    assert unit_a.damage_dealt == 650
+    assert unit_a.dodge_count == 1
+    assert unit_a.max_hit_damage == 500
+    assert unit_a.weapon_usage == {"BR": 1, "BZ": 2}
+    assert unit_a.signature_weapon_name == "BZ"
+    assert unit_a.action_counts == {"ATTACK": 3, "STRATEGY_CHANGED": 1}
+
+    unit_b = stats.unit(b)
+    assert unit_b.damage_taken == 1050
+    assert unit_b.damage_taken_count == 3
+    assert unit_b.attacks_received_count == 3
+    assert stats.unit(uuid.UUID(int=99)).kills == 0
+
+    # 集計済みの結果を渡した場合もログから集計した場合と同じダイジェストになること
+    player = create_player()
+    player.id = a
+    assert compute_digest_stats(
+        player, [], 0, "WIN", 100, 5000, log_stats=stats
+    ) == compute_digest_stats(player, logs, 0, "WIN", 100, 5000)
+
+
 def test_compute_digest_stats_no_damage_taken():
     """被弾なしで勝利した場合、damage_severity は無傷になる."""
     player = create_player(current_hp=1000, max_hp=1000)
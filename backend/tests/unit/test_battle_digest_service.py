@@ -13,6 +13,7 @@ from app.models.models import BattleResult, MobileSuit
 from app.services.battle_digest_service import (
     compute_battle_digest_fields,
     get_previous_digest_text,
+    get_previous_digest_texts,
 )
 
 
@@ -56,6 +57,32 @@ def test_get_previous_digest_text_returns_latest():
     assert get_previous_digest_text(session, "user1") == "新しい一言ログ"
 
 
+def test_get_previous_digest_texts_matches_single_lookup():
+    """一括取得の結果がユーザーごとの get_previous_digest_text と一致すること."""
+    session = _make_session()
+    for user_id, month, text in [
+        ("user1", 1, "user1 古い"),
+        ("user1", 3, "user1 新しい"),
+        ("user2", 2, "user2 のみ"),
+        ("user3", 1, "対象外"),
+    ]:
+        session.add(
+            BattleResult(
+                user_id=user_id,
+                win_loss="WIN",
+                digest_text=text,
+                created_at=datetime(2026, month, 1, tzinfo=UTC),
+            )
+        )
+    session.commit()
+
+    texts = get_previous_digest_texts(session, ["user1", "user2", "user_new"])
+    assert texts == {"user1": "user1 新しい", "user2": "user2 のみ"}
+    for user_id in ("user1", "user2"):
+        assert texts[user_id] == get_previous_digest_text(session, user_id)
+    assert get_previous_digest_texts(session, []) == {}
+
+
 def test_compute_battle_digest_fields_returns_battle_result_ready_dict():
     """BattleResult(**dict)にそのまま展開できるキー・値を返す."""
     session = _make_session()
@@ -0,0 +1,148 @@
+"""Tests for the compact binary replay format (battle_replay_codec).
+
+- 実際のバトルログ（保存時と同じ dict）が往復で復元されること
+  （座標・速度・向き・timestamp は量子化の誤差内、それ以外は完全一致）
+- 想定外の型・未知のキーは JSON として完全に復元されること
+- フレーム分割・逐次エンコードの結果が一括エンコードと同じであること
+- 不正なデータは ReplayDecodeError になること
+"""
+
+import json
+import uuid
+
+import pytest
+
+from app.engine.battle_utils import strip_debug_fields
+from app.engine.constants import LOG_LEVEL_REPLAY
+from app.engine.simulation import BattleSimulator
+from app.models.models import MobileSuit, Vector3, Weapon
+from app.services.battle_replay_codec import (
+    ReplayDecodeError,
+    ReplayEncoder,
+    decode_replay,
+    encode_replay,
+)
+
+# 量子化による最大誤差（丸めの半分 + 浮動小数点誤差）
+_VECTOR_TOLERANCE = 0.005 + 1e-9
+_TIMESTAMP_TOLERANCE = 0.0005 + 1e-9
+_HEADING_TOLERANCE = 0.005 + 1e-9
+
+
+def _make_unit(i: int, team_id: str) -> MobileSuit:
+    return MobileSuit(
+        id=uuid.UUID(int=i + 1),
+        name=f"u{i}",
+        max_hp=300,
+        current_hp=300,
+        armor=0,
+        mobility=1.0,
+        position=Vector3(x=150.0 * i, y=0.0, z=40.0 * (i % 2)),
+        sensor_range=800.0,
+        side="PLAYER" if team_id == "A" else "ENEMY",
+        team_id=team_id,
+        weapons=[
+            Weapon(id="br", name="ビームライフル", power=40, range=600, accuracy=80)
+        ],
+    )
+
+
+@pytest.fixture(scope="module")
+def battle_entries() -> list[dict]:
+    """保存・配信時と同じ形式（JSON 往復済み）の実バトルログ."""
+    units = [_make_unit(i, "A" if i < 3 else "B") for i in range(6)]
+    sim = BattleSimulator(units[0], units[1:], seed=7, log_level=LOG_LEVEL_REPLAY)
+    for _ in range(150):
+        if sim.is_finished:
+            break
+        sim.step()
+    return json.loads(json.dumps(strip_debug_fields(sim.logs), default=str))
+
+
+def _assert_close(original: dict, decoded: dict) -> None:
+    assert list(decoded) == list(original)
+    for key, value in original.items():
+        restored = decoded[key]
+        if value is None:
+            assert restored is None
+        elif key in ("position_snapshot", "velocity_snapshot"):
+            for axis in ("x", "y", "z"):
+                assert restored[axis] == pytest.approx(
+                    value[axis], abs=_VECTOR_TOLERANCE
+                )
+        elif key == "timestamp":
+            assert restored == pytest.approx(value, abs=_TIMESTAMP_TOLERANCE)
+        elif key == "heading":
+            assert restored == pytest.approx(value, abs=_HEADING_TOLERANCE)
+        else:
+            assert restored == value, key
+
+
+def test_round_trip_of_battle_logs(battle_entries: list[dict]) -> None:
+    """実バトルのログが往復で復元され、NDJSON より大幅に小さいこと."""
+    assert len(battle_entries) > 100
+    data = b"".join(encode_replay(battle_entries))
+    decoded = decode_replay(data)
+
+    assert len(decoded) == len(battle_entries)
+    for original, restored in zip(battle_entries, decoded, strict=True):
+        _assert_close(original, restored)
+
+    ndjson = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in battle_entries)
+    assert len(data) * 5 < len(ndjson.encode("utf-8"))
+
+
+def test_unexpected_values_round_trip_exactly() -> None:
+    """想定外の型・未知のキー・キー順は JSON として完全に復元されること."""
+    actor = str(uuid.UUID(int=1))
+    entries = [
+        {"msg": "from-neon"},
+        {
+            "actor_id": "not-a-uuid",
+            "damage": 12.5,
+            "is_crit": "yes",
+            "position_snapshot": {"x": 1, "y": "2", "z": 3},
+            "details": {"previous_strategy": "AGGRESSIVE", "nested": [1, None]},
+            "timestamp": 0.1,
+        },
+        {
+            "timestamp": 0.2,
+            "actor_id": actor,
+            "heading": -179.99,
+            "position_snapshot": {"x": -0.004, "y": 1e6, "z": 0},
+            "skill_activated": False,
+            "is_crit": True,
+            "target_id": None,
+        },
+    ]
+    decoded = decode_replay(b"".join(encode_replay(entries)))
+    assert decoded[:2] == entries[:2]
+    _assert_close(entries[2], decoded[2])
+
+
+def test_frames_and_incremental_encoding_match(battle_entries: list[dict]) -> None:
+    """フレームを細かく区切っても、逐次エンコードしても同じ内容に復元されること."""
+    whole = decode_replay(b"".join(encode_replay(battle_entries)))
+
+    small_frames = b"".join(encode_replay(battle_entries, frame_rows=7))
+    assert decode_replay(small_frames) == whole
+
+    encoder = ReplayEncoder(frame_rows=50)
+    chunks = [encoder.header()]
+    for start in range(0, len(battle_entries), 33):
+        chunks.append(encoder.encode(battle_entries[start : start + 33]))
+    chunks.append(encoder.finish())
+    assert decode_replay(b"".join(chunks)) == whole
+
+    assert decode_replay(b"".join(encode_replay([]))) == []
+
+
+def test_malformed_data_raises() -> None:
+    """ヘッダー違い・途中で切れたデータは ReplayDecodeError になること."""
+    data = b"".join(encode_replay([{"action_type": "MOVE", "damage": 3}]))
+    with pytest.raises(ReplayDecodeError):
+        decode_replay(b"{}\n")
+    with pytest.raises(ReplayDecodeError):
+        decode_replay(data[:4] + bytes([99]) + data[5:])
+    with pytest.raises(ReplayDecodeError):
+        decode_replay(data[:-3])
@@ -445,7 +445,7 @@ def test_boost_start_logged_on_boost_dash_action() -> None:
     )
     enemy = _make_unit("Enemy", "ENEMY", "ET", Vector3(x=2000, y=0, z=0))
     sim = BattleSimulator(player, [enemy])
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._step_count += 1  # 発見ステップの次ステップに進める（リアクション遅延を経過）
 
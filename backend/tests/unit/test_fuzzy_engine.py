@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import random
 from pathlib import Path
+from typing import Any
 
+import numpy as np
 import pytest
 
 from app.engine.fuzzy_engine import (
@@ -14,6 +17,7 @@ from app.engine.fuzzy_engine import (
     FuzzyRuleSet,
     TrapezoidMF,
     TriangleMF,
+    _defuzzify_centroid,
     _evaluate_rules,
     _fuzzify,
 )
@@ -587,3 +591,180 @@ class TestFuzzyRuleSetLoad:
         assert len(rs.rules) >= 10
         assert "distance_to_target" in rs.membership_functions
         assert "weapon_is_beam" in rs.membership_functions
+
+
+# ---------------------------------------------------------------------------
+# CompiledRuleSet（辞書ベース実装との等価性）
+# ---------------------------------------------------------------------------
+
+
+def _reference_infer(
+    rule_set: FuzzyRuleSet, inputs: dict[str, float]
+) -> tuple[dict[str, float], dict[str, Any]]:
+    """辞書ベースの関数群による推論（コンパイル前の基準実装）."""
+    fuzzified = _fuzzify(inputs, rule_set.membership_functions)
+    activations = _evaluate_rules(fuzzified, rule_set.rules)
+    debug = {"fuzzified": fuzzified, "activations": activations}
+    if not activations:
+        return {}, debug
+    return _defuzzify_centroid(activations, rule_set.membership_functions), debug
+
+
+def _random_inputs(rule_set: FuzzyRuleSet, rng: random.Random) -> dict[str, float]:
+    """サポート範囲外・境界値・欠損を含むランダム入力を生成する."""
+    inputs: dict[str, float] = {}
+    for var, mf_sets in rule_set.membership_functions.items():
+        if rng.random() < 0.1:
+            continue
+        lo = min(mf.support_range()[0] for mf in mf_sets.values())
+        hi = max(mf.support_range()[1] for mf in mf_sets.values())
+        margin = (hi - lo) * 0.2
+        if rng.random() < 0.1:
+            inputs[var] = rng.choice([lo, hi])
+        else:
+            inputs[var] = rng.uniform(lo - margin, hi + margin)
+    return inputs
+
+
+class TestCompiledRuleSet:
+    """コンパイル済みエンジンが辞書ベース実装と同一の結果を返すことのテスト."""
+
+    @pytest.mark.parametrize(
+        "json_path",
+        sorted(p for p in _FUZZY_RULES_DIR.glob("*.json") if p.name != "schema.json"),
+        ids=lambda p: p.stem,
+    )
+    def test_matches_dict_based_inference(self, json_path: Path) -> None:
+        """全ルールファイルで出力値・デバッグ情報（キー順含む）が完全一致する."""
+        engine = FuzzyEngine.from_json(json_path)
+        rng = random.Random(json_path.stem)
+        for _ in range(300):
+            inputs = _random_inputs(engine.rule_set, rng)
+            result, debug = engine.infer_with_debug(inputs)
+            expected, expected_debug = _reference_infer(engine.rule_set, inputs)
+            assert list(result.items()) == list(expected.items())
+            assert repr(debug) == repr(expected_debug)
+            assert engine.infer(inputs) == result
+            assert repr(engine.infer_activations(inputs)) == repr(
+                expected_debug["activations"]
+            )
+
+    def test_undefined_set_and_or_operator(self) -> None:
+        """未定義集合を参照する条件・OR ルール・重みが基準実装と一致する."""
+        rule_set = FuzzyRuleSet(
+            strategy="TEST",
+            layer="test",
+            rules=[
+                FuzzyRule(
+                    id="r1",
+                    conditions=[
+                        FuzzyCondition(variable="x", set="LOW"),
+                        FuzzyCondition(variable="x", set="UNDEFINED"),
+                    ],
+                    operator="OR",
+                    output=FuzzyOutput(variable="y", set="SMALL"),
+                    weight=0.8,
+                ),
+                FuzzyRule(
+                    id="r2",
+                    conditions=[FuzzyCondition(variable="x", set="HIGH")],
+                    operator="AND",
+                    output=FuzzyOutput(variable="y", set="BIG"),
+                ),
+            ],
+            membership_functions={
+                "x": {
+                    "LOW": TriangleMF(0.0, 0.0, 1.0),
+                    "HIGH": TriangleMF(0.0, 1.0, 1.0),
+                },
+                "y": {
+                    "SMALL": TriangleMF(0.0, 0.0, 0.5),
+                    "BIG": TrapezoidMF(0.3, 0.6, 1.0, 1.0),
+                },
+            },
+        )
+        engine = FuzzyEngine(rule_set=rule_set)
+        for x in (-1.0, 0.0, 0.25, 0.5, 0.9, 1.0, 2.0):
+            result, debug = engine.infer_with_debug({"x": x})
+            expected, expected_debug = _reference_infer(rule_set, {"x": x})
+            assert result == expected
+            assert debug == expected_debug
+
+
+class TestMaxActivation:
+    """FuzzyEngine.max_activation のテスト."""
+
+    def test_returns_label_with_highest_activation(self) -> None:
+        """活性化度が最大の集合名を返す."""
+        activations = {"action": {"MOVE": 0.2, "ATTACK": 0.7, "RETREAT": 0.1}}
+        assert FuzzyEngine.max_activation(activations, "action") == "ATTACK"
+
+    def test_tie_prefers_first_registered(self) -> None:
+        """同値の場合は先に登録された集合名を返す."""
+        activations = {"action": {"RETREAT": 0.5, "ATTACK": 0.5}}
+        assert FuzzyEngine.max_activation(activations, "action") == "RETREAT"
+
+    def test_missing_variable_returns_none(self) -> None:
+        """出力変数が無い・空の場合は None を返す."""
+        assert FuzzyEngine.max_activation({}, "action") is None
+        assert FuzzyEngine.max_activation({"action": {}}, "action") is None
+
+
+# ---------------------------------------------------------------------------
+# FuzzyEngine.infer_batch
+# ---------------------------------------------------------------------------
+
+
+class TestInferBatch:
+    """一括推論が要素ごとの単発推論と一致することのテスト."""
+
+    @pytest.mark.parametrize(
+        "json_path",
+        sorted(p for p in _FUZZY_RULES_DIR.glob("*.json") if p.name != "schema.json"),
+        ids=lambda p: p.stem,
+    )
+    def test_matches_infer(self, json_path: Path) -> None:
+        """各要素の値が infer() と一致し、infer() に無い出力は NaN になる."""
+        engine = FuzzyEngine.from_json(json_path)
+        rng = random.Random(json_path.stem)
+        for _ in range(20):
+            rows = [_random_inputs(engine.rule_set, rng) for _ in range(25)]
+            # 一括推論では全要素で同じ入力変数の組を使う
+            variables = set(rows[0])
+            rows = [
+                {var: row.get(var, rows[0][var]) for var in variables} for row in rows
+            ]
+            batch = engine.infer_batch(
+                {var: np.array([row[var] for row in rows]) for var in variables}
+            )
+            for i, row in enumerate(rows):
+                expected = engine.infer(row)
+                assert set(expected) <= set(batch)
+                for var, values in batch.items():
+                    if var in expected:
+                        assert values[i] == expected[var]
+                    else:
+                        assert np.isnan(values[i])
+
+    def test_default_output_for_non_firing_rows(self) -> None:
+        """全ルール不発火の要素はデフォルト出力で埋められる."""
+        rule_set = FuzzyRuleSet(
+            strategy="TEST",
+            layer="test",
+            rules=[
+                FuzzyRule(
+                    id="r1",
+                    conditions=[FuzzyCondition(variable="x", set="HIGH")],
+                    operator="AND",
+                    output=FuzzyOutput(variable="y", set="BIG"),
+                )
+            ],
+            membership_functions={
+                "x": {"HIGH": TriangleMF(0.5, 1.0, 1.0)},
+                "y": {"BIG": TriangleMF(0.0, 1.0, 1.0)},
+            },
+        )
+        engine = FuzzyEngine(rule_set=rule_set, default_output={"y": 0.25})
+        batch = engine.infer_batch({"x": np.array([0.0, 1.0])})
+        assert batch["y"][0] == 0.25
+        assert batch["y"][1] == engine.infer({"x": 1.0})["y"]
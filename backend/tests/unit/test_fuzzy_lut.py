@@ -0,0 +1,177 @@
+"""Tests for the precomputed fuzzy lookup table (FuzzyLookupTable).
+
+- 格子点ではテーブルの値が厳密推論と一致すること
+- 格子点以外でも誤差が小さく、スカラー版と一括版が同じ結果を返すこと
+- 近似できない入力では厳密推論にフォールバックすること
+- 保存・読み込み、ルール JSON のハッシュをキーにしたディスクキャッシュ
+- FuzzyRuleCache(lut_subdivisions=...) がターゲット・武器選択レイヤーにのみ付与すること
+"""
+
+from __future__ import annotations
+
+import itertools
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.engine.constants import FUZZY_RULES_DIR
+from app.engine.fuzzy_engine import FuzzyEngine
+from app.engine.fuzzy_lut import FuzzyLookupTable, load_or_build, lut_cache_path
+from app.engine.fuzzy_rule_cache import FuzzyRuleCache
+
+_TARGET_JSON = FUZZY_RULES_DIR / "aggressive_target_selection.json"
+
+
+@pytest.fixture(scope="module")
+def engine() -> FuzzyEngine:
+    """AGGRESSIVE のターゲット選択エンジン."""
+    return FuzzyEngine.from_json(_TARGET_JSON, default_output={"target_priority": 0.0})
+
+
+@pytest.fixture(scope="module")
+def table(engine: FuzzyEngine) -> FuzzyLookupTable:
+    """折れ点のみを格子にしたテーブル."""
+    return FuzzyLookupTable.build(engine, subdivisions=0)
+
+
+def _random_inputs(table: FuzzyLookupTable, n: int) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(0)
+    inputs = {
+        var: rng.uniform(axis[0], min(axis[-1], 200.0), n)
+        for var, axis in zip(table.variables, table.axes, strict=True)
+    }
+    # 真偽値の入力は 0/1 のみ
+    inputs["is_attacking_ally"] = rng.integers(0, 2, n).astype(float)
+    return inputs
+
+
+def test_lookup_matches_exact_at_grid_points(
+    engine: FuzzyEngine, table: FuzzyLookupTable
+) -> None:
+    """格子点ではテーブルの値が厳密推論と一致すること."""
+    for point in itertools.islice(itertools.product(*table.axes), 0, None, 7):
+        inputs = dict(zip(table.variables, map(float, point), strict=True))
+        approx = table.lookup(inputs)
+        if approx is None:
+            continue
+        exact = engine.infer_exact(inputs)
+        assert approx["target_priority"] == pytest.approx(
+            exact["target_priority"], abs=1e-9
+        )
+
+
+def test_lookup_error_is_small_and_scalar_matches_batch(
+    engine: FuzzyEngine, table: FuzzyLookupTable
+) -> None:
+    """格子点以外の誤差が小さく、スカラー版と一括版の結果が一致すること."""
+    inputs = _random_inputs(table, 2000)
+    result = table.lookup_batch(inputs)
+    assert result is not None
+    approx, inexact = result
+    exact = engine.infer_batch_exact(inputs)["target_priority"]
+
+    err = np.abs(approx["target_priority"] - exact)[~inexact]
+    assert inexact.mean() < 0.2
+    assert err.max() < 0.25
+    assert err.mean() < 0.02
+
+    for i in range(200):
+        scalar = table.lookup({var: float(col[i]) for var, col in inputs.items()})
+        if inexact[i]:
+            assert scalar is None
+        else:
+            assert scalar is not None
+            assert scalar["target_priority"] == approx["target_priority"][i]
+
+
+def test_engine_falls_back_to_exact_inference(
+    engine: FuzzyEngine, table: FuzzyLookupTable
+) -> None:
+    """入力が欠けている・余分な変数を含む場合は厳密推論の結果を返すこと."""
+    lut_engine = FuzzyEngine.from_json(
+        _TARGET_JSON, default_output={"target_priority": 0.0}
+    )
+    lut_engine.lookup_table = table
+
+    missing = {"target_hp_ratio": 0.3, "target_distance": 450.0}
+    assert table.lookup(missing) is None
+    assert lut_engine.infer(missing) == engine.infer_exact(missing)
+
+    extra = {
+        "target_hp_ratio": 0.3,
+        "target_distance": 450.0,
+        "target_attack_power": 30.0,
+        "is_attacking_ally": 0.0,
+        "target_priority": 0.5,
+    }
+    assert table.lookup(extra) is None
+    assert lut_engine.infer(extra) == engine.infer_exact(extra)
+
+    inputs = _random_inputs(table, 300)
+    result = table.lookup_batch(inputs)
+    assert result is not None
+    approx, inexact = result
+    batch = lut_engine.infer_batch(inputs)["target_priority"]
+    exact = engine.infer_batch_exact(inputs)["target_priority"]
+    np.testing.assert_array_equal(batch[inexact], exact[inexact])
+    np.testing.assert_array_equal(batch[~inexact], approx["target_priority"][~inexact])
+
+
+def test_save_and_load_round_trip(table: FuzzyLookupTable, tmp_path: Path) -> None:
+    """保存したテーブルを読み込むと同じ値を返し、壊れたファイルは None になること."""
+    path = tmp_path / "lut.npz"
+    table.save(path)
+    loaded = FuzzyLookupTable.load(path)
+    assert loaded is not None
+    assert loaded.variables == table.variables
+    np.testing.assert_array_equal(
+        loaded.values["target_priority"], table.values["target_priority"]
+    )
+    inputs = _random_inputs(table, 100)
+    first = table.lookup_batch(inputs)
+    second = loaded.lookup_batch(inputs)
+    assert first is not None and second is not None
+    np.testing.assert_array_equal(first[1], second[1])
+    np.testing.assert_array_equal(
+        first[0]["target_priority"], second[0]["target_priority"]
+    )
+
+    path.write_bytes(b"broken")
+    assert FuzzyLookupTable.load(path) is None
+    assert FuzzyLookupTable.load(tmp_path / "missing.npz") is None
+
+
+def test_disk_cache_is_keyed_by_rule_hash(engine: FuzzyEngine, tmp_path: Path) -> None:
+    """キャッシュファイルはルールのハッシュ・分割数ごとに作られ、再利用されること."""
+    path = lut_cache_path(tmp_path, "hash-a", engine, 0)
+    assert path != lut_cache_path(tmp_path, "hash-b", engine, 0)
+    assert path != lut_cache_path(tmp_path, "hash-a", engine, 1)
+
+    built = load_or_build(engine, "hash-a", 0, tmp_path)
+    assert path.exists()
+    cached = load_or_build(engine, "hash-a", 0, tmp_path)
+    assert cached is not built
+    np.testing.assert_array_equal(
+        cached.values["target_priority"], built.values["target_priority"]
+    )
+
+
+def test_rule_cache_attaches_tables_to_selection_layers(tmp_path: Path) -> None:
+    """lut_subdivisions 指定時、ターゲット・武器選択レイヤーにのみテーブルが付くこと."""
+    rules_dir = tmp_path / "fuzzy_rules"
+    rules_dir.mkdir()
+    for suffix in ("", "_target_selection", "_weapon_selection"):
+        name = f"aggressive{suffix}.json"
+        (rules_dir / name).write_bytes((FUZZY_RULES_DIR / name).read_bytes())
+
+    engines = FuzzyRuleCache(
+        rules_dir, lut_subdivisions=0, lut_cache_dir=tmp_path / "lut"
+    ).get_engines()["AGGRESSIVE"]
+    assert engines["behavior"].lookup_table is None
+    assert engines["target"].lookup_table is not None
+    assert engines["weapon"].lookup_table is not None
+    assert len(list((tmp_path / "lut").glob("*.npz"))) == 2
+
+    plain = FuzzyRuleCache(rules_dir).get_engines()["AGGRESSIVE"]
+    assert plain["target"].lookup_table is None
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from app.engine.fuzzy_engine import FuzzyEngine
-from app.engine.fuzzy_rule_cache import FuzzyRuleCache
+from app.engine.fuzzy_rule_cache import (
+    FuzzyRuleCache,
+    get_shared_rule_cache,
+    invalidate_shared_rule_caches,
+)
 
 # ---------------------------------------------------------------------------
 # テスト用ファジィルール JSON（最小限の有効な構造）
@@ -238,3 +243,81 @@ def test_hot_reload_disabled_uses_snapshot(tmp_path: Path) -> None:
 
     # ホットリロード無効時は常に同一スナップショットオブジェクトを返す
     assert engines_first is engines_second
+
+
+# ---------------------------------------------------------------------------
+# プロセス共有レジストリ
+# ---------------------------------------------------------------------------
+
+
+def test_shared_rule_cache_is_reused(tmp_path: Path) -> None:
+    """同じディレクトリに対しては同一の FuzzyRuleCache が返される."""
+    rules_dir = _make_test_rules_dir(tmp_path)
+    try:
+        first = get_shared_rule_cache(rules_dir)
+        assert get_shared_rule_cache(rules_dir) is first
+        invalidate_shared_rule_caches()
+        # 破棄後は新しいインスタンスが生成される
+        assert get_shared_rule_cache(rules_dir) is not first
+    finally:
+        invalidate_shared_rule_caches()
+
+
+def test_shared_rule_cache_concurrent_access(tmp_path: Path) -> None:
+    """複数スレッドから同時に取得しても1インスタンスのみ生成される."""
+    rules_dir = _make_test_rules_dir(tmp_path)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            caches = list(
+                pool.map(lambda _: get_shared_rule_cache(rules_dir), range(32))
+            )
+        assert all(cache is caches[0] for cache in caches)
+    finally:
+        invalidate_shared_rule_caches()
+
+
+def test_snapshot_not_mutated_by_reload(tmp_path: Path) -> None:
+    """再ロード後も以前に取得したエンジン辞書は変更されない（copy-on-write）."""
+    rules_dir = _make_test_rules_dir(tmp_path)
+    cache = FuzzyRuleCache(rules_dir)
+    snapshot = cache.snapshot()
+    behavior_before = snapshot["AGGRESSIVE"]["behavior"]
+
+    modified_json = dict(_MINIMAL_FUZZY_JSON)
+    modified_json["rules"] = []
+    _write_json(rules_dir / "aggressive.json", modified_json)
+    engines = cache.get_engines()
+
+    assert engines["AGGRESSIVE"]["behavior"] is not behavior_before
+    assert snapshot["AGGRESSIVE"]["behavior"] is behavior_before
+    cache.force_reload_all()
+    assert snapshot["AGGRESSIVE"]["behavior"] is behavior_before
+
+
+def test_simulators_share_engines() -> None:
+    """BattleSimulator 間でルールキャッシュとエンジンが共有される."""
+    from app.engine.simulation import BattleSimulator
+    from app.models.models import MobileSuit, Vector3
+
+    def _make_ms(name: str, side: str, team_id: str) -> MobileSuit:
+        return MobileSuit(
+            name=name,
+            max_hp=100,
+            current_hp=100,
+            armor=10,
+            mobility=2.0,
+            position=Vector3(x=0, y=0, z=0),
+            side=side,
+            team_id=team_id,
+        )
+
+    sims = [
+        BattleSimulator(
+            _make_ms("Player", "PLAYER", "PLAYER_TEAM"),
+            enemies=[_make_ms("Enemy", "ENEMY", "ENEMY_TEAM")],
+        )
+        for _ in range(2)
+    ]
+    assert sims[0]._rule_cache is sims[1]._rule_cache
+    assert sims[0]._fuzzy_engine is sims[1]._fuzzy_engine
+    assert sims[0]._fuzzy_engine is sims[0]._strategy_engines["AGGRESSIVE"]["behavior"]
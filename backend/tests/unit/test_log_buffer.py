@@ -0,0 +1,136 @@
+"""Tests for BattleLogBuffer (列指向バトルログバッファ).
+
+- BattleLog 互換のアクセス（添字・スライス・反復）で元のログと同じ内容になること
+- to_dicts() / iter_ndjson() が model_dump() と同じ内容・キー順になること
+- ダイジェスト集計がリストとバッファで同じ結果になること
+"""
+
+import json
+import random
+import uuid
+
+import numpy as np
+
+from app.engine.battle_digest import compute_digest_stats, compute_unit_kills
+from app.engine.battle_utils import strip_debug_fields
+from app.engine.log_buffer import BattleLogBuffer, iter_log_fields
+from app.engine.simulation import BattleSimulator
+from app.models.models import BattleLog, MobileSuit, Vector3, Weapon
+
+
+def _make_unit(name: str, team_id: str, x: float, z: float, i: int) -> MobileSuit:
+    return MobileSuit(
+        id=uuid.UUID(int=i + 1),
+        name=name,
+        max_hp=250,
+        current_hp=250,
+        armor=5,
+        mobility=1.2,
+        position=Vector3(x=x, y=0.0, z=z),
+        sensor_range=900.0,
+        side="PLAYER" if team_id == "A" else "ENEMY",
+        team_id=team_id,
+        weapons=[
+            Weapon(id=f"w_{name}", name="Rifle", power=45, range=500, accuracy=75)
+        ],
+    )
+
+
+def _run_battle() -> BattleSimulator:
+    rng = random.Random(11)
+    units = [
+        _make_unit(f"u{i}", "AB"[i % 2], rng.uniform(0, 1200), rng.uniform(0, 1200), i)
+        for i in range(6)
+    ]
+    random.seed(11)
+    sim = BattleSimulator(units[0], units[1:])
+    for _ in range(400):
+        if sim.is_finished:
+            break
+        sim.step()
+    return sim
+
+
+def test_record_and_append_round_trip() -> None:
+    """record() / append() した行が BattleLog として同じ値で取り出せること."""
+    actor, target = uuid.UUID(int=1), uuid.UUID(int=2)
+    buffer = BattleLogBuffer()
+    buffer.record(
+        timestamp=0.5,
+        actor_id=actor,
+        action_type="ATTACK",
+        message="hit",
+        position_snapshot=Vector3(x=1.0, y=2.0, z=3.0),
+        target_id=target,
+        damage=42,
+        velocity_snapshot=np.array([4.0, 5.0, 6.0]),
+        heading=90.0,
+        weapon_name="Rifle",
+        is_crit=True,
+    )
+    eager = BattleLog(
+        timestamp=1.0,
+        actor_id=target,
+        action_type="STRATEGY_CHANGED",
+        message="changed",
+        position_snapshot=Vector3(),
+        details={"rule_id": "T01"},
+    )
+    buffer.append(eager)
+    buffer.record_deferred(
+        "MOVE_SEARCH",
+        {"actor_name": "A", "distance": 300},
+        timestamp=1.5,
+        actor_id=actor,
+        action_type="MOVE",
+        position_snapshot=Vector3(x=7.0),
+    )
+
+    assert len(buffer) == 3
+    first = buffer[0]
+    assert first.target_id == target
+    assert first.damage == 42
+    assert first.velocity_snapshot == Vector3(x=4.0, y=5.0, z=6.0)
+    assert first.weapon_name == "Rifle" and first.is_crit
+    assert buffer[1] == eager
+    assert buffer[-1].message == "Aが索敵中 (残距離: 300m)"
+    assert [log.action_type for log in buffer[1:]] == ["STRATEGY_CHANGED", "MOVE"]
+
+
+def test_exports_match_model_dump() -> None:
+    """to_dicts() / iter_ndjson() が BattleLog の model_dump() と一致すること."""
+    sim = _run_battle()
+    models = sim.logs.to_models()
+    assert len(models) == len(sim.logs) > 0
+
+    expected = [log.model_dump() for log in models]
+    dicts = sim.logs.to_dicts()
+    assert dicts == expected
+    assert [list(d) for d in dicts] == [list(d) for d in expected]
+
+    lines = list(sim.logs.iter_ndjson())
+    assert [json.loads(line) for line in lines] == [
+        json.loads(log.model_dump_json()) for log in models
+    ]
+
+    assert strip_debug_fields(sim.logs) == strip_debug_fields(models)
+
+
+def test_digest_queries_match_list() -> None:
+    """iter_log_fields() と撃破数・ダイジェスト集計がリストと同じ結果になること."""
+    sim = _run_battle()
+    models = sim.logs.to_models()
+    names = ("action_type", "actor_id", "target_id", "damage", "heading")
+    assert list(iter_log_fields(sim.logs, *names)) == list(
+        iter_log_fields(models, *names)
+    )
+
+    player = sim.player
+    kills = compute_unit_kills(sim.logs, player.id)
+    assert kills == compute_unit_kills(models, player.id)
+    assert sum(compute_unit_kills(sim.logs, u.id) for u in sim.units) == sum(
+        1 for log in models if log.action_type == "DESTROYED"
+    )
+    assert compute_digest_stats(
+        player, sim.logs, kills, "WIN", 100, 5000
+    ) == compute_digest_stats(player, models, kills, "WIN", 100, 5000)
@@ -0,0 +1,140 @@
+"""Tests for battle log levels and deferred log messages.
+
+- record_deferred() のメッセージが BattleLog 生成時・書き出し時に生成され、
+  通常メッセージの行と同じ内容・キー順になること
+- log_level ごとに記録される action_type が絞り込まれること
+- log_level によって戦闘結果（乱数消費・勝敗）が変わらないこと
+"""
+
+import random
+import uuid
+
+import pytest
+
+from app.engine.battle_utils import strip_debug_fields
+from app.engine.constants import (
+    LOG_ACTION_TYPE_LEVELS,
+    LOG_LEVEL_DEBUG,
+    LOG_LEVEL_DIGEST,
+    LOG_LEVEL_REPLAY,
+)
+from app.engine.log_buffer import BattleLogBuffer
+from app.engine.simulation import BattleSimulator
+from app.models.models import BattleLog, MobileSuit, Vector3, Weapon
+
+_FIELDS = {
+    "timestamp": 1.5,
+    "actor_id": uuid.UUID(int=1),
+    "action_type": "MOVE",
+    "position_snapshot": Vector3(x=1.0, y=2.0, z=3.0),
+}
+_ARGS = {"actor_name": "ザク", "distance": 120}
+_EXPECTED_MESSAGE = "ザクが索敵中 (残距離: 120m)"
+
+
+def _make_unit(
+    name: str, team_id: str, x: float, z: float, unit_id: int = 0
+) -> MobileSuit:
+    return MobileSuit(
+        # 集合の走査順が UUID に依存するため、シード再現用に ID を固定する
+        id=uuid.UUID(int=unit_id + 1),
+        name=name,
+        max_hp=300,
+        current_hp=300,
+        armor=5,
+        mobility=1.2,
+        position=Vector3(x=x, y=0.0, z=z),
+        sensor_range=900.0,
+        side="PLAYER" if team_id == "A" else "ENEMY",
+        team_id=team_id,
+        weapons=[
+            Weapon(id=f"w_{name}", name="Rifle", power=40, range=500, accuracy=70)
+        ],
+    )
+
+
+def _run_battle(log_level: str, seed: int = 3) -> BattleSimulator:
+    rng = random.Random(seed)
+    units = [
+        _make_unit(f"u{i}", "AB"[i % 2], rng.uniform(0, 1500), rng.uniform(0, 1500), i)
+        for i in range(8)
+    ]
+    random.seed(seed)
+    sim = BattleSimulator(units[0], units[1:], log_level=log_level)
+    for _ in range(300):
+        if sim.is_finished:
+            break
+        sim.step()
+    return sim
+
+
+def test_deferred_message_renders_on_access() -> None:
+    """BattleLog として取り出した時点でテンプレートから生成されること."""
+    buffer = BattleLogBuffer()
+    buffer.record_deferred("MOVE_SEARCH", _ARGS, **_FIELDS)
+    assert buffer._messages[0] == ("MOVE_SEARCH", _ARGS)
+    assert buffer[0].message == _EXPECTED_MESSAGE
+    assert buffer[0] == BattleLog(message=_EXPECTED_MESSAGE, **_FIELDS)
+
+
+def test_deferred_message_exports_like_eager_log() -> None:
+    """保存・配信用の dict / NDJSON 書き出しが通常メッセージの行と一致すること."""
+    eager = BattleLogBuffer()
+    eager.record(message=_EXPECTED_MESSAGE, **_FIELDS)
+    deferred = BattleLogBuffer()
+    deferred.record_deferred("MOVE_SEARCH", _ARGS, **_FIELDS)
+
+    assert deferred.to_dicts() == eager.to_dicts()
+    assert list(deferred.to_dicts()[0]) == list(eager.to_dicts()[0])
+    assert list(deferred.iter_ndjson()) == list(eager.iter_ndjson())
+    assert strip_debug_fields(deferred)[0]["message"] == _EXPECTED_MESSAGE
+
+
+def test_unknown_log_level_raises() -> None:
+    """未知の log_level は ValueError になること."""
+    unit = _make_unit("a", "A", 0.0, 0.0)
+    with pytest.raises(ValueError):
+        BattleSimulator(
+            unit, [_make_unit("b", "B", 100.0, 0.0, 1)], log_level="VERBOSE"
+        )
+
+
+def test_log_levels_filter_action_types() -> None:
+    """DIGEST はダイジェスト用ログのみ、REPLAY は AI_DECISION と fuzzy_scores を除くこと."""
+    debug = _run_battle(LOG_LEVEL_DEBUG)
+    replay = _run_battle(LOG_LEVEL_REPLAY)
+    digest = _run_battle(LOG_LEVEL_DIGEST)
+
+    debug_types = {log.action_type for log in debug.logs}
+    assert "AI_DECISION" in debug_types
+    assert any(log.fuzzy_scores for log in debug.logs)
+
+    assert {log.action_type for log in replay.logs} == debug_types - {"AI_DECISION"}
+    assert all(log.fuzzy_scores is None for log in replay.logs)
+
+    digest_types = {
+        t for t, level in LOG_ACTION_TYPE_LEVELS.items() if level == LOG_LEVEL_DIGEST
+    }
+    assert {log.action_type for log in digest.logs} <= digest_types
+    assert len(digest.logs) < len(replay.logs) < len(debug.logs)
+
+
+def test_log_level_does_not_change_outcome() -> None:
+    """log_level によらず、同じシードなら同じ戦闘結果・同じ共通ログになること."""
+    debug = _run_battle(LOG_LEVEL_DEBUG)
+    digest = _run_battle(LOG_LEVEL_DIGEST)
+
+    assert debug.elapsed_time == digest.elapsed_time
+    assert [u.current_hp for u in debug.units] == [u.current_hp for u in digest.units]
+    assert [u.position for u in debug.units] == [u.position for u in digest.units]
+
+    kept = [
+        (log.timestamp, log.action_type, log.message, log.damage)
+        for log in debug.logs
+        if log.action_type in LOG_ACTION_TYPE_LEVELS
+        and LOG_ACTION_TYPE_LEVELS[log.action_type] == LOG_LEVEL_DIGEST
+    ]
+    assert kept == [
+        (log.timestamp, log.action_type, log.message, log.damage) for log in digest.logs
+    ]
+    assert kept, "攻撃が発生するケースであること"
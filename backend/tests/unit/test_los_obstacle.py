@@ -9,6 +9,7 @@ Validates:
 6. last_known_enemy_position tracking in _search_movement()
 7. Backward compatibility when obstacles = []
 8. _get_units_in_weapon_range() performance helper
+9. Per-step LOS cache and precomputed obstacle arrays
 """
 
 from unittest.mock import patch
@@ -214,7 +215,7 @@ def test_detection_passes_without_obstacle_on_ray() -> None:
     obs = _make_obstacle("obs1", 500.0, 0.0, 300.0, 100.0)  # 射線横
     sim = BattleSimulator(player, [enemy], obstacles=[obs])
 
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
 
     player_team_id = player.team_id
@@ -232,7 +233,7 @@ def test_detection_los_lost_stores_last_known_position() -> None:
 
     # 最初は障害物なしで発見させる（パッチで確率判定を常に成功させる）
     sim = BattleSimulator(player, [enemy])
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     assert enemy.id in sim.team_detected_units[player.team_id]
 
@@ -256,7 +257,7 @@ def test_detection_no_obstacles_backward_compatible() -> None:
     enemy = _make_unit("Enemy", "ENEMY", "ET", Vector3(x=500, y=0, z=0))
     sim = BattleSimulator(player, [enemy])  # obstacles なし
 
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
 
     assert enemy.id in sim.team_detected_units[player.team_id], (
@@ -561,3 +562,51 @@ def test_full_simulation_without_obstacles_unchanged() -> None:
 
     # シミュレーションが完了すること
     assert sim.is_finished or any(u.current_hp <= 0 for u in sim.units)
+
+
+# ---------------------------------------------------------------------------
+# 9. LOS キャッシュ・障害物配列の事前構築
+# ---------------------------------------------------------------------------
+
+
+def test_check_los_cache_is_symmetric_within_step() -> None:
+    """同一ステップ内では向きを問わず同じペアの LOS を再計算しないこと."""
+    player = _make_unit("Player", "PLAYER", "PT", Vector3(x=0, y=0, z=0))
+    enemy = _make_unit("Enemy", "ENEMY", "ET", Vector3(x=1000, y=0, z=0))
+    obs = _make_obstacle("obs1", 500.0, 0.0, 0.0, 100.0)
+    sim = BattleSimulator(player, [enemy], obstacles=[obs])
+    sim._unit_state.load(sim.unit_resources)
+
+    assert sim._check_los(player, enemy) is False
+    assert sim._check_los(enemy, player) is False
+    assert len(sim._los_cache) == 1
+
+
+def test_check_los_recomputed_after_move() -> None:
+    """ユニットが移動した後は LOS キャッシュが無効化され再計算されること."""
+    player = _make_unit("Player", "PLAYER", "PT", Vector3(x=0, y=0, z=0))
+    enemy = _make_unit("Enemy", "ENEMY", "ET", Vector3(x=1000, y=0, z=0))
+    obs = _make_obstacle("obs1", 500.0, 0.0, 0.0, 100.0)
+    sim = BattleSimulator(player, [enemy], obstacles=[obs])
+    sim._unit_state.load(sim.unit_resources)
+
+    assert sim._check_los(player, enemy) is False
+    sim._set_unit_position(enemy, np.array([1000.0, 0.0, 800.0]))
+    assert sim._check_los(player, enemy) is True
+
+
+def test_obstacle_arrays_rebuilt_when_obstacles_replaced() -> None:
+    """self.obstacles を差し替えた場合は障害物配列と LOS キャッシュが再構築されること."""
+    player = _make_unit("Player", "PLAYER", "PT", Vector3(x=0, y=0, z=0))
+    enemy = _make_unit("Enemy", "ENEMY", "ET", Vector3(x=1000, y=0, z=0))
+    sim = BattleSimulator(
+        player, [enemy], obstacles=[_make_obstacle("obs1", 500.0, 0.0, 300.0, 100.0)]
+    )
+    sim._unit_state.load(sim.unit_resources)
+    assert sim._check_los(player, enemy) is True
+
+    sim.obstacles = [_make_obstacle("obs2", 500.0, 0.0, 0.0, 100.0)]
+    centers, radii = sim._get_obstacle_arrays()
+    assert centers.tolist() == [[500.0, 0.0, 0.0]]
+    assert radii.tolist() == [100.0]
+    assert sim._check_los(player, enemy) is False
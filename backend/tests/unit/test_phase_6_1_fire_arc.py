@@ -151,7 +151,7 @@ def test_update_body_heading_turns_toward_target() -> None:
     sim = BattleSimulator(player, [enemy])
 
     # 検出フェーズ実行（確率判定を常に成功させる）
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._step_count += 1  # 発見ステップの次ステップに進める（リアクション遅延を経過）
 
@@ -361,7 +361,7 @@ def test_ai_decision_includes_angle_to_target() -> None:
     enemy = _make_unit("Enemy", "ENEMY", "ET", Vector3(x=500, y=0, z=0))
 
     sim = BattleSimulator(player, [enemy])
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._step_count += 1  # 発見ステップの次ステップに進める（リアクション遅延を経過）
 
@@ -422,7 +422,7 @@ def test_angle_to_target_180_via_fuzzy_log() -> None:
     enemy = _make_unit("Enemy", "ENEMY", "ET", Vector3(x=-500, y=0, z=0))
 
     sim = BattleSimulator(player, [enemy])
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     uid = str(player.id)
     sim.unit_resources[uid]["body_heading_deg"] = 0.0  # 正面 = +x, 敵は -x (180°)
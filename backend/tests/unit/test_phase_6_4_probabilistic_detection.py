@@ -85,7 +85,7 @@ def test_detection_probability_at_zero_distance() -> None:
 
     sim = BattleSimulator(player, [enemy], environment="SPACE")
     # random.random() が最大値 (0.9999) でも prob=1.0 なので常に発見
-    with patch("app.engine.targeting.random.random", return_value=0.9999):
+    with patch("random.random", return_value=0.9999):
         sim._detection_phase()
 
     assert enemy.id in sim.team_detected_units["PLAYER_TEAM"]
@@ -107,7 +107,7 @@ def test_detection_probability_at_effective_range() -> None:
     sim = BattleSimulator(player, [enemy], environment="SPACE")
     # ratio = 500/500 = 1.0, prob = max(0, 1-1^2) = 0 → 発見不可
     # random.random() の値に関わらず発見されない
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
 
     assert enemy.id not in sim.team_detected_units["PLAYER_TEAM"]
@@ -128,7 +128,7 @@ def test_detection_probability_outside_sensor_range() -> None:
     )
 
     sim = BattleSimulator(player, [enemy], environment="SPACE")
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
 
     assert enemy.id not in sim.team_detected_units["PLAYER_TEAM"]
@@ -148,7 +148,7 @@ def test_detection_succeeds_when_random_below_prob() -> None:
     enemy = _make_ms("Enemy", "ENEMY", "ENEMY_TEAM", Vector3(x=distance, y=0, z=0))
 
     sim = BattleSimulator(player, [enemy], environment="SPACE")
-    with patch("app.engine.targeting.random.random", return_value=0.74):
+    with patch("random.random", return_value=0.74):
         sim._detection_phase()
 
     assert enemy.id in sim.team_detected_units["PLAYER_TEAM"]
@@ -168,7 +168,7 @@ def test_detection_fails_when_random_above_prob() -> None:
     enemy = _make_ms("Enemy", "ENEMY", "ENEMY_TEAM", Vector3(x=distance, y=0, z=0))
 
     sim = BattleSimulator(player, [enemy], environment="SPACE")
-    with patch("app.engine.targeting.random.random", return_value=0.75):
+    with patch("random.random", return_value=0.75):
         sim._detection_phase()
 
     assert enemy.id not in sim.team_detected_units["PLAYER_TEAM"]
@@ -197,7 +197,7 @@ def test_already_detected_skips_probability_check() -> None:
     sim.team_detected_units["PLAYER_TEAM"].add(enemy.id)
 
     # random.random() が高い値（確率判定なら失敗する値）でも、既発見なので維持される
-    with patch("app.engine.targeting.random.random", return_value=0.99):
+    with patch("random.random", return_value=0.99):
         sim._detection_phase()
 
     # 障害物なしの場合、既発見ユニットは発見済みリストから除外されない
@@ -255,7 +255,7 @@ def test_minovsky_detection_with_high_exponent() -> None:
     sim_detect = BattleSimulator(
         player, [enemy], environment="SPACE", special_effects=["MINOVSKY"]
     )
-    with patch("app.engine.targeting.random.random", return_value=minovsky_prob - 0.01):
+    with patch("random.random", return_value=minovsky_prob - 0.01):
         sim_detect._detection_phase()
     assert enemy.id in sim_detect.team_detected_units["PLAYER_TEAM"]
 
@@ -271,7 +271,7 @@ def test_minovsky_detection_with_high_exponent() -> None:
     sim_miss = BattleSimulator(
         player2, [enemy2], environment="SPACE", special_effects=["MINOVSKY"]
     )
-    with patch("app.engine.targeting.random.random", return_value=minovsky_prob + 0.01):
+    with patch("random.random", return_value=minovsky_prob + 0.01):
         sim_miss._detection_phase()
     assert enemy2.id not in sim_miss.team_detected_units["PLAYER_TEAM"]
 
@@ -295,7 +295,7 @@ def test_detection_log_includes_probability_percentage() -> None:
     enemy = _make_ms("Enemy", "ENEMY", "ENEMY_TEAM", Vector3(x=distance, y=0, z=0))
 
     sim = BattleSimulator(player, [enemy], environment="SPACE")
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
 
     detection_logs = [log for log in sim.logs if log.action_type == "DETECTION"]
@@ -320,7 +320,7 @@ def test_minovsky_detection_log_includes_probability_percentage() -> None:
     sim = BattleSimulator(
         player, [enemy], environment="SPACE", special_effects=["MINOVSKY"]
     )
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
 
     detection_logs = [log for log in sim.logs if log.action_type == "DETECTION"]
@@ -451,7 +451,7 @@ class TestLosObstacleIntegration:
         enemy = self._make_unit("E", "ENEMY", "ET", Vector3(x=500, y=0, z=0))
         sim = BattleSimulator(player, [enemy], obstacles=[])
 
-        with patch("app.engine.targeting.random.random", return_value=0.0):
+        with patch("random.random", return_value=0.0):
             sim._detection_phase()
 
         assert enemy.id in sim.team_detected_units[player.team_id], (
@@ -307,7 +307,7 @@ class TestCalculateHitBaseDamageNewFormula:
         log_base = "Test"
 
         # 非クリティカルを強制
-        with patch("app.engine.combat.random.random", return_value=1.0):
+        with patch("random.random", return_value=1.0):
             base_damage, msg, _ = sim._calculate_hit_base_damage(
                 player, enemy, weapon, log_base
             )
@@ -326,7 +326,7 @@ class TestCalculateHitBaseDamageNewFormula:
         sim, player, enemy = self._make_sim_with_units(target_armor=9999)
         weapon = _make_weapon(power=200)
 
-        with patch("app.engine.combat.random.random", return_value=1.0):
+        with patch("random.random", return_value=1.0):
             base_damage, _, _ = sim._calculate_hit_base_damage(
                 player, enemy, weapon, ""
             )
@@ -341,7 +341,7 @@ class TestCalculateHitBaseDamageNewFormula:
         sim, player, enemy = self._make_sim_with_units(target_armor=200)
         weapon = _make_weapon(power=50)
 
-        with patch("app.engine.combat.random.random", return_value=1.0):
+        with patch("random.random", return_value=1.0):
             base_damage, _, _ = sim._calculate_hit_base_damage(
                 player, enemy, weapon, ""
             )
@@ -355,7 +355,7 @@ class TestCalculateHitBaseDamageNewFormula:
         weapon = _make_weapon(power=100)
 
         # クリティカルを強制
-        with patch("app.engine.combat.random.random", return_value=0.0):
+        with patch("random.random", return_value=0.0):
             base_damage, msg, _ = sim._calculate_hit_base_damage(
                 player, enemy, weapon, ""
             )
@@ -387,7 +387,7 @@ class TestCalculateHitBaseDamageNewFormula:
 
         # 非クリティカルでメレー武器を使用
         melee_w = _make_weapon(power=100, weapon_type="MELEE")
-        with patch("app.engine.combat.random.random", return_value=1.0):
+        with patch("random.random", return_value=1.0):
             base_damage, _, _ = sim._calculate_hit_base_damage(
                 player, enemy, melee_w, ""
             )
@@ -402,7 +402,7 @@ class TestCalculateHitBaseDamageNewFormula:
         sim, player, enemy = self._make_sim_with_units(target_armor=99999)
         weapon = _make_weapon(power=1)
 
-        with patch("app.engine.combat.random.random", return_value=1.0):
+        with patch("random.random", return_value=1.0):
             base_damage, _, _ = sim._calculate_hit_base_damage(
                 player, enemy, weapon, ""
             )
@@ -420,7 +420,7 @@ class TestCalculateHitBaseDamageNewFormula:
             player, [enemy], player_pilot_stats=PilotStats(sht=80)
         )
 
-        with patch("app.engine.combat.random.random", return_value=1.0):
+        with patch("random.random", return_value=1.0):
             dmg_low, _, _ = sim_low._calculate_hit_base_damage(
                 player, enemy, weapon, ""
             )
@@ -227,14 +227,14 @@ class TestFlankingAttractionVector:
     def test_no_flanking_force_when_level_0_and_roll_above_threshold(self) -> None:
         """Lv.0（確率 5%）のとき random=0.1（> 0.05）では発動しないこと."""
         player, enemy, sim = _make_sim(player_flanking=0)
-        with patch("app.engine.movement.random.random", return_value=0.1):
+        with patch("random.random", return_value=0.1):
             force = sim._flanking_attraction(player, enemy, dt=0.1)
         assert np.allclose(force, np.zeros(3))
 
     def test_flanking_force_nonzero_when_level3_activated(self) -> None:
         """Lv.3 で random=0.0（< 0.9）のとき非ゼロベクトルを返すこと."""
         player, enemy, sim = _make_sim(player_flanking=3)
-        with patch("app.engine.movement.random.random", return_value=0.0):
+        with patch("random.random", return_value=0.0):
             force = sim._flanking_attraction(player, enemy, dt=0.1)
         assert not np.allclose(force, np.zeros(3))
 
@@ -242,7 +242,7 @@ class TestFlankingAttractionVector:
         """EN 不足時はゼロベクトルを返してフォールバックすること."""
         player, enemy, sim = _make_sim(player_flanking=3, player_en=0.0)
         sim.unit_resources[str(player.id)]["current_en"] = 0.0
-        with patch("app.engine.movement.random.random", return_value=0.0):
+        with patch("random.random", return_value=0.0):
             force = sim._flanking_attraction(player, enemy, dt=0.1)
         assert np.allclose(force, np.zeros(3))
 
@@ -257,7 +257,7 @@ class TestFlankingAttractionVector:
         # enemy の body_heading_deg = 0 (デフォルト) → 正面=+X, 後方=-X
         sim.unit_resources[str(enemy.id)]["body_heading_deg"] = 0.0
 
-        with patch("app.engine.movement.random.random", return_value=0.0):
+        with patch("random.random", return_value=0.0):
             force = sim._flanking_attraction(player, enemy, dt=0.1)
 
         # 後方ポイントは (-30, 0, 0)、プレイヤーは (200, 0, 0) → 力は -X 方向
@@ -267,7 +267,7 @@ class TestFlankingAttractionVector:
     def test_flanking_force_zero_when_not_activated(self) -> None:
         """random=1.0（> 0.9）のとき Lv.3 でも発動しないこと."""
         player, enemy, sim = _make_sim(player_flanking=3)
-        with patch("app.engine.movement.random.random", return_value=1.0):
+        with patch("random.random", return_value=1.0):
             force = sim._flanking_attraction(player, enemy, dt=0.1)
         assert np.allclose(force, np.zeros(3))
 
@@ -287,7 +287,7 @@ class TestFlankingEnergyConsumption:
         dt = 0.1
         expected_cost = FLANKING_ENERGY_COST_RATE * DEFAULT_BOOST_EN_COST * dt
 
-        with patch("app.engine.movement.random.random", return_value=0.0):
+        with patch("random.random", return_value=0.0):
             sim._flanking_attraction(player, enemy, dt=dt)
 
         en_after = sim.unit_resources[str(player.id)]["current_en"]
@@ -298,7 +298,7 @@ class TestFlankingEnergyConsumption:
         player, enemy, sim = _make_sim(player_flanking=3, player_en=2000.0)
         en_before = sim.unit_resources[str(player.id)]["current_en"]
 
-        with patch("app.engine.movement.random.random", return_value=1.0):
+        with patch("random.random", return_value=1.0):
             sim._flanking_attraction(player, enemy, dt=0.1)
 
         en_after = sim.unit_resources[str(player.id)]["current_en"]
@@ -309,7 +309,7 @@ class TestFlankingEnergyConsumption:
         player, enemy, sim = _make_sim(player_flanking=3, player_en=0.0)
         sim.unit_resources[str(player.id)]["current_en"] = 0.0
 
-        with patch("app.engine.movement.random.random", return_value=0.0):
+        with patch("random.random", return_value=0.0):
             sim._flanking_attraction(player, enemy, dt=0.1)
 
         assert sim.unit_resources[str(player.id)]["current_en"] == pytest.approx(0.0)
@@ -329,7 +329,7 @@ class TestFlankingIntegration:
         sim.unit_resources[str(player.id)]["current_action"] = "RETREAT"
         en_before = sim.unit_resources[str(player.id)]["current_en"]
 
-        with patch("app.engine.movement.random.random", return_value=0.0):
+        with patch("random.random", return_value=0.0):
             sim._calculate_potential_field(player, enemy, dt=0.1)
 
         assert sim.unit_resources[str(player.id)]["current_en"] == pytest.approx(
@@ -345,7 +345,7 @@ class TestFlankingIntegration:
         # Lv.3: random=0.0 で常に発動 (0.0 <= 0.90)
         player3, enemy3, sim3 = _make_sim(player_flanking=3, player_en=10000.0)
         en_start3 = sim3.unit_resources[str(player3.id)]["current_en"]
-        with patch("app.engine.movement.random.random", return_value=0.0):
+        with patch("random.random", return_value=0.0):
             for _ in range(n_steps):
                 sim3._flanking_attraction(player3, enemy3, dt=dt)
         en_consumed3 = en_start3 - sim3.unit_resources[str(player3.id)]["current_en"]
@@ -353,7 +353,7 @@ class TestFlankingIntegration:
         # Lv.0: random=1.0 で常に不発動 (1.0 > 0.05)
         player0, enemy0, sim0 = _make_sim(player_flanking=0, player_en=10000.0)
         en_start0 = sim0.unit_resources[str(player0.id)]["current_en"]
-        with patch("app.engine.movement.random.random", return_value=1.0):
+        with patch("random.random", return_value=1.0):
             for _ in range(n_steps):
                 sim0._flanking_attraction(player0, enemy0, dt=dt)
         en_consumed0 = en_start0 - sim0.unit_resources[str(player0.id)]["current_en"]
@@ -387,7 +387,7 @@ class TestFlankingIntegration:
         dt = 0.5
         expected_cost = FLANKING_ENERGY_COST_RATE * DEFAULT_BOOST_EN_COST * dt
 
-        with patch("app.engine.movement.random.random", return_value=0.0):
+        with patch("random.random", return_value=0.0):
             sim._calculate_potential_field(player, enemy, dt=dt)
 
         en_after = sim.unit_resources[str(player.id)]["current_en"]
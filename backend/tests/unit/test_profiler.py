@@ -0,0 +1,124 @@
+"""Tests for step-level profiling (StepProfiler / BattleSimulator.profiler).
+
+- profile=True でフェーズ別の所要時間・各カウンタが集計されること
+- 無効時は何も集計せず、profiling() で区間を限定して有効にできること
+- 計測の有無でバトル結果が変わらないこと
+"""
+
+import json
+import uuid
+
+from app.engine.profiler import StepProfiler, format_profile
+from app.engine.simulation import BattleSimulator
+from app.models.models import MobileSuit, Obstacle, Vector3, Weapon
+
+
+def _make_sim(profile: bool = False) -> BattleSimulator:
+    units = [
+        MobileSuit(
+            id=uuid.UUID(int=i + 1),
+            name=f"u{i}",
+            max_hp=150,
+            current_hp=150,
+            armor=5,
+            mobility=1.2,
+            position=Vector3(x=200.0 * i, y=0.0, z=150.0 * (i % 2)),
+            sensor_range=1200.0,
+            side="PLAYER" if i % 2 == 0 else "ENEMY",
+            team_id="A" if i % 2 == 0 else "B",
+            weapons=[
+                Weapon(id=f"w{i}", name="Rifle", power=40, range=600, accuracy=75)
+            ],
+        )
+        for i in range(6)
+    ]
+    obstacles = [
+        Obstacle(
+            obstacle_id="obs0", position=Vector3(x=500.0, y=0.0, z=400.0), radius=60.0
+        )
+    ]
+    return BattleSimulator(
+        units[0], units[1:], obstacles=obstacles, seed=3, profile=profile
+    )
+
+
+def _run(sim: BattleSimulator, steps: int = 30) -> None:
+    for _ in range(steps):
+        if sim.is_finished:
+            break
+        sim.step()
+
+
+def test_profile_collects_phases_and_counters() -> None:
+    """profile=True でフェーズ別時間と LOS・ファジィ推論・グリッド・ログのカウンタが集計されること."""
+    sim = _make_sim(profile=True)
+    _run(sim, steps=20)
+    report = sim.profiler.to_dict()
+
+    assert report["steps"] == sim._step_count
+    for name in (
+        "area_shrink",
+        "detection",
+        "strategy",
+        "ai_decision",
+        "body_heading",
+        "action",
+        "refresh",
+    ):
+        assert report["phases"][name]["calls"] == report["steps"]
+    phase_total = sum(p["seconds"] for p in report["phases"].values())
+    assert 0.0 < phase_total <= report["total_seconds"]
+
+    counters = report["counters"]
+    assert counters["los_checks"]["total"] > 0
+    assert counters["los_raycasts"]["total"] > 0
+    assert counters["fuzzy_behavior_inferences"]["total"] > 0
+    assert counters["grid_syncs"]["total"] > 0
+    assert counters["logs_emitted"]["total"] == len(sim.logs)
+
+    assert json.loads(sim.profiler.to_json()) == report
+    assert "detection" in format_profile(report)
+
+
+def test_profiler_disabled_by_default() -> None:
+    """デフォルトでは何も集計せず、profiling() の区間だけ集計されること."""
+    sim = _make_sim()
+    _run(sim, steps=5)
+    assert sim.profiler.to_dict()["steps"] == 0
+    assert not sim.profiler.counters
+
+    with sim.profiler.profiling():
+        _run(sim, steps=5)
+    assert not sim.profiler.enabled
+    assert sim.profiler.steps == 5
+
+    _run(sim, steps=5)
+    assert sim.profiler.steps == 5
+
+
+def test_profiling_does_not_change_battle() -> None:
+    """計測の有無でログ・最終状態が変わらないこと."""
+    plain = _make_sim()
+    profiled = _make_sim(profile=True)
+    _run(plain)
+    _run(profiled)
+    assert [log.message for log in plain.logs] == [log.message for log in profiled.logs]
+    assert [u.current_hp for u in plain.units] == [u.current_hp for u in profiled.units]
+
+
+def test_merge_sums_profilers() -> None:
+    """merge() でフェーズ時間・呼び出し回数・カウンタが合算されること."""
+    a = StepProfiler(enabled=True)
+    b = StepProfiler(enabled=True)
+    for profiler, seconds in ((a, 0.5), (b, 0.25)):
+        profiler.add_time("detection", seconds)
+        profiler.add_step(1.0)
+        profiler.count("los_checks", 3)
+    b.count("grid_syncs")
+
+    a.merge(b)
+    assert a.steps == 2
+    assert a.total_seconds == 2.0
+    assert a.phase_seconds == {"detection": 0.75}
+    assert a.phase_calls == {"detection": 2}
+    assert a.counters == {"los_checks": 6, "grid_syncs": 1}
@@ -0,0 +1,161 @@
+"""Tests for RankingService.calculate_ranking."""
+
+from datetime import UTC, datetime, timedelta
+
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.db import json_serializer
+from app.models.models import BattleResult, Leaderboard, Pilot
+from app.services.ranking_service import RankingService
+
+
+def _make_session() -> Session:
+    engine = create_engine("sqlite:///:memory:", json_serializer=json_serializer)
+    SQLModel.metadata.create_all(engine)
+    return Session(engine)
+
+
+def _add_result(
+    session: Session,
+    user_id: str | None,
+    win_loss: str,
+    kills: int,
+    credits_gained: int,
+    created_at: datetime | None = None,
+) -> None:
+    session.add(
+        BattleResult(
+            user_id=user_id,
+            win_loss=win_loss,
+            kills=kills,
+            credits_gained=credits_gained,
+            created_at=created_at or datetime.now(UTC),
+        )
+    )
+
+
+def _board(session: Session) -> dict[str, tuple[str, int, int, int, int]]:
+    return {
+        lb.user_id: (lb.pilot_name, lb.wins, lb.losses, lb.kills, lb.credits_earned)
+        for lb in session.exec(select(Leaderboard)).all()
+    }
+
+
+def test_calculate_ranking_aggregates_real_kills_and_credits() -> None:
+    """撃墜数・獲得クレジットが BattleResult の実績値の合計になること."""
+    session = _make_session()
+    session.add(Pilot(user_id="u1", name="Amuro"))
+    session.add(Pilot(user_id="u2", name="Char"))
+    _add_result(session, "u1", "WIN", 3, 650)
+    _add_result(session, "u1", "LOSE", 1, 150)
+    _add_result(session, "u2", "DRAW", 0, 100)
+    # パイロットが存在しないユーザー・未ログインのバトルは集計しない
+    _add_result(session, "ghost", "WIN", 5, 750)
+    _add_result(session, None, "WIN", 5, 750)
+    session.commit()
+
+    RankingService(session).calculate_ranking()
+
+    assert _board(session) == {
+        "u1": ("Amuro", 1, 1, 4, 800),
+        "u2": ("Char", 0, 0, 0, 100),
+    }
+
+    # 全件集計を繰り返しても値は変わらない（既存レコードを置き換える）
+    RankingService(session).calculate_ranking()
+    assert len(session.exec(select(Leaderboard)).all()) == 2
+    assert _board(session)["u1"] == ("Amuro", 1, 1, 4, 800)
+
+
+def test_incremental_ranking_matches_full_recompute() -> None:
+    """差分集計の結果が全件再集計と一致すること."""
+    session = _make_session()
+    session.add(Pilot(user_id="u1", name="Amuro"))
+    session.add(Pilot(user_id="u2", name="Char"))
+    _add_result(session, "u1", "WIN", 2, 600, datetime.now(UTC) - timedelta(hours=2))
+    session.commit()
+
+    service = RankingService(session)
+    service.calculate_ranking(incremental=True)
+    assert _board(session) == {"u1": ("Amuro", 1, 0, 2, 600)}
+
+    # 前回の集計以降のバトルだけが加算される
+    _add_result(session, "u1", "LOSE", 1, 150)
+    _add_result(session, "u2", "WIN", 0, 500)
+    session.commit()
+    service.calculate_ranking(incremental=True)
+    incremental_board = _board(session)
+    assert incremental_board == {
+        "u1": ("Amuro", 1, 1, 3, 750),
+        "u2": ("Char", 1, 0, 0, 500),
+    }
+
+    service.calculate_ranking()
+    assert _board(session) == incremental_board
+
+
+def test_incremental_ranking_counts_backdated_results() -> None:
+    """前回の集計より前の created_at で後からコミットされた結果も1回だけ加算されること."""
+    session = _make_session()
+    session.add(Pilot(user_id="u1", name="Amuro"))
+    _add_result(session, "u1", "WIN", 1, 500)
+    session.commit()
+
+    service = RankingService(session)
+    service.calculate_ranking(incremental=True)
+    assert _board(session) == {"u1": ("Amuro", 1, 0, 1, 500)}
+
+    # 集計前に作成され、集計後にコミットされたバトル結果
+    _add_result(session, "u1", "LOSE", 2, 100, datetime.now(UTC) - timedelta(days=1))
+    session.commit()
+    service.calculate_ranking(incremental=True)
+    assert _board(session) == {"u1": ("Amuro", 1, 1, 3, 600)}
+
+    # 新しい結果がなければ再度の差分集計で値は変わらない
+    service.calculate_ranking(incremental=True)
+    assert _board(session) == {"u1": ("Amuro", 1, 1, 3, 600)}
+    service.calculate_ranking()
+    assert _board(session) == {"u1": ("Amuro", 1, 1, 3, 600)}
+
+
+def test_incremental_ranking_counts_results_before_pilot_creation() -> None:
+    """パイロット作成前の結果も、作成後の差分集計で1回だけ加算されること."""
+    session = _make_session()
+    session.add(Pilot(user_id="u1", name="Amuro"))
+    _add_result(session, "u1", "WIN", 1, 500)
+    _add_result(session, "u2", "LOSE", 2, 100)
+    session.commit()
+
+    service = RankingService(session)
+    service.calculate_ranking(incremental=True)
+    assert _board(session) == {"u1": ("Amuro", 1, 0, 1, 500)}
+
+    session.add(Pilot(user_id="u2", name="Char"))
+    session.commit()
+    service.calculate_ranking(incremental=True)
+    expected = {"u1": ("Amuro", 1, 0, 1, 500), "u2": ("Char", 0, 1, 2, 100)}
+    assert _board(session) == expected
+
+    service.calculate_ranking(incremental=True)
+    assert _board(session) == expected
+    service.calculate_ranking()
+    assert _board(session) == expected
+
+
+def test_incremental_ranking_without_ranked_results_recomputes_all() -> None:
+    """集計済みの印が1件もない場合（導入直後）の差分集計は全件集計になること."""
+    session = _make_session()
+    session.add(Pilot(user_id="u1", name="Amuro"))
+    _add_result(session, "u1", "WIN", 1, 500)
+    _add_result(session, "u1", "WIN", 2, 500)
+    session.commit()
+    service = RankingService(session)
+    service.calculate_ranking()
+
+    # 印のない既存データ（カラム追加前の集計結果）を再現する
+    for result in session.exec(select(BattleResult)).all():
+        result.ranking_batch_id = None
+    session.commit()
+
+    service.calculate_ranking(incremental=True)
+    assert _board(session) == {"u1": ("Amuro", 2, 0, 3, 1000)}
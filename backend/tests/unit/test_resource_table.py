@@ -0,0 +1,146 @@
+"""Tests for the array-backed resource table (ResourceTable / unit_resources views).
+
+- unit_resources[unit_id] への読み書きがテーブルの配列へライトスルーされること
+- ResourceTable.refresh() が従来のユニット単位の更新と同じ結果になること
+- テーブル外のユニットは dict のまま保持・更新されること
+"""
+
+import uuid
+
+import numpy as np
+
+from app.engine.resource_table import ResourceTable, UnitResourceView
+from app.engine.simulation import BattleSimulator
+from app.models.models import MobileSuit, Vector3, Weapon
+
+
+def _make_unit(i: int, team_id: str, max_ammo: int | None = None) -> MobileSuit:
+    return MobileSuit(
+        id=uuid.UUID(int=i + 1),
+        name=f"u{i}",
+        max_hp=100,
+        current_hp=100,
+        armor=0,
+        mobility=1.0,
+        position=Vector3(x=500.0 * i, y=0.0, z=0.0),
+        sensor_range=400.0,
+        side="PLAYER" if team_id == "A" else "ENEMY",
+        team_id=team_id,
+        max_en=200,
+        en_recovery=7,
+        weapons=[
+            Weapon(
+                id=f"w{i}",
+                name="Rifle",
+                power=30,
+                range=300,
+                accuracy=80,
+                max_ammo=max_ammo,
+            )
+        ],
+    )
+
+
+def _make_sim() -> BattleSimulator:
+    return BattleSimulator(
+        _make_unit(0, "A", max_ammo=12), [_make_unit(1, "B")], seed=1
+    )
+
+
+def test_views_write_through_to_arrays() -> None:
+    """ビューへの書き込みがテーブルの配列に反映されること."""
+    sim = _make_sim()
+    table = sim._resource_table
+    uid = str(sim.player.id)
+    resources = sim.unit_resources[uid]
+    assert isinstance(resources, UnitResourceView)
+
+    resources["current_en"] -= 50
+    resources["is_boosting"] = True
+    weapon_state = resources["weapon_states"]["w0"]
+    weapon_state["current_ammo"] -= 1
+    weapon_state["cooldown_remaining_sec"] = 1.5
+
+    row = table.row_of[uid]
+    col = table.weapon_cols[row]["w0"]
+    assert table.en[row] == 150.0
+    assert table.is_boosting[row]
+    assert table.weapon_ammo[col] == 11.0
+    assert table.weapon_cooldown[col] == 1.5
+    assert resources["is_boosting"] is True
+    assert weapon_state["current_ammo"] == 11
+
+    enemy_state = sim.unit_resources[str(sim.units[1].id)]["weapon_states"]["w1"]
+    assert enemy_state["current_ammo"] is None
+    assert set(enemy_state) == {"current_ammo", "cooldown_remaining_sec"}
+
+
+def test_assigning_dicts_loads_into_table() -> None:
+    """武器状態・ユニットのリソースに dict を代入するとテーブルへ書き込まれること."""
+    sim = _make_sim()
+    table = sim._resource_table
+    uid = str(sim.player.id)
+    row = table.row_of[uid]
+
+    sim.unit_resources[uid]["weapon_states"]["extra"] = {
+        "current_ammo": 3,
+        "cooldown_remaining_sec": 2.0,
+    }
+    col = table.weapon_cols[row]["extra"]
+    assert table.weapon_owner[col] == row
+    assert table.weapon_cooldown[col] == 2.0
+
+    sim.unit_resources[uid] = {
+        "current_en": 42.0,
+        "weapon_states": {},
+        "velocity_vec": np.zeros(3),
+        "status": "ACTIVE",
+    }
+    assert isinstance(sim.unit_resources[uid], UnitResourceView)
+    assert table.en[row] == 42.0
+    assert len(sim.unit_resources[uid]["weapon_states"]) == 0
+
+
+def test_refresh_matches_per_unit_update() -> None:
+    """refresh() の結果が従来のユニット単位の更新式と一致すること."""
+    units = [_make_unit(i, "A" if i % 2 else "B", max_ammo=5) for i in range(4)]
+    table = ResourceTable(units)
+    table.en[:] = [10.0, 195.0, 3.0, 50.0]
+    table.is_boosting[:] = [False, False, True, False]
+    table.boost_cooldown[:] = [0.05, 0.0, 0.0, 0.3]
+    table.weapon_cooldown[:] = [0.05, 1.0, 0.0, 2.0]
+    alive = np.array([True, True, True, False])
+
+    table.refresh(alive, 0.1)
+
+    assert table.en.tolist() == [17.0, 200.0, max(0.0, 3.0 - 5.0 * 0.1), 50.0]
+    assert table.boost_elapsed.tolist() == [0.0, 0.0, 0.1, 0.0]
+    assert table.boost_cooldown.tolist() == [0.0, 0.0, 0.0, 0.3]
+    assert table.weapon_cooldown.tolist() == [0.0, 0.9, 0.0, 2.0]
+
+
+def test_refresh_applies_recovery_per_merged_step() -> None:
+    """まとめたステップ数分の EN 回復が適用されること."""
+    table = ResourceTable([_make_unit(0, "A")])
+    table.en[0] = 100.0
+    table.refresh(np.array([True]), 0.5, recovery_steps=5)
+    assert table.en[0] == 135.0
+
+
+def test_units_outside_table_keep_plain_dicts() -> None:
+    """生成後に追加されたユニットは dict のまま保持され、従来通り更新されること."""
+    sim = _make_sim()
+    extra = _make_unit(5, "A")
+    sim.units.append(extra)
+    resources = {
+        "current_en": 100,
+        "weapon_states": {"w5": {"current_ammo": None, "cooldown_remaining_sec": 0.3}},
+        "is_boosting": False,
+    }
+    sim.unit_resources[str(extra.id)] = resources
+
+    sim._refresh_phase(0.1)
+
+    assert sim.unit_resources[str(extra.id)] is resources
+    assert resources["current_en"] == 107
+    assert abs(resources["weapon_states"]["w5"]["cooldown_remaining_sec"] - 0.2) < 1e-9
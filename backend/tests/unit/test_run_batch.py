@@ -500,3 +500,133 @@ def test_save_battle_results_kills_are_per_unit_not_team_wide(in_memory_session)
     }
     assert results["user_ace"].kills == 2
     assert results["user_support"].kills == 0
+
+
+def _count_save_queries(session: Session, entry_count: int) -> tuple[int, list[int]]:
+    """既存パイロットを持つ entry_count 人分の結果保存で発行された SELECT 数を返す."""
+    from sqlalchemy import event
+    from sqlmodel import select
+
+    from app.models.models import Pilot
+    from scripts.run_batch import _convert_snapshot_to_mobile_suit, _save_battle_results
+
+    room = _make_room(session)
+    entries = []
+    for i in range(entry_count):
+        user_id = f"user_bulk_{entry_count}_{i}"
+        session.add(Pilot(user_id=user_id, name=f"Pilot {i}"))
+        session.add(BattleResult(user_id=user_id, win_loss="WIN", digest_text="前回"))
+        snapshot = _make_snapshot(f"Bulk {i}")
+        snapshot["team_id"] = "team"
+        entries.append(_make_entry(session, room, user_id, snapshot))
+    session.commit()
+
+    units = [
+        _convert_snapshot_to_mobile_suit(dict(e.mobile_suit_snapshot)) for e in entries
+    ]
+    for unit in units:
+        unit.team_id = "team"
+    simulator = _make_simulator_mock(units)
+
+    selects = 0
+
+    def _count(conn, cursor, statement, *args):
+        nonlocal selects
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects += 1
+
+    bind = session.get_bind()
+    event.listen(bind, "before_cursor_execute", _count)
+    try:
+        _save_battle_results(
+            session=session,
+            room=room,
+            player_entries=entries,
+            npc_entries=[],
+            simulator=simulator,
+            primary_player_win=True,
+            player_unit=units[0],
+            enemy_units=units[1:],
+        )
+    finally:
+        event.remove(bind, "before_cursor_execute", _count)
+
+    results = session.exec(
+        select(BattleResult).where(BattleResult.room_id == room.id)
+    ).all()
+    return selects, sorted(r.exp_gained for r in results)
+
+
+def test_save_battle_results_query_count_independent_of_entries(in_memory_session):
+    """パイロット・直前ダイジェストの取得クエリ数がエントリー数に依存しないこと."""
+    small_selects, small_exp = _count_save_queries(in_memory_session, 2)
+    large_selects, large_exp = _count_save_queries(in_memory_session, 8)
+
+    assert large_selects == small_selects
+    assert small_exp == [100, 100]
+    assert large_exp == [100] * 8
+
+
+def test_finish_room_analyzes_logs_once(in_memory_session):
+    """勝敗判定と結果保存（撃破数・ダイジェスト）でログの集計が1回だけ行われること."""
+    from unittest.mock import patch
+
+    from sqlmodel import select
+
+    from app.engine.log_buffer import BattleLogBuffer
+    from app.engine.simulation_executor import SimulationOutcome
+    from scripts import run_batch
+
+    session = in_memory_session
+    room = _make_room(session)
+    snapshot = _make_snapshot("Hero Gundam")
+    snapshot["team_id"] = "TEAM_A"
+    entry = _make_entry(session, room, "user_hero", snapshot)
+
+    player_unit = run_batch._convert_snapshot_to_mobile_suit(dict(snapshot))
+    player_unit.team_id = "TEAM_A"
+    enemy_id = uuid4()
+    logs = BattleLogBuffer(
+        [
+            BattleLog(
+                timestamp=0.0,
+                actor_id=player_unit.id,
+                action_type="ATTACK",
+                target_id=enemy_id,
+                message="attack",
+                position_snapshot=Vector3(x=0, y=0, z=0),
+            ),
+            BattleLog(
+                timestamp=0.0,
+                actor_id=enemy_id,
+                action_type="DESTROYED",
+                message="destroyed",
+                position_snapshot=Vector3(x=0, y=0, z=0),
+            ),
+        ]
+    )
+    outcome = SimulationOutcome(
+        player=player_unit,
+        enemies=[],
+        logs=logs,
+        steps_used=10,
+        elapsed_time=1.0,
+        obstacles=[],
+        map_bounds=(0.0, 1000.0),
+        spawn_positions=(Vector3(x=0, y=0, z=0), {}),
+    )
+    prepared = run_batch._PreparedRoom(
+        room=room, player_entries=[entry], npc_entries=[], request=MagicMock()
+    )
+
+    with patch.object(
+        run_batch, "analyze_battle_logs", wraps=run_batch.analyze_battle_logs
+    ) as spy:
+        run_batch._finish_room(session, prepared, outcome)
+
+    assert spy.call_count == 1
+    result = session.exec(
+        select(BattleResult).where(BattleResult.room_id == room.id)
+    ).one()
+    assert result.kills == 1
+    assert result.win_loss == "WIN"
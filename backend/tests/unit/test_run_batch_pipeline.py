@@ -0,0 +1,108 @@
+"""Tests for run_batch の並列シミュレーション（プロセスプール + 単一 DB 書き込み）."""
+
+from datetime import UTC, datetime
+from uuid import UUID
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.db import json_serializer
+from app.models.models import (
+    BattleEntry,
+    BattleLogRecord,
+    BattleResult,
+    BattleRoom,
+    MobileSuit,
+    Vector3,
+    Weapon,
+)
+
+
+@pytest.fixture
+def in_memory_session():
+    """Create an in-memory SQLite session for testing."""
+    engine = create_engine("sqlite:///:memory:", json_serializer=json_serializer)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def _add_entry(
+    session: Session, room_id: UUID, name: str, x: float, is_npc: bool = False
+) -> None:
+    suit = MobileSuit(
+        name=name,
+        max_hp=150,
+        current_hp=150,
+        armor=5,
+        mobility=1.2,
+        position=Vector3(x=x, y=0.0, z=0.0),
+        sensor_range=900.0,
+        team_id=name,
+        weapons=[Weapon(id="w1", name="Rifle", power=60, range=500, accuracy=85)],
+    )
+    session.add(suit)
+    session.flush()
+    session.add(
+        BattleEntry(
+            user_id=None if is_npc else f"user_{name}",
+            room_id=room_id,
+            mobile_suit_id=suit.id,
+            mobile_suit_snapshot=suit.model_dump(),
+            is_npc=is_npc,
+        )
+    )
+
+
+def _make_room(session: Session, index: int, with_player: bool = True) -> UUID:
+    room = BattleRoom(
+        id=UUID(int=index + 1), status="WAITING", scheduled_at=datetime.now(UTC)
+    )
+    session.add(room)
+    session.flush()
+    if with_player:
+        _add_entry(session, room.id, f"p{index}", 0.0)
+    _add_entry(session, room.id, f"n{index}", 300.0, is_npc=True)
+    session.commit()
+    return room.id
+
+
+def test_pipelined_rooms_are_saved_and_failures_isolated(
+    in_memory_session, monkeypatch
+):
+    """並列実行したルームの結果が保存され、失敗したルームだけが WAITING に残ること."""
+    import scripts.run_batch as run_batch
+
+    monkeypatch.setattr(run_batch, "_MAX_SIMULATION_STEPS", 200)
+    ok_rooms = [_make_room(in_memory_session, i) for i in range(2)]
+    # プレイヤーエントリーのないルームはスキップされる
+    skipped_room = _make_room(in_memory_session, 2, with_player=False)
+    # シミュレーション入力の準備に失敗するルーム
+    broken_room = _make_room(in_memory_session, 3)
+    broken_entry = in_memory_session.exec(
+        select(BattleEntry).where(
+            BattleEntry.room_id == broken_room,
+            BattleEntry.is_npc == False,  # noqa: E712
+        )
+    ).one()
+    broken_entry.mobile_suit_snapshot = {"name": "broken"}
+    in_memory_session.add(broken_entry)
+    in_memory_session.commit()
+
+    run_batch.run_simulation_phase(in_memory_session, workers=2)
+
+    statuses = dict(
+        in_memory_session.exec(select(BattleRoom.id, BattleRoom.status)).all()
+    )
+    assert statuses == {
+        ok_rooms[0]: "COMPLETED",
+        ok_rooms[1]: "COMPLETED",
+        skipped_room: "WAITING",
+        broken_room: "WAITING",
+    }
+
+    results = in_memory_session.exec(select(BattleResult)).all()
+    assert sorted(r.room_id for r in results) == sorted(ok_rooms)
+    log_records = in_memory_session.exec(select(BattleLogRecord)).all()
+    assert {r.room_id for r in log_records} == set(ok_rooms)
+    assert all(r.logs for r in log_records)
@@ -0,0 +1,192 @@
+"""Tests for run_batch のタスク分割（Cloud Run Jobs 並列実行）."""
+
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.db import json_serializer
+from app.models.models import BattleEntry, BattleRoom, MobileSuit, Vector3
+
+
+@pytest.fixture
+def in_memory_session():
+    """Create an in-memory SQLite session for testing."""
+    engine = create_engine("sqlite:///:memory:", json_serializer=json_serializer)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def _make_rooms(session: Session, count: int, status: str = "WAITING") -> list[UUID]:
+    rooms = [
+        BattleRoom(id=UUID(int=i + 1), status=status, scheduled_at=datetime.now(UTC))
+        for i in range(count)
+    ]
+    session.add_all(rooms)
+    session.commit()
+    return [room.id for room in rooms]
+
+
+def _add_entry(session: Session, room_id: UUID) -> None:
+    suit = MobileSuit(
+        name="Entry",
+        max_hp=100,
+        current_hp=100,
+        armor=0,
+        mobility=1.0,
+        position=Vector3(),
+    )
+    session.add(suit)
+    session.flush()
+    session.add(
+        BattleEntry(
+            user_id="user",
+            room_id=room_id,
+            mobile_suit_id=suit.id,
+            mobile_suit_snapshot={},
+        )
+    )
+    session.commit()
+
+
+def test_rooms_are_partitioned_across_tasks(in_memory_session, monkeypatch):
+    """各 WAITING ルームがちょうど1タスクでのみ処理されること."""
+    import scripts.run_batch as run_batch
+
+    room_ids = _make_rooms(in_memory_session, 10)
+    processed: dict[int, list[UUID]] = {}
+
+    task_count = 3
+    for task_index in range(task_count):
+        monkeypatch.setattr(
+            run_batch,
+            "_process_room",
+            lambda _session, room, i=task_index: processed.setdefault(i, []).append(
+                room.id
+            ),
+        )
+        others = run_batch.run_simulation_phase(
+            in_memory_session, task_index, task_count, workers=1
+        )
+        assert set(others) == set(room_ids) - set(processed.get(task_index, []))
+
+    all_processed = [room_id for ids in processed.values() for room_id in ids]
+    assert sorted(all_processed) == sorted(room_ids)
+    assert len(processed) == task_count
+
+
+def test_failed_room_stays_waiting(in_memory_session, monkeypatch):
+    """処理に失敗したルームは WAITING のまま残り、後続のルームは処理されること."""
+    import scripts.run_batch as run_batch
+
+    room_ids = _make_rooms(in_memory_session, 2)
+
+    def _process(session: Session, room: BattleRoom) -> None:
+        if room.id == room_ids[0]:
+            raise RuntimeError("boom")
+        room.status = "COMPLETED"
+        session.add(room)
+        session.commit()
+
+    monkeypatch.setattr(run_batch, "_process_room", _process)
+    run_batch.run_simulation_phase(in_memory_session, workers=1)
+
+    statuses = dict(
+        in_memory_session.exec(select(BattleRoom.id, BattleRoom.status)).all()
+    )
+    assert statuses == {room_ids[0]: "WAITING", room_ids[1]: "COMPLETED"}
+
+
+def test_wait_for_matching(in_memory_session):
+    """エントリーを持つ OPEN ルームがある間はマッチング未完了と判定されること."""
+    from scripts.run_batch import wait_for_matching
+
+    (room_id,) = _make_rooms(in_memory_session, 1, status="OPEN")
+    # エントリーのない OPEN ルーム（次回募集用）は待機対象外
+    assert wait_for_matching(in_memory_session, timeout_sec=0)
+
+    _add_entry(in_memory_session, room_id)
+    assert not wait_for_matching(
+        in_memory_session, timeout_sec=0.05, poll_interval_sec=0.01
+    )
+
+    room = in_memory_session.get(BattleRoom, room_id)
+    room.status = "WAITING"
+    in_memory_session.add(room)
+    in_memory_session.commit()
+    assert wait_for_matching(in_memory_session, timeout_sec=0)
+
+
+def test_wait_for_shards(in_memory_session):
+    """他タスク担当ルームが全て完了するか、進捗が止まるまで待つこと."""
+    from scripts.run_batch import wait_for_shards
+
+    room_ids = _make_rooms(in_memory_session, 2)
+    assert not wait_for_shards(
+        in_memory_session, set(room_ids), idle_timeout_sec=0.05, poll_interval_sec=0.01
+    )
+
+    for room in in_memory_session.exec(select(BattleRoom)).all():
+        room.status = "COMPLETED"
+        in_memory_session.add(room)
+    in_memory_session.commit()
+    assert wait_for_shards(in_memory_session, set(room_ids), idle_timeout_sec=0)
+
+
+def test_wait_for_shards_skips_rooms_failed_in_worker(in_memory_session, monkeypatch):
+    """他タスクで失敗したルームを待ち続けず、すぐに待機を終えること."""
+    import scripts.run_batch as run_batch
+
+    batch_started_at = datetime.now(UTC)
+    room_ids = _make_rooms(in_memory_session, 4)
+
+    monkeypatch.setattr(run_batch, "_process_room", lambda _session, _room: None)
+    others = run_batch.run_simulation_phase(in_memory_session, 0, 2, workers=1)
+    failing_id = others[0]
+
+    def _process(session: Session, room: BattleRoom) -> None:
+        if room.id == failing_id:
+            raise RuntimeError("boom")
+        room.status = "COMPLETED"
+        session.add(room)
+        session.commit()
+
+    monkeypatch.setattr(run_batch, "_process_room", _process)
+    run_batch.run_simulation_phase(in_memory_session, 1, 2, workers=1)
+
+    failed_room = in_memory_session.get(BattleRoom, failing_id)
+    assert failed_room.status == "WAITING"
+    assert failed_room.failed_at is not None
+    assert set(room_ids) > set(others)
+
+    started = time.monotonic()
+    assert run_batch.wait_for_shards(
+        in_memory_session,
+        set(others),
+        batch_started_at,
+        idle_timeout_sec=60,
+        poll_interval_sec=0.01,
+    )
+    assert time.monotonic() - started < 5
+
+    # 前回バッチの失敗記録は今回の再実行を待つ対象から外さない
+    assert not run_batch.wait_for_shards(
+        in_memory_session,
+        {failing_id},
+        datetime.now(UTC) + timedelta(seconds=1),
+        idle_timeout_sec=0.05,
+        poll_interval_sec=0.01,
+    )
+
+
+def test_main_rejects_invalid_task_settings():
+    """タスク設定が不正な場合は ValueError になること."""
+    from scripts.run_batch import main
+
+    with pytest.raises(ValueError):
+        main(task_index=2, task_count=2)
+    with pytest.raises(ValueError):
+        main(task_index=0, task_count=0)
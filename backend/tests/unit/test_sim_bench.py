@@ -131,6 +131,27 @@ class TestSimBench:
         assert "win_counts" in json_data
         assert "durations" in json_data
         assert "action_distribution" in json_data
+        assert json_data["profile"] is None
+
+    def test_bench_profile_is_merged_across_rounds(self) -> None:
+        """profile=True の場合、全ラウンドのフェーズ別計測が合算されること."""
+        from sim_bench import BenchRunner
+
+        runner = BenchRunner(max_steps=50, profile=True)
+        summary = runner.run_with_units(
+            player_base=_make_player(),
+            enemies_base=[_make_enemy()],
+            mission=_make_mission(),
+            rounds=2,
+        )
+
+        assert summary.profile is not None
+        expected_steps = sum(round(d / 0.1) for d in summary.durations)
+        assert summary.profile.steps == expected_steps
+        assert summary.to_json()["profile"]["phases"]["detection"]["calls"] == (
+            expected_steps
+        )
+        assert "フェーズ別計測" in summary.to_text()
 
     def test_bench_draw_rate_warning(self) -> None:
         """引き分け率 > 20% のとき警告フラグが True になること."""
@@ -346,7 +346,7 @@ def test_tactics_strongest_priority() -> None:
     sim = BattleSimulator(player, enemies)
 
     # Run detection phase so enemies are detected (patch random to always succeed)
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._step_count += 1  # 発見ステップの次ステップに進める（リアクション遅延を経過）
 
@@ -379,7 +379,7 @@ def test_tactics_threat_priority() -> None:
     sim = BattleSimulator(player, enemies)
 
     # Run detection phase so enemies are detected (patch random to always succeed)
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._step_count += 1  # 発見ステップの次ステップに進める（リアクション遅延を経過）
 
@@ -424,7 +424,7 @@ def test_target_selection_with_multiple_tactics() -> None:
     player, enemies = create_scenario()
     player.tactics = {"priority": "CLOSEST", "range": "BALANCED"}
     sim = BattleSimulator(player, enemies)
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._step_count += 1  # 発見ステップの次ステップに進める（リアクション遅延を経過）
     target = sim._select_target_legacy(player)
@@ -435,7 +435,7 @@ def test_target_selection_with_multiple_tactics() -> None:
     player, enemies = create_scenario()
     player.tactics = {"priority": "WEAKEST", "range": "BALANCED"}
     sim = BattleSimulator(player, enemies)
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._step_count += 1  # 発見ステップの次ステップに進める（リアクション遅延を経過）
     target = sim._select_target_legacy(player)
@@ -446,7 +446,7 @@ def test_target_selection_with_multiple_tactics() -> None:
     player, enemies = create_scenario()
     player.tactics = {"priority": "STRONGEST", "range": "BALANCED"}
     sim = BattleSimulator(player, enemies)
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._step_count += 1  # 発見ステップの次ステップに進める（リアクション遅延を経過）
     target = sim._select_target_legacy(player)
@@ -483,7 +483,7 @@ def test_different_team_id_attack() -> None:
     enemy.team_id = "TEAM_B"
 
     sim = BattleSimulator(player, [enemy])
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._step_count += 1  # 発見ステップの次ステップに進める（リアクション遅延を経過）
 
@@ -1036,7 +1036,7 @@ def test_detection_shared_within_team() -> None:
 
     sim = BattleSimulator(scout, [rear_guard, enemy])
     sim.elapsed_time = 0.1
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._step_count += 1  # 発見ステップの次ステップに進める（リアクション遅延を経過）
 
@@ -1138,7 +1138,7 @@ def test_ai_decision_phase_logs_ai_decision() -> None:
     enemy = create_fuzzy_test_enemy("Enemy", Vector3(x=200, y=0, z=0))
 
     sim = BattleSimulator(player, enemies=[enemy])
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._ai_decision_phase(player)
 
@@ -1157,7 +1157,7 @@ def test_ai_decision_phase_fuzzy_scores_recorded() -> None:
     enemy = create_fuzzy_test_enemy("Enemy", Vector3(x=200, y=0, z=0))
 
     sim = BattleSimulator(player, enemies=[enemy])
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._ai_decision_phase(player)
 
@@ -1182,7 +1182,7 @@ def test_ai_decision_phase_retreat_fallback_to_move() -> None:
     ]
 
     sim = BattleSimulator(player, enemies=enemies)
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._ai_decision_phase(player)
 
@@ -1258,7 +1258,7 @@ def test_action_phase_respects_attack_action() -> None:
     enemy = create_fuzzy_test_enemy("Close Enemy", Vector3(x=100, y=0, z=0))
 
     sim = BattleSimulator(player, enemies=[enemy])
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._step_count += 1  # 発見ステップの次ステップに進める（リアクション遅延を経過）
 
@@ -1293,7 +1293,7 @@ def test_select_target_fuzzy_returns_target_when_single_enemy_detected() -> None
     player = create_test_player()
     enemy = create_test_enemy("Close Enemy", Vector3(x=100, y=0, z=0))
     sim = BattleSimulator(player, [enemy])
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._step_count += 1  # 発見ステップの次ステップに進める（リアクション遅延を経過）
 
@@ -1318,7 +1318,7 @@ def test_select_target_fuzzy_logs_fuzzy_scores_in_target_selection() -> None:
     player = create_test_player()
     enemy = create_test_enemy("Target Enemy", Vector3(x=100, y=0, z=0))
     sim = BattleSimulator(player, [enemy])
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._step_count += 1  # 発見ステップの次ステップに進める（リアクション遅延を経過）
 
@@ -1669,7 +1669,7 @@ def test_action_phase_uses_fuzzy_weapon_selection() -> None:
     )
     enemy.sensor_range = 1000
     sim = BattleSimulator(player, [enemy])
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._step_count += 1  # 発見ステップの次ステップに進める（リアクション遅延を経過）
     # プレイヤーを ATTACK モードに設定
@@ -1975,7 +1975,7 @@ def test_ai_decision_phase_defensive_strategy_mode_logged() -> None:
     enemy = create_fuzzy_test_enemy("Enemy", Vector3(x=200, y=0, z=0))
 
     sim = BattleSimulator(player, enemies=[enemy])
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._ai_decision_phase(player)
 
@@ -1994,7 +1994,7 @@ def test_ai_decision_phase_sniper_strategy_mode_logged() -> None:
     enemy.sensor_range = 5000.0
 
     sim = BattleSimulator(player, enemies=[enemy])
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._ai_decision_phase(player)
 
@@ -2154,7 +2154,7 @@ def test_team_detection_isolation() -> None:
     unit_c = _make_team_unit("TeamC", "TEAM_C", Vector3(x=50, y=0, z=0))
 
     sim = BattleSimulator(unit_a, [unit_b, unit_c])
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
 
     # チームAは近いTeamCを発見しているはず、遠いTeamBは未発見
@@ -2308,7 +2308,7 @@ def test_assault_behavior_close_enemy_attacks() -> None:
     enemy = create_fuzzy_test_enemy("Close Enemy", Vector3(x=100, y=0, z=0))
 
     sim = BattleSimulator(player, enemies=[enemy])
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
     sim._ai_decision_phase(player)
 
@@ -2420,7 +2420,7 @@ def test_reaction_delay_suppresses_attack_on_detection_step() -> None:
     sim = BattleSimulator(player, [enemy])
 
     # step_count=0 のまま発見させる（発見ステップ = 0）
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
 
     assert enemy.id in sim.team_detected_units["PLAYER_TEAM"], "発見済みであること"
@@ -2457,7 +2457,7 @@ def test_reaction_delay_fuzzy_suppresses_attack_on_detection_step() -> None:
     sim = BattleSimulator(player, [enemy])
 
     # step_count=0 のまま発見させる（発見ステップ = 0）
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
 
     assert enemy.id in sim.team_detected_units["PLAYER_TEAM"], "発見済みであること"
@@ -2494,7 +2494,7 @@ def test_reaction_delay_no_attack_log_on_detection_step() -> None:
     sim = BattleSimulator(player, [enemy])
 
     # 発見ステップ（step 0）を実行: 発見されるが攻撃は抑制されること
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim.step()
 
     attack_logs_step0 = [
@@ -2508,7 +2508,7 @@ def test_reaction_delay_no_attack_log_on_detection_step() -> None:
     assert player.current_hp > 0, "発見ステップでは player はまだ生存していること"
 
     # 次ステップ（step 1）を実行: 攻撃が実行されること
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim.step()
 
     attack_logs_step1 = [
@@ -0,0 +1,177 @@
+"""Tests for SimulationExecutor (シミュレーション実行器).
+
+- run_simulation() が直接実行とワーカープロセス実行で同じ結果を返すこと
+- 実行待ちが上限に達した場合に SimulationQueueFullError になること
+- タイムアウト時に SimulationTimeoutError になること
+"""
+
+import asyncio
+import pickle
+import random
+import threading
+import time
+import uuid
+
+import pytest
+
+from app.engine.simulation_executor import (
+    SimulationExecutor,
+    SimulationQueueFullError,
+    SimulationRequest,
+    SimulationTimeoutError,
+    run_simulation,
+)
+from app.models.models import MobileSuit, Vector3, Weapon
+
+
+def _make_unit(name: str, team_id: str, x: float, z: float, i: int) -> MobileSuit:
+    return MobileSuit(
+        id=uuid.UUID(int=i + 1),
+        name=name,
+        max_hp=200,
+        current_hp=200,
+        armor=5,
+        mobility=1.2,
+        position=Vector3(x=x, y=0.0, z=z),
+        sensor_range=900.0,
+        side="PLAYER" if team_id == "A" else "ENEMY",
+        team_id=team_id,
+        weapons=[
+            Weapon(id=f"w_{name}", name="Rifle", power=50, range=500, accuracy=80)
+        ],
+    )
+
+
+def _make_request(max_steps: int = 50) -> SimulationRequest:
+    return SimulationRequest(
+        player=_make_unit("player", "A", 0.0, 0.0, 0),
+        enemies=[
+            _make_unit("e1", "B", 400.0, 100.0, 1),
+            _make_unit("e2", "B", 450.0, -100.0, 2),
+        ],
+        max_steps=max_steps,
+    )
+
+
+def _block(event: threading.Event) -> bool:
+    return event.wait(timeout=5)
+
+
+def test_run_simulation_returns_picklable_outcome() -> None:
+    """run_simulation() の結果にログ・スポーン位置が含まれ、pickle できること."""
+    request = _make_request()
+    spawn = request.player.position.model_copy()
+    random.seed(5)
+    outcome = run_simulation(request)
+
+    assert 0 < outcome.steps_used <= 50
+    assert len(outcome.logs) > 0
+    assert outcome.spawn_positions[0] == spawn
+    assert set(outcome.spawn_positions[1]) == {e.id for e in outcome.enemies}
+
+    restored = pickle.loads(pickle.dumps(outcome))
+    assert restored.logs.to_dicts() == outcome.logs.to_dicts()
+    assert restored.player == outcome.player
+
+
+def test_process_pool_runs_simulation() -> None:
+    """ワーカープロセスで実行したシミュレーションの結果が受け取れること."""
+    executor = SimulationExecutor(max_workers=1, max_pending=2, timeout_sec=120)
+
+    async def _run() -> None:
+        await executor.start()
+        outcome = await executor.run(_make_request())
+        assert outcome.steps_used > 0
+        assert len(outcome.logs) > 0
+        assert outcome.player.id == uuid.UUID(int=1)
+        assert executor.pending == 0
+
+    try:
+        asyncio.run(_run())
+    finally:
+        executor.shutdown()
+
+
+def test_queue_full_raises() -> None:
+    """実行中 + 待機中ジョブ数が max_pending に達すると即座に拒否されること."""
+    executor = SimulationExecutor(max_workers=0, max_pending=1, timeout_sec=10)
+    event = threading.Event()
+
+    async def _run() -> None:
+        first = asyncio.ensure_future(executor._submit(_block, event))
+        await asyncio.sleep(0)
+        assert executor.pending == 1
+        with pytest.raises(SimulationQueueFullError):
+            await executor._submit(_block, event)
+        event.set()
+        assert await first is True
+        assert executor.pending == 0
+
+    try:
+        asyncio.run(_run())
+    finally:
+        event.set()
+        executor.shutdown()
+
+
+def test_timeout_raises() -> None:
+    """timeout_sec 以内に終わらないジョブは SimulationTimeoutError になること."""
+    executor = SimulationExecutor(max_workers=0, max_pending=1, timeout_sec=0.05)
+    event = threading.Event()
+
+    async def _run() -> None:
+        with pytest.raises(SimulationTimeoutError):
+            await executor._submit(_block, event)
+
+    try:
+        asyncio.run(_run())
+    finally:
+        event.set()
+        executor.shutdown()
+    assert executor.pending == 0
+
+
+def test_timed_out_job_keeps_slot_until_finished() -> None:
+    """タイムアウト直後の再投入は、元のジョブが終わるまで枠が空かず拒否されること."""
+    executor = SimulationExecutor(max_workers=0, max_pending=1, timeout_sec=0.05)
+    event = threading.Event()
+
+    async def _run() -> None:
+        with pytest.raises(SimulationTimeoutError):
+            await executor._submit(_block, event)
+        # ワーカー上ではまだ実行中
+        assert executor.pending == 1
+        with pytest.raises(SimulationQueueFullError):
+            await executor._submit(_block, event)
+
+        event.set()
+        for _ in range(100):
+            if executor.pending == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert executor.pending == 0
+        executor.timeout_sec = 10
+        assert await executor._submit(_block, event) is True
+        assert executor.pending == 0
+
+    try:
+        asyncio.run(_run())
+    finally:
+        event.set()
+        executor.shutdown()
+
+
+def test_worker_deadline_stops_simulation() -> None:
+    """期限切れの request はワーカー側でも打ち切られること."""
+    request = _make_request()
+    request.deadline = time.time() - 1.0
+    with pytest.raises(SimulationTimeoutError):
+        run_simulation(request)
+
+
+def test_invalid_arguments_raise() -> None:
+    """max_workers < 0 / max_pending < 1 は ValueError になること."""
+    with pytest.raises(ValueError):
+        SimulationExecutor(max_workers=-1)
+    with pytest.raises(ValueError):
+        SimulationExecutor(max_pending=0)
@@ -1,15 +1,21 @@
-"""Tests for UnitSpatialGrid (Issue #446) / PointSpatialGrid (Issue #447).
+"""Tests for UnitSpatialGrid (Issue #446) / PointSpatialGrid (Issue #447) / UnitSpatialIndex.
 
 近傍探索（グリッド分割）の境界条件を単体で検証する:
 - セル境界上・負座標での分類
 - 3x3x3近傍セルの範囲内/範囲外の判定
 - 極小セルサイズの下限クランプ
 - 空グリッドの挙動
+- 永続インデックスの差分同期が新規構築と同じ結果・列挙順になること
 """
 
 import numpy as np
 
-from app.engine.spatial_grid import _MIN_CELL_SIZE, PointSpatialGrid, UnitSpatialGrid
+from app.engine.spatial_grid import (
+    _MIN_CELL_SIZE,
+    PointSpatialGrid,
+    UnitSpatialGrid,
+    UnitSpatialIndex,
+)
 from app.models.models import MobileSuit, Vector3, Weapon
 
 
@@ -320,3 +326,86 @@ def test_point_grid_incremental_insert_accumulates() -> None:
     assert _neighbor_coords(grid, (0.0, 0.0, 0.0)) == {
         (float(i) * 10.0, 0.0, 0.0) for i in range(5)
     }
+
+
+# ---------------------------------------------------------------------------
+# UnitSpatialIndex（永続インデックスの差分同期）
+# ---------------------------------------------------------------------------
+
+
+def _positions(units: list[MobileSuit]) -> np.ndarray:
+    return np.array([u.position.to_numpy() for u in units])
+
+
+def test_spatial_index_sync_matches_fresh_grid() -> None:
+    """移動・撃破・復帰を差分同期した結果が、新規構築したグリッドと列挙順まで一致すること."""
+    rng = np.random.RandomState(7)  # noqa: NPY002 テスト再現性のため固定シード
+    units = [
+        _make_unit(f"u{i}", *rng.uniform(-1500.0, 1500.0, size=3).tolist())
+        for i in range(40)
+    ]
+    index = UnitSpatialIndex(units)
+    alive = np.ones(len(units), dtype=bool)
+
+    for step in range(30):
+        for u in units:
+            delta = rng.uniform(-120.0, 120.0, size=3)
+            u.position = Vector3.from_numpy(u.position.to_numpy() + delta)
+        alive[rng.randint(len(units))] = step % 3 != 0
+        grid = index.grid(150.0, _positions(units), alive)
+        fresh = UnitSpatialGrid(
+            [u for u, a in zip(units, alive, strict=True) if a], 150.0
+        )
+
+        for _ in range(5):
+            query = rng.uniform(-1500.0, 1500.0, size=3)
+            assert [u.name for u in grid.neighbors(query)] == [
+                u.name for u in fresh.neighbors(query)
+            ]
+            assert [u.name for u in grid.radius_neighbors(query, 400.0)] == [
+                u.name for u in fresh.radius_neighbors(query, 400.0)
+            ]
+            assert grid.nearest(query, lambda u: True) is fresh.nearest(
+                query, lambda u: True
+            )
+
+
+def test_spatial_index_sync_tracks_cell_bounds() -> None:
+    """端のセルが空いたり戻ったりしても、セル範囲が新規構築と一致すること."""
+    rng = np.random.RandomState(11)  # noqa: NPY002 テスト再現性のため固定シード
+    units = [
+        _make_unit(f"u{i}", *rng.uniform(-600.0, 600.0, size=3).tolist())
+        for i in range(12)
+    ]
+    index = UnitSpatialIndex(units)
+    alive = np.ones(len(units), dtype=bool)
+
+    for step in range(60):
+        mover = units[rng.randint(len(units))]
+        # 大きく跳ばして端のセルを空けたり新しい端を作ったりする
+        mover.position = Vector3.from_numpy(rng.uniform(-2000.0, 2000.0, size=3))
+        alive[rng.randint(len(units))] = step % 4 != 0
+        if step == 30:
+            alive[:] = False
+        grid = index.grid(150.0, _positions(units), alive)
+        fresh = UnitSpatialGrid(
+            [u for u, a in zip(units, alive, strict=True) if a], 150.0
+        )
+        assert grid._min_cell == fresh._min_cell
+        assert grid._max_cell == fresh._max_cell
+
+
+def test_spatial_index_keeps_one_layer_per_cell_size() -> None:
+    """同じセルサイズの層は使い回され、撃破ユニットは候補から外れること."""
+    units = [_make_unit("a", 0.0, 0.0, 0.0), _make_unit("b", 50.0, 0.0, 0.0)]
+    index = UnitSpatialIndex(units)
+    positions = _positions(units)
+
+    grid = index.grid(150.0, positions, np.array([True, True]))
+    assert index.grid(150.0, positions, np.array([True, False])) is grid
+    assert index.grid(300.0, positions, np.array([True, True])) is not grid
+    assert _neighbor_names(grid, (0.0, 0.0, 0.0)) == {"a"}
+    # 下限未満のセルサイズは同じ層に丸められる
+    assert index.grid(1.0, positions, np.array([True, True])) is index.grid(
+        _MIN_CELL_SIZE, positions, np.array([True, True])
+    )
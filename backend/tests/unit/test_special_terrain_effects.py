@@ -94,7 +94,7 @@ def test_minovsky_reduces_sensor_range() -> None:
         player, [enemy], environment="SPACE", special_effects=["MINOVSKY"]
     )
     # パッチで確率判定を常に成功させる（近距離でもミノフスキー粒子による確率低下のため）
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim_minovsky._detection_phase()
 
     # ミノフスキー粒子下では 600 * 0.5 = 300m が実効範囲
@@ -111,7 +111,7 @@ def test_minovsky_blocks_long_range_detection() -> None:
 
     # 通常環境（パッチで確率判定を常に成功させる）
     sim_normal = BattleSimulator(player, [enemy], environment="SPACE")
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim_normal._detection_phase()
     assert enemy.id in sim_normal.team_detected_units["PLAYER_TEAM"]
 
@@ -135,7 +135,7 @@ def test_minovsky_detection_log_includes_message() -> None:
         player, [enemy], environment="SPACE", special_effects=["MINOVSKY"]
     )
     sim.elapsed_time = 0.1
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
 
     detection_logs = [log for log in sim.logs if log.action_type == "DETECTION"]
@@ -150,7 +150,7 @@ def test_no_minovsky_no_message() -> None:
 
     sim = BattleSimulator(player, [enemy], environment="SPACE")
     sim.elapsed_time = 0.1
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
 
     detection_logs = [log for log in sim.logs if log.action_type == "DETECTION"]
@@ -172,6 +172,7 @@ def test_gravity_well_reduces_movement() -> None:
     sim_normal._detection_phase()
     for _ in range(20):
         sim_normal.step()
+    sim_normal.sync_unit_positions()
     normal_x = player_normal.position.x
 
     # 重力井戸環境
@@ -186,6 +187,7 @@ def test_gravity_well_reduces_movement() -> None:
     sim_gravity._detection_phase()
     for _ in range(20):
         sim_gravity.step()
+    sim_gravity.sync_unit_positions()
     gravity_x = player_gravity.position.x
 
     # 重力井戸下では通常より移動距離が少ないはず
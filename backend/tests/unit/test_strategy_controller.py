@@ -173,6 +173,56 @@ def test_team_metrics_excludes_destroyed_units() -> None:
     assert metrics.min_hp_ratio == pytest.approx(0.0)
 
 
+def test_team_metrics_from_unit_state_match_unit_scan() -> None:
+    """ステップ実行中（SoA ストア参照）とステップ外で同じメトリクスになること."""
+    allies = [
+        _make_unit(f"Ally{i}", "TEAM_P", position=Vector3(x=0, y=0, z=50.0 * i))
+        for i in range(4)
+    ]
+    enemy = _make_unit("Enemy", "TEAM_E", position=Vector3(x=3000, y=0, z=0))
+    sim = BattleSimulator(allies[0], [*allies[1:], enemy])
+    allies[1].current_hp = 35
+    allies[2].current_hp = 0
+    sim.unit_resources[str(allies[2].id)]["status"] = "DESTROYED"
+    sim.unit_resources[str(allies[3].id)]["status"] = "RETREATED"
+
+    scanned = sim._collect_team_metrics("TEAM_P")
+    sim._unit_state.load(sim.unit_resources)
+    try:
+        indexed = sim._collect_team_metrics("TEAM_P")
+        # ステップ内の撤退もライトスルーで反映されること
+        sim.unit_resources[str(allies[1].id)]["status"] = "RETREATED"
+        sim._unit_state.set_status(allies[1], "RETREATED")
+        after_retreat = sim._collect_team_metrics("TEAM_P")
+    finally:
+        sim._unit_state.deactivate()
+
+    assert indexed == scanned
+    assert indexed.alive_count == 2
+    assert indexed.total_count == 4
+    assert indexed.avg_hp_ratio == pytest.approx((1.0 + 0.35) / 2)
+    assert indexed.min_hp_ratio == pytest.approx(0.35)
+    assert after_retreat.alive_count == 1
+
+
+def test_strategy_phase_collects_metrics_only_for_due_teams() -> None:
+    """評価タイミングが来ていないチームのメトリクスは収集しないこと."""
+    from unittest.mock import patch
+
+    player = _make_unit("Player", "TEAM_P", position=Vector3(x=0, y=0, z=0))
+    enemy = _make_unit("Enemy", "TEAM_E", position=Vector3(x=3000, y=0, z=0))
+    sim = BattleSimulator(player, [enemy], strategy_update_interval=3)
+    sim._strategy_controllers["TEAM_E"]._step_counter = 1
+
+    with patch.object(
+        sim, "_collect_team_metrics", wraps=sim._collect_team_metrics
+    ) as collect:
+        sim._strategy_phase()
+        assert collect.call_count == 0
+        sim._strategy_phase()
+        assert [c.args[0] for c in collect.call_args_list] == ["TEAM_E"]
+
+
 # ---------------------------------------------------------------------------
 # BattleSimulator._strategy_phase() integration tests
 # ---------------------------------------------------------------------------
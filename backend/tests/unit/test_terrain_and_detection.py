@@ -149,6 +149,7 @@ def test_terrain_affects_movement_distance() -> None:
     )
     for _ in range(20):
         sim_ground.step()
+    sim_ground.sync_unit_positions()
 
     # Ground specialist should move further in ground
     # (But since we're comparing space specialist in space vs ground specialist in ground,
@@ -168,6 +169,7 @@ def test_terrain_affects_movement_distance() -> None:
     )
     for _ in range(20):
         sim_ground2.step()
+    sim_ground2.sync_unit_positions()
 
     # Space specialist in ground should move less than ground specialist in ground
     space_in_ground_distance = player_space_in_ground.position.x
@@ -193,7 +195,7 @@ def test_detection_phase_basic() -> None:
     assert len(sim.team_detected_units["PLAYER_TEAM"]) == 0
 
     # Run detection phase (patch random to always succeed probability check)
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
 
     # Close enemy should be detected
@@ -213,7 +215,7 @@ def test_detection_logs_generated() -> None:
     sim.elapsed_time = 0.1
 
     # Run detection phase (patch random to always succeed probability check)
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
 
     # Check that detection logs were created (both units detect each other)
@@ -240,7 +242,7 @@ def test_detection_shared_among_team() -> None:
     sim = BattleSimulator(player, [ally, enemy], environment="SPACE")
 
     # Run detection phase (patch random to always succeed probability check)
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
 
     # Enemy should be in PLAYER_TEAM's detected units
@@ -289,7 +291,7 @@ def test_enemy_detection_of_player() -> None:
     assert len(sim.team_detected_units["ENEMY_TEAM"]) == 0
 
     # Run detection phase (patch random to always succeed probability check)
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
 
     # Enemy should have detected player
@@ -307,7 +309,7 @@ def test_detection_log_shows_distance() -> None:
     sim.elapsed_time = 0.1
 
     # Run detection phase (patch random to always succeed probability check)
-    with patch("app.engine.targeting.random.random", return_value=0.0):
+    with patch("random.random", return_value=0.0):
         sim._detection_phase()
 
     # Check detection log includes distance
@@ -0,0 +1,143 @@
+"""Tests for the per-battle static unit profile (UnitProfile / BattleSimulator._unit_profile).
+
+- 攻撃力・武器分類・耐性・機動パラメータ・地形補正・パイロットステータスが
+  ユニットから正しく計算されること
+- 武器リストの差し替え・増減・要素の入れ替えが step() の冒頭で検出され、invalidate_unit_profile() で破棄できること
+- 戦略モードの解決結果が値ごとにキャッシュされること
+"""
+
+import logging
+import uuid
+
+import pytest
+
+from app.engine.calculator import PilotStats
+from app.engine.simulation import BattleSimulator
+from app.models.models import MobileSuit, Vector3, Weapon
+
+
+def _make_unit(i: int, team_id: str, weapons: list[Weapon]) -> MobileSuit:
+    return MobileSuit(
+        id=uuid.UUID(int=i + 1),
+        name=f"u{i}",
+        max_hp=100,
+        current_hp=100,
+        armor=0,
+        mobility=1.0,
+        position=Vector3(x=500.0 * i, y=0.0, z=0.0),
+        sensor_range=400.0,
+        side="PLAYER" if team_id == "A" else "ENEMY",
+        team_id=team_id,
+        beam_resistance=0.2,
+        physical_resistance=0.1,
+        max_speed=90.0,
+        terrain_adaptability={"GROUND": "B"},
+        weapons=weapons,
+    )
+
+
+def _weapons() -> list[Weapon]:
+    return [
+        Weapon(id="rifle", name="Rifle", power=30, range=500, accuracy=80),
+        Weapon(
+            id="saber",
+            name="Saber",
+            power=60,
+            range=50,
+            accuracy=90,
+            weapon_type="MELEE",
+            is_melee=True,
+        ),
+        Weapon(id="mg", name="MG", power=12, range=300, accuracy=70),
+    ]
+
+
+def _make_sim(**kwargs) -> BattleSimulator:
+    player = _make_unit(0, "A", _weapons())
+    enemy = _make_unit(1, "B", [])
+    return BattleSimulator(player, [enemy], seed=1, **kwargs)
+
+
+def test_profile_matches_unit_stats() -> None:
+    """プロファイルの各値がユニットのステータスから計算した値と一致すること."""
+    stats = PilotStats(sht=10, mel=5)
+    sim = _make_sim(
+        environment="GROUND",
+        special_effects=["GRAVITY_WELL"],
+        player_pilot_stats=stats,
+    )
+    profile = sim._unit_profile(sim.player)
+
+    assert profile.attack_power == 60.0
+    assert profile.avg_weapon_power == pytest.approx((30 + 60 + 12) / 3)
+    assert profile.max_weapon_range == 500
+    assert [w.id for w in profile.ranged_weapons] == ["rifle", "mg"]
+    assert [w.id for w in profile.melee_weapons] == ["saber"]
+    assert profile.beam_resistance == 0.2
+    assert profile.physical_resistance == 0.1
+    assert profile.max_speed == 90.0
+    assert profile.terrain_modifier < 1.0
+    assert sim._get_terrain_modifier(sim.player) == profile.terrain_modifier
+    assert profile.pilot_stats is stats
+
+    unarmed = sim._unit_profile(sim.units[1])
+    assert unarmed.attack_power == 0.0
+    assert unarmed.avg_weapon_power == 0.0
+    assert unarmed.ranged_weapons == ()
+
+
+def test_profile_is_rebuilt_when_loadout_changes() -> None:
+    """武器リストの差し替え・追加・要素の入れ替えは次の step() で検出され、再計算されること."""
+    sim = _make_sim()
+    player = sim.player
+    first = sim._unit_profile(player)
+    sim.step()
+    assert sim._unit_profile(player) is first
+
+    player.weapons.append(
+        Weapon(id="bazooka", name="Bazooka", power=90, range=400, accuracy=60)
+    )
+    sim.step()
+    assert sim._unit_profile(player) is not first
+    assert sim._calculate_attack_power(player) == 90.0
+
+    # リストを差し替えず要素だけを入れ替えた場合も検出されること
+    player.weapons[0] = Weapon(
+        id="mega", name="Mega", power=9999, range=800, accuracy=50
+    )
+    sim.step()
+    assert sim._calculate_attack_power(player) == 9999.0
+    assert sim._unit_profile(player).max_weapon_range == 800
+
+    player.weapons = [Weapon(id="v", name="Vulcan", power=5, range=100, accuracy=50)]
+    sim.step()
+    assert sim._calculate_attack_power(player) == 5.0
+    assert sim._unit_profile(player).melee_weapons == ()
+
+
+def test_invalidate_unit_profile_after_in_place_edit() -> None:
+    """武器ステータスを直接書き換えた場合は invalidate_unit_profile() で反映されること."""
+    sim = _make_sim()
+    player = sim.player
+    player.weapons[1].power = 100
+    assert sim._calculate_attack_power(player) == 60.0
+
+    sim.invalidate_unit_profile(player)
+    assert sim._calculate_attack_power(player) == 100.0
+
+
+def test_strategy_mode_resolution_is_cached(caplog) -> None:
+    """無効な strategy_mode の警告は値ごとに1回のみで、有効な値の変更は反映されること."""
+    sim = _make_sim()
+    player = sim.player
+
+    player.strategy_mode = "UNKNOWN_MODE"
+    with caplog.at_level(logging.WARNING, logger="app.engine.simulation"):
+        for _ in range(3):
+            assert sim._resolve_strategy_mode(player) == "AGGRESSIVE"
+    assert sum("UNKNOWN_MODE" in msg for msg in caplog.messages) == 1
+
+    player.strategy_mode = "SNIPER"
+    assert sim._resolve_strategy_mode(player) == "SNIPER"
+    player.strategy_mode = "sniper"
+    assert sim._resolve_strategy_mode(player) == "SNIPER"
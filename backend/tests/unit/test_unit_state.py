@@ -0,0 +1,129 @@
+"""Tests for UnitStateStore (SoA ユニット状態ストア).
+
+- load() による MobileSuit / unit_resources からの一括ロード
+- 位置の読み取り専用ビュー・HP のライトスルー・非アクティブ時のフォールバック
+- 位置は write_back()（バトル終了時 / sync_unit_positions()）まで MobileSuit へ
+  書き戻されず、ステップ外での unit.position の差し替えは次の load() で反映されること
+"""
+
+import numpy as np
+import pytest
+
+from app.engine.simulation import BattleSimulator
+from app.engine.unit_state import UnitStateStore
+from app.models.models import MobileSuit, Vector3, Weapon
+
+
+def _make_unit(name: str, x: float, team_id: str, hp: int = 100) -> MobileSuit:
+    return MobileSuit(
+        name=name,
+        max_hp=100,
+        current_hp=hp,
+        armor=0,
+        mobility=1.0,
+        position=Vector3(x=x, y=0.0, z=0.0),
+        side="PLAYER" if team_id == "A" else "ENEMY",
+        team_id=team_id,
+        weapons=[Weapon(id=f"w_{name}", name="w", power=10, range=300, accuracy=80)],
+    )
+
+
+def _resources(units: list[MobileSuit]) -> dict:
+    return {
+        str(u.id): {
+            "velocity_vec": np.array([1.0, 0.0, 2.0]),
+            "current_en": 50.0,
+            "movement_heading_deg": 30.0,
+            "body_heading_deg": 45.0,
+        }
+        for u in units
+    }
+
+
+def test_load_fills_arrays_in_unit_order() -> None:
+    """load() が units の並び順で各配列を埋めること."""
+    a = _make_unit("a", 10.0, "A")
+    b = _make_unit("b", 20.0, "B", hp=0)
+    c = _make_unit("c", 30.0, "A")
+    store = UnitStateStore([a, b, c])
+    store.load(_resources([a, b, c]))
+
+    assert store.active
+    np.testing.assert_allclose(store.positions[:, 0], [10.0, 20.0, 30.0])
+    assert store.alive.tolist() == [True, False, True]
+    assert store.team_idx.tolist() == [0, 1, 0]
+    np.testing.assert_allclose(store.velocities[1], [1.0, 0.0, 2.0])
+    np.testing.assert_allclose(store.en, [50.0, 50.0, 50.0])
+    np.testing.assert_allclose(store.body_heading, [45.0, 45.0, 45.0])
+    assert store.alive_units() == [a, c]
+
+
+def test_position_returns_read_only_view_and_writes_back_on_request() -> None:
+    """position() は読み取り専用ビューを返し、MobileSuit へは write_back() で反映すること."""
+    a = _make_unit("a", 10.0, "A")
+    store = UnitStateStore([a])
+    store.load(_resources([a]))
+
+    pos = store.position(a)
+    assert store.position(a) is pos
+    with pytest.raises(ValueError):
+        pos[0] = 1.0
+    assert store.set_position(a, np.array([99.0, 0.0, 0.0]))
+    # ビューなので後続の書き込みが見える。MobileSuit はまだ更新されない
+    assert pos[0] == 99.0
+    assert a.position.x == 10.0
+
+    store.deactivate()
+    # 非アクティブ時もストアの位置を返し、書き込みは拒否する
+    assert store.position(a)[0] == 99.0
+    assert not store.set_position(a, np.array([1.0, 0.0, 0.0]))
+    store.write_back()
+    assert a.position == Vector3(x=99.0, y=0.0, z=0.0)
+
+    # ステップ外での差し替えは即座に参照され、次の load() で取り込まれる
+    a.position = Vector3(x=5.0, y=0.0, z=0.0)
+    assert store.position(a)[0] == 5.0
+    store.load(_resources([a]))
+    assert store.positions[0, 0] == 5.0
+
+
+def test_set_hp_updates_alive_mask() -> None:
+    """set_hp() が HP 配列と生存フラグを更新すること."""
+    a = _make_unit("a", 0.0, "A")
+    b = _make_unit("b", 10.0, "B")
+    store = UnitStateStore([a, b])
+    store.load(_resources([a, b]))
+
+    b.current_hp = 0
+    store.set_hp(b)
+    assert store.hp[1] == 0.0
+    assert store.alive_units() == [a]
+
+
+def test_step_defers_model_positions_until_sync() -> None:
+    """step() 中の移動はストアにだけ書き込まれ、sync_unit_positions() で反映されること."""
+    player = _make_unit("p", 0.0, "A")
+    enemy = _make_unit("e", 2000.0, "B")
+    sim = BattleSimulator(player, [enemy])
+    spawn = [unit.position for unit in sim.units]
+
+    for _ in range(5):
+        sim.step()
+
+    store = sim._unit_state
+    assert not store.active
+    assert not sim.is_finished
+    assert [unit.position for unit in sim.units] == spawn
+    assert not np.allclose(store.positions, [p.to_numpy() for p in spawn])
+    for i, unit in enumerate(sim.units):
+        np.testing.assert_allclose(sim._unit_pos(unit), store.positions[i])
+        assert store.hp[i] == float(unit.current_hp)
+
+    sim.sync_unit_positions()
+    for i, unit in enumerate(sim.units):
+        np.testing.assert_allclose(store.positions[i], unit.position.to_numpy())
+
+    # ステップ外で位置を差し替えると次のステップはその位置から進む
+    enemy.position = Vector3(x=3000.0, y=0.0, z=0.0)
+    sim.step()
+    assert abs(store.positions[1, 0] - 3000.0) < 100.0